@@ -0,0 +1,143 @@
+# Imports from 3rd party libraries
+import csv
+import io
+import json
+
+from flask import Response, jsonify, request
+
+# Imports from this application
+from app import server
+from scoring import batch, drift, estimators, metrics, price_bands
+from scoring.arrivals import arrival_cache
+from scoring.explain import explanation_cache, explanation_method, pdp_cache
+from scoring.shadow import shadow
+from scoring.features import CXL_FEATURES
+from scoring.cache import prediction_cache
+from pages.occupancy import forecast_cache
+
+# Columns returned for each reservation, after its optional id
+RESULT_FIELDS = ['adr', 'total', 'cancellation_probability']
+
+# Added with ?bands=1
+BAND_FIELDS = ['adr_low', 'adr_high', 'cancellation_probability_at_adr_low',
+               'cancellation_probability_at_adr_high']
+
+
+def _read_reservations():
+    # Accepts a JSON list (or {"reservations": [...]}) or a CSV with a header row
+    if request.mimetype == 'text/csv':
+        text = request.get_data(as_text=True)
+        return list(csv.DictReader(io.StringIO(text))), 'csv'
+    data = request.get_json(force=True, silent=True)
+    if isinstance(data, dict):
+        data = data.get('reservations')
+    if not isinstance(data, list) or not all(isinstance(r, dict) for r in data):
+        raise ValueError('Expected a list of reservations')
+    return data, 'json'
+
+
+def _stream_json(reservations, results, fields, method=None):
+    for reservation, result in zip(reservations, results):
+        row = dict(zip(fields, result))
+        if 'id' in reservation:
+            row = {'id': reservation['id'], **row}
+        if len(result) > len(fields):
+            row['contributions'] = dict(zip(CXL_FEATURES, result[-1].tolist()))
+            row['contribution_method'] = method
+        yield json.dumps(row) + '\n'
+
+
+def _stream_csv(reservations, results, fields):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    header = ['id'] + fields
+    if results and len(results[0]) > len(fields):
+        header += [f'contribution_{feature}' for feature in CXL_FEATURES]
+    writer.writerow(header)
+    for reservation, result in zip(reservations, results):
+        row = list(result[:len(fields)])
+        if len(result) > len(fields):
+            row += result[-1].tolist()
+        writer.writerow([reservation.get('id', '')] + row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+# Score many reservations in one request, e.g. a nightly export from the PMS.
+# Fields are those of the reservation form, see scoring.batch.FIELDS. Add
+# ?explain=1 for the contribution of each feature to every probability, and
+# ?bands=1 for the band of each nightly rate and the probability at its ends.
+# Contributions are TreeSHAP values, or Saabas path attributions with
+# HOTEL_EXPLAINER=path, which are much quicker for large batches (see
+# scoring.explain): the method is in the X-Contribution-Method header, and in
+# each JSON row as contribution_method.
+@server.route('/api/score', methods=['POST'])
+def score():
+    bands = request.args.get('bands') == '1'
+    explain = request.args.get('explain') == '1'
+    try:
+        reservations, fmt = _read_reservations()
+        results = batch.score(reservations, explain=explain, bands=bands)
+    except ValueError as e:
+        return jsonify(error=str(e)), 400
+
+    fields = RESULT_FIELDS + BAND_FIELDS if bands else RESULT_FIELDS
+    method = explanation_method() if explain else None
+    headers = {'X-Contribution-Method': method} if explain else {}
+    if fmt == 'csv':
+        return Response(_stream_csv(reservations, results, fields), mimetype='text/csv',
+                        headers=headers)
+    return Response(_stream_json(reservations, results, fields, method),
+                    mimetype='application/x-ndjson', headers=headers)
+
+
+# Hit rate, evictions and size of the predictions page cache in this process
+@server.route('/api/cache', methods=['GET'])
+def cache_stats():
+    return jsonify(prediction_cache.stats())
+
+
+# Versions of the models loaded in this process
+@server.route('/api/models', methods=['GET'])
+def model_versions():
+    return jsonify({name: estimators.loaded_version(name)
+                    for name in ('price', 'cancellation')})
+
+
+# Latency and prediction differences of the shadow model in this process,
+# see scoring.shadow
+@server.route('/api/shadow', methods=['GET'])
+def shadow_stats():
+    if shadow is None:
+        return jsonify(error='No shadow model, set HOTEL_SHADOW_MODEL'), 404
+    return jsonify(shadow.stats())
+
+
+# PSI and KS distance of each feature of the reservations scored in this
+# process from the training data, see scoring.drift
+@server.route('/api/drift', methods=['GET'])
+def drift_stats():
+    scores = drift.drift_scores()
+    if scores is None:
+        return jsonify(error='No drift profile for the cancellation model, '
+                             'see python -m scoring.drift'), 404
+    return jsonify(scores)
+
+
+# Latency histograms, request counts, cache stats and model versions of this
+# process in the Prometheus text format, see scoring.metrics
+metrics.install(server)
+
+
+@server.route('/metrics', methods=['GET'])
+def metrics_text():
+    if not metrics.METRICS:
+        return jsonify(error='Metrics are off, unset HOTEL_METRICS'), 404
+    caches = {'predictions': prediction_cache, 'arrivals': arrival_cache,
+              'explanations': explanation_cache, 'pdp': pdp_cache, 'forecasts': forecast_cache}
+    versions = {name: estimators.loaded_version(name) for name in ('price', 'cancellation')}
+    batchers = [b for b in (estimators.price_batcher, price_bands.banded_batcher,
+                            estimators.cancellation_batcher) if b is not None]
+    return Response(metrics.render(caches, versions, {b.name: b for b in batchers}),
+                    mimetype='text/plain; version=0.0.4')
@@ -0,0 +1,65 @@
+// Clientside callbacks, see https://dash.plot.ly/performance
+
+// round(x, 2) of the model's NumPy float64 result, as NumPy does it: scale
+// by 100, round half to even and scale back
+function npRound2(x) {
+    var scaled = x * 100;
+    var cents = Math.round(scaled);
+    if (Math.abs(scaled % 1) === 0.5) {
+        cents = 2 * Math.round(scaled / 2);
+    }
+    return cents / 100;
+}
+
+// str() of a float in Python, which keeps the '.0' of whole numbers
+function pyStr(x) {
+    return Number.isInteger(x) ? x.toFixed(1) : String(x);
+}
+
+// ISO 8601 week of a 'YYYY-MM-DD' date, as Python's date.isocalendar()
+function isoWeek(date) {
+    var parts = date.split('-').map(Number);
+    var d = new Date(Date.UTC(parts[0], parts[1] - 1, parts[2]));
+    d.setUTCDate(d.getUTCDate() + 4 - (d.getUTCDay() || 7));
+    var yearStart = Date.UTC(d.getUTCFullYear(), 0, 1);
+    return Math.ceil(((d - yearStart) / 86400000 + 1) / 7);
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    hotel: {
+        // Walks the price model exported to assets/price_tree.js, the same as
+        // the predictions page would on the server. The server's own text for
+        // the same inputs, once it has come back, wins: the exported tree is
+        // out of date if the model was reloaded after the page was opened
+        estimatePrice: function(arrival_date, num_adults, num_nights, meal_plan, hotel, server) {
+            var inputs = [arrival_date, num_adults, num_nights, meal_plan, hotel];
+            if (server && JSON.stringify(server.inputs) === JSON.stringify(inputs)) {
+                return server.text;
+            }
+            if (!window.priceTree || inputs.some(function(v) { return v === null || v === undefined; })) {
+                return '';
+            }
+
+            // ['arrival_date_week_number', 'hotel', 'adults', 'nights_stay']
+            var x = [isoWeek(arrival_date.slice(0, 10)), hotel, num_adults, num_nights];
+            var tree = window.priceTree;
+            var node = 0;
+            while (tree.left[node] !== -1) {
+                node = x[tree.feature[node]] <= tree.threshold[node] ? tree.left[node] : tree.right[node];
+            }
+
+            var adr = npRound2(tree.value[node] + meal_plan * 10);
+            var total = npRound2(adr * num_nights);
+            var text = 'Estimated nightly rate ' + pyStr(adr) + ' Euros\n\n' +
+                       'Total cost ' + pyStr(total) + ' Euros';
+
+            // Band of the leaf, when the export has them (scoring/price_bands.py)
+            if (tree.low && tree.low[node] !== null) {
+                text += '\n\nLikely between ' + pyStr(npRound2(tree.low[node] + meal_plan * 10)) +
+                        ' and ' + pyStr(npRound2(tree.high[node] + meal_plan * 10)) +
+                        ' Euros a night';
+            }
+            return text;
+        }
+    }
+});
@@ -0,0 +1,2 @@
+// Generated by `python -m scoring.price_tree` from the price model. Do not edit.
+window.priceTree = {"left":[1,2,3,4,5,6,7,8,9,-1,11,-1,-1,14,15,-1,17,18,-1,-1,21,22,-1,-1,25,26,-1,-1,29,30,-1,-1,-1,34,-1,-1,-1,38,39,40,41,42,43,-1,45,-1,-1,48,-1,-1,-1,-1,53,54,55,-1,-1,-1,59,-1,-1,62,63,-1,-1,66,-1,-1,69,70,71,72,73,-1,-1,76,77,78,79,80,81,-1,-1,-1,-1,-1,87,-1,-1,-1,91,-1,93,94,95,-1,97,98,-1,-1,-1,102,-1,-1,105,106,-1,-1,-1,110,111,112,113,114,115,-1,117,118,-1,-1,121,122,-1,-1,125,-1,127,-1,-1,-1,-1,-1,133,134,135,136,137,-1,-1,140,-1,142,-1,-1,-1,146,147,148,149,150,-1,152,-1,-1,-1,156,157,-1,-1,160,-1,-1,163,164,-1,-1,167,-1,-1,170,-1,172,173,-1,175,-1,-1,178,179,180,181,-1,-1,184,-1,-1,-1,188,189,190,-1,-1,-1,-1,195,196,197,-1,199,200,-1,-1,-1,204,-1,206,207,-1,-1,-1,211,212,-1,214,215,216,217,-1,219,-1,-1,-1,-1,224,-1,-1,227,228,-1,-1,231,-1,233,234,235,-1,-1,-1,239,-1,-1,242,243,244,-1,-1,247,-1,249,250,251,252,253,-1,-1,256,-1,-1,-1,260,-1,-1,263,-1,265,-1,267,-1,-1,270,-1,272,273,274,-1,-1,-1,-1,279,280,-1,282,-1,-1,285,286,287,288,289,-1,-1,292,-1,-1,295,-1,-1,298,-1,300,301,302,-1,-1,305,-1,-1,308,-1,-1,311,312,313,-1,-1,-1,317,318,-1,-1,321,-1,-1,324,325,326,327,328,-1,-1,331,-1,333,-1,335,336,-1,338,-1,-1,341,342,-1,-1,345,-1,347,-1,-1,350,351,352,353,354,355,-1,357,-1,-1,360,361,-1,363,-1,-1,366,367,-1,369,-1,-1,372,-1,374,-1,-1,377,378,-1,-1,-1,382,-1,384,385,386,-1,-1,389,-1,-1,-1,393,394,395,396,397,398,-1,400,401,-1,-1,-1,405,406,-1,408,409,-1,-1,-1,413,414,415,-1,-1,418,-1,420,-1,-1,423,424,-1,-1,427,428,429,-1,-1,432,-1,-1,435,436,437,-1,-1,-1,-1,442,443,-1,-1,446,-1,448,449,-1,-1,-1,453,454,455,-1,-1,458,-1,-1,461,-1,-1,464,465,-1,-1,468,469,-1,-1,472,-1,-1,475,-1,-1,478,479,480,481,482,483,-1,485,-1,-1,488,489,-1,-1,-1,493,494,-1,-1,-1,498,499,500,-1,-1,503,-1,-1,506,-1,-1,509,-1,511,512,513,514,515,516,-1,-1,519,-1,-1,522,-1,-1,525,526,527,-1,-1,530,-1,-1,533,-1,-1,536,537,-1,539,-1,-1,-1,543,-1,545,546,-1,-1,-1,550,551,552,553,554,-1,-1,-1,558,-1,-1,561,562,-1,-1,-1,566,567,568,569,-1,-1,-1,-1,574,-1,576,-1,-1,579,580,581,-1,-1,584,585,586,-1,588,-1,-1,-1,592,-1,594,-1,-1,597,-1,-1,600,601,-1,603,-1,-1,606,-1,608,609,-1,-1,612,613,614,-1,-1,-1,-1,619,620,-1,622,623,624,625,626,627,-1,-1,630,-1,-1,633,634,-1,-1,637,638,-1,-1,641,-1,-1,644,645,646,647,-1,649,-1,651,-1,-1,654,-1,656,-1,658,-1,-1,661,-1,-1,664,665,-1,-1,668,-1,-1,671,672,673,674,-1,-1,-1,678,679,680,681,-1,683,-1,-1,686,-1,-1,-1,690,691,-1,-1,-1,695,-1,697,698,699,700,701,-1,-1,704,-1,-1,707,708,709,710,711,-1,-1,714,-1,716,717,-1,-1,-1,-1,722,723,724,-1,-1,-1,728,729,-1,-1,-1,733,734,735,-1,-1,-1,-1,740,741,742,743,744,-1,746,747,-1,-1,-1,751,752,-1,-1,-1,-1,-1,758,759,-1,761,762,763,764,765,-1,-1,-1,769,-1,-1,-1,773,-1,-1,776,777,778,779,-1,-1,782,783,-1,-1,-1,787,-1,-1,790,791,-1,-1,794,-1,796,-1,798,-1,-1,801,802,803,804,-1,-1,807,808,-1,-1,811,-1,-1,814,815,-1,-1,818,819,-1,-1,822,-1,-1,825,-1,827,-1,829,830,-1,-1,833,-1,-1,836,837,838,-1,-1,-1,842,843,844,-1,-1,847,-1,849,-1,-1,852,-1,-1,855,856,857,858,859,860,-1,-1,-1,864,865,866,-1,-1,869,870,871,-1,-1,-1,875,876,-1,-1,-1,880,-1,882,-1,884,-1,-1,887,888,889,-1,891,892,-1,-1,895,-1,-1,898,-1,-1,901,902,903,904,905,906,-1,908,-1,-1,-1,-1,913,914,-1,-1,917,918,-1,-1,-1,922,-1,-1,925,-1,-1,928,-1,930,931,932,933,934,935,936,-1,-1,939,940,-1,-1,943,-1,-1,946,947,-1,-1,-1,951,952,953,954,-1,-1,957,-1,-1,960,-1,-1,963,964,965,966,-1,-1,969,970,-1,-1,973,-1,-1,976,-1,-1,979,980,981,-1,-1,-1,-1,986,987,988,-1,-1,-1,992,993,-1,-1,996,997,-1,-1,1000,-1,-1,1003,1004,1005,1006,1007,-1,1009,-1,-1,1012,1013,-1,-1,1016,-1,1018,1019,-1,-1,1022,1023,-1,-1,1026,1027,-1,-1,1030,-1,-1,1033,1034,1035,1036,1037,1038,1039,-1,-1,1042,-1,-1,1045,-1,1047,-1,-1,1050,1051,-1,-1,-1,1055,1056,1057,-1,-1,-1,-1,1062,1063,-1,-1,1066,-1,1068,-1,-1,-1,1072,1073,1074,1075,1076,-1,1078,-1,-1,1081,1082,1083,1084,-1,-1,1087,-1,-1,1090,-1,-1,1093,1094,-1,-1,1097,1098,1099,-1,-1,1102,-1,-1,1105,-1,-1,1108,1109,-1,1111,1112,-1,-1,-1,1116,1117,-1,-1,-1,1121,-1,1123,1124,-1,-1,1127,-1,1129,1130,-1,-1,-1,1134,-1,1136,-1,-1,1139,1140,1141,-1,-1,1144,1145,-1,1147,-1,-1,1150,-1,1152,1153,-1,-1,-1,1157,1158,-1,-1,-1,1162,1163,1164,-1,-1,1167,-1,-1,-1,1171,1172,1173,1174,1175,-1,-1,-1,1179,-1,-1,-1,1183,1184,-1,-1,1187,-1,1189,-1,1191,-1,-1,1194,1195,1196,1197,1198,1199,1200,-1,1202,1203,1204,1205,-1,-1,1208,-1,1210,-1,1212,-1,-1,-1,-1,1217,1218,1219,1220,1221,-1,1223,-1,-1,1226,-1,1228,1229,-1,1231,1232,-1,-1,1235,-1,-1,-1,1239,1240,1241,-1,-1,-1,1245,1246,-1,-1,1249,-1,1251,-1,-1,-1,1255,1256,1257,1258,-1,1260,-1,-1,1263,1264,-1,-1,-1,1268,1269,-1,-1,1272,-1,-1,1275,1276,1277,-1,-1,1280,-1,-1,1283,1284,1285,-1,1287,-1,-1,-1,-1,1292,1293,1294,1295,-1,-1,1298,-1,-1,1301,1302,-1,-1,1305,-1,-1,1308,1309,1310,1311,-1,-1,1314,-1,-1,1317,1318,-1,-1,1321,-1,-1,1324,1325,1326,-1,1328,-1,1330,-1,1332,-1,-1,1335,1336,1337,1338,-1,-1,-1,1342,-1,1344,-1,-1,1347,1348,1349,-1,-1,1352,-1,-1,1355,-1,-1,1358,1359,-1,1361,1362,-1,-1,-1,1366,-1,-1,1369,1370,1371,1372,1373,1374,-1,1376,-1,-1,1379,-1,1381,-1,-1,1384,1385,1386,-1,-1,-1,1390,1391,-1,-1,-1,1395,1396,-1,-1,1399,1400,1401,1402,-1,-1,1405,-1,-1,-1,1409,-1,-1,1412,1413,1414,1415,-1,-1,1418,1419,1420,-1,1422,-1,-1,1425,-1,1427,-1,-1,1430,-1,1432,-1,1434,-1,-1,1437,-1,-1,1440,-1,1442,1443,-1,-1,1446,1447,-1,-1,1450,1451,-1,-1,1454,-1,-1,1457,1458,1459,1460,-1,-1,-1,1464,-1,1466,-1,-1,1469,1470,1471,1472,-1,-1,1475,1476,-1,1478,1479,-1,-1,1482,-1,1484,-1,-1,1487,-1,-1,1490,-1,1492,1493,-1,-1,1496,-1,1498,1499,1500,-1,1502,-1,-1,-1,-1,1507,1508,1509,1510,1511,-1,-1,1514,-1,-1,1517,1518,1519,-1,-1,1522,-1,-1,1525,1526,-1,-1,1529,-1,-1,1532,-1,1534,1535,1536,-1,-1,-1,1540,-1,-1,1543,1544,1545,1546,1547,-1,1549,-1,-1,1552,-1,-1,1555,1556,1557,-1,-1,1560,-1,-1,1563,-1,-1,1566,-1,-1,1569,1570,-1,1572,-1,-1,-1,1576,1577,1578,1579,1580,1581,1582,1583,-1,-1,-1,-1,1588,1589,-1,-1,1592,1593,1594,-1,-1,1597,-1,-1,1600,-1,-1,1603,1604,1605,1606,1607,-1,-1,1610,-1,-1,1613,-1,-1,1616,-1,-1,1619,1620,-1,-1,1623,-1,-1,1626,-1,1628,1629,1630,1631,-1,1633,-1,-1,1636,1637,1638,1639,-1,-1,1642,1643,-1,-1,1646,-1,-1,1649,1650,-1,-1,-1,1654,1655,-1,1657,-1,-1,1660,-1,1662,-1,-1,1665,-1,-1,1668,-1,1670,1671,-1,-1,1674,1675,-1,1677,1678,-1,1680,1681,-1,-1,-1,-1,1686,1687,-1,1689,1690,-1,-1,-1,1694,-1,1696,-1,-1,1699,1700,-1,1702,-1,1704,1705,-1,-1,1708,-1,-1,1711,1712,-1,-1,-1,1716,1717,1718,1719,1720,-1,1722,-1,-1,1725,-1,1727,-1,1729,-1,-1,1732,1733,-1,1735,1736,1737,-1,-1,-1,1741,1742,-1,-1,-1,1746,1747,1748,-1,1750,1751,-1,-1,1754,-1,1756,-1,1758,-1,-1,1761,1762,1763,-1,1765,-1,-1,1768,-1,1770,-1,-1,1773,1774,1775,1776,1777,-1,1779,-1,-1,1782,1783,-1,-1,-1,-1,1788,1789,-1,-1,1792,-1,-1,1795,-1,-1,1798,1799,1800,-1,-1,1803,1804,1805,-1,-1,1808,-1,-1,1811,1812,-1,-1,1815,-1,-1,1818,1819,-1,-1,1822,-1,-1,1825,1826,1827,-1,-1,1830,1831,1832,1833,-1,-1,-1,-1,-1,1839,1840,1841,1842,1843,1844,-1,-1,1847,-1,-1,1850,-1,1852,-1,-1,1855,-1,-1,1858,1859,-1,1861,1862,-1,-1,-1,1866,1867,-1,-1,-1,1871,1872,1873,1874,1875,1876,1877,1878,1879,-1,1881,-1,-1,-1,1885,1886,-1,1888,-1,-1,-1,1892,1893,-1,-1,1896,-1,-1,1899,-1,1901,-1,-1,1904,1905,1906,-1,-1,1909,-1,-1,-1,1913,-1,1915,-1,1917,-1,-1,1920,1921,-1,-1,1924,-1,-1,1927,1928,1929,1930,-1,1932,1933,-1,-1,-1,1937,-1,-1,-1,-1,1942,1943,1944,-1,1946,-1,-1,1949,-1,1951,1952,1953,-1,-1,-1,-1,1958,1959,-1,-1,1962,-1,1964,-1,-1,1967,1968,1969,1970,1971,1972,1973,1974,-1,1976,-1,-1,1979,1980,-1,-1,-1,1984,1985,-1,1987,-1,-1,1990,-1,1992,-1,-1,1995,1996,1997,-1,-1,-1,2001,2002,2003,-1,-1,2006,-1,-1,2009,-1,-1,-1,2013,2014,2015,-1,-1,2018,2019,2020,2021,-1,-1,-1,2025,2026,-1,-1,2029,2030,-1,-1,2033,-1,-1,2036,2037,2038,2039,-1,-1,-1,2043,-1,2045,-1,-1,-1,2049,2050,2051,-1,-1,2054,2055,2056,2057,2058,-1,-1,2061,-1,-1,2064,-1,-1,2067,2068,-1,-1,2071,-1,-1,2074,-1,-1,2077,-1,2079,-1,2081,2082,-1,-1,2085,-1,2087,-1,2089,-1,-1,2092,2093,2094,2095,2096,2097,2098,2099,2100,-1,2102,-1,-1,2105,-1,2107,-1,-1,2110,-1,2112,2113,-1,-1,-1,2117,2118,2119,-1,2121,-1,-1,2124,2125,-1,-1,-1,2129,2130,-1,2132,-1,-1,2135,2136,-1,-1,-1,-1,2141,2142,2143,-1,2145,2146,2147,-1,-1,-1,2151,2152,-1,-1,2155,-1,2157,-1,-1,-1,2161,2162,-1,2164,-1,-1,-1,2168,2169,2170,2171,2172,-1,2174,2175,-1,-1,-1,2179,2180,-1,-1,2183,-1,-1,2186,2187,2188,2189,-1,-1,-1,2193,-1,2195,-1,2197,-1,-1,2200,-1,-1,2203,2204,2205,2206,2207,2208,-1,-1,-1,-1,2213,2214,-1,-1,2217,-1,-1,2220,2221,-1,-1,2224,-1,-1,2227,2228,2229,2230,-1,-1,2233,2234,-1,-1,-1,-1,2239,2240,2241,2242,-1,-1,-1,2246,2247,-1,-1,2250,2251,-1,-1,2254,-1,2256,-1,-1,2259,2260,2261,-1,-1,-1,2265,2266,2267,-1,-1,2270,-1,-1,2273,-1,2275,-1,-1,2278,2279,2280,2281,-1,-1,2284,2285,-1,2287,-1,-1,-1,2291,-1,-1,2294,2295,2296,2297,2298,2299,2300,-1,-1,2303,-1,-1,2306,2307,-1,-1,2310,2311,2312,-1,-1,2315,-1,-1,2318,2319,-1,-1,2322,-1,-1,2325,2326,2327,2328,-1,2330,-1,-1,-1,-1,-1,2336,2337,2338,-1,-1,2341,-1,2343,-1,-1,2346,-1,-1,2349,2350,2351,2352,-1,-1,-1,-1,2357,-1,2359,-1,-1,2362,2363,2364,2365,-1,-1,-1,2369,-1,2371,-1,-1,2374,2375,-1,2377,-1,-1,2380,-1,2382,-1,2384,-1,-1,2387,2388,2389,2390,-1,-1,2393,-1,2395,2396,-1,-1,2399,-1,-1,-1,2403,2404,2405,-1,2407,-1,-1,2410,2411,-1,2413,-1,2415,-1,-1,-1,2419,-1,2421,-1,2423,-1,-1,2426,2427,2428,2429,2430,2431,2432,-1,-1,-1,2436,-1,-1,2439,-1,2441,-1,-1,-1,2445,2446,2447,-1,-1,2450,-1,-1,2453,-1,-1,2456,2457,2458,-1,2460,-1,-1,2463,2464,2465,2466,-1,2468,-1,-1,-1,2472,-1,-1,2475,2476,2477,-1,-1,-1,2481,-1,2483,-1,-1,2486,2487,2488,2489,2490,2491,2492,-1,-1,-1,-1,2497,2498,2499,2500,-1,-1,-1,2504,-1,2506,-1,-1,2509,2510,-1,-1,-1,2514,-1,2516,-1,2518,2519,2520,-1,2522,-1,2524,2525,-1,-1,2528,-1,2530,-1,-1,-1,2534,2535,-1,-1,2538,-1,-1,2541,2542,2543,2544,-1,-1,2547,2548,2549,-1,-1,-1,2553,2554,-1,-1,-1,2558,2559,2560,-1,2562,-1,-1,2565,2566,-1,-1,-1,2570,2571,2572,2573,-1,2575,-1,-1,-1,2579,2580,-1,2582,-1,-1,-1,2586,2587,-1,-1,2590,-1,-1,2593,2594,2595,2596,2597,2598,2599,2600,-1,-1,-1,2604,-1,-1,2607,-1,-1,2610,2611,2612,2613,-1,-1,2616,-1,-1,2619,2620,-1,-1,2623,-1,-1,2626,-1,2628,-1,2630,-1,-1,2633,2634,2635,-1,2637,-1,-1,2640,2641,2642,-1,2644,-1,-1,2647,-1,2649,-1,-1,2652,2653,-1,-1,-1,2657,-1,2659,-1,-1,2662,-1,-1,2665,2666,2667,-1,-1,-1,2671,2672,2673,2674,-1,-1,2677,-1,-1,2680,2681,2682,-1,2684,-1,-1,2687,-1,-1,2690,2691,2692,2693,-1,-1,2696,-1,2698,-1,2700,-1,-1,-1,2704,-1,-1,2707,2708,-1,2710,2711,-1,2713,2714,-1,2716,-1,-1,2719,-1,-1,2722,-1,2724,2725,2726,-1,-1,2729,-1,2731,-1,-1,-1,2735,2736,-1,2738,-1,-1,2741,-1,-1,2744,2745,2746,2747,-1,-1,-1,2751,-1,2753,2754,-1,-1,-1,2758,2759,2760,-1,2762,-1,-1,2765,-1,2767,-1,-1,2770,2771,-1,2773,-1,-1,-1,2777,2778,2779,2780,2781,2782,2783,2784,2785,-1,-1,-1,2789,-1,2791,-1,-1,2794,-1,2796,-1,2798,-1,-1,2801,-1,2803,2804,2805,2806,2807,2808,-1,-1,-1,2812,2813,2814,-1,-1,-1,2818,2819,2820,-1,-1,2823,-1,-1,2826,-1,-1,2829,-1,2831,2832,-1,-1,2835,-1,-1,2838,2839,-1,-1,2842,2843,2844,-1,-1,2847,2848,-1,-1,2851,-1,-1,2854,2855,-1,-1,2858,-1,-1,2861,2862,2863,2864,2865,-1,2867,2868,-1,-1,-1,2872,2873,-1,-1,-1,-1,-1,-1,2880,2881,2882,2883,-1,-1,2886,2887,-1,-1,2890,2891,2892,2893,-1,-1,-1,2897,2898,-1,-1,2901,-1,-1,2904,-1,-1,2907,2908,2909,-1,2911,-1,-1,2914,2915,-1,-1,2918,2919,-1,-1,2922,-1,-1,2925,-1,2927,2928,2929,-1,2931,-1,-1,2934,2935,-1,-1,-1,2939,2940,-1,-1,-1,2944,2945,2946,2947,2948,-1,2950,-1,2952,-1,2954,-1,-1,2957,-1,-1,2960,2961,2962,-1,-1,-1,2966,2967,2968,2969,-1,-1,-1,2973,2974,-1,-1,-1,2978,2979,2980,2981,-1,-1,2984,-1,-1,-1,2988,-1,-1,2991,2992,-1,2994,-1,-1,2997,-1,2999,-1,-1,3002,3003,3004,3005,-1,-1,-1,-1,3010,3011,-1,-1,-1,3015,3016,3017,3018,-1,-1,3021,-1,-1,3024,3025,3026,-1,-1,-1,3030,-1,3032,-1,3034,-1,-1,3037,3038,3039,-1,-1,3042,3043,-1,-1,3046,3047,-1,-1,-1,3051,-1,3053,-1,3055,-1,3057,-1,-1,3060,3061,3062,3063,3064,3065,-1,-1,3068,-1,-1,3071,3072,3073,-1,-1,3076,3077,-1,-1,-1,3081,-1,3083,-1,3085,3086,-1,-1,-1,3090,3091,3092,-1,-1,-1,3096,-1,-1,3099,3100,3101,3102,3103,-1,3105,-1,-1,-1,3109,3110,3111,3112,-1,-1,3115,-1,-1,-1,3119,-1,-1,3122,3123,3124,-1,-1,3127,-1,3129,-1,-1,-1,3133,3134,-1,3136,3137,-1,-1,3140,-1,3142,3143,-1,3145,-1,-1,3148,-1,-1,3151,3152,3153,3154,-1,-1,-1,-1,3159,-1,3161,-1,3163,-1,-1,3166,3167,3168,3169,3170,-1,3172,3173,-1,-1,3176,-1,3178,-1,-1,3181,3182,-1,-1,3185,3186,-1,-1,3189,3190,-1,-1,-1,3194,3195,3196,3197,3198,-1,-1,-1,3202,3203,3204,-1,-1,-1,3208,-1,-1,3211,3212,3213,-1,-1,-1,3217,3218,-1,3220,-1,-1,3223,-1,3225,-1,-1,3228,-1,3230,3231,3232,-1,3234,-1,-1,3237,3238,-1,3240,-1,-1,3243,3244,-1,-1,3247,-1,-1,3250,3251,3252,-1,-1,-1,3256,-1,-1,3259,3260,3261,-1,-1,3264,3265,-1,-1,3268,-1,-1,3271,-1,3273,3274,-1,-1,3277,3278,-1,-1,3281,-1,-1,3284,3285,3286,3287,3288,3289,-1,-1,-1,3293,3294,-1,-1,3297,-1,3299,-1,-1,3302,3303,3304,3305,-1,3307,-1,3309,-1,-1,3312,-1,3314,3315,-1,-1,-1,3319,3320,3321,-1,-1,-1,3325,-1,-1,3328,3329,3330,-1,3332,-1,3334,-1,-1,-1,3338,3339,-1,3341,3342,-1,-1,3345,-1,-1,3348,3349,-1,-1,3352,-1,-1,3355,3356,3357,3358,-1,-1,-1,-1,3363,3364,3365,3366,3367,-1,-1,-1,3371,-1,-1,-1,3375,3376,-1,-1,-1,3380,3381,3382,3383,-1,3385,-1,-1,3388,3389,3390,-1,-1,3393,-1,-1,-1,-1,-1,3399,3400,3401,3402,3403,3404,3405,3406,3407,-1,-1,-1,3411,-1,-1,3414,-1,3416,-1,-1,3419,-1,3421,-1,-1,-1,3425,3426,3427,3428,3429,-1,-1,-1,3433,-1,-1,-1,3437,3438,-1,3440,-1,-1,3443,3444,-1,-1,3447,-1,-1,3450,3451,3452,3453,3454,3455,-1,-1,3458,-1,-1,3461,-1,-1,-1,3465,3466,-1,-1,3469,3470,3471,-1,-1,3474,-1,-1,3477,3478,3479,-1,3481,-1,-1,3484,-1,3486,-1,-1,3489,3490,3491,-1,-1,-1,-1,-1,3497,3498,3499,3500,3501,-1,-1,-1,3505,3506,3507,-1,-1,3510,3511,-1,3513,-1,-1,-1,3517,3518,3519,3520,3521,3522,-1,-1,3525,-1,-1,-1,3529,-1,-1,3532,-1,-1,3535,3536,-1,-1,3539,3540,-1,-1,3543,-1,3545,-1,3547,-1,-1,-1,3551,3552,3553,3554,3555,3556,-1,-1,3559,3560,-1,-1,3563,-1,-1,-1,3567,3568,-1,-1,3571,-1,-1,3574,-1,3576,3577,3578,-1,-1,3581,-1,-1,-1,3585,3586,3587,3588,3589,-1,-1,3592,-1,-1,3595,3596,3597,-1,-1,3600,-1,-1,3603,-1,-1,3606,3607,3608,-1,-1,3611,3612,-1,-1,-1,3616,3617,-1,-1,-1,3621,3622,3623,-1,-1,3626,3627,-1,-1,3630,-1,-1,3633,-1,3635,-1,-1,3638,3639,3640,3641,3642,-1,3644,-1,3646,3647,3648,-1,-1,-1,3652,3653,-1,-1,3656,-1,3658,-1,3660,-1,-1,3663,-1,-1,3666,3667,3668,3669,3670,-1,3672,-1,3674,3675,-1,-1,3678,-1,-1,3681,-1,3683,-1,3685,3686,3687,-1,-1,-1,-1,3692,3693,3694,3695,3696,3697,-1,-1,3700,3701,-1,-1,3704,-1,-1,3707,-1,-1,3710,-1,-1,3713,-1,-1,3716,3717,3718,-1,3720,-1,-1,3723,3724,-1,-1,-1,3728,3729,-1,3731,-1,-1,3734,-1,3736,-1,-1,-1,3740,3741,3742,3743,3744,-1,-1,3747,-1,3749,-1,-1,3752,3753,3754,3755,3756,3757,-1,-1,3760,-1,-1,3763,3764,-1,-1,-1,3768,-1,3770,-1,-1,3773,3774,-1,3776,-1,-1,-1,3780,3781,-1,-1,-1,3785,3786,-1,-1,3789,-1,3791,-1,3793,-1,-1,3796,3797,3798,3799,-1,-1,-1,3803,3804,-1,-1,-1,3808,3809,3810,3811,-1,-1,3814,-1,-1,3817,3818,3819,3820,-1,-1,3823,3824,-1,-1,3827,-1,-1,3830,3831,-1,-1,-1,3835,3836,-1,-1,-1,3840,3841,3842,3843,3844,-1,-1,-1,3848,3849,-1,-1,-1,3853,3854,-1,-1,-1,3858,3859,3860,3861,-1,3863,-1,-1,3866,-1,-1,3869,-1,-1,-1,3873,3874,3875,3876,3877,3878,3879,-1,-1,3882,3883,-1,-1,-1,3887,3888,-1,-1,-1,3892,-1,3894,3895,-1,-1,3898,3899,-1,3901,-1,-1,-1,3905,3906,3907,3908,-1,3910,-1,-1,3913,-1,-1,-1,3917,3918,3919,3920,-1,3922,-1,-1,3925,3926,3927,-1,-1,3930,-1,-1,3933,3934,3935,-1,-1,3938,-1,3940,3941,-1,-1,-1,3945,-1,-1,3948,3949,-1,-1,3952,3953,3954,3955,-1,3957,-1,-1,3960,3961,-1,-1,-1,-1,-1,3967,3968,3969,3970,3971,-1,-1,3974,-1,-1,3977,-1,3979,3980,-1,-1,3983,-1,-1,3986,3987,-1,-1,3990,-1,3992,3993,3994,-1,3996,-1,-1,-1,4000,-1,-1,4003,-1,4005,4006,4007,-1,-1,-1,4011,-1,4013,-1,-1,4016,4017,4018,4019,4020,4021,-1,4023,4024,-1,-1,4027,-1,4029,4030,-1,-1,-1,-1,-1,4036,4037,4038,4039,-1,-1,4042,4043,4044,4045,-1,-1,4048,-1,-1,-1,4052,-1,-1,4055,4056,4057,-1,-1,4060,-1,-1,4063,4064,4065,-1,4067,4068,-1,-1,4071,-1,4073,-1,-1,4076,-1,4078,4079,-1,-1,-1,-1,4084,4085,4086,4087,4088,4089,-1,-1,-1,4093,-1,4095,4096,-1,4098,-1,-1,-1,4102,4103,-1,-1,4106,4107,4108,-1,-1,-1,4112,-1,-1,4115,4116,-1,-1,-1,4120,4121,-1,-1,-1,4125,-1,4127,4128,4129,4130,-1,-1,4133,-1,4135,-1,4137,-1,4139,-1,-1,4142,-1,4144,-1,-1,4147,-1,-1,4150,4151,-1,-1,-1,4155,4156,-1,4158,4159,4160,-1,4162,-1,-1,4165,-1,-1,4168,-1,4170,-1,-1,4173,4174,-1,4176,-1,-1,4179,4180,-1,4182,-1,-1,4185,4186,4187,-1,-1,4190,-1,-1,4193,-1,4195,-1,-1,4198,4199,4200,4201,4202,4203,-1,4205,4206,4207,4208,-1,-1,4211,4212,4213,-1,4215,-1,-1,-1,-1,4220,4221,4222,-1,4224,-1,-1,-1,4228,4229,-1,-1,-1,4233,4234,-1,-1,4237,-1,4239,-1,-1,4242,4243,4244,4245,4246,4247,-1,-1,4250,4251,-1,-1,4254,-1,-1,-1,4258,4259,-1,4261,4262,-1,-1,4265,4266,-1,-1,-1,4270,4271,4272,-1,-1,-1,4276,-1,-1,4279,4280,4281,-1,-1,4284,4285,4286,4287,-1,4289,-1,-1,-1,-1,4294,4295,-1,4297,4298,4299,-1,-1,-1,-1,4304,-1,-1,4307,4308,4309,-1,-1,4312,-1,-1,4315,4316,4317,4318,-1,-1,-1,4322,-1,-1,4325,4326,4327,4328,-1,-1,4331,-1,4333,-1,-1,4336,-1,-1,-1,4340,-1,-1,-1,4344,4345,4346,4347,4348,4349,4350,-1,4352,-1,-1,4355,-1,4357,-1,-1,4360,-1,4362,-1,-1,4365,4366,-1,-1,-1,4370,4371,-1,-1,-1,4375,-1,4377,4378,-1,-1,4381,4382,-1,-1,-1,4386,4387,4388,4389,-1,-1,4392,-1,-1,4395,4396,4397,-1,-1,-1,-1,4402,4403,-1,-1,4406,4407,4408,-1,-1,-1,4412,-1,-1,4415,4416,4417,4418,-1,4420,-1,-1,4423,-1,4425,4426,4427,4428,-1,4430,-1,4432,-1,4434,-1,-1,4437,-1,-1,4440,-1,-1,-1,4444,4445,4446,4447,-1,4449,-1,-1,4452,-1,4454,-1,-1,4457,-1,4459,-1,-1,4462,4463,-1,-1,4466,4467,-1,4469,-1,4471,-1,4473,-1,4475,-1,-1,4478,4479,4480,-1,-1,-1,4484,-1,4486,4487,-1,-1,4490,-1,-1,4493,4494,4495,4496,-1,4498,4499,-1,-1,4502,-1,-1,4505,4506,-1,-1,4509,4510,4511,4512,-1,-1,-1,4516,-1,-1,-1,4520,4521,4522,4523,4524,4525,4526,-1,-1,4529,-1,-1,4532,-1,-1,4535,-1,4537,-1,-1,4540,-1,4542,4543,4544,4545,-1,-1,4548,-1,-1,4551,-1,-1,4554,4555,-1,4557,-1,-1,4560,4561,-1,4563,-1,-1,4566,4567,4568,4569,-1,-1,-1,4573,4574,4575,-1,-1,4578,-1,-1,-1,4582,4583,-1,4585,-1,-1,-1,4589,4590,-1,-1,4593,4594,-1,-1,4597,4598,-1,4600,4601,-1,-1,4604,-1,-1,-1,4608,4609,4610,4611,-1,-1,4614,-1,-1,4617,-1,-1,4620,-1,-1,4623,4624,4625,4626,4627,4628,-1,4630,-1,-1,4633,-1,4635,-1,-1,4638,-1,-1,4641,4642,-1,-1,4645,-1,-1,4648,-1,4650,4651,4652,4653,4654,-1,-1,4657,4658,-1,-1,4661,-1,-1,4664,-1,4666,-1,-1,4669,-1,4671,4672,-1,-1,4675,-1,-1,4678,-1,4680,-1,4682,4683,-1,-1,-1,4687,4688,4689,-1,4691,-1,-1,4694,-1,4696,-1,-1,4699,-1,4701,4702,4703,4704,-1,-1,4707,-1,4709,-1,-1,-1,4713,-1,-1,4716,4717,4718,4719,4720,-1,-1,-1,4724,-1,4726,-1,4728,-1,-1,4731,-1,4733,-1,-1,4736,4737,-1,4739,-1,-1,4742,-1,4744,4745,-1,-1,4748,4749,-1,-1,4752,-1,4754,-1,4756,-1,4758,-1,-1,4761,4762,4763,4764,4765,4766,4767,4768,-1,4770,-1,-1,4773,-1,4775,-1,-1,4778,4779,4780,4781,4782,-1,-1,4785,-1,4787,-1,-1,4790,-1,4792,-1,-1,4795,4796,4797,-1,-1,-1,4801,4802,-1,4804,-1,-1,4807,4808,4809,-1,-1,4812,-1,-1,4815,-1,-1,4818,4819,4820,-1,-1,-1,4824,4825,-1,-1,-1,4829,4830,-1,-1,-1,4834,-1,4836,4837,4838,-1,4840,4841,-1,-1,-1,4845,4846,4847,4848,-1,-1,-1,4852,-1,-1,4855,4856,4857,-1,4859,-1,-1,4862,4863,4864,-1,-1,-1,4868,-1,-1,4871,4872,-1,-1,-1,4876,4877,4878,4879,-1,-1,4882,-1,4884,-1,-1,-1,4888,4889,4890,-1,4892,-1,-1,4895,-1,-1,4898,4899,4900,-1,4902,4903,-1,-1,-1,4907,-1,4909,-1,-1,4912,-1,-1,-1,4916,4917,4918,4919,-1,4921,4922,4923,-1,-1,-1,4927,-1,4929,-1,-1,4932,4933,4934,-1,4936,4937,4938,-1,-1,-1,-1,-1,4944,4945,4946,4947,-1,-1,4950,4951,-1,-1,4954,-1,-1,4957,4958,-1,-1,4961,-1,-1,4964,-1,4966,4967,4968,4969,-1,-1,-1,-1,4974,4975,-1,-1,-1,-1,4980,-1,4982,4983,4984,-1,4986,-1,-1,-1,-1,4991,4992,4993,4994,4995,4996,4997,4998,4999,-1,-1,5002,-1,-1,5005,-1,-1,5008,5009,5010,5011,5012,-1,5014,-1,5016,-1,-1,-1,5020,5021,-1,5023,5024,-1,-1,-1,-1,5029,5030,-1,5032,-1,5034,-1,-1,-1,5038,5039,5040,5041,-1,-1,5044,5045,-1,-1,5048,-1,-1,5051,-1,5053,-1,-1,5056,5057,5058,-1,5060,-1,-1,5063,5064,-1,-1,-1,5068,-1,5070,-1,-1,5073,5074,5075,5076,5077,5078,-1,-1,-1,-1,-1,5084,5085,-1,5087,-1,-1,5090,5091,5092,5093,-1,-1,-1,5097,-1,-1,-1,5101,5102,5103,5104,-1,5106,-1,-1,5109,5110,-1,-1,5113,-1,-1,5116,5117,-1,5119,-1,5121,-1,-1,5124,-1,5126,-1,-1,5129,5130,-1,-1,5133,5134,5135,5136,-1,-1,5139,-1,-1,5142,-1,-1,5145,5146,5147,-1,-1,5150,-1,-1,5153,-1,-1,5156,5157,5158,5159,5160,5161,-1,-1,5164,5165,-1,5167,-1,-1,5170,-1,5172,-1,-1,-1,5176,5177,5178,5179,5180,5181,-1,5183,-1,-1,5186,-1,5188,-1,-1,5191,5192,-1,-1,5195,5196,5197,-1,-1,5200,-1,-1,5203,-1,-1,5206,5207,-1,5209,-1,-1,-1,5213,5214,5215,5216,-1,-1,5219,-1,5221,-1,-1,-1,5225,5226,5227,5228,5229,-1,-1,5232,-1,-1,5235,-1,-1,-1,5239,5240,5241,-1,-1,-1,5245,-1,5247,5248,-1,-1,5251,-1,5253,-1,-1,5256,5257,5258,5259,5260,-1,5262,-1,-1,5265,5266,-1,-1,-1,5270,5271,5272,-1,-1,5275,-1,-1,5278,-1,-1,5281,5282,-1,-1,5285,-1,-1,5288,5289,-1,-1,5292,5293,-1,5295,-1,-1,5298,-1,-1,5301,5302,5303,5304,5305,-1,-1,5308,5309,5310,-1,-1,5313,-1,-1,5316,-1,-1,5319,5320,-1,5322,5323,-1,-1,-1,5327,5328,5329,5330,-1,-1,5333,-1,-1,5336,-1,-1,5339,-1,-1,5342,5343,5344,-1,5346,-1,-1,-1,5350,5351,5352,5353,5354,-1,-1,5357,-1,-1,-1,-1,5362,5363,-1,5365,-1,-1,5368,-1,-1,5371,5372,-1,-1,5375,-1,5377,5378,-1,-1,-1,5382,5383,5384,5385,5386,-1,-1,5389,-1,-1,-1,-1,5394,5395,5396,-1,-1,5399,-1,-1,5402,-1,-1,5405,5406,-1,5408,-1,5410,-1,-1,5413,-1,5415,5416,-1,-1,5419,5420,-1,-1,5423,-1,-1,5426,5427,5428,5429,5430,5431,5432,5433,-1,-1,5436,5437,-1,-1,-1,-1,5442,5443,5444,-1,-1,-1,5448,5449,-1,-1,-1,5453,-1,-1,5456,5457,5458,-1,-1,5461,5462,5463,5464,-1,-1,5467,5468,-1,-1,-1,5472,5473,-1,5475,-1,-1,5478,5479,-1,5481,-1,-1,5484,-1,5486,-1,-1,-1,5490,-1,5492,5493,5494,5495,5496,-1,-1,-1,5500,-1,5502,-1,-1,5505,5506,5507,-1,-1,5510,-1,5512,-1,-1,-1,5516,5517,-1,5519,-1,5521,-1,-1,5524,-1,-1,5527,5528,5529,5530,5531,-1,-1,5534,-1,-1,5537,-1,5539,-1,-1,-1,5543,5544,5545,-1,5547,-1,-1,-1,5551,5552,5553,5554,5555,5556,-1,5558,-1,-1,5561,-1,-1,5564,5565,-1,-1,-1,5569,5570,5571,5572,-1,-1,-1,5576,-1,-1,5579,5580,-1,-1,5583,-1,5585,-1,-1,5588,5589,5590,-1,-1,5593,-1,-1,5596,5597,5598,-1,-1,5601,-1,-1,5604,5605,-1,-1,-1,-1,5610,5611,5612,5613,5614,5615,-1,5617,-1,-1,5620,-1,5622,5623,-1,-1,5626,-1,-1,5629,-1,-1,5632,5633,5634,5635,5636,-1,5638,5639,5640,-1,-1,-1,-1,5645,5646,5647,-1,-1,-1,-1,5652,-1,-1,5655,-1,-1,5658,5659,5660,-1,5662,5663,-1,-1,-1,5667,-1,5669,5670,-1,-1,-1,5674,5675,5676,-1,-1,-1,-1,5681,5682,5683,5684,5685,5686,5687,-1,-1,-1,5691,5692,5693,-1,-1,5696,-1,-1,5699,-1,-1,5702,5703,5704,5705,-1,-1,5708,-1,-1,-1,5712,5713,-1,-1,-1,5717,-1,-1,5720,5721,-1,-1,5724,5725,5726,-1,-1,5729,-1,-1,5732,-1,5734,5735,5736,-1,5738,-1,-1,5741,-1,5743,-1,-1,-1,5747,5748,-1,5750,5751,5752,-1,-1,-1,5756,5757,5758,5759,-1,-1,-1,-1,5764,5765,5766,-1,5768,-1,-1,5771,-1,-1,-1,5775,5776,5777,-1,-1,5780,5781,-1,-1,5784,-1,-1,5787,-1,5789,-1,-1,5792,5793,5794,-1,-1,5797,5798,-1,5800,-1,-1,5803,5804,-1,-1,-1,5808,-1,5810,5811,5812,-1,5814,5815,-1,-1,-1,5819,5820,5821,-1,-1,-1,-1,5826,5827,5828,-1,-1,5831,-1,-1,5834,-1,5836,-1,-1,5839,5840,5841,5842,5843,5844,-1,-1,5847,-1,-1,5850,5851,-1,-1,5854,-1,-1,5857,5858,5859,5860,-1,-1,5863,5864,5865,-1,5867,-1,-1,-1,5871,5872,-1,-1,-1,5876,-1,5878,-1,5880,-1,-1,5883,5884,-1,-1,5887,-1,5889,-1,5891,-1,-1,5894,5895,5896,5897,5898,-1,-1,5901,5902,5903,5904,-1,-1,5907,-1,-1,5910,-1,-1,5913,5914,5915,-1,-1,-1,5919,5920,5921,-1,-1,5924,-1,-1,-1,5928,5929,5930,5931,-1,5933,-1,-1,-1,5937,5938,-1,-1,5941,-1,5943,-1,-1,5946,5947,5948,5949,-1,-1,-1,5953,5954,5955,-1,-1,-1,5959,5960,-1,-1,5963,-1,-1,5966,5967,5968,-1,-1,-1,5972,-1,5974,5975,5976,-1,-1,5979,-1,-1,5982,5983,-1,-1,5986,-1,5988,-1,-1,5991,5992,5993,5994,5995,5996,-1,-1,-1,-1,-1,-1,6003,-1,-1,6006,-1,6008,-1,-1,6011,6012,6013,6014,6015,6016,6017,-1,-1,-1,6021,-1,6023,-1,-1,6026,6027,6028,6029,6030,-1,6032,-1,-1,6035,-1,-1,6038,-1,-1,6041,6042,6043,-1,-1,-1,6047,-1,-1,6050,6051,6052,-1,-1,6055,6056,-1,6058,-1,-1,-1,-1,6063,6064,6065,-1,-1,6068,6069,6070,-1,-1,-1,6074,-1,-1,6077,6078,6079,6080,-1,-1,6083,6084,-1,6086,-1,-1,-1,-1,6091,6092,6093,-1,-1,6096,-1,6098,-1,-1,6101,-1,6103,-1,-1,-1,6107,6108,-1,-1,6111,6112,-1,-1,-1],"right":[4760,1193,618,323,68,37,36,13,10,-1,12,-1,-1,33,16,-1,20,19,-1,-1,24,23,-1,-1,28,27,-1,-1,32,31,-1,-1,-1,35,-1,-1,-1,61,52,51,50,47,44,-1,46,-1,-1,49,-1,-1,-1,-1,58,57,56,-1,-1,-1,60,-1,-1,65,64,-1,-1,67,-1,-1,278,109,90,75,74,-1,-1,89,86,85,84,83,82,-1,-1,-1,-1,-1,88,-1,-1,-1,92,-1,104,101,96,-1,100,99,-1,-1,-1,103,-1,-1,108,107,-1,-1,-1,241,132,131,130,129,116,-1,120,119,-1,-1,124,123,-1,-1,126,-1,128,-1,-1,-1,-1,-1,194,145,144,139,138,-1,-1,141,-1,143,-1,-1,-1,169,162,155,154,151,-1,153,-1,-1,-1,159,158,-1,-1,161,-1,-1,166,165,-1,-1,168,-1,-1,171,-1,177,174,-1,176,-1,-1,187,186,183,182,-1,-1,185,-1,-1,-1,193,192,191,-1,-1,-1,-1,210,203,198,-1,202,201,-1,-1,-1,205,-1,209,208,-1,-1,-1,226,213,-1,223,222,221,218,-1,220,-1,-1,-1,-1,225,-1,-1,230,229,-1,-1,232,-1,238,237,236,-1,-1,-1,240,-1,-1,269,246,245,-1,-1,248,-1,262,259,258,255,254,-1,-1,257,-1,-1,-1,261,-1,-1,264,-1,266,-1,268,-1,-1,271,-1,277,276,275,-1,-1,-1,-1,284,281,-1,283,-1,-1,310,297,294,291,290,-1,-1,293,-1,-1,296,-1,-1,299,-1,307,304,303,-1,-1,306,-1,-1,309,-1,-1,316,315,314,-1,-1,-1,320,319,-1,-1,322,-1,-1,599,578,349,330,329,-1,-1,332,-1,334,-1,340,337,-1,339,-1,-1,344,343,-1,-1,346,-1,348,-1,-1,477,392,381,376,359,356,-1,358,-1,-1,365,362,-1,364,-1,-1,371,368,-1,370,-1,-1,373,-1,375,-1,-1,380,379,-1,-1,-1,383,-1,391,388,387,-1,-1,390,-1,-1,-1,474,463,452,441,404,399,-1,403,402,-1,-1,-1,412,407,-1,411,410,-1,-1,-1,422,417,416,-1,-1,419,-1,421,-1,-1,426,425,-1,-1,434,431,430,-1,-1,433,-1,-1,440,439,438,-1,-1,-1,-1,445,444,-1,-1,447,-1,451,450,-1,-1,-1,460,457,456,-1,-1,459,-1,-1,462,-1,-1,467,466,-1,-1,471,470,-1,-1,473,-1,-1,476,-1,-1,549,508,497,492,487,484,-1,486,-1,-1,491,490,-1,-1,-1,496,495,-1,-1,-1,505,502,501,-1,-1,504,-1,-1,507,-1,-1,510,-1,542,535,524,521,518,517,-1,-1,520,-1,-1,523,-1,-1,532,529,528,-1,-1,531,-1,-1,534,-1,-1,541,538,-1,540,-1,-1,-1,544,-1,548,547,-1,-1,-1,565,560,557,556,555,-1,-1,-1,559,-1,-1,564,563,-1,-1,-1,573,572,571,570,-1,-1,-1,-1,575,-1,577,-1,-1,596,583,582,-1,-1,591,590,587,-1,589,-1,-1,-1,593,-1,595,-1,-1,598,-1,-1,605,602,-1,604,-1,-1,607,-1,611,610,-1,-1,617,616,615,-1,-1,-1,-1,854,621,-1,835,670,643,632,629,628,-1,-1,631,-1,-1,636,635,-1,-1,640,639,-1,-1,642,-1,-1,663,660,653,648,-1,650,-1,652,-1,-1,655,-1,657,-1,659,-1,-1,662,-1,-1,667,666,-1,-1,669,-1,-1,694,677,676,675,-1,-1,-1,689,688,685,682,-1,684,-1,-1,687,-1,-1,-1,693,692,-1,-1,-1,696,-1,800,739,706,703,702,-1,-1,705,-1,-1,732,721,720,713,712,-1,-1,715,-1,719,718,-1,-1,-1,-1,727,726,725,-1,-1,-1,731,730,-1,-1,-1,738,737,736,-1,-1,-1,-1,757,756,755,750,745,-1,749,748,-1,-1,-1,754,753,-1,-1,-1,-1,-1,775,760,-1,772,771,768,767,766,-1,-1,-1,770,-1,-1,-1,774,-1,-1,789,786,781,780,-1,-1,785,784,-1,-1,-1,788,-1,-1,793,792,-1,-1,795,-1,797,-1,799,-1,-1,824,813,806,805,-1,-1,810,809,-1,-1,812,-1,-1,817,816,-1,-1,821,820,-1,-1,823,-1,-1,826,-1,828,-1,832,831,-1,-1,834,-1,-1,841,840,839,-1,-1,-1,851,846,845,-1,-1,848,-1,850,-1,-1,853,-1,-1,1170,927,886,863,862,861,-1,-1,-1,879,868,867,-1,-1,874,873,872,-1,-1,-1,878,877,-1,-1,-1,881,-1,883,-1,885,-1,-1,900,897,890,-1,894,893,-1,-1,896,-1,-1,899,-1,-1,924,921,912,911,910,907,-1,909,-1,-1,-1,-1,916,915,-1,-1,920,919,-1,-1,-1,923,-1,-1,926,-1,-1,929,-1,1161,1002,985,950,945,938,937,-1,-1,942,941,-1,-1,944,-1,-1,949,948,-1,-1,-1,962,959,956,955,-1,-1,958,-1,-1,961,-1,-1,978,975,968,967,-1,-1,972,971,-1,-1,974,-1,-1,977,-1,-1,984,983,982,-1,-1,-1,-1,991,990,989,-1,-1,-1,995,994,-1,-1,999,998,-1,-1,1001,-1,-1,1138,1071,1032,1011,1008,-1,1010,-1,-1,1015,1014,-1,-1,1017,-1,1021,1020,-1,-1,1025,1024,-1,-1,1029,1028,-1,-1,1031,-1,-1,1070,1061,1054,1049,1044,1041,1040,-1,-1,1043,-1,-1,1046,-1,1048,-1,-1,1053,1052,-1,-1,-1,1060,1059,1058,-1,-1,-1,-1,1065,1064,-1,-1,1067,-1,1069,-1,-1,-1,1133,1120,1107,1080,1077,-1,1079,-1,-1,1092,1089,1086,1085,-1,-1,1088,-1,-1,1091,-1,-1,1096,1095,-1,-1,1104,1101,1100,-1,-1,1103,-1,-1,1106,-1,-1,1115,1110,-1,1114,1113,-1,-1,-1,1119,1118,-1,-1,-1,1122,-1,1126,1125,-1,-1,1128,-1,1132,1131,-1,-1,-1,1135,-1,1137,-1,-1,1156,1143,1142,-1,-1,1149,1146,-1,1148,-1,-1,1151,-1,1155,1154,-1,-1,-1,1160,1159,-1,-1,-1,1169,1166,1165,-1,-1,1168,-1,-1,-1,1182,1181,1178,1177,1176,-1,-1,-1,1180,-1,-1,-1,1186,1185,-1,-1,1188,-1,1190,-1,1192,-1,-1,3637,1966,1575,1368,1291,1216,1201,-1,1215,1214,1207,1206,-1,-1,1209,-1,1211,-1,1213,-1,-1,-1,-1,1254,1253,1238,1225,1222,-1,1224,-1,-1,1227,-1,1237,1230,-1,1234,1233,-1,-1,1236,-1,-1,-1,1244,1243,1242,-1,-1,-1,1248,1247,-1,-1,1250,-1,1252,-1,-1,-1,1274,1267,1262,1259,-1,1261,-1,-1,1266,1265,-1,-1,-1,1271,1270,-1,-1,1273,-1,-1,1282,1279,1278,-1,-1,1281,-1,-1,1290,1289,1286,-1,1288,-1,-1,-1,-1,1307,1300,1297,1296,-1,-1,1299,-1,-1,1304,1303,-1,-1,1306,-1,-1,1323,1316,1313,1312,-1,-1,1315,-1,-1,1320,1319,-1,-1,1322,-1,-1,1357,1334,1327,-1,1329,-1,1331,-1,1333,-1,-1,1346,1341,1340,1339,-1,-1,-1,1343,-1,1345,-1,-1,1354,1351,1350,-1,-1,1353,-1,-1,1356,-1,-1,1365,1360,-1,1364,1363,-1,-1,-1,1367,-1,-1,1456,1411,1394,1383,1378,1375,-1,1377,-1,-1,1380,-1,1382,-1,-1,1389,1388,1387,-1,-1,-1,1393,1392,-1,-1,-1,1398,1397,-1,-1,1408,1407,1404,1403,-1,-1,1406,-1,-1,-1,1410,-1,-1,1439,1436,1417,1416,-1,-1,1429,1424,1421,-1,1423,-1,-1,1426,-1,1428,-1,-1,1431,-1,1433,-1,1435,-1,-1,1438,-1,-1,1441,-1,1445,1444,-1,-1,1449,1448,-1,-1,1453,1452,-1,-1,1455,-1,-1,1468,1463,1462,1461,-1,-1,-1,1465,-1,1467,-1,-1,1506,1489,1474,1473,-1,-1,1486,1477,-1,1481,1480,-1,-1,1483,-1,1485,-1,-1,1488,-1,-1,1491,-1,1495,1494,-1,-1,1497,-1,1505,1504,1501,-1,1503,-1,-1,-1,-1,1542,1531,1516,1513,1512,-1,-1,1515,-1,-1,1524,1521,1520,-1,-1,1523,-1,-1,1528,1527,-1,-1,1530,-1,-1,1533,-1,1539,1538,1537,-1,-1,-1,1541,-1,-1,1568,1565,1554,1551,1548,-1,1550,-1,-1,1553,-1,-1,1562,1559,1558,-1,-1,1561,-1,-1,1564,-1,-1,1567,-1,-1,1574,1571,-1,1573,-1,-1,-1,1715,1698,1625,1602,1587,1586,1585,1584,-1,-1,-1,-1,1591,1590,-1,-1,1599,1596,1595,-1,-1,1598,-1,-1,1601,-1,-1,1618,1615,1612,1609,1608,-1,-1,1611,-1,-1,1614,-1,-1,1617,-1,-1,1622,1621,-1,-1,1624,-1,-1,1627,-1,1667,1664,1635,1632,-1,1634,-1,-1,1653,1648,1641,1640,-1,-1,1645,1644,-1,-1,1647,-1,-1,1652,1651,-1,-1,-1,1659,1656,-1,1658,-1,-1,1661,-1,1663,-1,-1,1666,-1,-1,1669,-1,1673,1672,-1,-1,1685,1676,-1,1684,1679,-1,1683,1682,-1,-1,-1,-1,1693,1688,-1,1692,1691,-1,-1,-1,1695,-1,1697,-1,-1,1710,1701,-1,1703,-1,1707,1706,-1,-1,1709,-1,-1,1714,1713,-1,-1,-1,1941,1824,1731,1724,1721,-1,1723,-1,-1,1726,-1,1728,-1,1730,-1,-1,1745,1734,-1,1740,1739,1738,-1,-1,-1,1744,1743,-1,-1,-1,1797,1760,1749,-1,1753,1752,-1,-1,1755,-1,1757,-1,1759,-1,-1,1772,1767,1764,-1,1766,-1,-1,1769,-1,1771,-1,-1,1794,1787,1786,1781,1778,-1,1780,-1,-1,1785,1784,-1,-1,-1,-1,1791,1790,-1,-1,1793,-1,-1,1796,-1,-1,1817,1802,1801,-1,-1,1810,1807,1806,-1,-1,1809,-1,-1,1814,1813,-1,-1,1816,-1,-1,1821,1820,-1,-1,1823,-1,-1,1838,1829,1828,-1,-1,1837,1836,1835,1834,-1,-1,-1,-1,-1,1870,1857,1854,1849,1846,1845,-1,-1,1848,-1,-1,1851,-1,1853,-1,-1,1856,-1,-1,1865,1860,-1,1864,1863,-1,-1,-1,1869,1868,-1,-1,-1,1926,1919,1912,1903,1898,1891,1884,1883,1880,-1,1882,-1,-1,-1,1890,1887,-1,1889,-1,-1,-1,1895,1894,-1,-1,1897,-1,-1,1900,-1,1902,-1,-1,1911,1908,1907,-1,-1,1910,-1,-1,-1,1914,-1,1916,-1,1918,-1,-1,1923,1922,-1,-1,1925,-1,-1,1940,1939,1936,1931,-1,1935,1934,-1,-1,-1,1938,-1,-1,-1,-1,1957,1948,1945,-1,1947,-1,-1,1950,-1,1956,1955,1954,-1,-1,-1,-1,1961,1960,-1,-1,1963,-1,1965,-1,-1,2776,2091,2012,2011,1994,1983,1978,1975,-1,1977,-1,-1,1982,1981,-1,-1,-1,1989,1986,-1,1988,-1,-1,1991,-1,1993,-1,-1,2000,1999,1998,-1,-1,-1,2008,2005,2004,-1,-1,2007,-1,-1,2010,-1,-1,-1,2048,2017,2016,-1,-1,2035,2024,2023,2022,-1,-1,-1,2028,2027,-1,-1,2032,2031,-1,-1,2034,-1,-1,2047,2042,2041,2040,-1,-1,-1,2044,-1,2046,-1,-1,-1,2076,2053,2052,-1,-1,2073,2066,2063,2060,2059,-1,-1,2062,-1,-1,2065,-1,-1,2070,2069,-1,-1,2072,-1,-1,2075,-1,-1,2078,-1,2080,-1,2084,2083,-1,-1,2086,-1,2088,-1,2090,-1,-1,2425,2386,2167,2140,2139,2116,2109,2104,2101,-1,2103,-1,-1,2106,-1,2108,-1,-1,2111,-1,2115,2114,-1,-1,-1,2128,2123,2120,-1,2122,-1,-1,2127,2126,-1,-1,-1,2134,2131,-1,2133,-1,-1,2138,2137,-1,-1,-1,-1,2160,2159,2144,-1,2150,2149,2148,-1,-1,-1,2154,2153,-1,-1,2156,-1,2158,-1,-1,-1,2166,2163,-1,2165,-1,-1,-1,2277,2202,2185,2178,2173,-1,2177,2176,-1,-1,-1,2182,2181,-1,-1,2184,-1,-1,2199,2192,2191,2190,-1,-1,-1,2194,-1,2196,-1,2198,-1,-1,2201,-1,-1,2226,2219,2212,2211,2210,2209,-1,-1,-1,-1,2216,2215,-1,-1,2218,-1,-1,2223,2222,-1,-1,2225,-1,-1,2238,2237,2232,2231,-1,-1,2236,2235,-1,-1,-1,-1,2258,2245,2244,2243,-1,-1,-1,2249,2248,-1,-1,2253,2252,-1,-1,2255,-1,2257,-1,-1,2264,2263,2262,-1,-1,-1,2272,2269,2268,-1,-1,2271,-1,-1,2274,-1,2276,-1,-1,2293,2290,2283,2282,-1,-1,2289,2286,-1,2288,-1,-1,-1,2292,-1,-1,2361,2348,2335,2324,2305,2302,2301,-1,-1,2304,-1,-1,2309,2308,-1,-1,2317,2314,2313,-1,-1,2316,-1,-1,2321,2320,-1,-1,2323,-1,-1,2334,2333,2332,2329,-1,2331,-1,-1,-1,-1,-1,2345,2340,2339,-1,-1,2342,-1,2344,-1,-1,2347,-1,-1,2356,2355,2354,2353,-1,-1,-1,-1,2358,-1,2360,-1,-1,2373,2368,2367,2366,-1,-1,-1,2370,-1,2372,-1,-1,2379,2376,-1,2378,-1,-1,2381,-1,2383,-1,2385,-1,-1,2402,2401,2392,2391,-1,-1,2394,-1,2398,2397,-1,-1,2400,-1,-1,-1,2418,2409,2406,-1,2408,-1,-1,2417,2412,-1,2414,-1,2416,-1,-1,-1,2420,-1,2422,-1,2424,-1,-1,2455,2444,2443,2438,2435,2434,2433,-1,-1,-1,2437,-1,-1,2440,-1,2442,-1,-1,-1,2452,2449,2448,-1,-1,2451,-1,-1,2454,-1,-1,2485,2462,2459,-1,2461,-1,-1,2474,2471,2470,2467,-1,2469,-1,-1,-1,2473,-1,-1,2480,2479,2478,-1,-1,-1,2482,-1,2484,-1,-1,2743,2540,2513,2496,2495,2494,2493,-1,-1,-1,-1,2508,2503,2502,2501,-1,-1,-1,2505,-1,2507,-1,-1,2512,2511,-1,-1,-1,2515,-1,2517,-1,2533,2532,2521,-1,2523,-1,2527,2526,-1,-1,2529,-1,2531,-1,-1,-1,2537,2536,-1,-1,2539,-1,-1,2592,2557,2546,2545,-1,-1,2552,2551,2550,-1,-1,-1,2556,2555,-1,-1,-1,2569,2564,2561,-1,2563,-1,-1,2568,2567,-1,-1,-1,2585,2578,2577,2574,-1,2576,-1,-1,-1,2584,2581,-1,2583,-1,-1,-1,2589,2588,-1,-1,2591,-1,-1,2664,2661,2632,2609,2606,2603,2602,2601,-1,-1,-1,2605,-1,-1,2608,-1,-1,2625,2618,2615,2614,-1,-1,2617,-1,-1,2622,2621,-1,-1,2624,-1,-1,2627,-1,2629,-1,2631,-1,-1,2656,2639,2636,-1,2638,-1,-1,2651,2646,2643,-1,2645,-1,-1,2648,-1,2650,-1,-1,2655,2654,-1,-1,-1,2658,-1,2660,-1,-1,2663,-1,-1,2670,2669,2668,-1,-1,-1,2706,2679,2676,2675,-1,-1,2678,-1,-1,2689,2686,2683,-1,2685,-1,-1,2688,-1,-1,2703,2702,2695,2694,-1,-1,2697,-1,2699,-1,2701,-1,-1,-1,2705,-1,-1,2734,2709,-1,2721,2712,-1,2718,2715,-1,2717,-1,-1,2720,-1,-1,2723,-1,2733,2728,2727,-1,-1,2730,-1,2732,-1,-1,-1,2740,2737,-1,2739,-1,-1,2742,-1,-1,2757,2750,2749,2748,-1,-1,-1,2752,-1,2756,2755,-1,-1,-1,2769,2764,2761,-1,2763,-1,-1,2766,-1,2768,-1,-1,2775,2772,-1,2774,-1,-1,-1,3398,3059,3014,2879,2800,2793,2788,2787,2786,-1,-1,-1,2790,-1,2792,-1,-1,2795,-1,2797,-1,2799,-1,-1,2802,-1,2860,2837,2828,2811,2810,2809,-1,-1,-1,2817,2816,2815,-1,-1,-1,2825,2822,2821,-1,-1,2824,-1,-1,2827,-1,-1,2830,-1,2834,2833,-1,-1,2836,-1,-1,2841,2840,-1,-1,2853,2846,2845,-1,-1,2850,2849,-1,-1,2852,-1,-1,2857,2856,-1,-1,2859,-1,-1,2878,2877,2876,2871,2866,-1,2870,2869,-1,-1,-1,2875,2874,-1,-1,-1,-1,-1,-1,2943,2906,2885,2884,-1,-1,2889,2888,-1,-1,2903,2896,2895,2894,-1,-1,-1,2900,2899,-1,-1,2902,-1,-1,2905,-1,-1,2924,2913,2910,-1,2912,-1,-1,2917,2916,-1,-1,2921,2920,-1,-1,2923,-1,-1,2926,-1,2938,2933,2930,-1,2932,-1,-1,2937,2936,-1,-1,-1,2942,2941,-1,-1,-1,3001,2990,2959,2956,2949,-1,2951,-1,2953,-1,2955,-1,-1,2958,-1,-1,2965,2964,2963,-1,-1,-1,2977,2972,2971,2970,-1,-1,-1,2976,2975,-1,-1,-1,2987,2986,2983,2982,-1,-1,2985,-1,-1,-1,2989,-1,-1,2996,2993,-1,2995,-1,-1,2998,-1,3000,-1,-1,3009,3008,3007,3006,-1,-1,-1,-1,3013,3012,-1,-1,-1,3036,3023,3020,3019,-1,-1,3022,-1,-1,3029,3028,3027,-1,-1,-1,3031,-1,3033,-1,3035,-1,-1,3050,3041,3040,-1,-1,3045,3044,-1,-1,3049,3048,-1,-1,-1,3052,-1,3054,-1,3056,-1,3058,-1,-1,3165,3098,3089,3070,3067,3066,-1,-1,3069,-1,-1,3080,3075,3074,-1,-1,3079,3078,-1,-1,-1,3082,-1,3084,-1,3088,3087,-1,-1,-1,3095,3094,3093,-1,-1,-1,3097,-1,-1,3132,3121,3108,3107,3104,-1,3106,-1,-1,-1,3118,3117,3114,3113,-1,-1,3116,-1,-1,-1,3120,-1,-1,3131,3126,3125,-1,-1,3128,-1,3130,-1,-1,-1,3150,3135,-1,3139,3138,-1,-1,3141,-1,3147,3144,-1,3146,-1,-1,3149,-1,-1,3158,3157,3156,3155,-1,-1,-1,-1,3160,-1,3162,-1,3164,-1,-1,3283,3258,3193,3180,3171,-1,3175,3174,-1,-1,3177,-1,3179,-1,-1,3184,3183,-1,-1,3188,3187,-1,-1,3192,3191,-1,-1,-1,3227,3210,3201,3200,3199,-1,-1,-1,3207,3206,3205,-1,-1,-1,3209,-1,-1,3216,3215,3214,-1,-1,-1,3222,3219,-1,3221,-1,-1,3224,-1,3226,-1,-1,3229,-1,3249,3236,3233,-1,3235,-1,-1,3242,3239,-1,3241,-1,-1,3246,3245,-1,-1,3248,-1,-1,3255,3254,3253,-1,-1,-1,3257,-1,-1,3270,3263,3262,-1,-1,3267,3266,-1,-1,3269,-1,-1,3272,-1,3276,3275,-1,-1,3280,3279,-1,-1,3282,-1,-1,3379,3354,3301,3292,3291,3290,-1,-1,-1,3296,3295,-1,-1,3298,-1,3300,-1,-1,3327,3318,3311,3306,-1,3308,-1,3310,-1,-1,3313,-1,3317,3316,-1,-1,-1,3324,3323,3322,-1,-1,-1,3326,-1,-1,3337,3336,3331,-1,3333,-1,3335,-1,-1,-1,3347,3340,-1,3344,3343,-1,-1,3346,-1,-1,3351,3350,-1,-1,3353,-1,-1,3362,3361,3360,3359,-1,-1,-1,-1,3374,3373,3370,3369,3368,-1,-1,-1,3372,-1,-1,-1,3378,3377,-1,-1,-1,3397,3396,3387,3384,-1,3386,-1,-1,3395,3392,3391,-1,-1,3394,-1,-1,-1,-1,-1,3496,3449,3424,3423,3418,3413,3410,3409,3408,-1,-1,-1,3412,-1,-1,3415,-1,3417,-1,-1,3420,-1,3422,-1,-1,-1,3436,3435,3432,3431,3430,-1,-1,-1,3434,-1,-1,-1,3442,3439,-1,3441,-1,-1,3446,3445,-1,-1,3448,-1,-1,3495,3464,3463,3460,3457,3456,-1,-1,3459,-1,-1,3462,-1,-1,-1,3468,3467,-1,-1,3476,3473,3472,-1,-1,3475,-1,-1,3488,3483,3480,-1,3482,-1,-1,3485,-1,3487,-1,-1,3494,3493,3492,-1,-1,-1,-1,-1,3550,3549,3504,3503,3502,-1,-1,-1,3516,3509,3508,-1,-1,3515,3512,-1,3514,-1,-1,-1,3534,3531,3528,3527,3524,3523,-1,-1,3526,-1,-1,-1,3530,-1,-1,3533,-1,-1,3538,3537,-1,-1,3542,3541,-1,-1,3544,-1,3546,-1,3548,-1,-1,-1,3584,3573,3566,3565,3558,3557,-1,-1,3562,3561,-1,-1,3564,-1,-1,-1,3570,3569,-1,-1,3572,-1,-1,3575,-1,3583,3580,3579,-1,-1,3582,-1,-1,-1,3620,3605,3594,3591,3590,-1,-1,3593,-1,-1,3602,3599,3598,-1,-1,3601,-1,-1,3604,-1,-1,3615,3610,3609,-1,-1,3614,3613,-1,-1,-1,3619,3618,-1,-1,-1,3632,3625,3624,-1,-1,3629,3628,-1,-1,3631,-1,-1,3634,-1,3636,-1,-1,4197,3872,3665,3662,3643,-1,3645,-1,3651,3650,3649,-1,-1,-1,3655,3654,-1,-1,3657,-1,3659,-1,3661,-1,-1,3664,-1,-1,3739,3738,3691,3680,3671,-1,3673,-1,3677,3676,-1,-1,3679,-1,-1,3682,-1,3684,-1,3690,3689,3688,-1,-1,-1,-1,3715,3712,3709,3706,3699,3698,-1,-1,3703,3702,-1,-1,3705,-1,-1,3708,-1,-1,3711,-1,-1,3714,-1,-1,3727,3722,3719,-1,3721,-1,-1,3726,3725,-1,-1,-1,3733,3730,-1,3732,-1,-1,3735,-1,3737,-1,-1,-1,3795,3784,3751,3746,3745,-1,-1,3748,-1,3750,-1,-1,3779,3772,3767,3762,3759,3758,-1,-1,3761,-1,-1,3766,3765,-1,-1,-1,3769,-1,3771,-1,-1,3778,3775,-1,3777,-1,-1,-1,3783,3782,-1,-1,-1,3788,3787,-1,-1,3790,-1,3792,-1,3794,-1,-1,3807,3802,3801,3800,-1,-1,-1,3806,3805,-1,-1,-1,3839,3816,3813,3812,-1,-1,3815,-1,-1,3834,3829,3822,3821,-1,-1,3826,3825,-1,-1,3828,-1,-1,3833,3832,-1,-1,-1,3838,3837,-1,-1,-1,3857,3852,3847,3846,3845,-1,-1,-1,3851,3850,-1,-1,-1,3856,3855,-1,-1,-1,3871,3868,3865,3862,-1,3864,-1,-1,3867,-1,-1,3870,-1,-1,-1,4154,4015,3904,3891,3886,3881,3880,-1,-1,3885,3884,-1,-1,-1,3890,3889,-1,-1,-1,3893,-1,3897,3896,-1,-1,3903,3900,-1,3902,-1,-1,-1,3916,3915,3912,3909,-1,3911,-1,-1,3914,-1,-1,-1,3966,3947,3924,3921,-1,3923,-1,-1,3932,3929,3928,-1,-1,3931,-1,-1,3944,3937,3936,-1,-1,3939,-1,3943,3942,-1,-1,-1,3946,-1,-1,3951,3950,-1,-1,3965,3964,3959,3956,-1,3958,-1,-1,3963,3962,-1,-1,-1,-1,-1,4002,3985,3976,3973,3972,-1,-1,3975,-1,-1,3978,-1,3982,3981,-1,-1,3984,-1,-1,3989,3988,-1,-1,3991,-1,3999,3998,3995,-1,3997,-1,-1,-1,4001,-1,-1,4004,-1,4010,4009,4008,-1,-1,-1,4012,-1,4014,-1,-1,4149,4124,4035,4034,4033,4022,-1,4026,4025,-1,-1,4028,-1,4032,4031,-1,-1,-1,-1,-1,4083,4054,4041,4040,-1,-1,4051,4050,4047,4046,-1,-1,4049,-1,-1,-1,4053,-1,-1,4062,4059,4058,-1,-1,4061,-1,-1,4082,4075,4066,-1,4070,4069,-1,-1,4072,-1,4074,-1,-1,4077,-1,4081,4080,-1,-1,-1,-1,4119,4114,4101,4092,4091,4090,-1,-1,-1,4094,-1,4100,4097,-1,4099,-1,-1,-1,4105,4104,-1,-1,4111,4110,4109,-1,-1,-1,4113,-1,-1,4118,4117,-1,-1,-1,4123,4122,-1,-1,-1,4126,-1,4146,4141,4132,4131,-1,-1,4134,-1,4136,-1,4138,-1,4140,-1,-1,4143,-1,4145,-1,-1,4148,-1,-1,4153,4152,-1,-1,-1,4172,4157,-1,4167,4164,4161,-1,4163,-1,-1,4166,-1,-1,4169,-1,4171,-1,-1,4178,4175,-1,4177,-1,-1,4184,4181,-1,4183,-1,-1,4192,4189,4188,-1,-1,4191,-1,-1,4194,-1,4196,-1,-1,4715,4414,4343,4342,4241,4204,-1,4232,4219,4210,4209,-1,-1,4218,4217,4214,-1,4216,-1,-1,-1,-1,4227,4226,4223,-1,4225,-1,-1,-1,4231,4230,-1,-1,-1,4236,4235,-1,-1,4238,-1,4240,-1,-1,4339,4278,4257,4256,4249,4248,-1,-1,4253,4252,-1,-1,4255,-1,-1,-1,4269,4260,-1,4264,4263,-1,-1,4268,4267,-1,-1,-1,4275,4274,4273,-1,-1,-1,4277,-1,-1,4306,4283,4282,-1,-1,4293,4292,4291,4288,-1,4290,-1,-1,-1,-1,4303,4296,-1,4302,4301,4300,-1,-1,-1,-1,4305,-1,-1,4314,4311,4310,-1,-1,4313,-1,-1,4324,4321,4320,4319,-1,-1,-1,4323,-1,-1,4338,4335,4330,4329,-1,-1,4332,-1,4334,-1,-1,4337,-1,-1,-1,4341,-1,-1,-1,4385,4374,4369,4364,4359,4354,4351,-1,4353,-1,-1,4356,-1,4358,-1,-1,4361,-1,4363,-1,-1,4368,4367,-1,-1,-1,4373,4372,-1,-1,-1,4376,-1,4380,4379,-1,-1,4384,4383,-1,-1,-1,4401,4394,4391,4390,-1,-1,4393,-1,-1,4400,4399,4398,-1,-1,-1,-1,4405,4404,-1,-1,4411,4410,4409,-1,-1,-1,4413,-1,-1,4492,4443,4422,4419,-1,4421,-1,-1,4424,-1,4442,4439,4436,4429,-1,4431,-1,4433,-1,4435,-1,-1,4438,-1,-1,4441,-1,-1,-1,4461,4456,4451,4448,-1,4450,-1,-1,4453,-1,4455,-1,-1,4458,-1,4460,-1,-1,4465,4464,-1,-1,4477,4468,-1,4470,-1,4472,-1,4474,-1,4476,-1,-1,4483,4482,4481,-1,-1,-1,4485,-1,4489,4488,-1,-1,4491,-1,-1,4622,4519,4504,4497,-1,4501,4500,-1,-1,4503,-1,-1,4508,4507,-1,-1,4518,4515,4514,4513,-1,-1,-1,4517,-1,-1,-1,4607,4588,4539,4534,4531,4528,4527,-1,-1,4530,-1,-1,4533,-1,-1,4536,-1,4538,-1,-1,4541,-1,4553,4550,4547,4546,-1,-1,4549,-1,-1,4552,-1,-1,4559,4556,-1,4558,-1,-1,4565,4562,-1,4564,-1,-1,4581,4572,4571,4570,-1,-1,-1,4580,4577,4576,-1,-1,4579,-1,-1,-1,4587,4584,-1,4586,-1,-1,-1,4592,4591,-1,-1,4596,4595,-1,-1,4606,4599,-1,4603,4602,-1,-1,4605,-1,-1,-1,4619,4616,4613,4612,-1,-1,4615,-1,-1,4618,-1,-1,4621,-1,-1,4686,4647,4640,4637,4632,4629,-1,4631,-1,-1,4634,-1,4636,-1,-1,4639,-1,-1,4644,4643,-1,-1,4646,-1,-1,4649,-1,4677,4668,4663,4656,4655,-1,-1,4660,4659,-1,-1,4662,-1,-1,4665,-1,4667,-1,-1,4670,-1,4674,4673,-1,-1,4676,-1,-1,4679,-1,4681,-1,4685,4684,-1,-1,-1,4698,4693,4690,-1,4692,-1,-1,4695,-1,4697,-1,-1,4700,-1,4712,4711,4706,4705,-1,-1,4708,-1,4710,-1,-1,-1,4714,-1,-1,4735,4730,4723,4722,4721,-1,-1,-1,4725,-1,4727,-1,4729,-1,-1,4732,-1,4734,-1,-1,4741,4738,-1,4740,-1,-1,4743,-1,4747,4746,-1,-1,4751,4750,-1,-1,4753,-1,4755,-1,4757,-1,4759,-1,-1,4990,4915,4914,4833,4828,4777,4772,4769,-1,4771,-1,-1,4774,-1,4776,-1,-1,4817,4794,4789,4784,4783,-1,-1,4786,-1,4788,-1,-1,4791,-1,4793,-1,-1,4800,4799,4798,-1,-1,-1,4806,4803,-1,4805,-1,-1,4814,4811,4810,-1,-1,4813,-1,-1,4816,-1,-1,4823,4822,4821,-1,-1,-1,4827,4826,-1,-1,-1,4832,4831,-1,-1,-1,4835,-1,4875,4844,4839,-1,4843,4842,-1,-1,-1,4854,4851,4850,4849,-1,-1,-1,4853,-1,-1,4870,4861,4858,-1,4860,-1,-1,4867,4866,4865,-1,-1,-1,4869,-1,-1,4874,4873,-1,-1,-1,4887,4886,4881,4880,-1,-1,4883,-1,4885,-1,-1,-1,4897,4894,4891,-1,4893,-1,-1,4896,-1,-1,4911,4906,4901,-1,4905,4904,-1,-1,-1,4908,-1,4910,-1,-1,4913,-1,-1,-1,4979,4978,4931,4920,-1,4926,4925,4924,-1,-1,-1,4928,-1,4930,-1,-1,4943,4942,4935,-1,4941,4940,4939,-1,-1,-1,-1,-1,4963,4956,4949,4948,-1,-1,4953,4952,-1,-1,4955,-1,-1,4960,4959,-1,-1,4962,-1,-1,4965,-1,4973,4972,4971,4970,-1,-1,-1,-1,4977,4976,-1,-1,-1,-1,4981,-1,4989,4988,4985,-1,4987,-1,-1,-1,-1,5838,5425,5404,5155,5072,5007,5004,5001,5000,-1,-1,5003,-1,-1,5006,-1,-1,5037,5028,5019,5018,5013,-1,5015,-1,5017,-1,-1,-1,5027,5022,-1,5026,5025,-1,-1,-1,-1,5036,5031,-1,5033,-1,5035,-1,-1,-1,5055,5050,5043,5042,-1,-1,5047,5046,-1,-1,5049,-1,-1,5052,-1,5054,-1,-1,5067,5062,5059,-1,5061,-1,-1,5066,5065,-1,-1,-1,5069,-1,5071,-1,-1,5100,5083,5082,5081,5080,5079,-1,-1,-1,-1,-1,5089,5086,-1,5088,-1,-1,5099,5096,5095,5094,-1,-1,-1,5098,-1,-1,-1,5128,5115,5108,5105,-1,5107,-1,-1,5112,5111,-1,-1,5114,-1,-1,5123,5118,-1,5120,-1,5122,-1,-1,5125,-1,5127,-1,-1,5132,5131,-1,-1,5144,5141,5138,5137,-1,-1,5140,-1,-1,5143,-1,-1,5152,5149,5148,-1,-1,5151,-1,-1,5154,-1,-1,5381,5300,5175,5174,5163,5162,-1,-1,5169,5166,-1,5168,-1,-1,5171,-1,5173,-1,-1,-1,5255,5212,5205,5190,5185,5182,-1,5184,-1,-1,5187,-1,5189,-1,-1,5194,5193,-1,-1,5202,5199,5198,-1,-1,5201,-1,-1,5204,-1,-1,5211,5208,-1,5210,-1,-1,-1,5224,5223,5218,5217,-1,-1,5220,-1,5222,-1,-1,-1,5238,5237,5234,5231,5230,-1,-1,5233,-1,-1,5236,-1,-1,-1,5244,5243,5242,-1,-1,-1,5246,-1,5250,5249,-1,-1,5252,-1,5254,-1,-1,5287,5280,5269,5264,5261,-1,5263,-1,-1,5268,5267,-1,-1,-1,5277,5274,5273,-1,-1,5276,-1,-1,5279,-1,-1,5284,5283,-1,-1,5286,-1,-1,5291,5290,-1,-1,5297,5294,-1,5296,-1,-1,5299,-1,-1,5370,5341,5318,5307,5306,-1,-1,5315,5312,5311,-1,-1,5314,-1,-1,5317,-1,-1,5326,5321,-1,5325,5324,-1,-1,-1,5338,5335,5332,5331,-1,-1,5334,-1,-1,5337,-1,-1,5340,-1,-1,5349,5348,5345,-1,5347,-1,-1,-1,5361,5360,5359,5356,5355,-1,-1,5358,-1,-1,-1,-1,5367,5364,-1,5366,-1,-1,5369,-1,-1,5374,5373,-1,-1,5376,-1,5380,5379,-1,-1,-1,5393,5392,5391,5388,5387,-1,-1,5390,-1,-1,-1,-1,5401,5398,5397,-1,-1,5400,-1,-1,5403,-1,-1,5412,5407,-1,5409,-1,5411,-1,-1,5414,-1,5418,5417,-1,-1,5422,5421,-1,-1,5424,-1,-1,5609,5526,5455,5452,5441,5440,5435,5434,-1,-1,5439,5438,-1,-1,-1,-1,5447,5446,5445,-1,-1,-1,5451,5450,-1,-1,-1,5454,-1,-1,5489,5460,5459,-1,-1,5488,5471,5466,5465,-1,-1,5470,5469,-1,-1,-1,5477,5474,-1,5476,-1,-1,5483,5480,-1,5482,-1,-1,5485,-1,5487,-1,-1,-1,5491,-1,5515,5504,5499,5498,5497,-1,-1,-1,5501,-1,5503,-1,-1,5514,5509,5508,-1,-1,5511,-1,5513,-1,-1,-1,5523,5518,-1,5520,-1,5522,-1,-1,5525,-1,-1,5542,5541,5536,5533,5532,-1,-1,5535,-1,-1,5538,-1,5540,-1,-1,-1,5550,5549,5546,-1,5548,-1,-1,-1,5608,5587,5568,5563,5560,5557,-1,5559,-1,-1,5562,-1,-1,5567,5566,-1,-1,-1,5578,5575,5574,5573,-1,-1,-1,5577,-1,-1,5582,5581,-1,-1,5584,-1,5586,-1,-1,5595,5592,5591,-1,-1,5594,-1,-1,5603,5600,5599,-1,-1,5602,-1,-1,5607,5606,-1,-1,-1,-1,5791,5680,5631,5628,5619,5616,-1,5618,-1,-1,5621,-1,5625,5624,-1,-1,5627,-1,-1,5630,-1,-1,5657,5654,5651,5644,5637,-1,5643,5642,5641,-1,-1,-1,-1,5650,5649,5648,-1,-1,-1,-1,5653,-1,-1,5656,-1,-1,5673,5666,5661,-1,5665,5664,-1,-1,-1,5668,-1,5672,5671,-1,-1,-1,5679,5678,5677,-1,-1,-1,-1,5746,5719,5716,5701,5690,5689,5688,-1,-1,-1,5698,5695,5694,-1,-1,5697,-1,-1,5700,-1,-1,5711,5710,5707,5706,-1,-1,5709,-1,-1,-1,5715,5714,-1,-1,-1,5718,-1,-1,5723,5722,-1,-1,5731,5728,5727,-1,-1,5730,-1,-1,5733,-1,5745,5740,5737,-1,5739,-1,-1,5742,-1,5744,-1,-1,-1,5774,5749,-1,5755,5754,5753,-1,-1,-1,5763,5762,5761,5760,-1,-1,-1,-1,5773,5770,5767,-1,5769,-1,-1,5772,-1,-1,-1,5786,5779,5778,-1,-1,5783,5782,-1,-1,5785,-1,-1,5788,-1,5790,-1,-1,5807,5796,5795,-1,-1,5802,5799,-1,5801,-1,-1,5806,5805,-1,-1,-1,5809,-1,5825,5818,5813,-1,5817,5816,-1,-1,-1,5824,5823,5822,-1,-1,-1,-1,5833,5830,5829,-1,-1,5832,-1,-1,5835,-1,5837,-1,-1,6010,5893,5856,5849,5846,5845,-1,-1,5848,-1,-1,5853,5852,-1,-1,5855,-1,-1,5882,5875,5862,5861,-1,-1,5870,5869,5866,-1,5868,-1,-1,-1,5874,5873,-1,-1,-1,5877,-1,5879,-1,5881,-1,-1,5886,5885,-1,-1,5888,-1,5890,-1,5892,-1,-1,6005,5990,5927,5900,5899,-1,-1,5912,5909,5906,5905,-1,-1,5908,-1,-1,5911,-1,-1,5918,5917,5916,-1,-1,-1,5926,5923,5922,-1,-1,5925,-1,-1,-1,5945,5936,5935,5932,-1,5934,-1,-1,-1,5940,5939,-1,-1,5942,-1,5944,-1,-1,5965,5952,5951,5950,-1,-1,-1,5958,5957,5956,-1,-1,-1,5962,5961,-1,-1,5964,-1,-1,5971,5970,5969,-1,-1,-1,5973,-1,5981,5978,5977,-1,-1,5980,-1,-1,5985,5984,-1,-1,5987,-1,5989,-1,-1,6002,6001,6000,5999,5998,5997,-1,-1,-1,-1,-1,-1,6004,-1,-1,6007,-1,6009,-1,-1,6106,6105,6062,6025,6020,6019,6018,-1,-1,-1,6022,-1,6024,-1,-1,6049,6040,6037,6034,6031,-1,6033,-1,-1,6036,-1,-1,6039,-1,-1,6046,6045,6044,-1,-1,-1,6048,-1,-1,6061,6054,6053,-1,-1,6060,6057,-1,6059,-1,-1,-1,-1,6076,6067,6066,-1,-1,6073,6072,6071,-1,-1,-1,6075,-1,-1,6090,6089,6082,6081,-1,-1,6088,6085,-1,6087,-1,-1,-1,-1,6100,6095,6094,-1,-1,6097,-1,6099,-1,-1,6102,-1,6104,-1,-1,-1,6110,6109,-1,-1,6114,6113,-1,-1,-1],"feature":[2,0,1,2,2,3,3,3,0,-1,0,-1,-1,0,0,-1,0,0,-1,-1,0,3,-1,-1,3,0,-1,-1,0,0,-1,-1,-1,0,-1,-1,-1,3,3,0,0,0,0,-1,0,-1,-1,0,-1,-1,-1,-1,0,0,3,-1,-1,-1,0,-1,-1,3,0,-1,-1,0,-1,-1,0,3,3,0,0,-1,-1,0,0,0,0,0,0,-1,-1,-1,-1,-1,0,-1,-1,-1,0,-1,0,0,0,-1,0,0,-1,-1,-1,0,-1,-1,0,0,-1,-1,-1,3,3,3,0,0,0,-1,0,0,-1,-1,0,0,-1,-1,0,-1,0,-1,-1,-1,-1,-1,0,3,0,0,0,-1,-1,0,-1,0,-1,-1,-1,3,0,3,0,0,-1,0,-1,-1,-1,0,0,-1,-1,0,-1,-1,3,0,-1,-1,0,-1,-1,0,-1,0,3,-1,3,-1,-1,0,3,3,0,-1,-1,3,-1,-1,-1,3,0,3,-1,-1,-1,-1,3,3,0,-1,0,0,-1,-1,-1,0,-1,0,0,-1,-1,-1,0,3,-1,3,3,0,3,-1,3,-1,-1,-1,-1,0,-1,-1,3,0,-1,-1,3,-1,0,3,3,-1,-1,-1,3,-1,-1,0,0,3,-1,-1,3,-1,0,0,3,0,3,-1,-1,3,-1,-1,-1,3,-1,-1,3,-1,3,-1,3,-1,-1,3,-1,3,0,0,-1,-1,-1,-1,3,0,-1,0,-1,-1,3,3,0,3,0,-1,-1,0,-1,-1,3,-1,-1,3,-1,0,3,0,-1,-1,0,-1,-1,3,-1,-1,0,3,3,-1,-1,-1,0,3,-1,-1,3,-1,-1,0,0,0,3,3,-1,-1,3,-1,3,-1,3,3,-1,3,-1,-1,3,3,-1,-1,3,-1,3,-1,-1,0,3,3,0,0,3,-1,3,-1,-1,3,0,-1,0,-1,-1,3,0,-1,0,-1,-1,0,-1,0,-1,-1,3,3,-1,-1,-1,3,-1,0,0,0,-1,-1,0,-1,-1,-1,3,3,0,3,3,0,-1,0,0,-1,-1,-1,0,3,-1,3,3,-1,-1,-1,0,3,3,-1,-1,3,-1,3,-1,-1,3,0,-1,-1,3,0,3,-1,-1,3,-1,-1,0,3,3,-1,-1,-1,-1,3,0,-1,-1,0,-1,0,3,-1,-1,-1,3,3,3,-1,-1,3,-1,-1,3,-1,-1,3,0,-1,-1,0,3,-1,-1,3,-1,-1,0,-1,-1,3,3,0,3,3,0,-1,0,-1,-1,0,0,-1,-1,-1,0,0,-1,-1,-1,3,3,0,-1,-1,0,-1,-1,0,-1,-1,3,-1,0,0,3,0,3,0,-1,-1,0,-1,-1,3,-1,-1,0,3,0,-1,-1,0,-1,-1,3,-1,-1,3,3,-1,3,-1,-1,-1,3,-1,3,3,-1,-1,-1,3,0,0,0,3,-1,-1,-1,3,-1,-1,0,3,-1,-1,-1,3,3,3,3,-1,-1,-1,-1,3,-1,0,-1,-1,3,3,3,-1,-1,3,3,3,-1,3,-1,-1,-1,3,-1,3,-1,-1,3,-1,-1,3,3,-1,3,-1,-1,3,-1,3,3,-1,-1,3,3,3,-1,-1,-1,-1,2,2,-1,0,3,0,0,3,0,-1,-1,0,-1,-1,0,3,-1,-1,0,3,-1,-1,3,-1,-1,0,0,3,0,-1,0,-1,0,-1,-1,0,-1,0,-1,0,-1,-1,3,-1,-1,0,3,-1,-1,3,-1,-1,3,0,0,0,-1,-1,-1,0,0,0,0,-1,0,-1,-1,0,-1,-1,-1,0,0,-1,-1,-1,3,-1,0,3,0,0,3,-1,-1,3,-1,-1,3,3,0,0,0,-1,-1,0,-1,0,0,-1,-1,-1,-1,0,0,0,-1,-1,-1,0,0,-1,-1,-1,0,0,0,-1,-1,-1,-1,3,0,0,0,0,-1,0,0,-1,-1,-1,0,0,-1,-1,-1,-1,-1,3,0,-1,0,0,3,0,3,-1,-1,-1,0,-1,-1,-1,3,-1,-1,0,3,3,0,-1,-1,3,3,-1,-1,-1,0,-1,-1,0,3,-1,-1,0,-1,3,-1,0,-1,-1,3,3,0,3,-1,-1,3,0,-1,-1,0,-1,-1,0,3,-1,-1,3,0,-1,-1,0,-1,-1,3,-1,0,-1,3,0,-1,-1,3,-1,-1,3,3,3,-1,-1,-1,3,3,3,-1,-1,3,-1,3,-1,-1,3,-1,-1,0,3,0,0,3,3,-1,-1,-1,3,0,3,-1,-1,3,0,0,-1,-1,-1,0,0,-1,-1,-1,0,-1,0,-1,0,-1,-1,3,0,0,-1,0,0,-1,-1,0,-1,-1,0,-1,-1,0,0,3,0,0,0,-1,0,-1,-1,-1,-1,0,0,-1,-1,0,0,-1,-1,-1,3,-1,-1,3,-1,-1,3,-1,3,3,0,0,3,0,3,-1,-1,3,0,-1,-1,0,-1,-1,0,0,-1,-1,-1,0,3,3,0,-1,-1,0,-1,-1,0,-1,-1,3,0,0,3,-1,-1,3,0,-1,-1,0,-1,-1,3,-1,-1,0,0,0,-1,-1,-1,-1,3,0,0,-1,-1,-1,0,3,-1,-1,3,0,-1,-1,0,-1,-1,3,0,3,0,3,-1,3,-1,-1,0,3,-1,-1,0,-1,0,3,-1,-1,0,3,-1,-1,3,0,-1,-1,0,-1,-1,3,0,0,0,3,3,0,-1,-1,3,-1,-1,0,-1,0,-1,-1,3,3,-1,-1,-1,3,3,3,-1,-1,-1,-1,3,3,-1,-1,0,-1,3,-1,-1,-1,3,0,0,3,0,-1,0,-1,-1,3,0,3,0,-1,-1,0,-1,-1,3,-1,-1,3,0,-1,-1,0,3,0,-1,-1,0,-1,-1,3,-1,-1,3,3,-1,3,3,-1,-1,-1,3,3,-1,-1,-1,3,-1,3,3,-1,-1,3,-1,3,3,-1,-1,-1,0,-1,3,-1,-1,0,0,0,-1,-1,0,3,-1,0,-1,-1,0,-1,3,3,-1,-1,-1,3,0,-1,-1,-1,0,3,0,-1,-1,0,-1,-1,-1,3,3,3,3,3,-1,-1,-1,3,-1,-1,-1,3,3,-1,-1,3,-1,3,-1,3,-1,-1,0,0,1,0,2,2,3,-1,0,3,0,3,-1,-1,3,-1,3,-1,0,-1,-1,-1,-1,0,3,0,3,3,-1,3,-1,-1,3,-1,3,3,-1,3,3,-1,-1,3,-1,-1,-1,3,3,3,-1,-1,-1,3,3,-1,-1,3,-1,3,-1,-1,-1,3,3,0,3,-1,3,-1,-1,3,3,-1,-1,-1,0,3,-1,-1,3,-1,-1,3,3,0,-1,-1,0,-1,-1,0,3,3,-1,3,-1,-1,-1,-1,3,0,3,0,-1,-1,0,-1,-1,3,0,-1,-1,0,-1,-1,0,3,3,3,-1,-1,3,-1,-1,3,3,-1,-1,3,-1,-1,3,0,3,-1,3,-1,3,-1,3,-1,-1,3,0,3,3,-1,-1,-1,3,-1,3,-1,-1,3,3,0,-1,-1,0,-1,-1,0,-1,-1,0,3,-1,3,3,-1,-1,-1,3,-1,-1,0,3,2,3,3,2,-1,0,-1,-1,2,-1,0,-1,-1,3,3,0,-1,-1,-1,0,2,-1,-1,-1,3,0,-1,-1,3,3,0,3,-1,-1,3,-1,-1,-1,0,-1,-1,0,3,2,3,-1,-1,3,2,3,-1,3,-1,-1,3,-1,3,-1,-1,3,-1,3,-1,2,-1,-1,2,-1,-1,2,-1,2,3,-1,-1,3,3,-1,-1,3,3,-1,-1,3,-1,-1,3,2,0,0,-1,-1,-1,0,-1,0,-1,-1,0,2,2,3,-1,-1,3,3,-1,3,3,-1,-1,3,-1,3,-1,-1,3,-1,-1,3,-1,3,3,-1,-1,3,-1,3,3,3,-1,3,-1,-1,-1,-1,3,3,2,3,0,-1,-1,0,-1,-1,3,0,2,-1,-1,2,-1,-1,2,0,-1,-1,0,-1,-1,3,-1,2,0,2,-1,-1,-1,0,-1,-1,3,3,2,0,2,-1,3,-1,-1,3,-1,-1,3,0,3,-1,-1,3,-1,-1,0,-1,-1,0,-1,-1,0,3,-1,2,-1,-1,-1,2,0,3,0,3,0,0,0,-1,-1,-1,-1,0,3,-1,-1,0,0,3,-1,-1,3,-1,-1,3,-1,-1,3,0,0,0,3,-1,-1,3,-1,-1,3,-1,-1,3,-1,-1,0,0,-1,-1,0,-1,-1,3,-1,3,0,0,3,-1,3,-1,-1,0,0,3,0,-1,-1,3,0,-1,-1,0,-1,-1,3,3,-1,-1,-1,3,0,-1,0,-1,-1,0,-1,0,-1,-1,3,-1,-1,0,-1,0,3,-1,-1,3,0,-1,0,0,-1,0,0,-1,-1,-1,-1,0,0,-1,0,3,-1,-1,-1,0,-1,3,-1,-1,3,3,-1,3,-1,3,3,-1,-1,3,-1,-1,3,3,-1,-1,-1,0,3,0,3,3,-1,3,-1,-1,3,-1,3,-1,3,-1,-1,0,3,-1,3,3,3,-1,-1,-1,3,3,-1,-1,-1,0,0,3,-1,3,3,-1,-1,3,-1,3,-1,3,-1,-1,0,3,3,-1,3,-1,-1,3,-1,3,-1,-1,3,3,3,0,3,-1,3,-1,-1,3,3,-1,-1,-1,-1,3,0,-1,-1,0,-1,-1,0,-1,-1,3,3,0,-1,-1,0,3,3,-1,-1,3,-1,-1,3,3,-1,-1,3,-1,-1,3,0,-1,-1,0,-1,-1,0,3,3,-1,-1,3,3,3,3,-1,-1,-1,-1,-1,0,0,3,3,3,3,-1,-1,3,-1,-1,3,-1,3,-1,-1,3,-1,-1,3,3,-1,3,3,-1,-1,-1,3,3,-1,-1,-1,3,3,3,3,0,3,3,0,0,-1,0,-1,-1,-1,0,0,-1,0,-1,-1,-1,0,0,-1,-1,0,-1,-1,3,-1,3,-1,-1,0,0,0,-1,-1,0,-1,-1,-1,0,-1,0,-1,0,-1,-1,0,0,-1,-1,3,-1,-1,0,0,3,0,-1,3,0,-1,-1,-1,0,-1,-1,-1,-1,3,3,3,-1,3,-1,-1,3,-1,3,3,3,-1,-1,-1,-1,3,3,-1,-1,3,-1,3,-1,-1,1,0,3,3,3,2,3,0,-1,0,-1,-1,0,0,-1,-1,-1,3,0,-1,0,-1,-1,0,-1,0,-1,-1,0,2,2,-1,-1,-1,2,0,2,-1,-1,2,-1,-1,0,-1,-1,-1,2,2,3,-1,-1,3,3,0,0,-1,-1,-1,0,3,-1,-1,3,0,-1,-1,0,-1,-1,3,3,3,0,-1,-1,-1,3,-1,3,-1,-1,-1,0,3,0,-1,-1,3,3,3,3,0,-1,-1,0,-1,-1,0,-1,-1,0,3,-1,-1,3,-1,-1,3,-1,-1,3,-1,3,-1,3,3,-1,-1,3,-1,3,-1,3,-1,-1,2,0,2,3,0,0,3,0,0,-1,0,-1,-1,0,-1,3,-1,-1,0,-1,0,0,-1,-1,-1,0,0,3,-1,3,-1,-1,3,3,-1,-1,-1,3,3,-1,0,-1,-1,0,0,-1,-1,-1,-1,0,3,3,-1,3,0,0,-1,-1,-1,3,0,-1,-1,0,-1,0,-1,-1,-1,0,3,-1,0,-1,-1,-1,3,0,3,3,0,-1,0,0,-1,-1,-1,0,0,-1,-1,0,-1,-1,0,3,0,0,-1,-1,-1,3,-1,0,-1,0,-1,-1,3,-1,-1,0,0,0,3,3,3,-1,-1,-1,-1,3,3,-1,-1,3,-1,-1,3,3,-1,-1,3,-1,-1,3,0,0,0,-1,-1,0,0,-1,-1,-1,-1,0,3,0,0,-1,-1,-1,0,3,-1,-1,3,0,-1,-1,3,-1,0,-1,-1,0,3,3,-1,-1,-1,3,3,0,-1,-1,0,-1,-1,3,-1,0,-1,-1,0,3,3,0,-1,-1,3,3,-1,0,-1,-1,-1,3,-1,-1,3,3,0,3,0,3,0,-1,-1,0,-1,-1,0,0,-1,-1,3,0,0,-1,-1,0,-1,-1,0,0,-1,-1,0,-1,-1,0,0,0,0,-1,0,-1,-1,-1,-1,-1,0,3,0,-1,-1,0,-1,3,-1,-1,3,-1,-1,0,0,0,0,-1,-1,-1,-1,0,-1,0,-1,-1,0,0,3,0,-1,-1,-1,0,-1,3,-1,-1,3,0,-1,0,-1,-1,0,-1,3,-1,0,-1,-1,3,3,3,0,-1,-1,2,-1,0,3,-1,-1,3,-1,-1,-1,0,2,3,-1,3,-1,-1,3,3,-1,3,-1,3,-1,-1,-1,2,-1,3,-1,3,-1,-1,3,0,0,0,0,0,0,-1,-1,-1,0,-1,-1,0,-1,0,-1,-1,-1,0,0,0,-1,-1,0,-1,-1,0,-1,-1,3,0,0,-1,0,-1,-1,0,0,0,0,-1,0,-1,-1,-1,0,-1,-1,0,0,0,-1,-1,-1,0,-1,0,-1,-1,0,3,3,0,0,0,0,-1,-1,-1,-1,0,0,0,0,-1,-1,-1,0,-1,0,-1,-1,0,0,-1,-1,-1,3,-1,0,-1,0,0,0,-1,0,-1,0,0,-1,-1,0,-1,0,-1,-1,-1,0,0,-1,-1,0,-1,-1,3,0,0,3,-1,-1,3,0,0,-1,-1,-1,0,0,-1,-1,-1,0,3,0,-1,0,-1,-1,0,0,-1,-1,-1,0,3,0,0,-1,0,-1,-1,-1,0,0,-1,0,-1,-1,-1,3,0,-1,-1,0,-1,-1,3,0,0,0,3,3,0,0,-1,-1,-1,0,-1,-1,0,-1,-1,3,3,0,0,-1,-1,0,-1,-1,0,0,-1,-1,0,-1,-1,0,-1,0,-1,0,-1,-1,0,0,3,-1,3,-1,-1,3,3,0,-1,0,-1,-1,0,-1,0,-1,-1,0,0,-1,-1,-1,3,-1,3,-1,-1,3,-1,-1,0,3,3,-1,-1,-1,3,0,0,3,-1,-1,3,-1,-1,0,3,0,-1,0,-1,-1,0,-1,-1,0,0,0,3,-1,-1,0,-1,3,-1,3,-1,-1,-1,0,-1,-1,3,0,-1,0,0,-1,3,3,-1,0,-1,-1,0,-1,-1,0,-1,3,3,0,-1,-1,0,-1,0,-1,-1,-1,0,0,-1,3,-1,-1,0,-1,-1,0,3,3,3,-1,-1,-1,3,-1,3,3,-1,-1,-1,3,3,3,-1,3,-1,-1,3,-1,3,-1,-1,3,3,-1,3,-1,-1,-1,0,0,0,2,0,3,3,3,3,-1,-1,-1,3,-1,3,-1,-1,3,-1,3,-1,3,-1,-1,2,-1,3,3,3,0,3,3,-1,-1,-1,3,0,0,-1,-1,-1,0,0,3,-1,-1,3,-1,-1,3,-1,-1,3,-1,0,0,-1,-1,0,-1,-1,0,3,-1,-1,3,0,3,-1,-1,0,3,-1,-1,3,-1,-1,0,0,-1,-1,3,-1,-1,3,3,3,3,3,-1,0,0,-1,-1,-1,0,0,-1,-1,-1,-1,-1,-1,3,0,3,0,-1,-1,3,0,-1,-1,3,3,3,0,-1,-1,-1,3,0,-1,-1,0,-1,-1,0,-1,-1,3,3,0,-1,0,-1,-1,0,3,-1,-1,0,3,-1,-1,3,-1,-1,3,-1,0,0,3,-1,3,-1,-1,3,3,-1,-1,-1,3,3,-1,-1,-1,3,0,0,3,3,-1,3,-1,3,-1,3,-1,-1,3,-1,-1,3,0,0,-1,-1,-1,3,3,0,0,-1,-1,-1,0,0,-1,-1,-1,0,3,0,3,-1,-1,3,-1,-1,-1,3,-1,-1,3,3,-1,3,-1,-1,3,-1,3,-1,-1,0,0,0,3,-1,-1,-1,-1,3,0,-1,-1,-1,3,2,3,3,-1,-1,3,-1,-1,3,3,3,-1,-1,-1,3,-1,3,-1,3,-1,-1,3,3,2,-1,-1,3,2,-1,-1,3,2,-1,-1,-1,2,-1,3,-1,3,-1,3,-1,-1,0,2,3,3,3,0,-1,-1,0,-1,-1,0,3,3,-1,-1,3,3,-1,-1,-1,3,-1,3,-1,3,3,-1,-1,-1,3,0,3,-1,-1,-1,3,-1,-1,0,3,3,3,3,-1,3,-1,-1,-1,3,3,3,3,-1,-1,3,-1,-1,-1,3,-1,-1,3,3,3,-1,-1,3,-1,3,-1,-1,-1,3,3,-1,3,3,-1,-1,3,-1,3,3,-1,3,-1,-1,3,-1,-1,3,3,3,3,-1,-1,-1,-1,3,-1,3,-1,3,-1,-1,3,0,0,2,3,-1,3,3,-1,-1,3,-1,3,-1,-1,3,3,-1,-1,3,3,-1,-1,3,3,-1,-1,-1,3,2,3,0,0,-1,-1,-1,0,3,0,-1,-1,-1,3,-1,-1,3,0,0,-1,-1,-1,3,0,-1,0,-1,-1,0,-1,0,-1,-1,3,-1,0,3,2,-1,0,-1,-1,2,3,-1,0,-1,-1,0,3,-1,-1,3,-1,-1,3,3,2,-1,-1,-1,2,-1,-1,3,3,2,-1,-1,3,2,-1,-1,2,-1,-1,3,-1,3,2,-1,-1,2,3,-1,-1,3,-1,-1,0,3,0,3,3,2,-1,-1,-1,3,3,-1,-1,3,-1,3,-1,-1,3,0,0,2,-1,3,-1,3,-1,-1,2,-1,3,3,-1,-1,-1,3,3,2,-1,-1,-1,2,-1,-1,0,3,2,-1,3,-1,3,-1,-1,-1,3,2,-1,0,3,-1,-1,3,-1,-1,0,3,-1,-1,3,-1,-1,0,3,3,2,-1,-1,-1,-1,3,3,0,3,0,-1,-1,-1,3,-1,-1,-1,3,0,-1,-1,-1,3,3,3,2,-1,3,-1,-1,3,3,2,-1,-1,2,-1,-1,-1,-1,-1,0,3,2,2,3,3,3,0,3,-1,-1,-1,0,-1,-1,3,-1,0,-1,-1,0,-1,3,-1,-1,-1,0,3,3,3,3,-1,-1,-1,3,-1,-1,-1,3,3,-1,3,-1,-1,3,3,-1,-1,3,-1,-1,3,2,2,3,0,3,-1,-1,3,-1,-1,3,-1,-1,-1,3,0,-1,-1,3,3,0,-1,-1,0,-1,-1,3,0,3,-1,3,-1,-1,3,-1,3,-1,-1,3,3,0,-1,-1,-1,-1,-1,2,2,3,0,0,-1,-1,-1,0,3,3,-1,-1,3,3,-1,3,-1,-1,-1,3,3,3,3,0,3,-1,-1,3,-1,-1,-1,0,-1,-1,0,-1,-1,3,0,-1,-1,0,3,-1,-1,3,-1,3,-1,3,-1,-1,-1,3,0,3,3,3,0,-1,-1,0,3,-1,-1,3,-1,-1,-1,0,3,-1,-1,3,-1,-1,3,-1,3,3,3,-1,-1,3,-1,-1,-1,0,3,3,0,3,-1,-1,3,-1,-1,3,0,3,-1,-1,3,-1,-1,0,-1,-1,3,0,3,-1,-1,3,3,-1,-1,-1,3,3,-1,-1,-1,3,3,3,-1,-1,3,3,-1,-1,3,-1,-1,3,-1,3,-1,-1,1,0,2,3,0,-1,3,-1,3,0,0,-1,-1,-1,3,0,-1,-1,0,-1,0,-1,0,-1,-1,0,-1,-1,3,3,3,2,0,-1,0,-1,0,0,-1,-1,0,-1,-1,0,-1,0,-1,0,0,0,-1,-1,-1,-1,2,0,0,0,0,3,-1,-1,0,3,-1,-1,3,-1,-1,3,-1,-1,3,-1,-1,3,-1,-1,0,3,0,-1,0,-1,-1,0,0,-1,-1,-1,3,0,-1,0,-1,-1,0,-1,0,-1,-1,-1,2,0,0,3,3,-1,-1,3,-1,3,-1,-1,3,3,3,3,0,0,-1,-1,0,-1,-1,0,0,-1,-1,-1,0,-1,0,-1,-1,3,0,-1,3,-1,-1,-1,3,3,-1,-1,-1,3,3,-1,-1,3,-1,3,-1,3,-1,-1,3,0,0,0,-1,-1,-1,0,0,-1,-1,-1,0,0,3,3,-1,-1,3,-1,-1,3,3,3,0,-1,-1,0,3,-1,-1,3,-1,-1,3,0,-1,-1,-1,0,3,-1,-1,-1,3,3,3,0,0,-1,-1,-1,0,0,-1,-1,-1,0,0,-1,-1,-1,3,3,0,3,-1,3,-1,-1,3,-1,-1,3,-1,-1,-1,0,2,2,3,3,0,3,-1,-1,0,0,-1,-1,-1,0,0,-1,-1,-1,3,-1,0,0,-1,-1,0,3,-1,0,-1,-1,-1,3,0,0,0,-1,0,-1,-1,0,-1,-1,-1,0,3,3,0,-1,0,-1,-1,0,3,3,-1,-1,3,-1,-1,3,3,0,-1,-1,3,-1,3,0,-1,-1,-1,0,-1,-1,3,0,-1,-1,3,3,3,3,-1,0,-1,-1,0,3,-1,-1,-1,-1,-1,0,0,3,3,3,-1,-1,3,-1,-1,3,-1,3,3,-1,-1,3,-1,-1,3,3,-1,-1,3,-1,3,3,3,-1,3,-1,-1,-1,3,-1,-1,3,-1,3,3,3,-1,-1,-1,3,-1,3,-1,-1,3,0,0,3,3,3,-1,3,3,-1,-1,3,-1,3,3,-1,-1,-1,-1,-1,0,3,3,0,-1,-1,3,3,0,3,-1,-1,3,-1,-1,-1,0,-1,-1,3,3,0,-1,-1,0,-1,-1,3,0,3,-1,3,3,-1,-1,3,-1,3,-1,-1,3,-1,3,3,-1,-1,-1,-1,3,3,0,3,3,3,-1,-1,-1,3,-1,3,3,-1,3,-1,-1,-1,3,3,-1,-1,3,3,3,-1,-1,-1,3,-1,-1,3,0,-1,-1,-1,3,3,-1,-1,-1,3,-1,3,3,3,3,-1,-1,3,-1,3,-1,3,-1,3,-1,-1,3,-1,3,-1,-1,3,-1,-1,3,3,-1,-1,-1,2,3,-1,3,3,3,-1,2,-1,-1,2,-1,-1,2,-1,3,-1,-1,3,3,-1,3,-1,-1,3,3,-1,3,-1,-1,3,3,3,-1,-1,3,-1,-1,3,-1,3,-1,-1,0,2,0,2,0,2,-1,3,0,3,3,-1,-1,3,3,3,-1,3,-1,-1,-1,-1,3,3,3,-1,3,-1,-1,-1,3,3,-1,-1,-1,3,0,-1,-1,3,-1,3,-1,-1,3,0,3,3,3,0,-1,-1,0,3,-1,-1,3,-1,-1,-1,0,3,-1,3,3,-1,-1,3,3,-1,-1,-1,3,3,3,-1,-1,-1,3,-1,-1,0,3,3,-1,-1,3,3,3,3,-1,3,-1,-1,-1,-1,3,3,-1,3,3,3,-1,-1,-1,-1,3,-1,-1,3,0,3,-1,-1,3,-1,-1,0,3,3,3,-1,-1,-1,3,-1,-1,3,3,3,3,-1,-1,3,-1,3,-1,-1,3,-1,-1,-1,0,-1,-1,-1,3,3,0,0,0,0,3,-1,3,-1,-1,3,-1,3,-1,-1,3,-1,3,-1,-1,3,3,-1,-1,-1,3,3,-1,-1,-1,3,-1,0,0,-1,-1,0,0,-1,-1,-1,0,3,3,0,-1,-1,0,-1,-1,0,3,0,-1,-1,-1,-1,3,3,-1,-1,3,3,3,-1,-1,-1,3,-1,-1,0,0,3,3,-1,3,-1,-1,3,-1,3,3,3,3,-1,3,-1,3,-1,3,-1,-1,3,-1,-1,3,-1,-1,-1,3,3,0,3,-1,3,-1,-1,3,-1,3,-1,-1,3,-1,0,-1,-1,3,0,-1,-1,0,3,-1,3,-1,3,-1,3,-1,3,-1,-1,3,3,3,-1,-1,-1,3,-1,3,3,-1,-1,3,-1,-1,0,0,3,3,-1,3,3,-1,-1,3,-1,-1,3,3,-1,-1,3,3,3,3,-1,-1,-1,3,-1,-1,-1,3,0,3,0,3,0,3,-1,-1,3,-1,-1,0,-1,-1,3,-1,3,-1,-1,3,-1,3,0,3,0,-1,-1,0,-1,-1,3,-1,-1,3,0,-1,0,-1,-1,3,0,-1,0,-1,-1,3,0,3,3,-1,-1,-1,3,3,0,-1,-1,0,-1,-1,-1,0,3,-1,3,-1,-1,-1,3,3,-1,-1,3,3,-1,-1,3,3,-1,3,3,-1,-1,3,-1,-1,-1,0,3,0,3,-1,-1,3,-1,-1,3,-1,-1,3,-1,-1,3,3,3,0,3,0,-1,0,-1,-1,0,-1,0,-1,-1,3,-1,-1,0,0,-1,-1,0,-1,-1,3,-1,0,3,0,3,0,-1,-1,0,3,-1,-1,3,-1,-1,3,-1,3,-1,-1,0,-1,0,3,-1,-1,3,-1,-1,3,-1,3,-1,3,3,-1,-1,-1,3,0,3,-1,0,-1,-1,3,-1,3,-1,-1,3,-1,0,3,3,0,-1,-1,3,-1,3,-1,-1,-1,3,-1,-1,2,3,3,3,3,-1,-1,-1,3,-1,2,-1,3,-1,-1,3,-1,3,-1,-1,3,3,-1,3,-1,-1,3,-1,3,3,-1,-1,3,3,-1,-1,3,-1,3,-1,3,-1,3,-1,-1,0,1,2,3,0,0,0,3,-1,3,-1,-1,3,-1,3,-1,-1,0,0,3,0,3,-1,-1,3,-1,0,-1,-1,0,-1,0,-1,-1,0,3,3,-1,-1,-1,0,3,-1,3,-1,-1,3,3,0,-1,-1,0,-1,-1,0,-1,-1,0,3,3,-1,-1,-1,3,3,-1,-1,-1,3,3,-1,-1,-1,3,-1,0,0,3,-1,3,3,-1,-1,-1,3,0,0,0,-1,-1,-1,0,-1,-1,3,3,0,-1,0,-1,-1,0,3,0,-1,-1,-1,0,-1,-1,0,3,-1,-1,-1,3,0,0,0,-1,-1,0,-1,0,-1,-1,-1,0,0,3,-1,3,-1,-1,3,-1,-1,0,0,0,-1,3,3,-1,-1,-1,3,-1,3,-1,-1,3,-1,-1,-1,0,3,0,3,-1,3,0,0,-1,-1,-1,0,-1,3,-1,-1,3,0,0,-1,0,0,0,-1,-1,-1,-1,-1,3,0,0,3,-1,-1,3,0,-1,-1,0,-1,-1,0,3,-1,-1,3,-1,-1,3,-1,0,3,0,3,-1,-1,-1,-1,3,0,-1,-1,-1,-1,3,-1,3,3,3,-1,3,-1,-1,-1,-1,0,1,2,3,0,0,3,0,3,-1,-1,3,-1,-1,0,-1,-1,0,3,3,0,0,-1,0,-1,0,-1,-1,-1,0,0,-1,0,0,-1,-1,-1,-1,0,0,-1,0,-1,0,-1,-1,-1,0,3,0,3,-1,-1,0,3,-1,-1,3,-1,-1,0,-1,0,-1,-1,0,0,3,-1,3,-1,-1,3,3,-1,-1,-1,3,-1,3,-1,-1,3,0,0,0,0,0,-1,-1,-1,-1,-1,0,0,-1,0,-1,-1,0,0,0,0,-1,-1,-1,0,-1,-1,-1,0,3,0,0,-1,0,-1,-1,0,0,-1,-1,0,-1,-1,0,0,-1,0,-1,0,-1,-1,0,-1,0,-1,-1,0,3,-1,-1,0,0,3,0,-1,-1,0,-1,-1,3,-1,-1,0,3,0,-1,-1,0,-1,-1,3,-1,-1,0,0,0,3,3,0,-1,-1,0,3,-1,3,-1,-1,3,-1,3,-1,-1,-1,0,0,3,0,0,3,-1,3,-1,-1,3,-1,3,-1,-1,0,3,-1,-1,3,0,3,-1,-1,3,-1,-1,0,-1,-1,0,0,-1,0,-1,-1,-1,0,3,3,0,-1,-1,0,-1,3,-1,-1,-1,0,3,3,0,3,-1,-1,3,-1,-1,0,-1,-1,-1,0,3,3,-1,-1,-1,3,-1,3,3,-1,-1,3,-1,3,-1,-1,3,3,0,0,3,-1,3,-1,-1,3,3,-1,-1,-1,3,3,0,-1,-1,0,-1,-1,0,-1,-1,0,0,-1,-1,0,-1,-1,3,0,-1,-1,0,3,-1,3,-1,-1,3,-1,-1,0,3,0,3,0,-1,-1,3,3,0,-1,-1,0,-1,-1,0,-1,-1,0,3,-1,3,3,-1,-1,-1,3,3,3,0,-1,-1,0,-1,-1,0,-1,-1,0,-1,-1,3,0,0,-1,0,-1,-1,-1,3,3,0,3,0,-1,-1,0,-1,-1,-1,-1,0,0,-1,3,-1,-1,0,-1,-1,3,3,-1,-1,3,-1,3,3,-1,-1,-1,0,3,3,3,0,-1,-1,0,-1,-1,-1,-1,3,3,0,-1,-1,0,-1,-1,0,-1,-1,3,0,-1,0,-1,0,-1,-1,0,-1,3,0,-1,-1,0,3,-1,-1,3,-1,-1,0,0,0,3,3,0,3,3,-1,-1,2,3,-1,-1,-1,-1,0,3,3,-1,-1,-1,2,3,-1,-1,-1,0,-1,-1,3,0,3,-1,-1,2,0,3,0,-1,-1,3,0,-1,-1,-1,0,3,-1,3,-1,-1,0,3,-1,0,-1,-1,3,-1,3,-1,-1,-1,3,-1,3,0,3,2,0,-1,-1,-1,3,-1,0,-1,-1,3,0,3,-1,-1,0,-1,3,-1,-1,-1,3,0,-1,0,-1,0,-1,-1,3,-1,-1,3,2,0,0,3,-1,-1,0,-1,-1,3,-1,0,-1,-1,-1,3,3,0,-1,0,-1,-1,-1,2,3,0,3,3,0,-1,3,-1,-1,0,-1,-1,0,0,-1,-1,-1,3,0,3,0,-1,-1,-1,3,-1,-1,0,3,-1,-1,3,-1,0,-1,-1,0,3,3,-1,-1,0,-1,-1,3,0,3,-1,-1,3,-1,-1,0,0,-1,-1,-1,-1,0,0,0,3,3,3,-1,3,-1,-1,3,-1,3,3,-1,-1,3,-1,-1,3,-1,-1,3,3,2,0,3,-1,3,3,3,-1,-1,-1,-1,3,3,3,-1,-1,-1,-1,3,-1,-1,0,-1,-1,3,0,3,-1,3,3,-1,-1,-1,3,-1,3,3,-1,-1,-1,3,0,3,-1,-1,-1,-1,3,0,2,3,0,3,3,-1,-1,-1,3,0,3,-1,-1,3,-1,-1,0,-1,-1,0,3,0,3,-1,-1,3,-1,-1,-1,3,3,-1,-1,-1,3,-1,-1,3,0,-1,-1,3,0,3,-1,-1,3,-1,-1,3,-1,2,0,3,-1,3,-1,-1,3,-1,3,-1,-1,-1,3,0,-1,0,3,3,-1,-1,-1,0,2,3,3,-1,-1,-1,-1,2,3,0,-1,3,-1,-1,0,-1,-1,-1,0,0,3,-1,-1,0,3,-1,-1,3,-1,-1,0,-1,3,-1,-1,3,0,3,-1,-1,0,3,-1,3,-1,-1,2,3,-1,-1,-1,3,-1,0,3,3,-1,3,0,-1,-1,-1,0,3,3,-1,-1,-1,-1,3,0,3,-1,-1,3,-1,-1,0,-1,3,-1,-1,1,0,3,0,3,0,-1,-1,0,-1,-1,0,3,-1,-1,3,-1,-1,3,3,0,3,-1,-1,3,3,0,-1,0,-1,-1,-1,0,0,-1,-1,-1,0,-1,0,-1,0,-1,-1,0,3,-1,-1,3,-1,0,-1,3,-1,-1,2,0,0,3,0,-1,-1,3,0,0,3,-1,-1,3,-1,-1,3,-1,-1,3,0,0,-1,-1,-1,0,0,3,-1,-1,3,-1,-1,-1,3,0,0,0,-1,3,-1,-1,-1,0,3,-1,-1,0,-1,3,-1,-1,0,3,0,0,-1,-1,-1,3,0,0,-1,-1,-1,0,0,-1,-1,3,-1,-1,0,3,3,-1,-1,-1,3,-1,0,3,3,-1,-1,3,-1,-1,3,3,-1,-1,3,-1,3,-1,-1,3,3,3,3,3,3,-1,-1,-1,-1,-1,-1,3,-1,-1,3,-1,0,-1,-1,0,3,0,3,0,3,0,-1,-1,-1,3,-1,0,-1,-1,0,3,3,3,0,-1,0,-1,-1,0,-1,-1,0,-1,-1,0,0,3,-1,-1,-1,3,-1,-1,3,3,3,-1,-1,0,3,-1,3,-1,-1,-1,-1,3,0,0,-1,-1,0,0,0,-1,-1,-1,0,-1,-1,0,2,3,0,-1,-1,0,0,-1,3,-1,-1,-1,-1,3,3,0,-1,-1,0,-1,0,-1,-1,3,-1,3,-1,-1,-1,3,3,-1,-1,3,3,-1,-1,-1],"threshold":[2.5,13.5,1.5,1.5,0.5,3.723746657371521,3.223746657371521,1.5,4.5,0.0,9.5,0.0,0.0,11.0,2.0,0.0,5.0,3.5,0.0,0.0,6.5,2.5,0.0,0.0,2.5,8.5,0.0,0.0,8.5,7.5,0.0,0.0,0.0,12.5,0.0,0.0,0.0,7.5,4.5,12.5,11.0,7.0,2.5,0.0,4.5,0.0,0.0,9.0,0.0,0.0,0.0,0.0,10.5,8.5,5.5,0.0,0.0,0.0,12.5,0.0,0.0,10.0,9.5,0.0,0.0,7.5,0.0,0.0,10.5,2.5,1.5,2.5,1.5,0.0,0.0,9.5,7.5,6.5,5.5,4.5,3.5,0.0,0.0,0.0,0.0,0.0,8.5,0.0,0.0,0.0,1.5,0.0,7.5,5.5,2.5,0.0,4.5,3.5,0.0,0.0,0.0,6.5,0.0,0.0,9.5,8.5,0.0,0.0,0.0,12.5,3.723746657371521,3.223746657371521,9.5,8.5,1.5,0.0,3.5,2.5,0.0,0.0,5.5,4.5,0.0,0.0,6.5,0.0,7.5,0.0,0.0,0.0,0.0,0.0,6.5,4.5,5.5,2.5,1.5,0.0,0.0,3.5,0.0,4.5,0.0,0.0,0.0,6.5,4.5,5.5,3.5,1.5,0.0,2.5,0.0,0.0,0.0,2.5,1.5,0.0,0.0,3.5,0.0,0.0,5.5,5.5,0.0,0.0,5.5,0.0,0.0,1.5,0.0,2.5,8.0,0.0,9.5,0.0,0.0,4.5,10.5,7.5,3.5,0.0,0.0,9.0,0.0,0.0,0.0,10.0,5.5,7.5,0.0,0.0,0.0,0.0,5.5,4.5,7.5,0.0,9.5,8.5,0.0,0.0,0.0,7.5,0.0,9.5,8.5,0.0,0.0,0.0,8.5,6.5,0.0,11.0,9.5,7.5,7.5,0.0,8.5,0.0,0.0,0.0,0.0,7.5,0.0,0.0,6.5,9.5,0.0,0.0,7.5,0.0,9.5,9.5,8.5,0.0,0.0,0.0,9.0,0.0,0.0,6.5,2.5,22.0,0.0,0.0,13.5,0.0,5.5,4.5,24.5,3.5,14.5,0.0,0.0,17.0,0.0,0.0,0.0,18.5,0.0,0.0,14.5,0.0,17.5,0.0,24.5,0.0,0.0,13.5,0.0,22.5,9.0,7.5,0.0,0.0,0.0,0.0,1.5,11.5,0.0,12.5,0.0,0.0,5.5,3.223746657371521,12.5,2.5,11.5,0.0,0.0,11.5,0.0,0.0,2.5,0.0,0.0,3.723746657371521,0.0,12.5,4.5,11.5,0.0,0.0,11.5,0.0,0.0,4.5,0.0,0.0,11.5,8.5,6.5,0.0,0.0,0.0,12.5,6.5,0.0,0.0,6.5,0.0,0.0,12.5,11.5,1.5,2.5,1.5,0.0,0.0,3.223746657371521,0.0,3.723746657371521,0.0,6.5,4.5,0.0,5.5,0.0,0.0,9.5,8.0,0.0,0.0,16.0,0.0,25.5,0.0,0.0,6.5,4.5,3.223746657371521,5.5,2.5,1.5,0.0,2.5,0.0,0.0,1.5,3.5,0.0,4.5,0.0,0.0,2.5,3.5,0.0,4.5,0.0,0.0,3.5,0.0,4.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,5.5,3.5,2.5,0.0,0.0,4.5,0.0,0.0,0.0,25.5,18.5,5.5,15.0,5.5,2.5,0.0,4.5,3.5,0.0,0.0,0.0,2.5,6.5,0.0,9.5,8.0,0.0,0.0,0.0,3.5,7.5,6.5,0.0,0.0,9.0,0.0,11.0,0.0,0.0,6.5,4.5,0.0,0.0,9.5,4.5,7.5,0.0,0.0,7.5,0.0,0.0,4.5,13.0,11.5,0.0,0.0,0.0,0.0,16.5,2.5,0.0,0.0,2.5,0.0,4.0,17.5,0.0,0.0,0.0,8.5,6.5,5.5,0.0,0.0,7.5,0.0,0.0,11.5,0.0,0.0,19.5,3.0,0.0,0.0,3.5,20.5,0.0,0.0,20.5,0.0,0.0,2.5,0.0,0.0,7.5,3.223746657371521,9.5,2.5,1.5,7.5,0.0,8.5,0.0,0.0,8.5,7.5,0.0,0.0,0.0,8.5,7.5,0.0,0.0,0.0,2.5,1.5,10.5,0.0,0.0,10.5,0.0,0.0,10.5,0.0,0.0,3.723746657371521,0.0,10.5,9.5,5.5,8.5,4.5,7.5,0.0,0.0,7.5,0.0,0.0,4.5,0.0,0.0,8.5,6.5,7.5,0.0,0.0,7.5,0.0,0.0,6.5,0.0,0.0,6.5,4.5,0.0,5.5,0.0,0.0,0.0,4.5,0.0,6.5,5.5,0.0,0.0,0.0,10.5,9.5,8.5,7.5,9.0,0.0,0.0,0.0,9.0,0.0,0.0,10.5,8.5,0.0,0.0,0.0,14.5,13.5,12.5,11.5,0.0,0.0,0.0,0.0,20.0,0.0,8.0,0.0,0.0,9.5,2.5,1.5,0.0,0.0,5.5,4.5,3.223746657371521,0.0,3.723746657371521,0.0,0.0,0.0,6.5,0.0,8.0,0.0,0.0,10.5,0.0,0.0,3.223746657371521,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,5.5,4.5,0.0,0.0,11.0,8.0,6.5,0.0,0.0,0.0,0.0,1.5,0.5,0.0,12.5,2.5,5.5,2.5,1.5,1.5,0.0,0.0,1.5,0.0,0.0,3.5,1.5,0.0,0.0,4.5,1.5,0.0,0.0,1.5,0.0,0.0,10.5,9.5,1.5,6.5,0.0,7.5,0.0,8.5,0.0,0.0,6.5,0.0,7.5,0.0,8.5,0.0,0.0,1.5,0.0,0.0,11.5,1.5,0.0,0.0,1.5,0.0,0.0,3.223746657371521,3.5,2.5,1.5,0.0,0.0,0.0,9.5,8.5,6.5,4.5,0.0,5.5,0.0,0.0,7.5,0.0,0.0,0.0,11.5,10.5,0.0,0.0,0.0,3.723746657371521,0.0,9.5,6.5,2.5,1.5,4.5,0.0,0.0,4.5,0.0,0.0,5.5,4.5,8.5,4.5,3.5,0.0,0.0,5.5,0.0,7.5,6.5,0.0,0.0,0.0,0.0,6.5,5.5,4.0,0.0,0.0,0.0,8.5,7.5,0.0,0.0,0.0,7.5,6.5,4.5,0.0,0.0,0.0,0.0,7.5,8.5,7.5,4.5,1.5,0.0,3.5,2.5,0.0,0.0,0.0,6.5,5.5,0.0,0.0,0.0,0.0,0.0,10.5,2.5,0.0,8.0,6.0,9.5,4.5,8.5,0.0,0.0,0.0,3.5,0.0,0.0,0.0,8.5,0.0,0.0,5.5,25.0,11.5,4.0,0.0,0.0,17.5,13.0,0.0,0.0,0.0,4.5,0.0,0.0,6.5,20.0,0.0,0.0,7.5,0.0,17.5,0.0,8.5,0.0,0.0,7.5,5.5,10.5,4.5,0.0,0.0,4.5,11.5,0.0,0.0,11.5,0.0,0.0,10.5,6.5,0.0,0.0,6.5,11.5,0.0,0.0,11.5,0.0,0.0,9.0,0.0,10.5,0.0,12.5,11.5,0.0,0.0,16.0,0.0,0.0,3.5,2.5,1.5,0.0,0.0,0.0,9.0,5.5,4.5,0.0,0.0,6.5,0.0,7.5,0.0,0.0,12.5,0.0,0.0,12.5,3.223746657371521,5.5,1.5,2.5,1.5,0.0,0.0,0.0,2.5,2.5,1.5,0.0,0.0,1.5,4.5,3.5,0.0,0.0,0.0,4.5,3.5,0.0,0.0,0.0,2.5,0.0,3.5,0.0,4.5,0.0,0.0,1.5,10.5,6.5,0.0,8.5,7.5,0.0,0.0,9.5,0.0,0.0,11.5,0.0,0.0,11.5,10.5,2.5,9.5,8.5,6.5,0.0,7.5,0.0,0.0,0.0,0.0,7.5,6.5,0.0,0.0,9.5,8.5,0.0,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,3.723746657371521,0.0,31.5,6.5,9.5,3.5,5.5,1.5,4.5,0.0,0.0,4.5,2.5,0.0,0.0,2.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,5.5,5.5,4.5,4.5,0.0,0.0,4.5,0.0,0.0,4.5,0.0,0.0,5.5,8.5,6.5,4.5,0.0,0.0,4.5,7.5,0.0,0.0,7.5,0.0,0.0,4.5,0.0,0.0,8.5,7.5,6.5,0.0,0.0,0.0,0.0,4.5,11.5,10.5,0.0,0.0,0.0,10.5,5.5,0.0,0.0,5.5,11.5,0.0,0.0,11.5,0.0,0.0,20.5,7.5,9.5,1.5,7.5,0.0,8.5,0.0,0.0,2.5,7.5,0.0,0.0,3.5,0.0,4.5,7.5,0.0,0.0,5.5,7.5,0.0,0.0,7.5,6.5,0.0,0.0,6.5,0.0,0.0,18.5,5.5,4.5,3.5,13.0,10.5,2.0,0.0,0.0,11.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,13.5,11.5,0.0,0.0,0.0,13.0,11.5,10.5,0.0,0.0,0.0,0.0,12.5,10.5,0.0,0.0,6.5,0.0,15.5,0.0,0.0,0.0,15.0,11.5,10.5,7.5,8.5,0.0,9.5,0.0,0.0,9.5,9.5,8.5,8.5,0.0,0.0,8.5,0.0,0.0,8.5,0.0,0.0,10.5,9.0,0.0,0.0,9.5,12.5,8.5,0.0,0.0,8.5,0.0,0.0,12.5,0.0,0.0,10.5,7.5,0.0,9.5,8.5,0.0,0.0,0.0,13.0,11.5,0.0,0.0,0.0,7.5,0.0,9.5,8.5,0.0,0.0,10.5,0.0,13.5,12.0,0.0,0.0,0.0,9.5,0.0,17.0,0.0,0.0,9.5,3.5,2.5,0.0,0.0,6.5,24.5,0.0,5.0,0.0,0.0,7.5,0.0,26.5,23.0,0.0,0.0,0.0,24.5,10.5,0.0,0.0,0.0,7.5,38.5,3.0,0.0,0.0,3.5,0.0,0.0,0.0,5.5,4.5,3.223746657371521,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,0.0,0.0,7.5,6.5,0.0,0.0,8.5,0.0,9.5,0.0,10.5,0.0,0.0,40.5,22.5,1.5,17.5,1.5,0.5,2.0,0.0,16.5,7.0,14.5,4.5,0.0,0.0,3.723746657371521,0.0,4.5,0.0,15.5,0.0,0.0,0.0,0.0,15.5,15.0,14.5,3.223746657371521,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,11.0,4.5,0.0,6.5,5.5,0.0,0.0,7.5,0.0,0.0,0.0,3.5,2.5,1.5,0.0,0.0,0.0,5.5,4.5,0.0,0.0,6.5,0.0,7.5,0.0,0.0,0.0,5.5,3.5,16.5,1.5,0.0,2.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,16.5,4.5,0.0,0.0,4.5,0.0,0.0,7.5,6.5,16.5,0.0,0.0,16.5,0.0,0.0,16.5,12.0,9.0,0.0,10.5,0.0,0.0,0.0,0.0,2.5,15.5,1.5,14.5,0.0,0.0,14.5,0.0,0.0,1.5,16.5,0.0,0.0,16.5,0.0,0.0,14.5,6.5,4.5,3.5,0.0,0.0,5.5,0.0,0.0,9.0,7.5,0.0,0.0,10.5,0.0,0.0,7.5,15.5,3.5,0.0,4.5,0.0,5.5,0.0,6.5,0.0,0.0,4.5,16.5,3.723746657371521,3.223746657371521,0.0,0.0,0.0,3.223746657371521,0.0,3.723746657371521,0.0,0.0,6.5,5.5,16.5,0.0,0.0,16.5,0.0,0.0,16.5,0.0,0.0,16.5,8.5,0.0,11.5,10.0,0.0,0.0,0.0,8.5,0.0,0.0,19.5,4.5,1.5,2.5,1.5,0.5,0.0,18.5,0.0,0.0,0.5,0.0,18.5,0.0,0.0,3.723746657371521,3.223746657371521,18.5,0.0,0.0,0.0,18.5,0.5,0.0,0.0,0.0,1.5,18.5,0.0,0.0,3.723746657371521,3.223746657371521,18.5,2.5,0.0,0.0,2.5,0.0,0.0,0.0,18.5,0.0,0.0,18.5,11.5,0.5,6.0,0.0,0.0,7.5,1.5,5.5,0.0,6.5,0.0,0.0,5.5,0.0,6.5,0.0,0.0,8.5,0.0,10.0,0.0,1.5,0.0,0.0,1.5,0.0,0.0,0.5,0.0,1.5,6.5,0.0,0.0,6.5,5.5,0.0,0.0,8.5,7.5,0.0,0.0,10.5,0.0,0.0,1.5,1.5,21.5,20.5,0.0,0.0,0.0,20.5,0.0,21.5,0.0,0.0,20.5,1.5,0.5,3.5,0.0,0.0,8.5,2.5,0.0,4.5,3.5,0.0,0.0,5.5,0.0,6.5,0.0,0.0,12.5,0.0,0.0,2.5,0.0,4.5,3.5,0.0,0.0,5.5,0.0,14.5,11.0,6.5,0.0,7.5,0.0,0.0,0.0,0.0,4.5,3.223746657371521,0.5,2.5,21.5,0.0,0.0,21.5,0.0,0.0,2.5,21.5,1.5,0.0,0.0,1.5,0.0,0.0,1.5,21.5,0.0,0.0,21.5,0.0,0.0,3.723746657371521,0.0,1.5,21.5,0.5,0.0,0.0,0.0,21.5,0.0,0.0,8.5,7.5,1.5,21.5,0.5,0.0,5.5,0.0,0.0,6.0,0.0,0.0,6.5,21.5,5.5,0.0,0.0,5.5,0.0,0.0,21.5,0.0,0.0,21.5,0.0,0.0,21.5,10.5,0.0,1.5,0.0,0.0,0.0,1.5,21.5,3.223746657371521,17.5,1.5,16.5,15.5,14.5,0.0,0.0,0.0,0.0,14.5,2.5,0.0,0.0,16.5,15.5,2.5,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,2.5,20.5,19.5,18.5,1.5,0.0,0.0,1.5,0.0,0.0,1.5,0.0,0.0,1.5,0.0,0.0,19.5,18.5,0.0,0.0,20.5,0.0,0.0,3.723746657371521,0.0,6.5,20.5,14.5,4.5,0.0,5.5,0.0,0.0,17.5,16.5,4.5,15.5,0.0,0.0,5.5,15.5,0.0,0.0,15.5,0.0,0.0,5.5,4.5,0.0,0.0,0.0,4.5,18.5,0.0,19.5,0.0,0.0,18.5,0.0,19.5,0.0,0.0,4.5,0.0,0.0,14.5,0.0,15.5,7.5,0.0,0.0,7.5,16.5,0.0,20.5,17.5,0.0,19.5,18.5,0.0,0.0,0.0,0.0,18.5,16.5,0.0,17.5,8.5,0.0,0.0,0.0,20.0,0.0,12.0,0.0,0.0,5.5,1.5,0.0,2.5,0.0,3.723746657371521,3.223746657371521,0.0,0.0,4.5,0.0,0.0,12.0,8.0,0.0,0.0,0.0,21.5,6.5,14.5,3.223746657371521,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,4.5,0.0,5.5,0.0,0.0,15.5,1.5,0.0,3.723746657371521,3.223746657371521,2.5,0.0,0.0,0.0,5.5,4.5,0.0,0.0,0.0,19.5,16.5,1.5,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,4.5,0.0,5.5,0.0,0.0,17.5,3.5,1.5,0.0,2.5,0.0,0.0,4.5,0.0,5.5,0.0,0.0,5.5,3.723746657371521,3.223746657371521,18.5,1.5,0.0,2.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,0.0,4.5,18.5,0.0,0.0,18.5,0.0,0.0,18.5,0.0,0.0,4.5,1.5,20.5,0.0,0.0,20.5,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,0.0,5.5,20.5,0.0,0.0,20.5,0.0,0.0,14.5,8.5,7.5,0.0,0.0,21.0,12.5,10.5,9.5,0.0,0.0,0.0,0.0,0.0,16.5,15.5,13.5,10.5,8.5,7.5,0.0,0.0,9.5,0.0,0.0,11.5,0.0,12.5,0.0,0.0,17.5,0.0,0.0,10.5,7.5,0.0,9.5,8.5,0.0,0.0,0.0,13.0,11.5,0.0,0.0,0.0,13.5,11.5,10.5,9.5,20.5,8.5,7.5,19.5,17.5,0.0,18.5,0.0,0.0,0.0,19.5,17.5,0.0,18.5,0.0,0.0,0.0,18.5,17.5,0.0,0.0,19.5,0.0,0.0,7.5,0.0,8.5,0.0,0.0,20.5,18.5,17.5,0.0,0.0,19.5,0.0,0.0,0.0,18.5,0.0,19.5,0.0,20.5,0.0,0.0,18.5,17.5,0.0,0.0,12.5,0.0,0.0,20.5,19.5,19.5,17.5,0.0,16.0,18.5,0.0,0.0,0.0,18.5,0.0,0.0,0.0,0.0,7.5,3.223746657371521,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,6.5,5.5,4.5,0.0,0.0,0.0,0.0,9.5,8.5,0.0,0.0,10.5,0.0,12.5,0.0,0.0,1.5,25.5,3.723746657371521,3.223746657371521,2.5,1.5,1.5,23.5,0.0,24.5,0.0,0.0,24.5,23.5,0.0,0.0,0.0,1.5,23.5,0.0,24.5,0.0,0.0,23.5,0.0,24.5,0.0,0.0,23.5,1.5,0.5,0.0,0.0,0.0,1.5,24.5,0.5,0.0,0.0,0.5,0.0,0.0,24.5,0.0,0.0,0.0,1.5,0.5,7.0,0.0,0.0,6.5,4.5,24.5,23.5,0.0,0.0,0.0,23.5,5.5,0.0,0.0,5.5,24.5,0.0,0.0,24.5,0.0,0.0,13.5,9.0,7.5,23.5,0.0,0.0,0.0,11.0,0.0,12.5,0.0,0.0,0.0,24.5,4.5,23.5,0.0,0.0,9.5,7.5,6.5,5.5,23.5,0.0,0.0,23.5,0.0,0.0,23.5,0.0,0.0,23.5,8.5,0.0,0.0,8.5,0.0,0.0,10.5,0.0,0.0,4.5,0.0,5.5,0.0,7.5,6.5,0.0,0.0,8.5,0.0,9.5,0.0,11.0,0.0,0.0,1.5,38.5,0.5,3.223746657371521,36.5,31.5,2.5,29.0,26.5,0.0,27.5,0.0,0.0,30.5,0.0,1.5,0.0,0.0,27.0,0.0,30.5,29.0,0.0,0.0,0.0,33.5,32.5,1.5,0.0,2.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,2.5,1.5,0.0,34.5,0.0,0.0,35.5,34.5,0.0,0.0,0.0,0.0,35.5,10.0,3.723746657371521,0.0,5.0,32.0,29.5,0.0,0.0,0.0,6.5,29.5,0.0,0.0,29.0,0.0,33.5,0.0,0.0,0.0,37.5,6.0,0.0,36.5,0.0,0.0,0.0,4.5,29.5,2.5,1.5,26.5,0.0,28.5,27.5,0.0,0.0,0.0,27.5,26.5,0.0,0.0,28.5,0.0,0.0,28.5,3.223746657371521,27.5,26.5,0.0,0.0,0.0,3.723746657371521,0.0,26.5,0.0,27.5,0.0,0.0,3.5,0.0,0.0,32.5,31.5,30.5,3.5,2.5,1.5,0.0,0.0,0.0,0.0,2.5,1.5,0.0,0.0,3.5,0.0,0.0,2.5,1.5,0.0,0.0,3.5,0.0,0.0,1.5,37.5,34.5,33.5,0.0,0.0,36.5,35.5,0.0,0.0,0.0,0.0,35.5,2.5,34.5,33.5,0.0,0.0,0.0,33.5,3.5,0.0,0.0,3.223746657371521,34.5,0.0,0.0,3.723746657371521,0.0,34.5,0.0,0.0,36.5,3.5,2.5,0.0,0.0,0.0,3.223746657371521,2.5,37.5,0.0,0.0,37.5,0.0,0.0,3.723746657371521,0.0,37.5,0.0,0.0,27.5,10.0,5.5,26.5,0.0,0.0,8.0,6.5,0.0,26.5,0.0,0.0,0.0,12.5,0.0,0.0,8.5,7.5,35.5,6.5,29.5,5.5,28.5,0.0,0.0,28.5,0.0,0.0,31.5,30.5,0.0,0.0,5.5,33.5,32.5,0.0,0.0,34.5,0.0,0.0,33.5,32.5,0.0,0.0,34.5,0.0,0.0,33.5,32.5,31.0,28.5,0.0,29.5,0.0,0.0,0.0,0.0,0.0,37.5,5.5,36.5,0.0,0.0,36.5,0.0,6.5,0.0,0.0,5.5,0.0,0.0,34.0,32.5,31.0,29.0,0.0,0.0,0.0,0.0,36.0,0.0,37.5,0.0,0.0,31.5,29.5,15.0,28.5,0.0,0.0,0.0,30.5,0.0,12.0,0.0,0.0,13.0,34.5,0.0,36.5,0.0,0.0,32.5,0.0,16.5,0.0,34.5,0.0,0.0,3.723746657371521,3.223746657371521,1.5,39.5,0.0,0.0,0.5,0.0,39.5,2.5,0.0,0.0,2.5,0.0,0.0,0.0,39.5,0.5,4.5,0.0,31.0,0.0,0.0,10.5,4.5,0.0,5.5,0.0,6.5,0.0,0.0,0.0,0.5,0.0,4.5,0.0,7.5,0.0,0.0,1.5,34.5,33.5,30.5,28.5,27.5,26.5,0.0,0.0,0.0,29.5,0.0,0.0,31.5,0.0,32.5,0.0,0.0,0.0,38.5,36.5,35.5,0.0,0.0,37.5,0.0,0.0,39.5,0.0,0.0,2.5,28.5,26.5,0.0,27.5,0.0,0.0,34.5,32.5,31.5,29.5,0.0,30.5,0.0,0.0,0.0,33.5,0.0,0.0,37.5,36.5,35.5,0.0,0.0,0.0,38.5,0.0,39.5,0.0,0.0,38.5,4.5,3.223746657371521,29.5,28.5,27.5,26.5,0.0,0.0,0.0,0.0,35.5,32.5,31.5,30.5,0.0,0.0,0.0,33.5,0.0,34.5,0.0,0.0,37.5,36.5,0.0,0.0,0.0,3.723746657371521,0.0,26.5,0.0,34.5,33.5,27.5,0.0,28.5,0.0,30.5,29.5,0.0,0.0,31.5,0.0,32.5,0.0,0.0,0.0,36.5,35.5,0.0,0.0,37.5,0.0,0.0,6.5,29.5,26.5,5.5,0.0,0.0,5.5,28.5,27.5,0.0,0.0,0.0,28.5,27.5,0.0,0.0,0.0,32.5,5.5,30.5,0.0,31.5,0.0,0.0,31.5,30.5,0.0,0.0,0.0,36.5,5.5,35.5,33.5,0.0,34.5,0.0,0.0,0.0,35.5,33.5,0.0,34.5,0.0,0.0,0.0,5.5,37.5,0.0,0.0,37.5,0.0,0.0,9.5,37.5,32.5,28.5,8.5,7.5,27.5,26.5,0.0,0.0,0.0,27.5,0.0,0.0,26.5,0.0,0.0,8.5,7.5,30.5,29.5,0.0,0.0,31.5,0.0,0.0,30.5,29.5,0.0,0.0,31.5,0.0,0.0,29.5,0.0,30.5,0.0,31.5,0.0,0.0,36.5,33.5,7.5,0.0,8.5,0.0,0.0,8.5,7.5,34.5,0.0,35.5,0.0,0.0,34.5,0.0,35.5,0.0,0.0,35.5,34.5,0.0,0.0,0.0,7.5,0.0,8.5,0.0,0.0,8.0,0.0,0.0,26.5,12.5,10.5,0.0,0.0,0.0,12.5,28.5,27.5,10.5,0.0,0.0,11.0,0.0,0.0,31.5,10.5,29.5,0.0,30.5,0.0,0.0,29.5,0.0,0.0,35.5,34.5,32.5,11.0,0.0,0.0,33.5,0.0,10.5,0.0,11.5,0.0,0.0,0.0,36.5,0.0,0.0,16.5,27.5,0.0,31.5,29.0,0.0,15.0,13.5,0.0,30.5,0.0,0.0,30.5,0.0,0.0,32.5,0.0,14.5,13.5,33.5,0.0,0.0,35.0,0.0,36.5,0.0,0.0,0.0,33.5,30.0,0.0,18.0,0.0,0.0,36.0,0.0,0.0,39.5,5.5,4.5,3.5,0.0,0.0,0.0,6.5,0.0,8.5,7.5,0.0,0.0,0.0,7.5,4.5,3.223746657371521,0.0,3.723746657371521,0.0,0.0,5.5,0.0,6.5,0.0,0.0,12.0,8.5,0.0,10.0,0.0,0.0,0.0,35.5,28.5,27.5,1.5,23.5,5.5,3.223746657371521,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,4.5,0.0,0.0,6.5,0.0,8.5,0.0,10.5,0.0,0.0,0.5,0.0,8.5,4.5,3.223746657371521,24.5,2.5,1.5,0.0,0.0,0.0,1.5,26.5,25.5,0.0,0.0,0.0,26.5,25.5,2.5,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,3.723746657371521,0.0,25.5,24.5,0.0,0.0,26.5,0.0,0.0,24.5,6.0,0.0,0.0,6.5,25.5,5.5,0.0,0.0,26.5,5.5,0.0,0.0,5.5,0.0,0.0,26.5,25.5,0.0,0.0,7.5,0.0,0.0,25.5,20.0,16.5,12.0,9.5,0.0,26.5,25.5,0.0,0.0,0.0,26.0,24.5,0.0,0.0,0.0,0.0,0.0,0.0,6.5,24.5,1.5,23.5,0.0,0.0,2.5,23.5,0.0,0.0,5.5,3.723746657371521,3.223746657371521,23.5,0.0,0.0,0.0,4.5,23.5,0.0,0.0,23.5,0.0,0.0,23.5,0.0,0.0,3.223746657371521,1.5,25.5,0.0,26.5,0.0,0.0,25.5,2.5,0.0,0.0,26.5,2.5,0.0,0.0,2.5,0.0,0.0,3.723746657371521,0.0,26.5,25.5,4.5,0.0,5.5,0.0,0.0,5.5,4.5,0.0,0.0,0.0,5.5,4.5,0.0,0.0,0.0,13.5,26.5,23.5,11.5,7.5,0.0,8.5,0.0,9.5,0.0,10.5,0.0,0.0,12.5,0.0,0.0,7.5,25.5,24.5,0.0,0.0,0.0,9.5,8.5,25.5,24.5,0.0,0.0,0.0,25.5,24.5,0.0,0.0,0.0,25.5,12.0,24.5,10.5,0.0,0.0,10.5,0.0,0.0,0.0,10.5,0.0,0.0,9.5,7.5,0.0,8.5,0.0,0.0,10.5,0.0,11.5,0.0,0.0,25.5,24.5,23.5,17.5,0.0,0.0,0.0,0.0,14.5,26.5,0.0,0.0,0.0,6.5,1.5,2.5,1.5,0.0,0.0,4.0,0.0,0.0,3.223746657371521,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,4.5,0.0,5.5,0.0,0.0,10.5,7.5,1.5,0.0,0.0,8.5,1.5,0.0,0.0,9.5,1.5,0.0,0.0,0.0,1.5,0.0,11.5,0.0,12.5,0.0,13.5,0.0,0.0,30.5,1.5,7.5,2.5,1.5,29.5,0.0,0.0,29.5,0.0,0.0,29.5,4.5,3.5,0.0,0.0,6.5,5.5,0.0,0.0,0.0,3.5,0.0,4.5,0.0,6.5,5.5,0.0,0.0,0.0,9.5,29.5,8.5,0.0,0.0,0.0,10.5,0.0,0.0,29.5,10.5,3.723746657371521,3.223746657371521,1.5,0.0,2.5,0.0,0.0,0.0,8.5,7.5,5.5,4.5,0.0,0.0,6.5,0.0,0.0,0.0,9.5,0.0,0.0,16.5,12.5,11.5,0.0,0.0,13.5,0.0,14.5,0.0,0.0,0.0,8.5,1.5,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,6.5,4.5,0.0,5.5,0.0,0.0,7.5,0.0,0.0,13.0,11.5,10.5,9.5,0.0,0.0,0.0,0.0,14.5,0.0,16.0,0.0,17.5,0.0,0.0,6.5,34.5,31.5,1.5,1.5,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,4.5,0.0,0.0,2.5,1.5,0.0,0.0,3.723746657371521,3.223746657371521,0.0,0.0,5.5,4.5,0.0,0.0,0.0,3.223746657371521,1.5,1.5,33.5,32.5,0.0,0.0,0.0,33.5,2.5,32.5,0.0,0.0,0.0,2.5,0.0,0.0,1.5,33.5,32.5,0.0,0.0,0.0,2.5,32.5,0.0,33.5,0.0,0.0,32.5,0.0,33.5,0.0,0.0,3.723746657371521,0.0,33.5,4.5,1.5,0.0,32.5,0.0,0.0,1.5,5.5,0.0,32.5,0.0,0.0,32.5,5.5,0.0,0.0,5.5,0.0,0.0,5.5,4.5,1.5,0.0,0.0,0.0,1.5,0.0,0.0,3.223746657371521,1.5,1.5,0.0,0.0,2.5,1.5,0.0,0.0,1.5,0.0,0.0,3.723746657371521,0.0,4.5,1.5,0.0,0.0,1.5,5.5,0.0,0.0,5.5,0.0,0.0,34.5,13.5,31.5,8.5,7.5,1.5,0.0,0.0,0.0,10.5,9.5,0.0,0.0,11.5,0.0,12.5,0.0,0.0,9.5,33.5,32.5,1.5,0.0,7.5,0.0,8.5,0.0,0.0,1.5,0.0,8.5,7.5,0.0,0.0,0.0,8.5,7.5,1.5,0.0,0.0,0.0,1.5,0.0,0.0,32.5,12.5,1.5,0.0,10.5,0.0,11.5,0.0,0.0,0.0,11.5,1.5,0.0,33.5,10.5,0.0,0.0,10.5,0.0,0.0,33.5,12.5,0.0,0.0,12.5,0.0,0.0,31.5,38.0,15.0,1.5,0.0,0.0,0.0,0.0,18.0,16.5,33.5,15.0,32.5,0.0,0.0,0.0,15.0,0.0,0.0,0.0,20.0,33.0,0.0,0.0,0.0,13.5,12.0,8.5,1.5,0.0,7.5,0.0,0.0,10.5,9.5,1.5,0.0,0.0,1.5,0.0,0.0,0.0,0.0,0.0,37.5,6.5,1.9266639351844788,1.4266639351844788,4.5,3.223746657371521,2.5,36.5,1.5,0.0,0.0,0.0,36.5,0.0,0.0,3.723746657371521,0.0,36.5,0.0,0.0,36.5,0.0,5.5,0.0,0.0,0.0,36.5,5.5,3.5,2.5,1.5,0.0,0.0,0.0,4.5,0.0,0.0,0.0,3.223746657371521,1.5,0.0,2.5,0.0,0.0,4.5,3.723746657371521,0.0,0.0,5.5,0.0,0.0,31.0,1.9266639351844788,1.4266639351844788,10.5,36.5,8.5,0.0,0.0,8.5,0.0,0.0,12.5,0.0,0.0,0.0,7.5,36.5,0.0,0.0,9.5,8.5,36.5,0.0,0.0,36.5,0.0,0.0,13.0,36.5,10.5,0.0,11.5,0.0,0.0,10.5,0.0,11.5,0.0,0.0,15.5,14.5,36.5,0.0,0.0,0.0,0.0,0.0,1.9266639351844788,1.4266639351844788,1.5,39.5,38.5,0.0,0.0,0.0,38.5,3.5,2.5,0.0,0.0,11.5,4.5,0.0,7.0,0.0,0.0,0.0,5.5,4.5,3.723746657371521,3.223746657371521,39.5,2.5,0.0,0.0,2.5,0.0,0.0,0.0,39.5,0.0,0.0,39.5,0.0,0.0,6.5,39.5,0.0,0.0,39.5,8.5,0.0,0.0,8.5,0.0,10.5,0.0,12.5,0.0,0.0,0.0,5.5,39.5,3.723746657371521,3.223746657371521,1.5,38.5,0.0,0.0,38.5,2.5,0.0,0.0,2.5,0.0,0.0,0.0,38.5,4.5,0.0,0.0,4.5,0.0,0.0,1.5,0.0,4.5,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,0.0,0.0,39.5,10.5,7.5,38.5,6.5,0.0,0.0,6.5,0.0,0.0,9.5,38.5,8.5,0.0,0.0,8.5,0.0,0.0,38.5,0.0,0.0,14.5,38.5,12.5,0.0,0.0,13.0,11.5,0.0,0.0,0.0,24.5,18.0,0.0,0.0,0.0,11.5,7.5,6.5,0.0,0.0,9.5,8.5,0.0,0.0,10.5,0.0,0.0,13.0,0.0,17.5,0.0,0.0,1.5,46.5,0.5,4.5,41.5,0.0,1.5,0.0,2.5,45.0,43.5,0.0,0.0,0.0,3.723746657371521,44.5,0.0,0.0,42.5,0.0,43.5,0.0,44.5,0.0,0.0,44.0,0.0,0.0,3.723746657371521,3.223746657371521,1.5,1.5,41.5,0.0,42.5,0.0,44.5,43.5,0.0,0.0,45.5,0.0,0.0,41.5,0.0,42.5,0.0,45.5,44.5,43.5,0.0,0.0,0.0,0.0,1.5,45.5,44.5,43.5,41.5,2.5,0.0,0.0,42.5,2.5,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,43.5,2.5,41.5,0.0,42.5,0.0,0.0,42.5,41.5,0.0,0.0,0.0,2.5,44.5,0.0,45.5,0.0,0.0,44.5,0.0,45.5,0.0,0.0,0.0,1.5,45.5,41.5,5.5,4.5,0.0,0.0,6.5,0.0,13.0,0.0,0.0,11.5,6.5,5.5,4.5,43.5,42.5,0.0,0.0,44.5,0.0,0.0,44.5,43.5,0.0,0.0,0.0,42.5,0.0,43.5,0.0,0.0,9.0,43.0,0.0,7.5,0.0,0.0,0.0,22.0,14.0,0.0,0.0,0.0,5.5,4.5,0.0,0.0,6.5,0.0,8.0,0.0,12.5,0.0,0.0,4.5,43.5,42.5,41.5,0.0,0.0,0.0,45.5,44.5,0.0,0.0,0.0,43.5,41.5,6.5,5.5,0.0,0.0,8.0,0.0,0.0,10.5,7.5,5.5,42.5,0.0,0.0,42.5,6.5,0.0,0.0,6.5,0.0,0.0,9.0,42.5,0.0,0.0,0.0,42.5,11.5,0.0,0.0,0.0,7.5,6.5,5.5,45.5,44.5,0.0,0.0,0.0,45.5,44.5,0.0,0.0,0.0,45.5,44.5,0.0,0.0,0.0,18.0,11.5,44.5,8.5,0.0,10.0,0.0,0.0,8.5,0.0,0.0,13.0,0.0,0.0,0.0,52.5,1.5,0.5,3.223746657371521,2.5,49.5,1.5,0.0,0.0,51.5,50.5,0.0,0.0,0.0,51.0,49.5,0.0,0.0,0.0,3.723746657371521,0.0,48.5,47.5,0.0,0.0,51.5,4.5,0.0,50.0,0.0,0.0,0.0,1.5,51.5,49.5,47.5,0.0,48.5,0.0,0.0,50.5,0.0,0.0,0.0,49.5,6.5,2.5,47.5,0.0,48.5,0.0,0.0,47.5,4.5,3.5,0.0,0.0,5.5,0.0,0.0,5.5,3.223746657371521,48.5,0.0,0.0,3.723746657371521,0.0,4.5,48.5,0.0,0.0,0.0,48.5,0.0,0.0,8.0,47.5,0.0,0.0,18.0,15.0,11.0,9.5,0.0,48.0,0.0,0.0,47.5,13.0,0.0,0.0,0.0,0.0,0.0,51.5,50.5,5.5,3.5,2.5,0.0,0.0,4.5,0.0,0.0,6.5,0.0,9.5,8.0,0.0,0.0,11.0,0.0,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,9.5,6.5,4.5,0.0,5.5,0.0,0.0,0.0,13.0,0.0,0.0,2.5,0.0,6.0,4.5,3.5,0.0,0.0,0.0,8.0,0.0,9.5,0.0,0.0,27.5,51.5,47.5,7.5,6.5,1.5,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,5.5,4.5,0.0,0.0,0.0,0.0,0.0,49.5,4.5,1.5,48.5,0.0,0.0,3.723746657371521,3.223746657371521,48.5,2.5,0.0,0.0,2.5,0.0,0.0,0.0,48.5,0.0,0.0,6.5,5.5,48.5,0.0,0.0,48.5,0.0,0.0,25.5,48.5,7.5,0.0,13.0,10.0,0.0,0.0,14.5,0.0,19.5,0.0,0.0,7.5,0.0,18.0,11.5,0.0,0.0,0.0,0.0,10.5,7.5,50.5,3.223746657371521,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,6.5,4.5,0.0,5.5,0.0,0.0,0.0,2.5,1.5,0.0,0.0,5.5,4.5,3.5,0.0,0.0,0.0,6.5,0.0,0.0,9.0,50.5,0.0,0.0,0.0,13.0,11.5,0.0,0.0,0.0,1.5,0.0,10.5,7.5,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,4.5,0.0,5.5,0.0,6.5,0.0,0.0,8.5,0.0,9.5,0.0,0.0,13.5,0.0,0.0,31.0,28.5,0.0,0.0,0.0,1.5,1.5,0.0,4.5,3.5,2.5,0.0,0.5,0.0,0.0,0.5,0.0,0.0,0.5,0.0,5.5,0.0,0.0,3.5,1.5,0.0,2.5,0.0,0.0,6.5,4.5,0.0,5.5,0.0,0.0,10.5,8.5,7.5,0.0,0.0,9.5,0.0,0.0,11.5,0.0,13.0,0.0,0.0,52.5,1.9266639351844788,47.5,1.4266639351844788,42.5,0.5,0.0,7.5,41.5,2.5,1.5,0.0,0.0,6.0,4.5,3.223746657371521,0.0,3.723746657371521,0.0,0.0,0.0,0.0,3.723746657371521,3.223746657371521,1.5,0.0,2.5,0.0,0.0,0.0,6.0,4.5,0.0,0.0,0.0,8.5,41.5,0.0,0.0,9.5,0.0,12.0,0.0,0.0,26.0,44.5,3.723746657371521,3.223746657371521,1.5,43.5,0.0,0.0,43.5,2.5,0.0,0.0,2.5,0.0,0.0,0.0,43.5,4.5,0.0,6.5,5.5,0.0,0.0,12.5,8.5,0.0,0.0,0.0,13.0,6.5,5.0,0.0,0.0,0.0,20.5,0.0,0.0,45.5,2.5,1.5,0.0,0.0,7.5,6.5,5.5,3.5,0.0,4.5,0.0,0.0,0.0,0.0,14.0,8.5,0.0,12.0,10.5,9.5,0.0,0.0,0.0,0.0,15.5,0.0,0.0,2.5,46.5,1.5,0.0,0.0,1.5,0.0,0.0,46.5,5.5,4.5,3.5,0.0,0.0,0.0,6.5,0.0,0.0,12.5,8.5,4.5,3.5,0.0,0.0,5.5,0.0,6.5,0.0,0.0,10.5,0.0,0.0,0.0,45.0,0.0,0.0,0.0,4.5,3.223746657371521,51.5,50.5,49.5,48.5,1.5,0.0,2.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,49.5,48.5,0.0,0.0,51.5,50.5,0.0,0.0,0.0,51.5,6.5,5.5,50.5,0.0,0.0,49.5,0.0,0.0,49.5,7.5,48.5,0.0,0.0,0.0,0.0,6.5,5.5,0.0,0.0,10.5,9.5,8.0,0.0,0.0,0.0,12.0,0.0,0.0,43.5,41.5,3.223746657371521,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,13.0,10.5,8.5,4.5,0.0,5.5,0.0,6.5,0.0,7.5,0.0,0.0,9.5,0.0,0.0,11.5,0.0,0.0,0.0,4.5,3.223746657371521,42.5,1.5,0.0,2.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,42.5,0.0,0.0,5.5,42.5,0.0,0.0,42.5,6.5,0.0,7.5,0.0,8.5,0.0,9.5,0.0,12.0,0.0,0.0,8.5,7.5,6.5,0.0,0.0,0.0,9.5,0.0,12.5,10.5,0.0,0.0,15.5,0.0,0.0,48.5,44.5,4.5,1.5,0.0,3.223746657371521,2.5,0.0,0.0,3.723746657371521,0.0,0.0,6.5,5.5,0.0,0.0,12.5,9.5,8.5,7.5,0.0,0.0,0.0,10.5,0.0,0.0,0.0,13.5,47.5,3.223746657371521,46.5,2.5,45.5,1.5,0.0,0.0,1.5,0.0,0.0,45.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,5.5,46.5,4.5,45.5,0.0,0.0,45.5,0.0,0.0,4.5,0.0,0.0,6.5,45.5,0.0,46.5,0.0,0.0,7.5,45.5,0.0,46.5,0.0,0.0,10.5,45.5,9.5,8.5,0.0,0.0,0.0,9.5,8.5,46.5,0.0,0.0,46.5,0.0,0.0,0.0,46.0,11.5,0.0,12.5,0.0,0.0,0.0,2.5,1.5,0.0,0.0,3.723746657371521,3.223746657371521,0.0,0.0,9.0,4.5,0.0,6.5,5.5,0.0,0.0,7.5,0.0,0.0,0.0,47.5,18.0,45.5,14.5,0.0,0.0,14.5,0.0,0.0,24.5,0.0,0.0,16.5,0.0,0.0,8.5,3.223746657371521,2.5,51.5,1.5,49.5,0.0,50.5,0.0,0.0,49.5,0.0,50.5,0.0,0.0,1.5,0.0,0.0,50.5,49.5,0.0,0.0,51.5,0.0,0.0,3.723746657371521,0.0,51.5,6.5,50.5,4.5,49.5,0.0,0.0,49.5,5.5,0.0,0.0,5.5,0.0,0.0,4.5,0.0,5.5,0.0,0.0,49.5,0.0,50.5,7.5,0.0,0.0,7.5,0.0,0.0,4.5,0.0,5.5,0.0,7.5,6.5,0.0,0.0,0.0,12.5,51.5,9.5,0.0,50.0,0.0,0.0,9.5,0.0,11.0,0.0,0.0,13.5,0.0,51.5,28.5,16.0,50.5,0.0,0.0,18.5,0.0,23.5,0.0,0.0,0.0,15.0,0.0,0.0,1.5,6.0,3.223746657371521,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,0.5,0.0,4.5,0.0,0.0,7.5,0.0,9.0,0.0,0.0,3.223746657371521,1.5,0.0,2.5,0.0,0.0,3.723746657371521,0.0,5.5,4.5,0.0,0.0,7.5,6.5,0.0,0.0,8.5,0.0,9.5,0.0,11.0,0.0,13.0,0.0,0.0,12.5,1.5,3.5,3.223746657371521,11.5,2.5,1.5,1.5,0.0,2.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,9.5,5.5,2.5,3.5,1.5,0.0,0.0,1.5,0.0,4.5,0.0,0.0,3.5,0.0,4.5,0.0,0.0,6.5,2.5,1.5,0.0,0.0,0.0,7.5,1.5,0.0,2.5,0.0,0.0,2.5,1.5,8.5,0.0,0.0,8.5,0.0,0.0,8.5,0.0,0.0,10.5,2.5,1.5,0.0,0.0,0.0,2.5,1.5,0.0,0.0,0.0,2.5,1.5,0.0,0.0,0.0,3.723746657371521,0.0,6.5,1.5,4.5,0.0,8.5,5.5,0.0,0.0,0.0,4.5,4.5,3.5,2.5,0.0,0.0,0.0,5.5,0.0,0.0,7.5,5.5,4.0,0.0,5.5,0.0,0.0,4.5,6.5,3.5,0.0,0.0,0.0,5.5,0.0,0.0,3.5,9.0,0.0,0.0,0.0,4.5,11.5,8.5,7.5,0.0,0.0,9.5,0.0,10.5,0.0,0.0,0.0,8.5,7.5,5.5,0.0,6.5,0.0,0.0,6.0,0.0,0.0,11.5,10.5,9.5,0.0,8.5,6.5,0.0,0.0,0.0,6.5,0.0,9.0,0.0,0.0,6.0,0.0,0.0,0.0,11.5,6.5,3.5,1.5,0.0,3.0,2.5,1.5,0.0,0.0,0.0,2.5,0.0,4.5,0.0,0.0,1.5,10.5,4.5,0.0,8.5,6.5,5.5,0.0,0.0,0.0,0.0,0.0,3.223746657371521,7.5,5.5,2.5,0.0,0.0,2.5,6.5,0.0,0.0,6.5,0.0,0.0,8.5,2.5,0.0,0.0,2.5,0.0,0.0,3.723746657371521,0.0,8.5,5.5,7.5,4.5,0.0,0.0,0.0,0.0,5.5,10.0,0.0,0.0,0.0,0.0,1.5,0.0,5.5,4.5,2.5,0.0,3.5,0.0,0.0,0.0,0.0,39.5,1.5,3.5,3.5,25.5,14.5,2.5,13.5,1.5,0.0,0.0,1.5,0.0,0.0,13.5,0.0,0.0,19.5,2.5,1.5,18.5,15.5,0.0,16.5,0.0,17.5,0.0,0.0,0.0,18.5,15.5,0.0,17.5,16.5,0.0,0.0,0.0,0.0,18.5,15.5,0.0,16.5,0.0,17.5,0.0,0.0,0.0,22.5,2.5,20.5,1.5,0.0,0.0,21.5,1.5,0.0,0.0,1.5,0.0,0.0,20.5,0.0,21.5,0.0,0.0,24.5,23.5,1.5,0.0,2.5,0.0,0.0,2.5,1.5,0.0,0.0,0.0,1.5,0.0,2.5,0.0,0.0,1.5,30.5,29.5,28.5,27.5,26.5,0.0,0.0,0.0,0.0,0.0,33.5,31.5,0.0,32.5,0.0,0.0,38.5,36.5,35.5,34.5,0.0,0.0,0.0,37.5,0.0,0.0,0.0,32.5,2.5,28.5,26.5,0.0,27.5,0.0,0.0,30.5,29.5,0.0,0.0,31.5,0.0,0.0,29.5,26.5,0.0,27.5,0.0,28.5,0.0,0.0,30.5,0.0,31.5,0.0,0.0,33.5,2.5,0.0,0.0,36.5,35.5,2.5,34.5,0.0,0.0,34.5,0.0,0.0,2.5,0.0,0.0,38.5,2.5,37.5,0.0,0.0,37.5,0.0,0.0,2.5,0.0,0.0,35.5,29.5,14.5,11.5,4.5,13.5,0.0,0.0,13.5,5.5,0.0,6.5,0.0,0.0,5.5,0.0,6.5,0.0,0.0,0.0,25.5,19.5,6.5,16.5,15.5,4.5,0.0,5.5,0.0,0.0,4.5,0.0,5.5,0.0,0.0,17.5,4.5,0.0,0.0,5.5,18.5,4.5,0.0,0.0,4.5,0.0,0.0,18.5,0.0,0.0,18.5,15.5,0.0,17.0,0.0,0.0,0.0,21.5,6.5,4.5,20.5,0.0,0.0,20.5,0.0,5.5,0.0,0.0,0.0,23.5,6.5,5.5,22.5,4.5,0.0,0.0,4.5,0.0,0.0,22.5,0.0,0.0,0.0,24.5,6.5,5.0,0.0,0.0,0.0,4.5,0.0,6.5,5.5,0.0,0.0,8.0,0.0,9.5,0.0,0.0,7.5,6.5,27.5,26.5,4.5,0.0,5.5,0.0,0.0,5.5,4.5,0.0,0.0,0.0,5.5,4.5,28.5,0.0,0.0,28.5,0.0,0.0,28.5,0.0,0.0,27.5,26.5,0.0,0.0,28.5,0.0,0.0,9.0,28.0,0.0,0.0,28.5,11.0,0.0,13.0,0.0,0.0,11.5,0.0,0.0,34.5,7.5,31.5,4.5,30.5,0.0,0.0,6.5,5.5,30.5,0.0,0.0,30.5,0.0,0.0,30.5,0.0,0.0,32.5,4.5,0.0,6.5,5.5,0.0,0.0,0.0,6.5,5.5,4.5,33.5,0.0,0.0,33.5,0.0,0.0,33.5,0.0,0.0,33.5,0.0,0.0,8.5,33.5,31.0,0.0,32.5,0.0,0.0,0.0,11.5,10.5,32.0,9.5,30.5,0.0,0.0,30.5,0.0,0.0,0.0,0.0,32.5,30.5,0.0,13.0,0.0,0.0,33.5,0.0,0.0,5.5,4.5,0.0,0.0,6.5,0.0,11.5,8.0,0.0,0.0,0.0,37.5,6.5,5.5,4.5,36.5,0.0,0.0,36.5,0.0,0.0,0.0,0.0,5.5,4.5,38.5,0.0,0.0,38.5,0.0,0.0,38.5,0.0,0.0,1.5,20.0,0.0,27.5,0.0,33.0,0.0,0.0,22.5,0.0,2.5,29.0,0.0,0.0,29.5,3.5,0.0,0.0,3.5,0.0,0.0,27.5,21.5,14.5,8.5,4.5,13.5,2.5,1.5,0.0,0.0,3.5,3.5,0.0,0.0,0.0,0.0,13.5,6.5,5.5,0.0,0.0,0.0,3.5,6.5,0.0,0.0,0.0,13.5,0.0,0.0,3.223746657371521,15.5,2.5,0.0,0.0,3.5,17.5,1.5,16.5,0.0,0.0,2.5,16.5,0.0,0.0,0.0,18.5,1.5,0.0,2.5,0.0,0.0,20.5,2.5,0.0,19.5,0.0,0.0,1.5,0.0,2.5,0.0,0.0,0.0,3.723746657371521,0.0,6.5,17.0,4.5,3.5,15.5,0.0,0.0,0.0,5.5,0.0,15.5,0.0,0.0,5.5,18.5,4.5,0.0,0.0,20.0,0.0,4.5,0.0,0.0,0.0,8.0,15.5,0.0,17.5,0.0,20.0,0.0,0.0,9.5,0.0,0.0,2.5,3.5,25.0,22.5,1.5,0.0,0.0,23.5,0.0,0.0,1.5,0.0,26.5,0.0,0.0,0.0,3.723746657371521,3.223746657371521,23.0,0.0,25.5,0.0,0.0,0.0,3.5,7.5,24.5,6.5,5.5,23.0,0.0,4.5,0.0,0.0,23.5,0.0,0.0,23.5,22.5,0.0,0.0,0.0,5.5,26.5,4.5,25.5,0.0,0.0,0.0,4.5,0.0,0.0,25.5,6.5,0.0,0.0,6.5,0.0,26.5,0.0,0.0,24.5,9.5,8.5,0.0,0.0,23.0,0.0,0.0,10.5,26.5,9.5,0.0,0.0,9.5,0.0,0.0,26.5,25.5,0.0,0.0,0.0,0.0,35.5,30.5,28.5,8.5,3.5,1.5,0.0,2.5,0.0,0.0,4.5,0.0,6.5,5.5,0.0,0.0,7.5,0.0,0.0,9.5,0.0,0.0,6.5,5.5,3.5,29.5,1.5,0.0,4.5,3.5,2.5,0.0,0.0,0.0,0.0,4.5,3.5,2.0,0.0,0.0,0.0,0.0,2.5,0.0,0.0,29.5,0.0,0.0,11.5,29.5,7.5,0.0,9.5,8.5,0.0,0.0,0.0,7.5,0.0,10.0,8.5,0.0,0.0,0.0,14.5,29.5,13.0,0.0,0.0,0.0,0.0,6.5,33.5,3.5,3.5,31.5,2.5,1.5,0.0,0.0,0.0,2.5,32.5,1.5,0.0,0.0,1.5,0.0,0.0,32.5,0.0,0.0,32.5,5.5,31.5,4.5,0.0,0.0,4.5,0.0,0.0,0.0,5.5,4.5,0.0,0.0,0.0,3.5,0.0,0.0,1.5,34.5,0.0,0.0,3.223746657371521,34.5,2.5,0.0,0.0,2.5,0.0,0.0,3.723746657371521,0.0,3.5,34.5,4.5,0.0,5.5,0.0,0.0,4.5,0.0,5.5,0.0,0.0,0.0,9.5,31.5,0.0,32.5,8.5,7.5,0.0,0.0,0.0,33.5,3.5,8.5,7.5,0.0,0.0,0.0,0.0,3.5,8.5,34.5,0.0,7.5,0.0,0.0,34.5,0.0,0.0,0.0,33.5,31.5,10.5,0.0,0.0,32.5,12.0,0.0,0.0,12.0,0.0,0.0,34.5,0.0,10.5,0.0,0.0,3.223746657371521,36.5,1.5,0.0,0.0,38.0,1.5,0.0,2.5,0.0,0.0,3.5,2.0,0.0,0.0,0.0,3.723746657371521,0.0,37.5,6.5,4.5,0.0,5.5,36.5,0.0,0.0,0.0,36.5,12.0,8.5,0.0,0.0,0.0,0.0,6.0,38.5,4.5,0.0,0.0,4.5,0.0,0.0,38.5,0.0,8.5,0.0,0.0,1.5,43.5,2.5,41.5,1.5,40.5,0.0,0.0,40.5,0.0,0.0,42.5,1.5,0.0,0.0,1.5,0.0,0.0,5.5,4.5,40.5,3.5,0.0,0.0,3.723746657371521,3.223746657371521,41.5,0.0,42.5,0.0,0.0,0.0,42.5,41.5,0.0,0.0,0.0,40.5,0.0,41.5,0.0,42.5,0.0,0.0,41.5,7.5,0.0,0.0,6.5,0.0,42.5,0.0,8.0,0.0,0.0,3.5,52.5,46.5,1.5,44.5,0.0,0.0,3.5,45.5,44.5,2.5,0.0,0.0,2.5,0.0,0.0,2.5,0.0,0.0,4.5,45.5,44.5,0.0,0.0,0.0,45.5,44.5,5.5,0.0,0.0,5.5,0.0,0.0,0.0,2.5,49.5,48.5,47.5,0.0,1.5,0.0,0.0,0.0,50.5,1.5,0.0,0.0,51.5,0.0,1.5,0.0,0.0,49.5,3.5,48.5,47.5,0.0,0.0,0.0,4.5,48.5,47.5,0.0,0.0,0.0,48.5,47.5,0.0,0.0,5.5,0.0,0.0,50.5,4.5,3.5,0.0,0.0,0.0,3.5,0.0,51.5,5.5,4.5,0.0,0.0,6.5,0.0,0.0,5.5,4.5,0.0,0.0,6.5,0.0,8.5,0.0,0.0,6.5,5.5,4.5,3.5,2.5,1.5,0.0,0.0,0.0,0.0,0.0,0.0,7.5,0.0,0.0,2.5,0.0,51.5,0.0,0.0,52.5,9.5,45.5,2.5,43.5,1.5,42.0,0.0,0.0,0.0,1.5,0.0,44.5,0.0,0.0,43.5,5.5,4.5,3.5,41.0,0.0,42.5,0.0,0.0,42.5,0.0,0.0,42.0,0.0,0.0,42.0,40.5,6.5,0.0,0.0,0.0,6.5,0.0,0.0,8.0,4.5,3.5,0.0,0.0,44.5,5.5,0.0,6.5,0.0,0.0,0.0,0.0,1.5,47.5,46.5,0.0,0.0,50.5,49.5,48.5,0.0,0.0,0.0,51.5,0.0,0.0,48.5,3.5,2.5,47.0,0.0,0.0,47.5,46.5,0.0,3.5,0.0,0.0,0.0,0.0,3.223746657371521,2.5,50.5,0.0,0.0,49.5,0.0,51.0,0.0,0.0,3.723746657371521,0.0,6.5,0.0,0.0,0.0,3.5,2.5,0.0,0.0,8.5,5.5,0.0,0.0,0.0],"value":[0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,6.0,0.0,0.0,6.0,0.0,0.0,91.6,0.0,0.0,6.67,0.0,0.0,0.0,69.5,69.53,0.0,0.0,0.0,1.0,0.0,0.0,34.75,0.0,86.4,0.0,78.0,98.55,0.0,0.0,0.0,0.0,0.0,0.0,0.0,86.86,0.0,77.25,73.39,0.0,91.6,85.96,77.86,42.9,0.0,0.0,0.0,63.12,82.44,56.27,0.0,93.82,120.0,0.0,0.0,0.0,89.88,0.0,35.81,0.0,0.0,0.0,0.0,0.0,0.0,65.9225,73.794875,0.0,0.0,0.0,0.0,0.0,0.0,76.30472222222221,78.0693103448276,76.30322580645162,73.33857142857143,79.32736842105264,0.0,75.6918115942029,73.89217391304348,79.10948275862066,0.0,91.26857142857143,0.0,0.0,0.0,71.932,0.0,0.0,75.05222222222223,75.93954545454545,72.68444444444444,0.0,82.44666666666666,81.51923076923077,0.0,0.0,72.09847457627117,65.35944444444445,72.59212765957447,0.0,0.0,0.0,0.0,0.0,0.0,83.08266666666667,0.0,0.0,65.23479999999999,68.33,0.0,0.0,75.75228571428572,80.6846153846154,0.0,65.97999999999999,0.0,79.02636363636364,72.31681818181819,81.63290322580644,65.92457831325301,0.0,0.0,0.0,0.0,0.0,0.0,67.22166666666668,61.29,0.0,71.83636363636363,0.0,70.77,70.31666666666666,61.66904761904762,0.0,0.0,0.0,0.0,0.0,74.0,0.0,84.7,83.6925,75.47857142857143,0.0,0.0,79.9,77.0,0.0,58.24,76.3,0.0,0.0,75.0,70.69,0.0,123.1,85.1,0.0,0.0,0.0,0.0,51.7,0.0,62.83,55.2,0.0,0.0,0.0,0.0,87.43,68.5,0.0,71.0,78.7,88.0,0.0,0.0,0.0,74.8,64.08,64.75,75.0,0.0,0.0,0.0,76.04333333333334,0.0,0.0,79.28428571428572,80.1047619047619,77.09923076923077,0.0,106.62,0.0,0.0,76.015,71.42666666666668,87.17857142857143,0.0,0.0,100.3,0.0,0.0,0.0,0.0,41.0,0.0,61.52,70.0,82.0,116.28,0.0,96.5,0.5,0.0,0.0,50.29333333333333,62.77333333333333,0.0,83.53333333333335,0.0,0.0,0.0,64.75,60.0,66.3,0.0,80.0,66.45,0.0,0.0,0.0,90.43,94.88,0.0,92.85,0.0,0.0,0.0,0.0,0.0,80.4,81.0,0.0,75.47,80.09,73.89,0.0,59.5,68.23,0.0,70.43,0.0,98.49,0.0,70.91,91.32,0.0,69.82,0.0,0.0,0.0,108.35,103.39,93.75,74.8,0.0,0.0,91.26346153846156,0.0,81.91611111111112,89.25428571428571,0.0,0.0,0.0,0.0,0.0,84.54375,86.60285714285715,0.0,84.60208333333333,76.56090909090909,0.0,79.03658536585365,88.92333333333333,0.0,0.0,0.0,0.0,0.0,77.31214285714285,75.716,0.0,76.315,105.92,0.0,102.02833333333335,81.08,0.0,0.0,0.0,90.0,58.6,100.3,0.0,0.0,64.005,68.15333333333334,0.0,75.48666666666666,78.5266666666667,0.0,0.0,0.0,0.0,0.0,95.37411764705882,79.41999999999999,0.0,99.82430232558139,0.0,0.0,0.0,0.0,88.54,0.0,96.25805555555557,89.495,0.0,0.0,64.85799999999999,74.8,0.0,105.4,0.0,74.8,98.6,0.0,0.0,0.0,0.0,0.0,0.0,87.96386363636363,0.0,84.34760869565216,86.15719999999999,0.0,0.0,85.17136363636365,0.0,83.40830188679244,84.48444444444443,0.0,0.0,86.2992857142857,0.0,80.426,82.0641791044776,0.0,78.58410256410257,0.0,88.278125,79.22549999999998,0.0,0.0,89.8037037037037,87.28850000000001,90.5758,0.0,0.0,0.0,0.0,0.0,79.75679999999998,78.94735294117645,0.0,82.83238095238096,82.84767441860468,79.40148648648652,0.0,0.0,0.0,0.0,0.0,0.0,92.57611111111113,0.0,0.0,79.97533333333334,83.7770588235294,88.67111111111112,0.0,0.0,67.9725,0.0,0.0,78.9325,78.2,74.8,0.0,0.0,0.0,93.64777777777778,107.05272727272724,0.0,82.01666666666667,0.0,98.6,96.91,0.0,0.0,84.56,99.04857142857144,0.0,0.0,0.0,85.906,108.8,0.0,80.03,76.87,0.0,0.0,0.0,88.0,105.4,64.14,98.1,0.0,0.0,74.8,69.5,0.0,70.67,0.0,0.0,88.12,94.35,74.8,0.0,0.0,0.0,81.99088235294118,95.78166666666665,0.0,71.58333333333333,72.33333333333333,0.0,119.435,99.33,0.0,0.0,96.9,168.3,0.0,0.0,75.0,142.8,0.0,71.2,74.8,0.0,52.5,80.485,0.0,0.0,0.0,0.0,0.0,0.0,89.70231707317072,0.0,85.40050505050505,88.85488888888888,0.0,0.0,84.26459677419356,80.15639097744362,85.32079207920793,0.0,0.0,87.42182608695653,90.18872727272726,86.43680000000002,0.0,0.0,0.0,94.3082608695652,85.40235294117646,0.0,88.06894230769231,94.51361445783131,0.0,86.99112,89.62245714285724,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,86.5738888888889,85.02323943661973,0.0,90.5588235294118,91.67297297297299,0.0,91.84300000000005,82.72386363636366,0.0,0.0,0.0,93.06125,121.83999999999999,0.0,102.19833333333332,62.957499999999996,0.0,80.47,90.02555555555554,0.0,0.0,87.14636363636366,0.0,85.65777777777777,84.43583333333333,80.12500000000001,0.0,79.04383928571427,0.0,0.0,83.76589743589743,84.79714285714284,90.50249999999998,0.0,0.0,0.0,0.0,0.0,108.01400000000001,107.1,105.48,0.0,140.78333333333333,150.8,0.0,0.0,84.02499999999999,132.33,124.22666666666667,0.0,0.0,0.0,0.0,67.15,63.01,84.69,51.0,0.0,110.53,0.0,68.34,86.39,0.0,0.0,0.0,89.76733333333331,95.89218309859159,0.0,0.0,0.0,88.38085714285718,0.0,0.0,86.04008547008549,97.76808510638298,0.0,77.5311111111111,0.0,82.19421052631579,85.51,0.0,217.75,212.73,0.0,0.0,106.9542857142857,0.0,99.80161538461542,102.12595555555548,0.0,0.0,0.0,0.0,97.7331896551724,95.51050000000002,0.0,0.0,0.0,110.359,102.82785714285713,119.49000000000001,152.7,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,46.8,41.93043478260869,0.0,37.0,43.22222222222222,0.0,0.0,38.201052631578946,41.892857142857146,0.0,0.0,37.284,35.306666666666665,0.0,37.56170212765957,38.29666666666667,0.0,0.0,0.0,0.0,38.89607843137255,0.0,45.339285714285715,0.0,40.10625,43.73028571428571,0.0,45.6,0.0,37.333333333333336,0.0,34.394,36.11764705882353,0.0,42.205128205128204,52.76470588235294,0.0,0.0,36.839,35.76470588235294,0.0,41.16923076923077,33.75,0.0,0.0,0.0,0.0,44.0,34.75,52.89622641509434,0.0,0.0,0.0,0.0,45.25749999999999,0.0,41.394444444444446,41.04875,0.0,48.0,44.82875,35.4,0.0,0.0,45.10933333333333,45.18541666666667,48.625,0.0,0.0,0.0,0.0,0.0,0.0,0.0,16.11,37.0,0.0,30.0,25.11,0.0,0.0,0.0,0.0,0.0,37.4,35.642857142857146,0.0,44.57142857142857,0.0,0.0,38.95,39.09090909090909,38.25,33.15555555555555,0.0,0.0,0.0,39.0,22.5,37.15,0.0,0.0,43.2,41.80800000000001,48.26666666666667,0.0,0.0,0.0,38.5,43.0,35.1,18.5,0.0,0.0,0.0,0.0,0.0,53.68,0.0,0.0,49.7,42.333333333333336,51.2725,0.0,0.0,34.855000000000004,38.2,42.541999999999994,51.51555555555555,31.455,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,38.55,50.0,37.7,0.0,39.0,25.0,47.0,0.0,31.59,22.5,0.0,0.0,0.0,0.0,38.0,49.400000000000006,0.0,0.0,55.8,58.0,48.8,0.0,37.83,42.11,0.0,0.0,27.5,30.0,0.0,55.8,0.0,45.0,0.0,36.55,41.52,0.0,0.0,0.0,0.0,51.199999999999996,67.0,0.0,0.0,40.25,40.89666666666667,0.0,48.72,54.875,0.0,0.0,31.45,38.81818181818182,0.0,0.0,38.48285714285714,38.0,0.0,56.95333333333334,42.84826086956521,0.0,79.23333333333333,0.0,37.754999999999995,0.0,0.0,51.234,48.0,0.0,47.0,44.0,0.0,0.0,0.0,46.81,44.39692307692307,52.09636363636364,0.0,0.0,0.0,71.615,79.2,0.0,27.07,0.0,80.14,68.4,0.0,99.21,74.28,0.0,0.0,0.0,0.0,0.0,0.0,62.93283582089552,72.67736842105263,57.418333333333344,0.0,0.0,0.0,59.31867924528302,53.11722222222222,0.0,0.0,0.0,54.68781818181818,53.86739130434783,50.61095238095238,0.0,0.0,54.784857142857135,54.80088235294118,59.29625000000001,0.0,47.128214285714286,0.0,62.25714285714286,0.0,49.594999999999985,52.30470588235294,0.0,0.0,0.0,57.17129032258065,0.0,0.0,58.63577777777777,59.484736842105264,0.0,58.47826086956522,58.5,0.0,54.69787234042553,59.828648648648645,0.0,0.0,0.0,0.0,0.0,0.0,60.0054,0.0,63.378733333333344,61.318113207547164,55.046666666666674,70.54571428571428,0.0,0.0,62.079411764705874,52.390714285714296,0.0,0.0,60.73692307692307,67.54947368421053,55.167142857142856,0.0,67.58809523809524,64.45083333333334,0.0,51.388888888888886,54.029500000000006,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,59.37461538461538,62.938,0.0,0.0,56.77611111111111,58.52916666666667,0.0,57.43214285714286,44.824,0.0,0.0,66.2825,67.0,68.425,0.0,0.0,0.0,0.0,51.48538461538462,50.17,0.0,34.704,37.343333333333334,0.0,108.0,65.0,0.0,0.0,0.0,0.0,55.0492,55.559999999999995,0.0,0.0,57.60069767441861,60.22200000000001,0.0,57.49631578947369,54.225,0.0,50.410645161290326,67.2,0.0,0.0,0.0,44.477999999999994,45.864285714285714,50.4,60.125,0.0,0.0,0.0,61.93304347826087,58.30461538461537,46.49153846153846,0.0,0.0,71.95333333333333,61.3,0.0,0.0,66.32,61.86470588235294,0.0,62.175,74.736,0.0,0.0,0.0,0.0,0.0,60.777142857142856,0.0,67.91666666666667,65.705,0.0,0.0,49.02090909090909,57.586666666666666,0.0,62.8125,0.0,0.0,55.17099999999999,59.4,0.0,0.0,58.4175,71.4,0.0,0.0,57.82375,58.95249999999999,0.0,53.275,55.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,42.6,27.0,0.0,45.82,41.4,0.0,58.480000000000004,0.0,37.8,60.0,0.0,0.0,69.5,86.0,30.6,0.0,0.0,0.0,36.0,34.0,28.1,40.04666666666667,0.0,0.0,74.75,68.0,0.0,42.394,0.0,58.715,61.6,24.94,0.0,0.0,0.0,0.0,0.0,49.87416666666667,0.0,54.87636363636364,51.64293103448276,0.0,0.0,0.0,0.0,52.910000000000004,47.45,0.0,36.335,44.181666666666665,0.0,0.0,48.5,0.0,0.0,57.64,49.60166666666666,0.0,0.0,0.0,48.27,45.86,0.0,46.36666666666667,48.279999999999994,0.0,47.0,49.482000000000006,0.0,0.0,54.47,0.0,0.0,73.34,68.4,60.3,0.0,0.0,47.67857142857143,51.59,58.866666666666674,0.0,46.6784,0.0,0.0,58.89666666666667,57.8275,0.0,34.16,0.0,0.0,60.64,52.65,59.205,0.0,46.44,0.0,61.7,62.0,0.0,0.0,0.0,54.35,26.01,0.0,0.0,35.2,0.0,55.8,72.21,0.0,70.405,0.0,0.0,53.0,57.5375,68.0,0.0,0.0,82.0,67.575,54.0,0.0,0.0,0.0,34.0,41.47,0.0,27.145,31.45,0.26,0.0,0.0,0.0,0.0,0.0,71.046,74.82622950819672,77.89238095238096,0.0,0.0,75.57218181818182,80.39117647058823,0.0,0.0,68.521,64.8328125,0.0,84.80999999999999,0.0,54.8,0.0,72.73,82.68,0.0,0.0,0.0,0.0,0.0,0.0,0.0,6.0,0.0,0.0,0.0,0.0,101.25,73.74,0.0,0.0,0.0,88.395,0.0,51.525,40.75,101.7,103.05,0.0,0.0,0.0,0.0,0.0,91.86823529411765,0.0,100.8,97.31549295774647,0.0,0.0,0.0,0.0,89.98076923076923,0.0,0.0,94.425,104.725,0.0,88.0,80.1,109.65,0.0,0.0,0.0,87.85249999999999,86.73478260869565,89.73352941176472,0.0,0.0,93.47142857142856,116.80999999999999,0.0,91.9175,0.0,82.34,80.75,150.0,0.0,0.0,0.0,0.0,99.75,0.0,106.2375,100.30266666666668,0.0,0.0,101.9275,102.0125,109.04842105263161,0.0,0.0,104.12142857142858,95.04222222222222,0.0,94.24857142857142,97.51249999999999,0.0,0.0,0.0,115.0,114.0,0.0,132.985,259.29,0.0,0.0,0.0,95.0,0.0,99.49,95.0,119.0,19.09,0.0,0.0,0.0,0.0,104.84888888888888,100.07727272727274,0.0,98.31216000000003,100.22458100558661,0.0,0.0,115.29582278481011,114.84317073170733,0.0,104.44032786885245,110.1926388888889,0.0,0.0,0.0,0.0,105.50681159420289,100.55442477876109,0.0,108.24148936170214,106.49,0.0,0.0,127.10235294117646,117.565,0.0,102.55,99.0,0.0,0.0,0.0,116.30921348314601,0.0,112.09985185185188,0.0,108.73049180327872,0.0,112.09719999999997,113.42882352941176,0.0,0.0,0.0,0.0,108.97904761904758,0.0,113.62906040268459,0.0,109.54225108225104,0.0,0.0,107.70224999999999,0.0,0.0,0.0,115.50733333333336,114.52535211267607,0.0,105.68916666666667,116.34375,0.0,113.15333333333335,123.16166666666665,0.0,0.0,156.53199999999998,0.0,0.0,145.0,140.05,130.0,0.0,109.8,114.66,0.0,0.0,0.0,0.0,0.0,0.0,200.0,0.0,114.04113636363635,101.55043478260869,0.0,0.0,0.0,104.65933333333334,124.71511627906976,0.0,0.0,0.0,102.24150943396225,110.82216216216216,0.0,0.0,0.0,108.38,124.56846153846155,108.378,0.0,0.0,116.85181818181815,124.46821428571428,0.0,0.0,0.0,0.0,112.34614457831324,115.09852941176469,0.0,113.15009523809522,111.3092558139534,0.0,0.0,116.31192052980131,117.26591836734697,0.0,0.0,0.0,0.0,127.83,0.0,0.0,0.0,0.0,126.92,0.0,118.6625,120.69,0.0,117.69431372549019,0.0,116.65449999999996,115.33142857142856,0.0,99.7875,0.0,71.37,0.0,95.0,102.39,0.0,150.42,176.32,0.0,50.87,0.0,0.0,180.38,181.43,0.0,0.0,132.85416666666666,128.19818181818184,0.0,0.0,144.06882352941176,146.25,0.0,186.0,146.0,0.0,0.0,0.0,0.0,103.69661971830986,117.79666666666667,99.39086206896552,0.0,117.200625,0.0,112.19210526315787,110.95183908045979,0.0,0.0,0.0,0.0,118.17,0.0,0.0,0.0,130.7859574468085,0.0,0.0,143.73400000000004,122.32000000000001,0.0,159.7625,0.0,144.0,150.79250000000002,0.0,120.6,100.0,0.0,116.75377952755905,0.0,0.0,127.25705645161295,135.34221238938053,0.0,111.97508771929824,0.0,0.0,0.0,132.83545454545455,0.0,145.81499999999997,132.94,118.29,78.35,0.0,0.0,0.0,0.0,0.0,82.36666666666666,128.78,0.0,123.05,0.0,0.0,0.0,0.0,120.6838,117.26906403940887,0.0,123.63811764705882,123.09035502958582,0.0,0.0,125.61666666666666,98.41857142857143,0.0,120.6799111111111,118.94506493506488,0.0,0.0,0.0,0.0,0.0,99.45,92.54846153846152,107.45222222222222,0.0,124.14890410958903,120.81629213483147,0.0,0.0,0.0,0.0,0.0,110.75,0.0,164.70000000000002,143.48333333333332,0.0,96.69999999999999,148.04,0.0,0.0,0.0,124.9503448275862,133.38833333333335,0.0,134.68026315789476,121.81400000000001,0.0,130.213,120.856,0.0,126.0,161.175,0.0,0.0,85.75,0.0,110.0,129.0,154.44,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,60.751999999999995,57.710303030303024,52.69666666666667,62.31590909090908,0.0,0.0,46.86666666666667,48.75,0.0,0.0,0.0,56.3423076923077,56.76636363636364,0.0,62.70526315789474,72.635,0.0,52.400000000000006,42.711666666666666,0.0,0.0,0.0,0.0,0.0,56.86666666666667,61.6528,0.0,61.234782608695646,53.14333333333334,0.0,65.67916666666666,63.537826086956514,0.0,56.46969696969697,54.84705882352941,0.0,0.0,74.73,71.33333333333333,0.0,50.57142857142857,70.10888888888888,0.0,0.0,0.0,0.0,0.0,0.0,48.88611111111111,0.0,56.86800000000001,42.0,0.0,0.0,0.0,0.0,52.99142857142857,52.0,0.0,0.0,79.06333333333333,74.82000000000001,0.0,42.0,63.1125,0.0,0.0,112.5875,119.05,74.0,0.0,0.0,49.19,0.0,63.82000000000001,45.0,0.0,77.96666666666667,0.0,37.725,74.0,0.0,45.0,2.6,0.0,61.616666666666674,0.0,0.0,46.452000000000005,36.0,0.0,0.0,59.518125000000005,0.0,0.0,46.83200000000001,0.0,0.0,51.905,51.539375,44.945,62.165,0.0,0.0,92.0,0.0,0.0,49.7625,65.3,44.1,0.0,104.225,0.0,54.0,71.76,0.0,0.0,68.32272727272726,0.0,88.42857142857143,0.0,0.0,67.57142857142857,0.0,0.0,76.77916666666667,71.72,0.0,0.0,60.0,56.575,34.85,0.0,0.0,0.0,0.0,0.0,67.71119047619047,0.0,78.29833333333333,73.07600000000001,0.0,0.0,0.0,67.4556,0.0,73.9504,77.25833333333334,0.0,0.0,75.24166666666667,0.0,0.0,0.0,89.39489795918368,96.33859154929577,0.0,0.0,0.0,97.31270833333333,103.56653846153846,88.28818181818183,0.0,0.0,0.0,74.59268292682926,0.0,0.0,83.54555555555557,84.71437499999999,0.0,0.0,0.0,83.77136363636365,0.0,75.685,78.22142857142856,0.0,0.0,0.0,83.51714285714286,0.0,92.19192307692308,89.12014925373133,0.0,81.93366666666665,0.0,84.81545454545454,84.55909090909091,0.0,0.0,0.0,0.0,0.0,76.74661016949153,0.0,83.83928571428571,85.83576271186442,0.0,0.0,89.10227272727272,89.00431818181818,84.15274509803923,0.0,0.0,0.0,90.9723188405797,85.77065217391304,0.0,71.225,94.8955,0.0,146.5,85.67285714285715,0.0,0.0,0.0,88.455,79.66947368421053,0.0,0.0,0.0,70.39999999999999,73.68806451612903,0.0,0.0,70.36894736842105,0.0,0.0,78.48688524590163,86.35263157894738,0.0,0.0,83.89586206896553,0.0,0.0,88.02733333333335,100.38888888888889,0.0,94.143,79.0076923076923,0.0,0.0,0.0,90.92,97.11,0.0,0.0,0.0,0.0,73.27333333333333,88.33333333333333,51.87,95.0,50.91,0.0,0.0,0.0,0.0,0.0,0.0,73.30827586206895,77.63,0.0,82.82363636363635,80.0,0.0,60.16,0.0,41.4,52.2,0.0,127.14999999999999,47.5,0.0,0.0,79.80743902439026,0.0,0.0,108.6375,96.41000000000001,77.02285714285713,0.0,0.0,50.85,48.18,68.26666666666667,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,75.29283582089553,0.0,72.20399999999998,74.10846153846151,79.28539473684208,0.0,0.0,69.28,0.0,88.13272727272728,101.83333333333333,65.08333333333333,0.0,0.0,70.05,75.75333333333333,0.0,70.36888888888889,67.01142857142857,0.0,72.16536231884056,0.0,62.81,62.760000000000005,0.0,0.0,0.0,67.9875,104.78333333333335,0.0,75.79333333333332,71.63687500000002,102.38666666666667,0.0,80.85,0.0,47.769999999999996,0.0,62.94,62.07416666666668,0.0,0.0,126.67,113.56599999999999,0.0,61.900000000000006,118.8,0.0,0.0,0.0,0.0,68.285,0.0,0.0,60.336666666666666,58.81,67.5,0.0,77.0,82.85,74.51857142857143,100.82000000000001,0.0,0.0,0.0,87.54064516129033,0.0,100.07468085106383,101.97690476190473,0.0,0.0,0.0,0.0,0.0,84.98372093023255,88.8390476190476,84.49166666666665,89.93575757575756,0.0,0.0,121.74625,133.01999999999998,0.0,84.47866666666667,0.0,123.605,117.84111111111113,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,113.04108695652172,0.0,87.14625000000001,101.52166666666666,0.0,0.0,109.48227272727273,111.18631578947368,119.974,0.0,0.0,125.30211267605632,0.0,114.45861313868613,113.42962499999999,0.0,108.93497674418597,0.0,116.06592857142857,112.87897321428571,0.0,0.0,0.0,95.82,108.05092592592592,128.87422594142265,0.0,0.0,0.0,116.49,108.25740740740741,0.0,119.5,115.50578124999998,0.0,117.0739357429718,114.90304635761588,0.0,0.0,0.0,0.0,112.01,0.0,0.0,0.0,0.0,0.0,117.901,106.41117647058823,114.81258064516129,0.0,0.0,139.6,127.11000000000001,0.0,0.0,120.23611111111111,113.11666666666667,0.0,109.0,119.51515151515152,0.0,0.0,0.0,0.0,123.14666666666665,141.0,142.976,0.0,162.45,0.0,175.17,172.15,110.0,0.0,0.0,0.0,125.54238095238097,123.0,0.0,0.0,0.0,0.0,0.0,137.15888888888887,138.17678571428573,0.0,131.3290909090909,136.05615384615382,0.0,138.291,141.02846153846156,0.0,0.0,114.52,118.55,0.0,132.2525,187.2,0.0,225.0,138.93,0.0,130.4067307692308,0.0,114.55972972972971,0.0,0.0,126.90761904761905,114.81588235294119,0.0,187.09,0.0,107.86666666666667,0.0,125.81666666666666,113.475,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,91.85,83.325,0.0,0.0,0.0,97.54,6.0,0.0,100.8,0.0,0.0,86.63,93.795,86.5,0.0,0.0,0.0,127.38,0.0,86.5,118.15,0.0,0.0,109.83,138.05,104.05,0.0,0.0,97.54,0.0,63.315,88.77,0.0,0.0,106.32,94.62,108.66,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,90.05,121.88,0.0,0.0,0.0,0.0,7.5,0.0,77.53,0.0,0.0,57.3,0.0,0.0,0.0,0.0,0.0,121.01,106.9,124.25,0.0,0.0,0.0,0.0,0.0,109.70888888888888,0.0,0.0,100.72274999999999,95.85235294117649,105.5790909090909,0.0,0.0,98.07828282828282,96.48150000000001,0.0,101.83704545454545,100.42538461538462,0.0,0.0,0.0,0.0,94.11115384615385,91.85863636363638,97.87466666666667,0.0,0.0,0.0,92.23333333333333,0.0,96.455,94.08714285714287,0.0,79.92499999999998,80.41153846153846,0.0,0.0,0.0,0.0,0.0,0.0,91.47517241379309,82.17179487179487,93.455625,65.67916666666666,0.0,0.0,82.68304347826087,87.81129032258065,0.0,111.1611111111111,116.95428571428572,0.0,0.0,74.13185185185183,92.8941176470588,0.0,75.0494117647059,68.64750000000001,0.0,0.0,0.0,0.0,97.05652173913045,103.62516129032258,0.0,0.0,94.48727272727274,92.95166666666667,98.24928571428572,104.28347826086956,0.0,0.0,0.0,0.0,82.404,89.65757575757576,69.159375,0.0,0.0,100.521,120.33333333333333,0.0,0.0,104.44500000000001,105.69000000000001,0.0,0.0,0.0,113.07166666666667,96.45399999999998,0.0,0.0,0.0,82.00800000000001,76.80547619047621,66.04,0.0,0.0,0.0,89.25593220338983,88.76190476190476,0.0,90.45071428571428,102.88727272727272,0.0,0.0,0.0,85.9609090909091,87.60714285714286,0.0,0.0,0.0,0.0,106.485,105.57500000000002,0.0,0.0,145.27272727272728,0.0,130.0,80.75,63.42,0.0,168.3,196.21,0.0,0.0,0.0,0.0,0.0,0.0,0.0,104.7,79.45666666666666,0.0,110.0,113.4,0.0,0.0,127.55,133.58333333333334,0.0,0.0,0.0,112.4,83.2,0.0,116.35999999999997,109.73600000000002,0.0,0.0,114.3,115.76666666666667,0.0,142.5,120.33333333333333,0.0,0.0,0.0,0.0,99.69999999999999,0.0,142.29,101.5,67.5,126.32249999999999,49.74,0.0,0.0,0.0,82.15,98.14454545454547,0.0,88.83,0.0,84.0,80.75,0.0,109.602,123.2625,0.0,0.0,0.0,0.0,148.75,120.45,170.0,114.0,0.0,266.75,0.0,100.88,144.21666666666667,0.0,0.0,0.0,0.0,98.4,114.2,48.6,0.0,0.0,0.0,90.95,68.0,0.0,0.0,75.0,0.0,85.0,89.17,0.0,128.83,0.0,117.42,0.0,106.0,111.7,0.0,0.0,0.0,0.0,111.44381818181817,119.48439393939393,0.0,155.68,0.0,0.0,94.11772727272728,106.5220512820513,0.0,105.11344444444445,103.32714285714285,0.0,0.0,0.0,0.0,0.0,0.0,127.38,8.34,0.0,0.0,153.3014285714286,0.0,142.41931034482758,0.0,170.0,148.54000000000002,236.14,0.0,0.0,0.0,88.984,0.0,58.0,65.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,121.38603960396037,120.18140625000001,131.68483516483516,0.0,116.35287671232875,114.97719626168225,0.0,128.6573786407767,0.0,123.26017094017092,122.28101265822784,130.28315789473683,0.0,0.0,0.0,117.50827586206896,114.44389610389611,0.0,100.02129411764707,113.70646017699114,0.0,125.4516129032258,131.27987012987015,0.0,0.0,0.0,115.64045977011497,0.0,104.80777777777773,106.32474860335196,0.0,0.0,0.0,0.0,96.73466981132074,0.0,91.33068840579708,94.75778325123152,97.66776649746188,0.0,102.49424157303372,109.33141700404859,0.0,0.0,0.0,86.7449425287356,85.63593103448275,91.88907407407406,0.0,103.32169971671392,0.0,90.46070000000002,96.69682051282054,0.0,0.0,0.0,0.0,0.0,0.0,0.0,110.88023529411763,110.59984000000003,111.66954773869332,102.04601351351354,0.0,0.0,0.0,0.0,112.72933333333329,120.59309734513275,112.22020304568527,0.0,127.26449367088605,0.0,120.05305732484078,116.97556451612904,0.0,0.0,107.57790322580641,103.37238461538459,117.62112903225803,0.0,0.0,0.0,120.16561643835617,0.0,0.0,0.0,100.66173553719017,0.0,112.94876288659796,0.0,0.0,100.23923076923083,102.60693693693693,0.0,115.430253164557,0.0,100.99382550335574,104.38642335766421,120.03337499999998,0.0,0.0,99.33287128712873,93.93045045045048,0.0,102.51358490566038,102.1657534246575,0.0,0.0,0.0,0.0,119.30407407407405,118.6525,0.0,0.0,0.0,109.39800000000004,108.28436363636364,118.20394736842103,0.0,0.0,117.26619047619049,110.23444444444442,100.6532258064516,0.0,0.0,0.0,124.1312195121951,0.0,130.04787878787877,127.55116279069765,0.0,0.0,119.18894736842105,111.658125,120.79210526315788,0.0,0.0,0.0,0.0,109.41299999999998,0.0,115.50176470588235,113.58562500000004,108.30535714285715,0.0,0.0,116.04880000000001,0.0,129.5664285714286,117.5957142857143,106.35357142857143,0.0,0.0,123.65600000000002,123.77562499999999,0.0,109.74047619047617,117.17599999999997,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,108.2053846153846,103.56315789473683,111.97269230769228,0.0,120.39999999999999,90.855,0.0,144.85,108.765,0.0,0.0,0.0,0.0,116.03636363636365,110.17142857142855,0.0,118.21324999999999,115.25210526315784,0.0,0.0,131.96200000000002,109.64125,0.0,133.84333333333333,133.01999999999998,0.0,92.242,0.0,126.62909090909089,0.0,105.042,95.09833333333334,0.0,0.0,0.0,105.55529411764705,0.0,112.27749999999999,104.4742857142857,0.0,0.0,0.0,108.23804878048779,0.0,113.33903225806452,110.195,0.0,117.0,0.0,83.1525,102.56166666666665,0.0,0.0,118.14600000000003,140.06,76.5,0.0,110.44962962962964,0.0,174.96333333333334,79.64,0.0,123.8923529411765,149.4,0.0,0.0,0.0,273.7,189.18,79.29,0.0,0.0,0.0,0.0,106.525,107.1,0.0,64.7425,99.45,0.0,0.0,0.0,95.23750000000001,0.0,146.4,111.27000000000001,0.0,99.75,96.58166666666666,0.0,0.0,0.0,0.0,82.29,93.68666666666667,0.0,118.43,0.0,104.83333333333333,0.0,97.13666666666666,91.67,68.87,0.0,109.775,101.64500000000001,0.0,0.0,152.1,0.0,0.0,81.81,0.0,0.0,112.0,0.0,108.445,104.305,0.0,107.1,125.0,0.0,138.7075,0.0,0.0,0.0,106.54,98.62,0.0,158.95,0.0,104.13,119.85,94.0,0.0,0.0,90.95,0.0,76.5,75.0,0.0,101.98,110.0,0.0,0.0,0.0,0.0,140.56754098360656,142.5419540229885,139.19392857142856,0.0,160.51250000000002,0.0,0.0,125.17461538461538,84.13,169.11,0.0,0.0,0.0,109.41213953488374,0.0,0.0,104.82283185840703,0.0,124.1363157894737,0.0,115.55000000000001,112.73428571428573,0.0,0.0,167.75,0.0,121.205,155.45,193.92,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,74.8,82.0,95.89750000000001,0.0,0.0,0.0,56.25,77.92999999999999,0.0,171.0,0.0,105.81,0.0,69.3,60.9,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,89.07142857142857,49.66875,106.35142857142857,0.0,0.0,0.0,81.67916666666666,89.84318181818182,104.76470588235294,0.0,0.0,0.0,125.6,120.0,0.0,108.0,102.665,0.0,129.0,132.20000000000002,0.0,0.0,0.0,0.0,88.7,80.475,0.0,107.3,92.0,0.0,0.0,119.5,133.21428571428572,0.0,0.0,0.0,137.54000000000002,117.04,0.0,0.0,63.27,60.35,0.0,89.1,143.245,0.0,0.0,78.85285714285715,141.12666666666667,0.0,64.08666666666666,87.95,0.0,0.0,0.0,0.0,0.0,73.67999999999999,0.0,0.0,77.995,71.0,90.07,0.0,0.0,63.95,65.75,62.9,117.45,49.95,115.0,0.0,0.0,0.0,0.0,102.21631578947368,103.06470588235294,0.0,0.0,112.06857142857143,137.65869565217395,0.0,0.0,0.0,0.0,109.99034482758621,110.08310344827588,0.0,0.0,0.0,107.08592592592592,121.46558139534882,0.0,110.25730769230768,99.11142857142856,0.0,125.95400000000002,123.8614285714286,0.0,0.0,0.0,126.20476190476191,0.0,127.35,128.13133333333334,0.0,0.0,143.10902439024392,162.86,0.0,0.0,144.55499999999998,119.85972222222222,0.0,132.2841025641026,157.6024,0.0,0.0,0.0,0.0,0.0,112.80428571428571,0.0,129.5304166666667,137.51111111111106,0.0,0.0,101.00967741935483,103.24730769230769,117.70842105263158,0.0,0.0,129.40628571428573,133.70687500000003,141.80285714285714,0.0,0.0,0.0,0.0,0.0,93.65318840579708,0.0,129.786,0.0,98.75777777777778,0.0,92.00800000000001,86.2575,0.0,121.0,111.51666666666667,0.0,0.0,0.0,101.42611111111108,104.79492537313435,101.29648648648646,0.0,0.0,0.0,0.0,121.36666666666667,102.674,118.88125,0.0,0.0,142.9888888888889,132.3857142857143,119.61333333333334,0.0,0.0,0.0,0.0,90.90749999999998,81.14999999999999,0.0,102.03500000000001,96.8175,137.9,0.0,111.44,108.71857142857142,0.0,0.0,116.36737500000001,0.0,118.133,118.2976923076923,0.0,102.81888888888888,0.0,128.0666666666667,123.97999999999998,0.0,0.0,0.0,0.0,85.0368181818182,82.0,82.36684210526319,87.33941176470589,0.0,0.0,91.0864705882353,91.83944444444442,86.875,0.0,0.0,0.0,0.0,106.53611111111111,154.33333333333334,0.0,64.5,104.85,0.0,0.0,0.0,145.73127659574467,155.83300000000003,169.24783333333332,0.0,0.0,0.0,156.5681818181818,0.0,147.69638297872336,155.00125000000003,0.0,0.0,0.0,84.625,128.83575471698114,0.0,0.0,211.8,153.67785714285716,0.0,0.0,133.0,127.2942857142857,152.72434782608696,0.0,74.07,0.0,110.96272727272726,0.0,127.30499999999999,0.0,119.25,113.77499999999999,0.0,0.0,0.0,0.0,0.0,0.0,120.83333333333333,103.22777777777777,0.0,110.58571428571429,123.33333333333333,0.0,0.0,0.0,95.0,168.62666666666667,0.0,0.0,97.375,153.0,97.42799999999998,0.0,201.0,0.0,126.91666666666667,0.0,0.0,161.98666666666668,165.765,182.0,0.0,0.0,0.0,172.9,152.5,131.63,0.0,266.5,159.85,0.0,0.0,0.0,0.0,0.0,169.1375,0.0,142.47765625,159.6890697674419,0.0,0.0,0.0,0.0,0.0,159.95463414634145,167.3873529411765,0.0,159.85357142857146,159.17225490196077,178.25809523809525,0.0,151.57266666666666,156.76615384615386,0.0,0.0,0.0,127.05833333333334,103.11,0.0,165.985,0.0,130.57117647058823,125.15666666666668,204.44,0.0,0.0,156.87738095238097,0.0,0.0,181.91729729729732,192.84085714285715,0.0,0.0,0.0,0.0,171.40553571428572,0.0,191.96230769230766,180.5532142857143,0.0,173.10270000000003,178.53,0.0,0.0,0.0,0.0,158.54923076923075,167.76250000000002,144.73833333333334,174.6875,0.0,121.91999999999999,0.0,160.53,0.0,179.06,196.0,0.0,0.0,0.0,0.0,0.0,131.24222222222224,0.0,0.0,171.4,216.5,0.0,0.0,0.0,176.53333333333333,144.63333333333333,0.0,0.0,186.57548387096773,196.6637931034483,0.0,0.0,164.78937499999998,0.0,0.0,0.0,182.1117741935484,191.54083333333335,178.24529411764703,0.0,0.0,0.0,0.0,0.0,139.0,121.5,176.5,0.0,0.0,0.0,194.34,210.2266666666667,167.18,0.0,169.0,151.0,0.0,0.0,0.0,206.62973684210525,201.9561224489796,180.82868421052632,0.0,0.0,218.0623076923077,0.0,219.68068181818182,220.690625,0.0,193.61239130434782,0.0,207.76849056603774,205.7025454545455,0.0,0.0,0.0,0.0,0.0,218.5,0.0,187.30836065573772,190.92859374999998,0.0,0.0,185.41,0.0,191.44333333333336,224.33,0.0,0.0,205.57644067796616,195.71489795918365,0.0,202.80107692307686,205.92048387096773,0.0,0.0,0.0,240.0,214.5687234042553,207.10072727272728,0.0,153.75,191.96235294117648,0.0,0.0,0.0,135.925,173.65681818181818,0.0,0.0,172.0,195.26029411764708,0.0,192.04500000000002,188.3757142857143,0.0,0.0,0.0,0.0,100.15,180.11553191489364,0.0,0.0,218.70000000000002,158.53,0.0,165.97933333333336,170.2561290322581,0.0,0.0,0.0,0.0,0.0,0.0,142.85500000000002,166.30071428571432,177.9025,0.0,0.0,144.51,148.48666666666668,0.0,183.65833333333333,0.0,159.79999999999998,177.62,0.0,0.0,0.0,0.0,198.25714285714284,0.0,177.0550909090909,0.0,169.44444444444446,172.01999999999998,0.0,139.29500000000002,0.0,0.0,174.0635106382979,173.85555555555555,189.06,0.0,0.0,0.0,173.10500000000002,181.47966101694917,198.39090909090908,0.0,150.6,175.3306666666667,0.0,0.0,0.0,153.425,0.0,206.09478260869565,0.0,182.176,172.0,254.845,0.0,0.0,116.5,0.0,0.0,192.175,177.0,0.0,173.825,191.61499999999998,0.0,0.0,189.33333333333334,167.214,0.0,147.5225,153.165,0.0,0.0,0.0,0.0,172.0,194.88857142857142,237.0,110.5,0.0,0.0,0.0,0.0,0.0,147.173,146.9213333333333,103.5,0.0,149.7859090909091,203.29,102.0,0.0,0.0,191.0,204.74,126.0,0.0,0.0,0.0,0.0,229.815,0.0,155.00372093023256,156.0381818181818,0.0,0.0,0.0,129.27,149.89181818181817,0.0,130.39499999999998,125.9125,167.55200000000002,197.165,95.25999999999999,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,125.725,104.9125,86.38999999999999,0.0,63.900000000000006,89.08275862068966,0.0,0.0,0.0,71.55,75.37666666666667,0.0,110.7,0.0,115.4,124.76666666666665,0.0,0.0,0.0,0.0,0.0,0.0,143.69142857142856,137.97058823529412,119.67319148936168,0.0,142.12894736842102,138.466,162.23333333333335,0.0,0.0,125.51851851851853,0.0,152.40125,138.43055555555557,0.0,0.0,0.0,95.703488372093,0.0,126.41444444444444,125.27000000000001,0.0,0.0,0.0,0.0,0.0,0.0,57.3,71.4,0.0,99.8,51.9,0.0,123.0,66.16,0.0,0.0,0.0,85.78663157894735,89.79553846153843,0.0,0.0,0.0,144.02,120.502,0.0,113.41000000000001,94.05,0.0,0.0,0.0,91.53388888888888,0.0,76.35333333333334,87.732,0.0,86.6875,0.0,115.18,99.17,0.0,0.0,0.0,83.58846153846153,78.69500000000001,95.0,70.0,0.0,0.0,0.0,0.0,0.0,0.0,76.95454545454545,82.66666666666667,76.38399999999999,0.0,0.0,0.0,50.050000000000004,41.74799999999998,0.0,0.0,62.125,0.0,66.0,64.0,45.9,0.0,0.0,0.0,0.0,0.0,0.0,71.33777777777777,67.44666666666667,0.0,48.0,55.360833333333325,0.0,0.0,61.53125,85.61,0.0,128.5,82.99333333333334,0.0,0.0,34.0,36.5,0.0,0.0,88.0,85.5,0.0,46.58090909090909,0.0,94.1,0.0,64.83,55.86000000000001,0.0,0.0,0.0,0.0,0.0,0.0,0.0,101.48875,100.34260869565216,0.0,0.0,96.31041666666668,88.27000000000002,0.0,90.37421052631579,103.42781249999999,0.0,0.0,0.0,111.01536585365852,101.49722222222222,0.0,94.95673076923073,113.10000000000001,0.0,94.865,0.0,0.0,0.0,74.86958333333334,85.93071428571429,0.0,0.0,64.419375,102.25714285714285,0.0,0.0,0.0,0.0,0.0,78.35318181818182,79.38704545454544,0.0,85.02733333333335,79.69559523809527,0.0,0.0,0.0,100.62666666666667,107.54400000000001,0.0,97.28999999999999,67.50666666666667,0.0,81.50428571428573,70.7875,0.0,0.0,0.0,59.95,72.03687500000001,0.0,0.0,60.260000000000005,89.78,55.6825,0.0,0.0,104.53333333333335,102.86,59.91,0.0,0.0,0.0,72.52454545454545,70.55513513513512,0.0,0.0,76.70428571428572,81.57444444444444,0.0,74.64217391304348,73.0575,0.0,117.75666666666666,0.0,86.90142857142858,52.2,0.0,0.0,0.0,0.0,0.0,108.0,0.0,0.0,0.0,0.0,0.0,109.35,81.5,165.38,0.0,0.0,18.6,0.0,0.0,110.7,0.0,6.0,0.0,85.265,83.5,0.0,0.0,72.0,0.0,0.0,0.0,0.0,0.0,84.86309523809523,0.0,104.0323966942149,0.0,0.0,95.15274509803923,94.39195652173912,0.0,85.95357142857142,95.97322580645161,0.0,116.94907407407408,0.0,101.11366071428573,0.0,0.0,0.0,108.4127848101266,109.79433962264152,112.68206896551723,99.16170731707317,0.0,0.0,0.0,0.0,0.0,0.0,101.14374999999998,91.58174603174601,0.0,0.0,98.77857142857142,100.46786516853932,0.0,106.36187500000001,98.83464285714287,0.0,86.06785714285714,96.39208333333333,0.0,100.16583333333334,103.93035714285713,0.0,116.45076923076924,153.6291304347826,0.0,0.0,0.0,91.3748559670782,0.0,97.32140969162992,98.03685950413222,0.0,0.0,102.09440758293836,101.44714975845406,98.88140740740735,0.0,0.0,83.51857954545453,0.0,94.38710843373494,83.30721311475408,0.0,98.73676113360301,0.0,88.42465240641711,93.5000568181818,0.0,0.0,0.0,0.0,0.0,0.0,131.84093023255812,126.725,0.0,89.52571428571427,0.0,148.8,95.0,0.0,0.0,0.0,0.0,0.0,0.0,94.16239999999999,94.66,0.0,113.92571428571429,95.40875,0.0,0.0,85.825,98.87,85.16,0.0,128.7,0.0,93.28666666666668,119.425,0.0,0.0,91.69,0.0,62.0,65.0,101.38,0.0,0.0,186.22,131.57,212.0,0.0,0.0,141.96590909090912,135.22875,0.0,95.7675,0.0,68.85,0.0,71.87,70.87,0.0,0.0,0.0,0.0,98.8540157480315,96.38864406779659,103.00857142857146,0.0,0.0,97.13652631578945,89.66513888888889,102.65566666666665,0.0,0.0,0.0,0.0,101.76190476190479,104.76733333333333,0.0,96.83285714285715,89.25,0.0,0.0,0.0,0.0,104.26633333333335,114.28892857142857,0.0,0.0,126.54916666666664,111.888,0.0,103.36583333333334,115.485,0.0,0.0,79.97333333333334,94.5,67.77,0.0,0.0,107.92,139.5,172.23,0.0,0.0,0.0,0.0,0.0,100.99208333333333,97.85722222222222,93.66,0.0,0.0,100.18857142857144,94.28444444444443,120.75,0.0,0.0,93.91375,104.678,81.92333333333333,0.0,0.0,0.0,0.0,110.0,0.0,89.25,104.32,0.0,117.5,115.68,0.0,124.52,129.48,91.09,0.0,0.0,0.0,0.0,0.0,0.0,0.0,82.44,71.22,0.0,0.0,91.6,90.625,77.25,0.0,0.0,46.54,82.44,44.79,0.0,0.0,0.0,0.0,0.0,6.4,0.0,0.0,67.26,0.0,76.16,77.86,55.53,0.0,0.0,0.0,0.0,67.40926829268294,0.0,75.94263157894737,69.93939393939394,0.0,66.42690476190477,69.87259999999999,75.671875,0.0,0.0,0.0,0.0,74.25803571428571,0.0,76.82304347826086,77.44192307692309,0.0,0.0,0.0,72.96285714285715,75.86153846153846,0.0,86.25,77.92833333333334,0.0,0.0,0.0,70.58500000000001,70.50268292682927,0.0,0.0,0.0,0.0,71.46111111111111,68.87375,67.02,0.0,38.0,48.5,0.0,0.0,101.07333333333334,168.0,0.0,0.0,0.0,0.0,83.89500000000001,0.0,69.24,76.59,0.0,0.0,79.0,90.79,96.92,66.29,97.2,0.0,0.0,0.0,0.0,0.0,77.46564814814816,84.655,0.0,69.00666666666666,65.125,0.0,97.445,0.0,0.0,84.1,79.2,0.0,65.11,73.95,0.0,0.0,72.58125,78.28444444444443,0.0,0.0,0.0,0.0,0.0,73.8,0.0,58.0,69.0,40.0,0.0,83.0,74.8,0.0,76.2,0.0,0.0,0.0,90.45,81.59,103.75,0.0,80.27000000000001,0.0,67.5,77.69,0.0,0.0,0.0,0.0,0.0,0.0,83.02107142857143,0.0,0.0,85.57435897435899,88.05958333333332,0.0,0.0,0.0,0.0,85.32253731343285,87.70400000000001,83.83666666666666,71.98666666666666,118.095,0.0,0.0,0.0,0.0,85.52921568627448,82.75526315789473,0.0,0.0,0.0,0.0,79.60249999999999,80.17030000000004,0.0,81.1879775280899,80.15510948905109,0.0,0.0,82.15976190476192,80.2091358024691,0.0,0.0,0.0,83.58833333333334,89.83166666666668,0.0,106.2,99.66749999999999,0.0,0.0,0.0,72.10249999999999,0.0,0.0,77.78,79.2,0.0,65.6,0.0,74.8,76.78,0.0,86.98333333333333,0.0,0.0,75.915,74.8,81.83,93.01,0.0,0.0,0.0,0.0,0.0,0.0,87.61499999999998,85.64770833333334,90.37322222222224,0.0,0.0,0.0,0.0,84.18508474576277,0.0,80.7535294117647,84.876,87.7375,0.0,0.0,81.95833333333333,75.35310344827586,0.0,0.0,0.0,85.40999999999998,81.87437500000001,99.34,0.0,74.46000000000001,80.84142857142857,0.0,0.0,68.07,74.8,56.416666666666664,0.0,0.0,133.6,147.9,90.35,0.0,96.874,0.0,0.0,0.0,0.0,85.26600000000002,92.43352941176467,0.0,0.0,0.0,83.21234042553193,0.0,90.82642857142855,0.0,76.96625,88.00142857142858,0.0,146.2,0.0,97.58666666666666,99.85,0.0,58.91,72.25,0.0,0.0,147.9,171.3,98.33,0.0,0.0,67.39999999999999,0.0,0.0,0.0,93.356,0.0,91.6,69.74625,0.0,101.34,130.1966666666667,0.0,74.29,0.0,70.0,63.33,0.0,0.0,104.90862745098039,0.0,109.77444444444444,107.54787037037035,0.0,0.0,100.7070085470086,0.0,93.75535211267605,99.52939393939396,0.0,0.0,0.0,80.33959999999999,107.1525,0.0,76.03333333333333,68.34,0.0,147.585,0.0,73.66999999999999,126.04,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,66.26666666666667,59.40909090909091,0.0,0.0,0.0,51.75727272727273,0.0,0.0,53.0,59.44,46.4388888888889,0.0,0.0,0.0,46.10619047619048,0.0,51.08461538461539,48.885714285714286,0.0,0.0,0.0,52.025,63.36,48.38249999999999,0.0,0.0,2.0,30.0,0.0,89.0,0.0,0.0,44.2375,0.0,0.0,0.0,0.0,0.0,0.0,46.720588235294116,45.31744680851063,0.0,0.0,45.61,43.857142857142854,0.0,43.51666666666667,43.886,0.0,0.0,0.0,51.055,0.0,0.0,29.2,37.9,0.0,0.0,45.44625,36.0,49.8,0.0,0.0,0.0,54.166666666666664,51.4,60.279999999999994,0.0,36.0,52.2,0.0,0.0,0.0,36.66666666666667,38.04,0.0,0.0,0.0,0.0,49.69,0.0,48.4,47.73,29.3,56.9675,0.0,0.0,38.5,0.0,0.0,0.0,44.1,37.6,52.2,38.857142857142854,0.0,54.6,40.0,0.0,0.0,0.0,45.092592592592595,40.376842105263165,0.0,43.46693877551021,54.57647058823529,0.0,0.0,0.0,0.0,44.11818181818182,44.462380952380954,35.943333333333335,0.0,47.435,50.0675,0.0,0.0,0.0,0.0,38.18181818181818,38.81727272727273,0.0,27.0,0.0,35.53333333333333,39.212500000000006,0.0,61.254999999999995,38.13,31.716666666666665,0.0,0.0,37.7,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,38.248000000000005,0.0,34.04125,33.55555555555556,0.0,36.9775,0.0,39.5895652173913,40.199999999999996,0.0,40.34173913043478,0.0,44.086666666666666,42.5,0.0,0.0,34.71777777777778,37.28235294117647,31.456666666666667,0.0,0.0,40.236,39.5,44.58142857142857,0.0,0.0,0.0,0.0,32.08,33.45454545454545,0.0,0.0,40.0,37.0,39.652,0.0,0.0,0.0,0.0,38.0,31.8,0.0,35.4,27.9,0.0,0.0,0.0,41.64,42.85,37.8,56.7,0.0,0.0,48.16,42.36750000000001,0.0,0.0,0.0,57.09142857142857,35.64,77.25,0.0,39.0,42.54,0.0,0.0,0.0,0.0,81.14428571428572,0.0,68.80760000000001,76.33707865168539,0.0,0.0,0.0,0.0,0.0,0.0,69.65936507936507,0.0,60.21375,0.0,81.30333333333333,0.0,65.37204081632657,71.16666666666667,0.0,87.4,74.75333333333334,0.0,10.0,50.94857142857143,81.093,0.0,0.0,0.0,0.0,65.15086206896552,0.0,71.00666666666666,65.26148148148148,0.0,64.60056603773586,0.0,61.84904761904762,61.844545454545454,0.0,0.0,0.0,58.217499999999994,63.472022471910115,0.0,0.0,68.01894736842105,72.86307692307693,0.0,0.0,42.69333333333333,0.0,75.1760869565217,0.0,65.12166666666666,0.0,81.0,0.0,65.025,59.5,0.0,0.0,0.0,61.91375000000001,61.22919999999999,53.975,0.0,75.17333333333333,0.0,0.0,69.075,63.472,0.0,70.62,67.56,0.0,0.0,0.0,0.0,51.090714285714284,0.0,0.0,55.95476190476192,58.735,0.0,0.0,57.0514705882353,0.0,0.0,78.54047619047618,80.12642857142858,0.0,0.0,0.0,0.0,54.1251282051282,59.75428571428572,48.25333333333333,0.0,90.96,56.02,34.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,54.20732142857144,53.64255319148937,0.0,58.723749999999995,67.36000000000001,0.0,56.32941176470587,49.20749999999998,0.0,49.636833333333335,0.0,54.42159090909093,54.854285714285716,0.0,0.0,0.0,0.0,0.0,0.0,53.95894736842104,53.75193548387096,0.0,49.93782608695653,51.95137931034483,0.0,47.536666666666655,39.511111111111106,0.0,0.0,65.02111111111111,0.0,51.633333333333326,60.99318181818182,0.0,0.0,50.07521739130437,0.0,52.2804347826087,52.41850000000001,0.0,0.0,0.0,0.0,59.91909090909091,56.16,65.124,0.0,0.0,0.0,37.8,51.37800000000001,0.0,64.6,59.33,39.6,0.0,0.0,48.0,0.0,46.825,46.8,57.65,0.0,0.0,49.57557142857144,51.82552631578947,0.0,0.0,45.19483870967742,0.0,0.0,0.0,56.720000000000006,0.0,0.0,46.24857142857143,50.45249999999999,0.0,55.67090909090909,55.8,40.4,0.0,0.0,0.0,0.0,64.724,53.32,0.0,73.89,73.8,0.0,48.4,38.25,0.0,96.0,86.6,0.0,0.0,0.0,0.0,0.0,0.0,58.27372881355932,0.0,56.265238095238104,57.08711111111111,0.0,55.93979166666667,0.0,52.45374999999999,49.299090909090914,0.0,62.82115384615385,62.2025,0.0,0.0,65.23326732673264,63.93560606060606,0.0,50.721999999999994,62.69699999999998,0.0,0.0,0.0,0.0,0.0,0.0,0.0,53.50066666666667,51.79222222222222,0.0,0.0,55.8,37.26,0.0,46.705000000000005,50.666666666666664,0.0,48.28769230769231,0.0,61.265,61.65,0.0,65.61142857142858,0.0,0.0,56.025555555555556,70.07,0.0,54.97833333333333,37.8,0.0,68.47285714285715,0.0,54.05636363636363,0.0,0.0,61.93749999999999,62.0059574468085,58.695,0.0,0.0,0.0,83.21000000000001,0.0,66.0,53.9,0.0,75.65333333333334,0.0,86.89,82.745,0.0,48.182500000000005,0.0,0.0,0.0,0.0,58.1,63.71,0.0,38.67,0.0,51.99,58.156666666666666,68.2,0.0,82.29,64.21,0.0,0.0,0.0,0.0,0.0,44.64,51.285714285714285,100.25,0.0,0.0,0.0,0.0,0.0,38.1575,74.7,0.0,70.035,0.0,107.08,96.0,0.0,0.0,98.32666666666665,0.0,159.50448275862072,133.14451219512196,0.0,0.0,0.0,0.0,95.84704545454544,107.17125000000001,0.0,0.0,58.44,60.78599999999999,0.0,72.76599999999999,0.0,97.16666666666667,0.0,62.88,0.0,77.99,80.14,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,118.66666666666667,0.0,156.0,131.74285714285713,0.0,131.29999999999998,0.0,107.6275,114.3,0.0,0.0,0.0,0.0,0.0,120.15,181.4,0.0,129.02666666666667,0.0,109.16666666666667,95.0,0.0,126.75,0.0,164.8,150.93400000000003,0.0,0.0,0.0,130.0,202.1,136.60600000000002,0.0,0.0,131.85,0.0,123.31999999999998,119.53333333333335,0.0,0.0,0.0,142.07999999999998,128.5,0.0,149.6,154.4,0.0,130.47833333333335,131.25583333333336,0.0,0.0,0.0,131.66,117.85,132.13,0.0,0.0,129.6,150.375,130.13875,0.0,0.0,159.6,134.94375,154.0209090909091,0.0,0.0,0.0,0.0,0.0,132.5376923076923,0.0,0.0,120.02749999999999,115.6,130.9,0.0,0.0,0.0,0.0,116.53000000000002,115.66666666666667,108.45,0.0,129.625,120.26125,0.0,0.0,0.0,103.35749999999999,0.0,141.6,119.425,0.0,0.0,0.0,108.8,107.95,123.01,0.0,70.4,96.99,0.0,0.0,116.23666666666668,113.39,119.0,0.0,0.0,0.0,0.0,126.89166666666665,128.2235714285714,0.0,115.61714285714285,0.0,131.32142857142858,118.67571428571429,130.57181818181814,0.0,0.0,0.0,130.69,0.0,135.365,132.466,0.0,166.16799999999998,133.49,0.0,0.0,0.0,128.228,0.0,0.0,120.73333333333333,125.0,131.47,0.0,98.94,0.0,134.3,118.96,0.0,165.6,142.15,202.51,0.0,0.0,0.0,0.0,79.5,0.0,0.0,0.0,61.0,81.0,39.15,0.0,39.15,0.0,93.0,94.0,0.0,0.0,0.0,97.125,0.0,0.0,0.0,50.0,100.5,48.35,117.0,28.35,0.0,0.0,0.0,0.0,93.0,92.0,0.0,0.0,120.0,107.5,0.0,118.0,124.0,0.0,0.0,77.66666666666667,54.75,0.0,83.0,88.79499999999999,0.0,0.0,0.0,0.0,0.0,0.0,88.0,88.56,69.66666666666667,12.0,0.0,0.0,77.9,83.23,151.0,141.0,0.0,158.5,0.0,0.0,0.0,20.0,0.0,59.9,49.076666666666675,12.0,102.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,187.0,166.98357142857142,0.0,145.70285714285714,156.13,0.0,143.6109090909091,155.4112,0.0,0.0,0.0,0.0,0.0,192.325,0.0,145.875,0.0,172.61666666666667,185.1,110.675,0.0,0.0,160.45000000000002,0.0,0.0,169.0,181.28727272727272,168.5946153846154,196.1,0.0,0.0,163.39785714285716,0.0,175.38809523809522,0.0,154.33599999999998,172.57857142857145,160.21380952380954,0.0,0.0,0.0,0.0,193.71666666666667,202.425,0.0,0.0,192.65454545454543,169.14999999999998,0.0,165.598,200.77750000000003,0.0,170.97416666666666,0.0,197.22428571428574,175.85466666666667,0.0,0.0,0.0,150.625,0.0,164.56666666666666,167.70384615384617,0.0,0.0,164.55714285714285,164.68333333333334,159.108,0.0,193.1,0.0,177.75,181.29916666666668,0.0,0.0,0.0,0.0,0.0,0.0,164.8,171.50916666666663,158.29166666666666,177.00000000000003,157.3857142857143,0.0,0.0,184.22523809523807,0.0,229.0,195.33333333333334,0.0,0.0,0.0,0.0,171.6,171.10769230769236,138.66,0.0,185.72,186.65,156.8857142857143,0.0,0.0,0.0,0.0,153.70714285714283,0.0,168.15,158.64166666666668,0.0,0.0,144.80227272727268,157.35000000000002,0.0,127.90000000000002,149.27062500000002,0.0,0.0,162.64444444444445,0.0,154.3395833333333,0.0,151.25411764705882,149.6991304347826,0.0,177.97529411764708,0.0,159.3165625,161.384,0.0,0.0,178.5946153846154,176.74612903225804,0.0,0.0,0.0,0.0,166.27083333333331,155.16875,0.0,157.58,175.7182608695652,0.0,143.25000000000003,146.21666666666667,0.0,0.0,0.0,172.84285714285713,175.16666666666666,0.0,167.39,165.15,0.0,161.53636363636363,172.46249999999998,0.0,0.0,0.0,0.0,0.0,0.0,144.568125,144.178,0.0,0.0,148.05,0.0,150.0,149.315,0.0,152.9488888888889,0.0,193.5,149.125,194.06,0.0,0.0,0.0,0.0,0.0,0.0,157.19,0.0,136.49333333333334,173.0,0.0,152.90916666666666,0.0,172.14444444444445,142.72,0.0,0.0,147.08333333333334,129.3685714285714,0.0,0.0,0.0,161.153,136.265,0.0,147.48,174.64999999999998,0.0,131.18,158.1,0.0,0.0,165.75,0.0,171.64333333333335,174.21,209.07,0.0,0.0,0.0,0.0,177.15833333333333,185.16,0.0,192.0,0.0,167.76,169.66,212.8,0.0,0.0,0.0,0.0,0.0,161.24555555555557,192.15,0.0,159.86700000000002,124.38333333333333,0.0,103.42,236.67,144.14,0.0,0.0,0.0,179.425,198.0,151.9025,0.0,144.676,0.0,0.0,170.2025,170.05,0.0,150.45,0.0,166.5,169.0,0.0,0.0,0.0,0.0,0.0,137.935,0.0,146.23333333333332,155.4,0.0,0.0,166.1270588235294,158.98375,142.0025,0.0,0.0,0.0,152.752,148.50000000000003,0.0,136.99916666666667,144.10500000000002,0.0,141.08249999999998,168.09,0.0,0.0,154.93,144.18833333333333,0.0,171.396,169.55666666666664,0.0,0.0,138.55,96.9,0.0,0.0,124.80666666666667,0.0,138.56,146.91500000000002,0.0,165.1,131.36,0.0,0.0,0.0,0.0,0.0,175.097,179.69166666666663,0.0,0.0,0.0,153.87444444444446,153.95000000000002,0.0,147.46666666666667,135.1925,0.0,167.5533333333333,184.95625,0.0,0.0,142.63214285714284,0.0,0.0,167.96,176.4057142857143,165.45615384615388,0.0,0.0,0.0,0.0,179.08750000000003,160.31157894736842,0.0,156.21923076923073,181.9857142857143,0.0,173.16666666666666,169.575,0.0,152.34499999999997,160.61200000000002,0.0,0.0,0.0,119.64,0.0,113.47500000000001,107.1,139.95,0.0,0.0,0.0,0.0,0.0,165.35,127.22,0.0,195.0,170.0,196.2,196.4466666666667,0.0,0.0,164.76,0.0,135.01,139.5,0.0,195.0,150.3,0.0,0.0,146.92750000000004,157.61,0.0,193.654,0.0,0.0,161.83599999999998,139.66666666666666,200.29,0.0,0.0,0.0,0.0,0.0,138.308,143.58666666666667,0.0,149.29666666666668,141.54999999999998,115.68333333333334,167.04,0.0,0.0,0.0,155.475,163.32142857142858,0.0,168.3,167.22,0.0,143.215,141.64000000000001,0.0,0.0,182.0,0.0,240.0,0.0,223.75,214.75,0.0,295.0,0.0,0.0,210.0,214.75,0.0,0.0,234.0,233.0,0.0,299.33,253.5,0.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,116.0,117.66666666666667,0.0,0.0,107.4325,89.9,117.0,88.0,0.0,0.0,0.0,176.4,105.0,193.71,0.0,0.0,90.0,88.84,134.06,0.0,85.72,57.09,0.0,0.0,0.0,150.25,249.25,0.0,0.0,0.0,0.0,151.0,105.0,0.0,0.0,86.3,108.33333333333333,123.0,0.0,0.0,200.7,0.0,160.5,171.0,0.0,0.0,80.0,0.0,87.5,114.5,0.0,108.53333333333335,0.0,157.8,198.0,209.0,0.0,0.0,0.0,0.0,0.0,0.0,0.0,146.38,130.0,108.36,0.0,62.64,0.0,103.68,88.81333333333333,0.0,0.0,0.0,116.16,124.4,0.0,160.0,0.0,130.46800000000002,127.0,179.33,0.0,0.0,180.0,0.0,147.4,0.0,170.0,152.0,0.0,55.78,175.0,0.0,0.0,0.0,0.0,0.0,168.1,227.25,0.0,167.33333333333334,160.0,0.0,273.5,0.0,223.33333333333334,210.48333333333335,0.0,0.0,0.0,0.0,132.025,0.0,185.0,159.9,0.0,0.0,0.0,0.0,0.0,0.0,0.0,161.125,0.0,230.0,194.0,0.0,207.0,108.0,0.0,0.0,123.6,133.555,111.37,0.0,0.0,0.0,0.0,157.624,175.5,216.0,0.0,136.4625,79.59,0.0,0.0,188.75,162.93,0.0,133.67,0.0,205.49,187.53875,0.0,0.0,0.0,213.71,138.17,0.0,258.0,318.82,0.0,0.0,0.0,153.0,212.0,0.0,204.0,147.88666666666666,0.0,0.0,145.0,150.64,142.97,260.0,0.0,0.0,0.0,0.0,0.0,0.0,167.0,0.0,202.1725,206.04333333333338,0.0,147.14666666666665,0.0,0.0,213.62,191.37666666666667,0.0,168.746,135.875,0.0,255.84,248.1,0.0,0.0,0.0,0.0,0.0,160.0,0.0,0.0,0.0,245.6825,208.77666666666667,249.13600000000002,217.05,0.0,0.0,0.0,235.25,208.65,147.56666666666666,226.275,0.0,150.0,196.14,0.0,315.0,243.8325,0.0,0.0,0.0,172.97,0.0,0.0,210.0,220.61,171.46,0.0,202.22181818181818,0.0,0.0,217.35,219.66500000000002,224.0,0.0,0.0,0.0,135.5,171.32,141.48,187.5,0.0,0.0,0.0,0.0,0.0,0.0,0.0,245.5,223.1,251.048,0.0,0.0,0.0,287.0,295.0,0.0,234.4,269.93999999999994,0.0,230.85200000000003,250.8875,0.0,0.0,0.0,0.0,231.50750000000002,213.85,0.0,232.725,275.6333333333333,158.30666666666664,0.0,0.0,197.3,182.3675,234.70499999999998,0.0,84.84,190.0,0.0,0.0,193.5,226.0,0.0,0.0,0.0,284.34000000000003,292.0,0.0,244.0,250.90666666666667,0.0,0.0,0.0,0.0,0.0,271.13,0.0,237.9014285714286,259.736,0.0,227.01799999999997,0.0,273.0,245.04599999999996,357.0,0.0,0.0,207.73499999999999,0.0,0.0,0.0,239.6614285714286,224.0,242.35,0.0,0.0,0.0,0.0,210.11277777777775,205.76,221.71499999999997,190.0,0.0,0.0,0.0,226.1214285714286,0.0,213.16000000000003,219.25,0.0,180.47,195.0,271.0,0.0,0.0,0.0,189.98666666666665,154.8,0.0,0.0,207.805,251.43,0.0,229.13,196.7,0.0,39.0,0.0,146.95,218.3,0.0,0.0,0.0,202.25,182.51666666666665,0.0,0.0,181.33333333333334,0.0,75.46,174.75,0.0,0.0,129.0,145.0,148.0,0.0,0.0,0.0,0.0,0.0,184.33333333333334,0.0,0.0,166.86666666666667,143.65,180.0,0.0,0.0,0.0,106.33666666666666,168.4,80.03,155.31333333333333,0.0,0.0,0.0,96.345,89.495,0.0,154.0,130.45,0.0,203.43,0.0,132.76999999999998,91.6,0.0,0.0,0.0,0.0,0.0,0.0,205.0,154.67499999999998,0.0,143.86666666666667,154.27666666666667,0.0,0.0,174.6475,184.5,0.0,151.2,169.775,0.0,0.0,0.0,0.0,140.47,118.115,0.0,0.0,0.0,153.45499999999998,0.0,133.57874999999999,150.85499999999996,0.0,0.0,0.0,150.6,163.7,147.81333333333333,0.0,162.88,0.0,113.98666666666666,0.0,131.32000000000002,128.29999999999998,0.0,0.0,161.165,150.4,0.0,205.1,0.0,203.0,0.0,151.2,187.0,0.0,0.0,0.0,0.0,0.0,203.81,160.0,0.0,0.0,0.0,0.0,130.74375,126.0,0.0,121.65,135.74,0.0,105.0,158.5533333333333,0.0,0.0,0.0,123.28000000000002,117.2825,134.45,0.0,0.0,0.0,114.15,113.7,0.0,124.01500000000001,115.09,92.65,0.0,0.0,0.0,0.0,135.33333333333334,0.0,128.35,126.0,146.24,0.0,0.0,96.73333333333333,112.05,0.0,126.0,0.0,118.26666666666667,105.0,0.0,0.0,0.0,0.0,111.59750000000001,112.60000000000001,109.47999999999999,0.0,0.0,0.0,130.9,136.5,122.725,0.0,0.0,107.1,92.65,0.0,116.19999999999999,131.89,0.0,0.0,0.0,115.67166666666667,123.48818181818181,153.725,0.0,126.68750000000001,0.0,0.0,0.0,109.10000000000001,111.775,0.0,130.9,119.0,0.0,0.0,118.935,121.975,0.0,105.54,0.0,128.0,117.64,0.0,0.0,0.0,0.0,0.0,0.0,132.96666666666667,154.75,131.28333333333336,142.83,184.65,123.485,0.0,89.89500000000001,109.23,0.0,199.43,0.0,182.18,174.42,0.0,0.0,0.0,0.0,0.0,0.0,0.0,116.5,134.625,171.0,0.0,145.0,0.0,109.0,105.0,0.0,0.0,0.0,0.0,0.0,98.0,0.0,83.62,72.56,0.0,88.83333333333333,97.95833333333333,0.0,76.0,73.74333333333334,0.0,0.0,0.0,105.77,99.0,64.1,0.0,110.83,108.34833333333331,0.0,0.0,0.0,136.67,73.44,0.0,0.0,142.8,0.0,116.0,129.45,97.3,161.67,0.0,0.0,0.0,75.0,67.5,0.0,0.0,0.0,121.575,125.5,121.0,0.0,65.0,115.0,0.0,0.0,0.0,0.0,42.08,0.0,0.0,0.0,77.18,0.0,65.66666666666667,64.8925,82.86,129.0,0.0,0.0,0.0,92.8,78.5,0.0,98.8,0.0,114.07,102.785,0.0,0.0,0.0,73.575,110.11,203.95,0.0,0.0,210.346,276.6,0.0,0.0,144.92,246.0,116.4]};
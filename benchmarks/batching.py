@@ -0,0 +1,107 @@
+# Throughput and latency of single reservation model calls from concurrent
+# requests, scored one call each and through scoring.batching at a range of
+# windows and batch sizes. Each level of concurrency is that many threads,
+# like a worker's request threads, each scoring one row after another for
+# --duration seconds. A share of the rows (--duplicates) comes from a few
+# popular reservations, as many users looking at the same dates would.
+#
+#   python benchmarks/batching.py [--model-dir models] [--backend sklearn]
+#       [--model cancellation] [--concurrency 1 4 16 64] [--windows 0 1 2 5]
+#       [--sizes 16 64]
+#
+# Without --model-dir, the stand-in models of benchmarks/suite.py are used.
+# Results are JSON lines on stdout.
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from suite import ROOT, STANDIN_DIR, standin_models, synthetic_features
+
+
+def run(predict, rows, hot, concurrency, duration, duplicates):
+    # Calls of predict with one row from each of concurrency threads
+    times = [[] for _ in range(concurrency)]
+    stop = time.perf_counter() + duration
+
+    def client(i):
+        rng = np.random.default_rng(i)
+        while time.perf_counter() < stop:
+            pool = hot if rng.random() < duplicates else rows
+            row = pool[rng.integers(len(pool))]
+            start = time.perf_counter()
+            predict([row])
+            times[i].append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    latencies = np.concatenate([np.array(t) for t in times]) * 1000
+    return {'calls': len(latencies), 'calls_per_s': len(latencies) / elapsed,
+            'p50_ms': float(np.percentile(latencies, 50)),
+            'p99_ms': float(np.percentile(latencies, 99))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-batching throughput and latency')
+    parser.add_argument('--model-dir', help='default: stand-in models')
+    parser.add_argument('--backend', default='sklearn', choices=['sklearn', 'compiled'])
+    parser.add_argument('--model', default='cancellation', choices=['cancellation', 'price'])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--windows', type=float, nargs='+', default=[0, 1, 2, 5],
+                        help='milliseconds')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[16, 64])
+    parser.add_argument('--duration', type=float, default=3, help='seconds per measurement')
+    parser.add_argument('--duplicates', type=float, default=0.2,
+                        help='share of calls for one of a few popular reservations')
+    args = parser.parse_args()
+
+    model_dir = args.model_dir
+    if model_dir is None:
+        model_dir = STANDIN_DIR
+        if not os.path.exists(os.path.join(model_dir, 'cancellation_model.joblib')):
+            standin_models(model_dir)
+    os.environ.update(HOTEL_MODEL_DIR=model_dir, HOTEL_INFERENCE=args.backend,
+                      HOTEL_MICRO_BATCH='0', HOTEL_RELOAD_INTERVAL='0')
+    sys.path.insert(0, ROOT)
+    from scoring import estimators
+    from scoring.batching import MicroBatcher
+    from scoring.features import CXL_FEATURES, PRICE_FEATURES
+
+    X, _ = synthetic_features(2000)
+    if args.model == 'price':
+        score = estimators._score_price
+        X = X[:, [CXL_FEATURES.index(feature) for feature in PRICE_FEATURES]]
+    else:
+        score = estimators._score_cancellation
+    rows, hot = X.tolist(), X[:5].tolist()
+    # Loaded and first touched before timing
+    score(X[:100])
+
+    for concurrency in args.concurrency:
+        result = run(score, rows, hot, concurrency, args.duration, args.duplicates)
+        print(json.dumps({'model': args.model, 'backend': args.backend, 'mode': 'direct',
+                          'concurrency': concurrency, **result}), flush=True)
+        for size in args.sizes:
+            for window in args.windows:
+                batcher = MicroBatcher(args.model, score, window / 1000, size)
+                result = run(batcher.predict, rows, hot, concurrency, args.duration,
+                             args.duplicates)
+                stats = batcher.stats()
+                print(json.dumps({'model': args.model, 'backend': args.backend,
+                                  'mode': 'batched', 'window_ms': window, 'max_size': size,
+                                  'concurrency': concurrency, **result,
+                                  'mean_batch': round(stats['mean_size'], 2),
+                                  'deduplicated': stats['deduplicated']}), flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# Time to get the encoded feature matrix of a bookings file: parsing and
+# encoding the CSV every time, against opening a store ingested from it once
+# with scoring.datastore. Each is the best of several runs, in milliseconds.
+#
+#   python benchmarks/datastore.py hotel_bookings.csv [--store data/bookings] [--repeat 5]
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scoring import datastore  # noqa: E402
+
+
+def best_of(repeat, function):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CSV parse against columnar store load')
+    parser.add_argument('csv', help='CSV shaped like hotel_bookings.csv')
+    parser.add_argument('--store', help='store to use, ingested from the CSV if missing; '
+                                        'default: a temporary one')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = args.store or os.path.join(tmp, 'bookings')
+        start = time.perf_counter()
+        if not datastore.is_store(store):
+            datastore.ingest(args.csv, store)
+        ingest = (time.perf_counter() - start) * 1000
+
+        results = [
+            ('csv parse', lambda: datastore.read_csv(args.csv)),
+            ('csv parse and encode', lambda: datastore.matrix(datastore.read(args.csv))),
+            ('store open', lambda: datastore.open_store(store)),
+            ('store open and matrix', lambda: datastore.matrix(datastore.open_store(store))),
+        ]
+        rows = datastore.row_count(store)
+        for name, function in results:
+            print(json.dumps({'case': name, 'rows': rows,
+                              'ms': best_of(args.repeat, function)}))
+        print(json.dumps({'case': 'ingest', 'rows': rows, 'ms': ingest}))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+# Load test of the app with simulated users editing the reservation form.
+# Each user loads the site, navigates to the predictions page through
+# display_page and then keeps changing the form: arrival dates, steps of the
+# numeric inputs, hotel switches and trips to another page and back. Every
+# change sends the callbacks the browser would send for it. Reports
+# throughput, latency percentiles and error rates for each number of users.
+#
+# Starts gunicorn with each combination of --workers and --threads, or
+# drives a server that is already running with --url, and prints one JSON
+# line per run and a knee per server configuration: the most users it takes
+# before throughput stops growing or the p99 goes over --slo-ms. The users
+# run as threads of this process, so on a small box pin it to other cores
+# than the server (taskset) for numbers that aren't its own.
+#
+#   python benchmarks/load.py [--workers 1 2 4] [--threads 1 4] [--users 1 4 16 32]
+#   python benchmarks/load.py --url http://127.0.0.1:8050 --users 8 --duration 60
+import argparse
+import contextlib
+import datetime as dt
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+
+from suite import ROOT, STANDIN_DIR, standin_models
+
+# Initial value of each input of the predictions page, as in its layout
+DEFAULTS = {'arrival_date': None, 'hotel': 1, 'num_nights': 1, 'num_adults': 2, 'meal_plan': 3,
+            'num_cars': 2, 'num_sr': 2, 'prev_stay': 1, 'num_prev_cxl': 0, 'deposit_type': 0,
+            'heatmap_metric': 'cxl'}
+
+# Limits of the numeric inputs users step through
+STEPS = {'num_nights': (1, 30), 'num_adults': (1, 4), 'num_cars': (0, 4), 'num_sr': (0, 5),
+         'num_prev_cxl': (0, 10)}
+
+FORM = ['arrival_date', 'num_adults', 'num_nights', 'meal_plan', 'hotel', 'num_cars',
+        'num_sr', 'prev_stay', 'num_prev_cxl', 'deposit_type']
+
+# Callbacks of the predictions page: output, inputs
+CALLBACKS = {
+    '..cxl-output.children...server-price.data..': FORM,
+    'cxl-explanation.figure': FORM,
+    'arrival-heatmap.figure': ['heatmap_metric'] + FORM[1:],
+}
+
+# How often users do each thing
+ACTIONS = {'date': 0.35, 'step': 0.35, 'hotel': 0.15, 'navigate': 0.15}
+PAGES = ['/', '/process', '/insights', '/occupancy']
+
+
+def _kind(output):
+    # Component of the (first) output a callback is recorded under
+    return output.strip('.').split('.')[0]
+
+
+def _outputs(output):
+    # A callback with several outputs names them all in its id, as
+    # '..component.property...component.property..', and takes them as a list
+    if output.startswith('..'):
+        return [_outputs(part) for part in output[2:-2].split('...')]
+    component, prop = output.split('.')
+    return {'id': component, 'property': prop}
+
+
+def _payload(output, inputs, values, changed):
+    return {'output': output, 'outputs': _outputs(output),
+            'inputs': [{'id': name, 'property': 'date' if name == 'arrival_date' else 'value',
+                        'value': values[name]} for name in inputs],
+            'changedPropIds': [f"{changed}.{'date' if changed == 'arrival_date' else 'value'}"],
+            'state': []}
+
+
+class User:
+
+    def __init__(self, url, seed, think):
+        self.url = url
+        self.random = random.Random(seed)
+        self.think = think
+        self.values = None
+        self.records = []
+
+    def _request(self, kind, path, body=None):
+        data = None if body is None else json.dumps(body).encode()
+        request = urllib.request.Request(self.url + path, data=data,
+                                         headers={'Content-Type': 'application/json'})
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                response.read()
+                ok = response.status == 200
+        except (urllib.error.URLError, OSError):
+            ok = False
+        self.records.append((time.monotonic(), kind, time.perf_counter() - start, ok))
+
+    def _navigate(self, pathname):
+        self._request('display_page', '/_dash-update-component',
+                      {'output': 'page-content.children',
+                       'outputs': {'id': 'page-content', 'property': 'children'},
+                       'inputs': [{'id': 'url', 'property': 'pathname', 'value': pathname}],
+                       'changedPropIds': ['url.pathname'], 'state': []})
+
+    def _changed(self, name):
+        # Every callback taking the changed input
+        for output, inputs in CALLBACKS.items():
+            if name in inputs:
+                self._request(_kind(output), '/_dash-update-component',
+                              _payload(output, inputs, self.values, name))
+
+    def open_predictions(self):
+        # A freshly rendered page sends every callback with the initial values
+        self._navigate('/predictions')
+        self.values = dict(DEFAULTS, arrival_date=dt.date.today().isoformat())
+        for output, inputs in CALLBACKS.items():
+            self._request(_kind(output), '/_dash-update-component',
+                          _payload(output, inputs, self.values, inputs[0]))
+
+    def act(self):
+        action = self.random.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+        if action == 'date':
+            days = self.random.randrange(365)
+            self.values['arrival_date'] = (dt.date.today() + dt.timedelta(days=days)).isoformat()
+            self._changed('arrival_date')
+        elif action == 'step':
+            name = self.random.choice(list(STEPS))
+            low, high = STEPS[name]
+            self.values[name] = min(high, max(low, self.values[name] + self.random.choice((-1, 1))))
+            self._changed(name)
+        elif action == 'hotel':
+            self.values['hotel'] = 3 - self.values['hotel']
+            self._changed('hotel')
+        else:
+            self._navigate(self.random.choice(PAGES))
+            self.open_predictions()
+
+    def run(self, deadline):
+        self._request('page', '/')
+        self.open_predictions()
+        while time.monotonic() < deadline:
+            if self.think:
+                time.sleep(self.random.expovariate(1 / self.think))
+            self.act()
+
+
+def load(url, users, duration, warmup, think):
+    # Runs the users for warmup + duration seconds, and summarizes the
+    # requests that started after the warm up
+    deadline = time.monotonic() + warmup + duration
+    simulated = [User(url, seed, think) for seed in range(users)]
+    threads = [threading.Thread(target=user.run, args=(deadline,)) for user in simulated]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    measured_from = start + warmup
+    records = [r for user in simulated for r in user.records if r[0] - r[2] >= measured_from]
+    elapsed = max(time.monotonic() - measured_from, 1e-9)
+    return summarize(records, elapsed)
+
+
+def _percentiles(seconds):
+    ms = np.array(seconds) * 1000
+    return {'p50_ms': float(np.percentile(ms, 50)), 'p90_ms': float(np.percentile(ms, 90)),
+            'p99_ms': float(np.percentile(ms, 99)), 'max_ms': float(ms.max())}
+
+
+def summarize(records, elapsed):
+    if not records:
+        return {'requests': 0, 'rps': 0.0, 'error_rate': 0.0}
+    errors = sum(not ok for _, _, _, ok in records)
+    summary = {'requests': len(records), 'rps': len(records) / elapsed,
+               'error_rate': errors / len(records),
+               **_percentiles([seconds for _, _, seconds, _ in records])}
+    kinds = sorted({kind for _, kind, _, _ in records})
+    summary['by_kind'] = {kind: {'requests': len(times), **_percentiles(times)}
+                          for kind in kinds
+                          for times in [[s for _, k, s, _ in records if k == kind]]}
+    return summary
+
+
+def _serving(url):
+    try:
+        urllib.request.urlopen(url + '/', timeout=1)
+        return True
+    except OSError:
+        return False
+
+
+@contextlib.contextmanager
+def server(workers, threads, port, model_dir):
+    # gunicorn with the app's own settings (gunicorn.conf.py), warmed up
+    env = dict(os.environ, HOTEL_MODEL_DIR=model_dir)
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-w', str(workers),
+                                '--threads', str(threads), '-b', f'127.0.0.1:{port}',
+                                'run:server'],
+                               cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+    url = f'http://127.0.0.1:{port}'
+    try:
+        deadline = time.time() + 300
+        while not _serving(url):
+            if process.poll() is not None or time.time() > deadline:
+                raise RuntimeError(f'gunicorn did not start with {workers} workers')
+            time.sleep(0.5)
+        yield url
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait()
+
+
+def knee(runs, slo_ms):
+    # The most users before throughput grows by less than 10% or the p99
+    # goes over the SLO
+    best = None
+    for run in runs:
+        if run['error_rate'] > 0.01 or run.get('p99_ms', 0) > slo_ms:
+            break
+        if best is not None and run['rps'] < best['rps'] * 1.1:
+            break
+        best = run
+    return best
+
+
+def sweep(url, args, config):
+    runs = []
+    for users in args.users:
+        result = {**config, 'users': users,
+                  **load(url, users, args.duration, args.warmup, args.think)}
+        runs.append(result)
+        print(json.dumps(result), flush=True)
+    best = knee(runs, args.slo_ms)
+    print(json.dumps({**config, 'knee_users': best and best['users'],
+                      'knee_rps': best and best['rps'],
+                      'knee_p99_ms': best and best['p99_ms'],
+                      'max_rps': max(run['rps'] for run in runs)}), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test with simulated form-editing users')
+    parser.add_argument('--url', help='server to drive, default: start gunicorn for each '
+                                      'combination of --workers and --threads')
+    parser.add_argument('--model-dir', default=os.path.join(ROOT, 'models'))
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--users', type=int, nargs='+', default=[1, 4, 16, 32])
+    parser.add_argument('--duration', type=float, default=20, help='seconds measured per run')
+    parser.add_argument('--warmup', type=float, default=3, help='seconds left out of each run')
+    parser.add_argument('--think', type=float, default=0,
+                        help='mean seconds a user waits between changes, default: none')
+    parser.add_argument('--slo-ms', type=float, default=500, help='p99 latency limit')
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args()
+
+    if args.url:
+        sweep(args.url.rstrip('/'), args, {'url': args.url})
+        return
+
+    model_dir = os.path.abspath(args.model_dir)
+    if not os.path.exists(os.path.join(model_dir, 'cancellation_model.joblib')):
+        model_dir = standin_models(STANDIN_DIR)
+    for workers in args.workers:
+        for threads in args.threads:
+            with server(workers, threads, args.port, model_dir) as url:
+                sweep(url, args, {'workers': workers, 'threads': threads})
+
+
+if __name__ == '__main__':
+    main()
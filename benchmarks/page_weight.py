@@ -0,0 +1,182 @@
+# Page weight and estimated time to render of the home and insights pages,
+# without and with the static build (python -m scoring.assets), each in a
+# fresh interpreter through the Flask test client. Counts the bytes a browser
+# accepting brotli and gzip receives for the page shell (HTML, scripts, Dash
+# layout and dependencies), the page itself through display_page, the images
+# it shows, picking from srcset as a browser would for the viewport, and the
+# lazily loaded component chunks it needs. Externally hosted stylesheets and
+# content drawn by callbacks are left out.
+#
+# Time to render is modelled, not measured in a browser: one round trip plus
+# the transfer time of each wave of requests a browser must wait for in turn,
+# plus the server's time. A repeat visit refetches nothing cached as
+# immutable, and revalidates what has an ETag for a round trip.
+#
+#   python benchmarks/page_weight.py [--build build] [--mbps 10] [--rtt-ms 50]
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PAGES = ['/', '/insights']
+HEADERS = {'Accept-Encoding': 'br, gzip'}
+
+# Component types loading a chunk of their own, and the chunks' names
+ASYNC_CHUNKS = {'Markdown': 'markdown', 'Graph': 'graph', 'Dropdown': 'dropdown',
+                'Slider': 'slider', 'DatePickerSingle': 'datepicker', 'Upload': 'upload'}
+
+
+def _components(node):
+    # Every component in a layout, depth first
+    if isinstance(node, list):
+        for child in node:
+            yield from _components(child)
+    elif isinstance(node, dict) and 'type' in node and 'props' in node:
+        yield node
+        yield from _components(node['props'].get('children'))
+
+
+def _slot_width(sizes, viewport):
+    # Width in pixels the sizes attribute gives the image at the viewport
+    for size in (sizes or '100vw').split(','):
+        condition = re.match(r'\s*\(min-width:\s*(\d+)px\)\s*(.+)', size)
+        if condition and viewport < int(condition.group(1)):
+            continue
+        length = (condition.group(2) if condition else size).strip()
+        if length.endswith('vw'):
+            return viewport * float(length[:-2]) / 100
+        return float(length.rstrip('px'))
+    return viewport
+
+
+def _pick(srcset, sizes, viewport):
+    # The narrowest candidate at least as wide as the slot, as browsers do
+    candidates = sorted((int(width.rstrip('w')), url) for url, width
+                        in (candidate.split() for candidate in srcset.split(',')))
+    slot = _slot_width(sizes, viewport)
+    return next((url for width, url in candidates if width >= slot), candidates[-1][1])
+
+
+def images(layout, viewport):
+    # URL of every image the page shows, WebP where a picture offers it
+    urls, inside = [], set()
+    for component in _components(layout):
+        props = component['props']
+        if component['type'] == 'Picture':
+            source, img = props['children']
+            inside.add(id(img))
+            urls.append(_pick(source['props']['srcSet'], source['props'].get('sizes'), viewport))
+        elif component['type'] == 'Img' and id(component) not in inside:
+            urls.append(_pick(props['srcSet'], props.get('sizes'), viewport)
+                        if props.get('srcSet') else props['src'])
+        elif component['type'] == 'Markdown' and isinstance(props.get('children'), str):
+            urls += re.findall(r'!\[[^\]]*\]\(([^)]+)\)', props['children'])
+    return urls
+
+
+def measure(viewport, mbps, rtt_ms):
+    sys.path.insert(0, ROOT)
+    import run
+
+    client = run.server.test_client()
+    results = []
+
+    def fetch(method, url, **kwargs):
+        url = url if url.startswith('/') else '/' + url
+        start = time.perf_counter()
+        response = getattr(client, method)(url, headers=HEADERS, **kwargs)
+        seconds = time.perf_counter() - start
+        cache = response.headers.get('Cache-Control', '')
+        return {'url': url, 'bytes': len(response.get_data()), 'server_s': seconds,
+                'immutable': 'immutable' in cache or 'max-age=31536000' in cache,
+                'etag': 'ETag' in response.headers, 'status': response.status_code}
+
+    for page in PAGES:
+        html = client.get(page, headers=HEADERS).get_data(as_text=True)
+        scripts = [src for src in re.findall(r'<script[^>]*src="([^"]+)"', html)
+                   if src.startswith('/')]
+        payload = {'output': 'page-content.children',
+                   'outputs': {'id': 'page-content', 'property': 'children'},
+                   'inputs': [{'id': 'url', 'property': 'pathname', 'value': page}],
+                   'changedPropIds': ['url.pathname'], 'state': []}
+        content = client.post('/_dash-update-component', json=payload).get_json()
+        layout = content['response']['page-content']['children']
+        used = {c['type'] for c in _components(layout)}
+        chunks = [f'/_dash-component-suites/dash/dcc/async-{ASYNC_CHUNKS[t]}.js'
+                  for t in sorted(used) if t in ASYNC_CHUNKS]
+        if 'Graph' in used:
+            chunks.append('/_dash-component-suites/plotly/package_data/plotly.min.js')
+
+        # Requests a browser makes in turn, each wave needing the one before
+        waves = [[fetch('get', page)],
+                 [fetch('get', src) for src in scripts],
+                 [fetch('get', '/_dash-layout'), fetch('get', '/_dash-dependencies')],
+                 [fetch('post', '/_dash-update-component', json=payload)],
+                 [fetch('get', url) for url in images(layout, viewport) + chunks]]
+        requests = [r for wave in waves for r in wave]
+
+        def visit_ms(repeat):
+            total = 0.0
+            for wave in waves:
+                wave_bytes = sum(r['bytes'] for r in wave
+                                 if not (repeat and (r['immutable'] or r['etag'])))
+                if repeat and all(r['immutable'] for r in wave):
+                    continue
+                server_s = max(r['server_s'] for r in wave)
+                total += rtt_ms + wave_bytes * 8 / (mbps * 1000) + server_s * 1000
+            return total
+
+        image_urls = {url.lstrip('/') for url in images(layout, viewport)}
+        results.append({
+            'page': page, 'requests': len(requests),
+            'errors': sum(r['status'] >= 400 for r in requests),
+            'bytes': sum(r['bytes'] for r in requests),
+            'script_bytes': sum(r['bytes'] for r in waves[1]) +
+                            sum(r['bytes'] for r in waves[4] if r['url'].endswith('.js')),
+            'image_bytes': sum(r['bytes'] for r in waves[4]
+                               if r['url'].lstrip('/') in image_urls),
+            'cached_immutable': sum(r['immutable'] for r in requests),
+            'first_visit_ms': visit_ms(False),
+            'repeat_visit_bytes': sum(r['bytes'] for r in requests
+                                      if not (r['immutable'] or r['etag'])),
+            'repeat_visit_ms': visit_ms(True)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Page weight with and without the static build')
+    parser.add_argument('--build', default=os.path.join(ROOT, 'build'),
+                        help='static build to measure, made first if missing')
+    parser.add_argument('--viewport', type=int, default=1280, help='CSS pixels')
+    parser.add_argument('--mbps', type=float, default=10, help='bandwidth of the modelled link')
+    parser.add_argument('--rtt-ms', type=float, default=50, help='round trip of the modelled link')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.viewport, args.mbps, args.rtt_ms)))
+        return
+
+    build = os.path.abspath(args.build)
+    if not os.path.exists(os.path.join(build, 'manifest.json')):
+        subprocess.run([sys.executable, '-m', 'scoring.assets', '--out', build], cwd=ROOT,
+                       check=True)
+    with tempfile.TemporaryDirectory() as empty:
+        for mode, static_dir in (('before', empty), ('after', build)):
+            env = dict(os.environ, HOTEL_STATIC_DIR=static_dir)
+            out = subprocess.run([sys.executable, __file__, '--child',
+                                  '--viewport', str(args.viewport), '--mbps', str(args.mbps),
+                                  '--rtt-ms', str(args.rtt_ms)],
+                                 env=env, capture_output=True, text=True, check=True).stdout
+            for result in json.loads(out.splitlines()[-1]):
+                print(json.dumps({'mode': mode, **result}))
+
+
+if __name__ == '__main__':
+    main()
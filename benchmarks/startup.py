@@ -0,0 +1,76 @@
+# Startup cost of one app worker: how long until it can serve a page, how long
+# its first prediction takes, and its resident memory, for each way of loading
+# the models. Every configuration runs in a fresh interpreter.
+#
+#   python benchmarks/startup.py [--model-dir models]
+import argparse
+import datetime as dt
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Name, environment and whether to warm up right after import
+CONFIGS = [
+    ('sklearn, warm up at start', {'HOTEL_INFERENCE': 'sklearn'}, True),
+    ('sklearn, lazy', {'HOTEL_INFERENCE': 'sklearn'}, False),
+    ('compiled, lazy', {'HOTEL_INFERENCE': 'compiled'}, False),
+    ('compiled, warm up at start', {'HOTEL_INFERENCE': 'compiled'}, True),
+]
+
+
+def rss():
+    # Resident memory in MB, split into private (anonymous) and file backed
+    # pages; memory mapped model files show up as file backed
+    usage = {}
+    with open('/proc/self/status') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('VmRSS', 'RssAnon', 'RssFile'):
+                usage[key] = int(value.split()[0]) / 1024
+    return usage
+
+
+def measure(warm):
+    sys.path.insert(0, ROOT)
+    start = time.perf_counter()
+    import run  # registers every page, as a gunicorn worker does
+    if warm:
+        from scoring.estimators import warm_up
+        warm_up()
+    ready = time.perf_counter() - start
+    rss_ready = rss()
+
+    # First prediction through the page callback
+    from pages import predictions
+    start = time.perf_counter()
+    predictions.predict(dt.date.today().isoformat(), 2, 1, 0, 1, 0, 0, 0, 0, 1)
+    first_prediction = time.perf_counter() - start
+
+    return {'ready_s': ready, 'first_prediction_s': first_prediction,
+            'time_to_first_prediction_s': ready + first_prediction,
+            'rss_ready_mb': rss_ready, 'rss_after_prediction_mb': rss()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model-dir', default=os.path.join(ROOT, 'models'))
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child == 'warm')))
+        return
+
+    for name, env, warm in CONFIGS:
+        env = dict(os.environ, HOTEL_MODEL_DIR=os.path.abspath(args.model_dir), **env)
+        out = subprocess.run([sys.executable, __file__, '--child', 'warm' if warm else 'lazy'],
+                             env=env, capture_output=True, text=True, check=True).stdout
+        print(json.dumps({'config': name, **json.loads(out.splitlines()[-1])}))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+# Benchmarks of the prediction path, for comparing commits: latency of the
+# predictions page callback, called directly and through Dash's
+# _dash-update-component route, rows per second of each model and of batch
+# scoring, cold import time of run.py and the resident memory of a worker.
+# Each inference backend is measured in a fresh interpreter.
+#
+# Runs offline. Without models/cancellation_model.joblib, small stand-in
+# models are trained on synthetic reservations and kept in .cache/benchmarks,
+# so the numbers compare code, not models. Results are JSON lines on stdout,
+# and with --out one JSON document with the commit they were measured on:
+#
+#   python benchmarks/suite.py [--model-dir models] [--out results.json]
+#   python benchmarks/suite.py --compare before.json after.json
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scoring.features import CXL_FEATURES, PRICE_FEATURES  # noqa: E402
+
+STANDIN_DIR = os.path.join(ROOT, '.cache', 'benchmarks', 'models')
+
+BACKENDS = {
+    'sklearn': {'HOTEL_INFERENCE': 'sklearn'},
+    'compiled': {'HOTEL_INFERENCE': 'compiled'},
+}
+
+# Inputs of the predictions callback, in its argument order
+FORM = ['arrival_date', 'num_adults', 'num_nights', 'meal_plan', 'hotel', 'num_cars',
+        'num_sr', 'prev_stay', 'num_prev_cxl', 'deposit_type']
+
+
+def synthetic_features(rows, random_state=0):
+    # Encoded cancellation model inputs in the ranges of the bookings data,
+    # with a cancellation label loosely following the real one
+    rng = np.random.default_rng(random_state)
+    columns = {
+        'hotel': rng.integers(1, 3, rows),
+        'lead_time': rng.gamma(1.5, 70, rows).round(),
+        'arrival_date_week_number': rng.integers(1, 54, rows),
+        'adults': rng.integers(1, 5, rows),
+        'meal': rng.integers(0, 4, rows),
+        'market_segment': rng.integers(0, 6, rows),
+        'is_repeated_guest': rng.random(rows) < 0.05,
+        'previous_cancellations': rng.poisson(0.1, rows),
+        'booking_changes': rng.poisson(0.2, rows),
+        'deposit_type': rng.choice(3, rows, p=[0.85, 0.02, 0.13]),
+        'days_in_waiting_list': np.zeros(rows),
+        'customer_type': rng.integers(1, 5, rows),
+        'adr': rng.normal(100, 35, rows).clip(20, 400).round(2),
+        'required_car_parking_spaces': rng.random(rows) < 0.06,
+        'total_of_special_requests': rng.poisson(0.6, rows),
+        'nights_stay': rng.integers(1, 15, rows),
+        'room_type_changed': rng.random(rows) < 0.12,
+    }
+    X = np.column_stack([columns[feature] for feature in CXL_FEATURES]).astype(float)
+    logit = (-1.2 + 0.006 * columns['lead_time'] + 3 * (columns['deposit_type'] == 2)
+             + 0.8 * columns['previous_cancellations'] - 0.5 * columns['total_of_special_requests']
+             - 1.5 * columns['required_car_parking_spaces'] - columns['is_repeated_guest'])
+    y = rng.random(rows) < 1 / (1 + np.exp(-logit))
+    return X, y
+
+
+def standin_models(directory, rows=20000):
+    # Price and cancellation models of the real shapes, trained in seconds
+    from joblib import dump
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.tree import DecisionTreeRegressor
+
+    from scoring.explain import REFERENCE_SAMPLE, save_reference_sample
+
+    if os.path.exists(os.path.join(directory, 'cancellation_model.joblib')):
+        return directory
+    os.makedirs(directory, exist_ok=True)
+    X, y = synthetic_features(rows)
+    price_X = X[:, [CXL_FEATURES.index(feature) for feature in PRICE_FEATURES]]
+    dump(DecisionTreeRegressor(max_depth=10, random_state=42)
+         .fit(price_X, X[:, CXL_FEATURES.index('adr')]),
+         os.path.join(directory, 'price_model.joblib'))
+    save_reference_sample(X, os.path.join(directory, REFERENCE_SAMPLE))
+    # Written last, as it marks the stand-ins complete
+    dump(RandomForestClassifier(n_estimators=50, max_depth=15, random_state=42).fit(X, y),
+         os.path.join(directory, 'cancellation_model.joblib'))
+    return directory
+
+
+def forms(count, random_state=0):
+    # Random but valid predictions page inputs
+    rng = np.random.default_rng(random_state)
+    today = dt.date.today()
+    return [[(today + dt.timedelta(days=int(rng.integers(0, 365)))).isoformat(),
+             int(rng.integers(1, 5)), int(rng.integers(1, 15)), int(rng.integers(0, 4)),
+             int(rng.integers(1, 3)), int(rng.integers(0, 3)), int(rng.integers(0, 6)),
+             int(rng.integers(0, 2)), int(rng.integers(0, 4)), int(rng.integers(0, 3))]
+            for _ in range(count)]
+
+
+def dash_payload(form):
+    # Request body the browser sends when an input of the predictions form
+    # changes. The callback has two outputs, the gauge and the server's price
+    # text, both named in its id
+    return {'output': '..cxl-output.children...server-price.data..',
+            'outputs': [{'id': 'cxl-output', 'property': 'children'},
+                        {'id': 'server-price', 'property': 'data'}],
+            'inputs': [{'id': name, 'property': 'date' if name == 'arrival_date' else 'value',
+                        'value': value} for name, value in zip(FORM, form)],
+            'changedPropIds': ['num_nights.value'],
+            'state': []}
+
+
+def latency(function, calls, before=None):
+    # Distribution of the time of each call, in microseconds
+    times = []
+    for args in calls:
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    times = np.array(times) * 1e6
+    return {'calls': len(times), 'mean_us': float(times.mean()),
+            'p50_us': float(np.percentile(times, 50)), 'p90_us': float(np.percentile(times, 90)),
+            'p99_us': float(np.percentile(times, 99)), 'max_us': float(times.max())}
+
+
+def rows_per_second(function, rows, repeat=3):
+    best = min(_seconds(function) for _ in range(repeat))
+    return {'rows': rows, 'rows_per_s': rows / best, 'best_ms': best * 1000}
+
+
+def _seconds(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def measure(requests, rows):
+    # Runs in the child interpreter, one JSON line per case
+    from startup import rss
+
+    start = time.perf_counter()
+    import run
+    yield {'case': 'import run', 'seconds': time.perf_counter() - start, 'rss_mb': rss()}
+
+    from pages import predictions
+    from scoring import batch, estimators
+    from scoring.cache import prediction_cache
+
+    calls = forms(requests)
+    start = time.perf_counter()
+    predictions.predict(*calls[0])
+    yield {'case': 'first predict', 'seconds': time.perf_counter() - start, 'rss_mb': rss()}
+
+    # Every call misses the cache, then the same call repeated hits it
+    yield {'case': 'predict', **latency(predictions.predict, calls, prediction_cache.clear)}
+    yield {'case': 'predict cached', **latency(predictions.predict, calls[:1] * requests)}
+
+    client = run.server.test_client()
+
+    def update(form):
+        response = client.post('/_dash-update-component', json=dash_payload(form))
+        if response.status_code != 200:
+            raise RuntimeError(f'_dash-update-component answered {response.status_code}')
+        return response.get_json()['response']['cxl-output']['children']
+
+    yield {'case': '_dash-update-component',
+           **latency(update, [[form] for form in calls], prediction_cache.clear)}
+    yield {'case': '_dash-update-component cached',
+           **latency(update, [[calls[0]]] * requests)}
+
+    X, _ = synthetic_features(rows, random_state=1)
+    price_X = X[:, [CXL_FEATURES.index(feature) for feature in PRICE_FEATURES]]
+    price = estimators.get_price_estimator()
+    cancellation = estimators.get_cxl_estimator()
+    yield {'case': 'price model', **rows_per_second(lambda: price.predict(price_X), rows)}
+    yield {'case': 'cancellation model',
+           **rows_per_second(lambda: cancellation.predict_proba(X), rows)}
+
+    records = [dict(zip(FORM, form)) for form in forms(rows, random_state=2)]
+    yield {'case': 'batch score', **rows_per_second(lambda: batch.score(records), rows)}
+    yield {'case': 'worker memory', 'rss_mb': rss()}
+
+
+def commit():
+    try:
+        head = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return head + ('-dirty' if dirty else '')
+
+
+def compare(before, after):
+    # Relative change of every number measured in both, per backend and case
+    with open(before) as f:
+        old = {(r['backend'], r['case']): r for r in json.load(f)['results']}
+    with open(after) as f:
+        new = {(r['backend'], r['case']): r for r in json.load(f)['results']}
+    for key in [key for key in new if key in old]:
+        for metric, value in new[key].items():
+            base = old[key].get(metric)
+            if isinstance(value, (int, float)) and isinstance(base, (int, float)) and base:
+                print(json.dumps({'backend': key[0], 'case': key[1], 'metric': metric,
+                                  'before': base, 'after': value,
+                                  'change_pct': round((value - base) / base * 100, 1)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks of the prediction path')
+    parser.add_argument('--model-dir', default=os.path.join(ROOT, 'models'))
+    parser.add_argument('--backends', nargs='+', choices=list(BACKENDS), default=list(BACKENDS))
+    parser.add_argument('--requests', type=int, default=1000,
+                        help='calls per latency distribution')
+    parser.add_argument('--rows', type=int, default=10000, help='rows per throughput case')
+    parser.add_argument('--out', help='JSON file to write the results to')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='compare two --out files instead of measuring')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.child:
+        for result in measure(args.requests, args.rows):
+            print(json.dumps(result), flush=True)
+        return
+
+    model_dir = os.path.abspath(args.model_dir)
+    standin = not os.path.exists(os.path.join(model_dir, 'cancellation_model.joblib'))
+    if standin:
+        model_dir = standin_models(STANDIN_DIR)
+
+    results = []
+    for backend in args.backends:
+        env = dict(os.environ, HOTEL_MODEL_DIR=model_dir, **BACKENDS[backend])
+        out = subprocess.run([sys.executable, __file__, '--child', backend,
+                              '--requests', str(args.requests), '--rows', str(args.rows)],
+                             env=env, capture_output=True, text=True, check=True).stdout
+        for line in out.splitlines():
+            if line.startswith('{'):
+                result = {'backend': backend, **json.loads(line)}
+                results.append(result)
+                print(json.dumps(result), flush=True)
+
+    if args.out:
+        import sklearn
+
+        with open(args.out, 'w') as f:
+            json.dump({'commit': commit(), 'created': dt.datetime.now().isoformat(timespec='seconds'),
+                       'python': platform.python_version(), 'sklearn': sklearn.__version__,
+                       'cpus': os.cpu_count(), 'models': model_dir, 'standin_models': standin,
+                       'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# Total memory of a gunicorn deployment against its number of workers, with
+# each worker holding its own copy of the models versus all of them attached
+# to the shared packed models (HOTEL_SHARED_MODELS=1). Reports the summed RSS
+# of the master and workers, which counts shared pages once per process, and
+# the summed PSS, which splits shared pages between the processes using them.
+#
+#   python benchmarks/workers_memory.py [--model-dir models] [--workers 1 4 16]
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    'per-worker sklearn': {'HOTEL_INFERENCE': 'sklearn'},
+    'shared': {'HOTEL_SHARED_MODELS': '1'},
+}
+
+
+def _children(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    stat = f.read()
+            except OSError:
+                continue
+            # The parent pid follows the parenthesized command name
+            if int(stat.rsplit(')', 1)[1].split()[1]) == pid:
+                children.append(int(entry))
+    return children
+
+
+def _memory(pid):
+    usage = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            key, _, value = line.partition(':')
+            if key in ('Rss', 'Pss'):
+                usage[key] = int(value.split()[0]) / 1024
+    return usage
+
+
+def total_memory(master):
+    totals = {'Rss': 0.0, 'Pss': 0.0}
+    for pid in [master] + _children(master):
+        for key, value in _memory(pid).items():
+            totals[key] += value
+    return totals
+
+
+def measure(mode, workers, model_dir, port):
+    env = dict(os.environ, HOTEL_MODEL_DIR=os.path.abspath(model_dir), **MODES[mode])
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-w', str(workers),
+                                '-b', f'127.0.0.1:{port}', 'run:server'],
+                               cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.DEVNULL)
+    try:
+        # Wait for the workers to come up and warm up, until memory settles
+        deadline = time.time() + 300
+        while len(_children(process.pid)) < workers or not _serving(port):
+            if time.time() > deadline:
+                raise RuntimeError(f'gunicorn did not start {workers} workers')
+            time.sleep(0.5)
+        previous = None
+        while True:
+            time.sleep(2)
+            current = total_memory(process.pid)
+            if previous and abs(current['Rss'] - previous['Rss']) < 1:
+                return current
+            previous = current
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait()
+
+
+def _serving(port):
+    try:
+        urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1)
+        return True
+    except OSError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model-dir', default=os.path.join(ROOT, 'models'))
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    for mode in MODES:
+        for workers in args.workers:
+            usage = measure(mode, workers, args.model_dir, args.port)
+            print(json.dumps({'mode': mode, 'workers': workers,
+                              'total_rss_mb': round(usage['Rss'], 1),
+                              'total_pss_mb': round(usage['Pss'], 1)}), flush=True)
+
+
+if __name__ == '__main__':
+    main()
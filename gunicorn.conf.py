@@ -0,0 +1,28 @@
+# Gunicorn settings, read automatically by `gunicorn run:server` (see Procfile)
+import os
+import subprocess
+import sys
+
+
+def on_starting(server):
+    # With HOTEL_SHARED_MODELS=1 both models are packed into shared memory
+    # once, before any worker starts, and the workers only attach to them.
+    # Packing runs in its own process so the master doesn't keep the memory.
+    if os.environ.get('HOTEL_SHARED_MODELS', '0') == '1':
+        model_dir = os.environ.get('HOTEL_MODEL_DIR', 'models')
+        subprocess.run([sys.executable, '-m', 'scoring.shared', model_dir], check=True)
+
+
+def post_worker_init(worker):
+    # Micro-batched model calls give up well before the worker would be
+    # killed for the request (see scoring/batching.py)
+    if worker.cfg.timeout and 'HOTEL_BATCH_TIMEOUT' not in os.environ:
+        from scoring import batching
+        batching.TIMEOUT = worker.cfg.timeout / 2
+
+    # Load the models and score one reservation before the worker takes
+    # requests, so the first prediction isn't slow. HOTEL_WARM_UP=0 leaves
+    # them to load on first use instead.
+    if os.environ.get('HOTEL_WARM_UP', '1') == '1':
+        from scoring.estimators import warm_up
+        warm_up()
@@ -8,6 +8,7 @@ import plotly.express as px
 
 # Imports from this application
 from app import app
+from static_assets import image
 
 # 2 column layout. 1st column width = 4/12
 # https://dash-bootstrap-components.opensource.faculty.ai/l/components/layout
@@ -36,7 +37,7 @@ fig = px.scatter(gapminder.query("year==2007"), x="gdpPercap", y="lifeExp", size
 
 column2 = dbc.Col(
     [
-        html.Img(src='assets/Four-Seasons.jpg', className='img-fluid')
+        image('Four-Seasons.jpg', sizes='(min-width: 768px) 66vw, 100vw', className='img-fluid')
     ],
     style={'margin-top': '10px'}
 )
@@ -5,8 +5,72 @@ import dash_core_components as dcc
 import dash_html_components as html
 from dash.dependencies import Input, Output
 
+import plotly.graph_objs as go
+
 # Imports from this application
 from app import app
+from scoring.evaluation import get_report
+from scoring.explain import cached_partial_dependence
+from scoring.features import CXL_FEATURES, cat_map
+from static_assets import image
+
+# Partial dependence plots shown alongside the text, and the image in assets/
+# the notebook rendered for each, shown when the curves can't be computed
+PDP_IMAGES = {
+    'lead_time': 'pdp_lead.jpg',
+    'required_car_parking_spaces': 'pdp_parking.jpg',
+    'deposit_type': 'pdp_deposit.jpg',
+    'previous_cancellations': 'pdp_cxl.jpg',
+}
+
+# Images fill one of two columns on wider screens
+HALF_WIDTH = '(min-width: 768px) 50vw, 100vw'
+
+
+def pdp_panel(feature):
+    return html.Div(
+        [
+            html.Div(image(PDP_IMAGES[feature], sizes=HALF_WIDTH, className='img-fluid'),
+                     id=f'pdp-{feature}'),
+            dcc.Checklist(
+                id=f'pdp-ice-{feature}',
+                options=[{'label': ' Show individual reservations', 'value': 'ice'}],
+                value=['ice']
+            )
+        ],
+        className='mb-3'
+    )
+
+
+def pdp_figure(feature, grid, ice, pdp, show_ice, max_lines=50):
+    # Partial dependence (mean over the reference sample) and, optionally,
+    # the individual conditional expectation curves it averages
+    lines = []
+    if show_ice:
+        step = max(1, len(ice) // max_lines)
+        lines = [go.Scatter(x=grid, y=curve, mode='lines', hoverinfo='skip',
+                            line={'color': 'rgba(120, 120, 120, 0.25)', 'width': 1})
+                 for curve in ice[::step]]
+    lines.append(go.Scatter(x=grid, y=pdp, mode='lines+markers', name='Average',
+                            line={'color': '#593196', 'width': 3}))
+
+    xaxis = {'title': feature}
+    labels = {m['col']: {v: k for k, v in m['mapping'].items()} for m in cat_map}
+    if feature in labels:
+        xaxis.update(tickvals=list(grid), ticktext=[labels[feature].get(v, v) for v in grid])
+    return go.Figure(data=lines,
+                     layout={'xaxis': xaxis, 'yaxis': {'title': 'Probability of cancellation'},
+                             'showlegend': False, 'margin': {'t': 10}})
+
+
+def pdp_view(feature, points, show_ice, image_name=None):
+    curves = cached_partial_dependence(feature, points)
+    if curves is None:
+        if image_name:
+            return image(image_name, sizes=HALF_WIDTH, className='img-fluid')
+        return dcc.Markdown('No reference sample has been saved with the model.')
+    return dcc.Graph(figure=pdp_figure(feature, *curves, show_ice),
+                     config={'displayModeBar': False})
 
 # 1 column layout
 # https://dash-bootstrap-components.opensource.faculty.ai/l/components/layout
@@ -52,11 +116,7 @@ column1 = dbc.Col(
             """
         ),
 
-        html.P(
-            [
-                html.Img(src='assets/pdp_lead.jpg', className='img-fluid')
-            ] 
-        ),
+        pdp_panel('lead_time'),
 
         dcc.Markdown(
             """
@@ -72,11 +132,7 @@ column1 = dbc.Col(
 
         ),
 
-        html.P(
-            [
-                html.Img(src='assets/pdp_parking.jpg', className='img-fluid')
-            ] 
-        )
+        pdp_panel('required_car_parking_spaces')
 
     ],
 )
@@ -85,7 +141,7 @@ column2 = dbc.Col(
     [
         html.P(
             [
-                html.Img(src='assets/shap_summary.jpg', className='img-fluid')
+                image('shap_summary.jpg', sizes=HALF_WIDTH, className='img-fluid')
             ] 
         ),
 
@@ -105,11 +161,7 @@ column2 = dbc.Col(
             """
         ),
 
-        html.P(
-            [
-                html.Img(src='assets/pdp_deposit.jpg', className='img-fluid')
-            ] 
-        ),
+        pdp_panel('deposit_type'),
 
         dcc.Markdown(
             """
@@ -119,7 +171,7 @@ column2 = dbc.Col(
 
         html.P(
             [
-                html.Img(src='assets/shap_prediction.jpg', className='img-fluid')
+                image('shap_prediction.jpg', sizes=HALF_WIDTH, className='img-fluid')
             ] 
         ),
 
@@ -135,15 +187,202 @@ column2 = dbc.Col(
             """
         ),
 
-        html.P(
-            [
-                html.Img(src='assets/pdp_cxl.jpg', className='img-fluid')
-            ] 
-        ),
+        pdp_panel('previous_cancellations'),
 
 
     ], 
     style={'margin-top': '30px'}
 )
 
-layout = dbc.Row([column1, column2])
\ No newline at end of file
+# Curves for any feature of the model, at a chosen resolution
+explorer = dbc.Row(
+    dbc.Col(
+        [
+            dcc.Markdown(
+                """
+                #### Explore the Model
+
+                Choose any feature to see how the probability of cancellation changes with it,
+                on average and for a sample of individual reservations, using the current model.
+
+                """
+            ),
+            dcc.Dropdown(
+                id='pdp_feature',
+                options=[{'label': feature, 'value': feature} for feature in CXL_FEATURES],
+                value='lead_time'
+            ),
+            dcc.Slider(id='pdp_points', min=5, max=50, step=5, value=20,
+                       marks={n: str(n) for n in range(5, 51, 5)}),
+            dcc.Markdown('Points on the curve'),
+            dcc.Checklist(
+                id='pdp_ice',
+                options=[{'label': ' Show individual reservations', 'value': 'ice'}],
+                value=['ice']
+            ),
+            html.Div(id='pdp-explorer')
+        ]
+    ),
+    style={'margin-top': '30px'}
+)
+
+# How good the model is on reservations it wasn't trained on, from the
+# evaluation report saved with it (see scoring.evaluation)
+performance = dbc.Row(
+    [
+        dbc.Col(
+            [
+                dcc.Markdown('#### How Good is the Model?'),
+                dcc.Markdown(id='evaluation-summary'),
+                html.Div(id='evaluation-roc'),
+                html.Div(id='evaluation-calibration'),
+            ],
+            md=6,
+        ),
+        dbc.Col(
+            [
+                dcc.Markdown(
+                    """
+                    Choose the probability above which a reservation is treated as a likely
+                    cancellation, to see what share of the cancellations it catches (recall), how
+                    many of those it flags really cancel (precision) and what its mistakes cost.
+                    """
+                ),
+                dcc.Slider(id='evaluation_threshold', min=0, max=1, step=0.01, value=0.5,
+                           marks={t / 10: str(t / 10) for t in range(11)}),
+                html.Div(id='evaluation-sweep'),
+                html.Div(id='evaluation-confusion'),
+            ],
+            md=6,
+        ),
+    ],
+    style={'margin-top': '30px'}
+)
+
+layout = html.Div([dbc.Row([column1, column2]), explorer, performance])
+
+
+def register_pdp_callback(feature, image_name):
+    @app.callback(Output(f'pdp-{feature}', 'children'),
+                  [Input(f'pdp-ice-{feature}', 'value')])
+    def update_pdp(show_ice):
+        return pdp_view(feature, 20, 'ice' in show_ice, image_name)
+
+
+for feature, image_name in PDP_IMAGES.items():
+    register_pdp_callback(feature, image_name)
+
+
+@app.callback(Output('pdp-explorer', 'children'),
+              [Input('pdp_feature', 'value'),
+               Input('pdp_points', 'value'),
+               Input('pdp_ice', 'value')])
+def explore_pdp(feature, points, show_ice):
+    return pdp_view(feature, points, 'ice' in show_ice)
+
+
+def _band(x, low, high, name, color):
+    # Shaded confidence interval between two curves
+    return [go.Scatter(x=x, y=high, mode='lines', line={'width': 0}, hoverinfo='skip',
+                       showlegend=False),
+            go.Scatter(x=x, y=low, mode='lines', line={'width': 0}, fill='tonexty',
+                       fillcolor=color, name=name, hoverinfo='skip')]
+
+
+def roc_figure(report):
+    roc = report['roc']
+    data = []
+    if 'low' in roc:
+        data += _band(roc['fpr'], roc['low'], roc['high'],
+                      f"{report['confidence']:.0%} interval", 'rgba(89, 49, 150, 0.2)')
+    data += [go.Scatter(x=roc['fpr'], y=roc['tpr'], mode='lines', name='ROC curve',
+                        line={'color': '#593196', 'width': 3}),
+             go.Scatter(x=[0, 1], y=[0, 1], mode='lines', name='Chance',
+                        line={'color': 'gray', 'dash': 'dash'})]
+    return go.Figure(data=data, layout={'xaxis': {'title': 'False positive rate'},
+                                        'yaxis': {'title': 'True positive rate'},
+                                        'legend': {'orientation': 'h'}, 'margin': {'t': 10}})
+
+
+def calibration_figure(report):
+    calibration = report['calibration']
+    error = None
+    if 'observed_low' in calibration:
+        error = {'type': 'data', 'symmetric': False,
+                 'array': [None if h is None else h - o for o, h
+                           in zip(calibration['observed'], calibration['observed_high'])],
+                 'arrayminus': [None if l is None else o - l for o, l
+                                in zip(calibration['observed'], calibration['observed_low'])]}
+    data = [go.Scatter(x=calibration['predicted'], y=calibration['observed'],
+                       mode='lines+markers', name='Model', error_y=error,
+                       text=[f'{n} reservations' for n in calibration['rows']],
+                       line={'color': '#593196', 'width': 3}),
+            go.Scatter(x=[0, 1], y=[0, 1], mode='lines', name='Perfectly calibrated',
+                       line={'color': 'gray', 'dash': 'dash'})]
+    return go.Figure(data=data, layout={'xaxis': {'title': 'Predicted probability of cancellation'},
+                                        'yaxis': {'title': 'Share cancelled'},
+                                        'legend': {'orientation': 'h'}, 'margin': {'t': 10}})
+
+
+def sweep_figure(report, threshold):
+    sweep = report['thresholds']
+    data = []
+    for key, name, color, fill in (('precision', 'Precision', '#593196', 'rgba(89, 49, 150, 0.15)'),
+                                   ('recall', 'Recall', '#5cb85c', 'rgba(92, 184, 92, 0.15)'),
+                                   ('cost', 'Cost per reservation', '#d9534f',
+                                    'rgba(217, 83, 79, 0.15)')):
+        if f'{key}_low' in sweep:
+            data += _band(sweep['threshold'], sweep[f'{key}_low'], sweep[f'{key}_high'],
+                          f'{name} interval', fill)
+        data.append(go.Scatter(x=sweep['threshold'], y=sweep[key], mode='lines', name=name,
+                               line={'color': color, 'width': 3}))
+    return go.Figure(data=data, layout={
+        'xaxis': {'title': 'Threshold'}, 'legend': {'orientation': 'h'}, 'margin': {'t': 10},
+        'shapes': [{'type': 'line', 'x0': threshold, 'x1': threshold, 'yref': 'paper',
+                    'y0': 0, 'y1': 1, 'line': {'color': 'gray', 'dash': 'dot'}}]})
+
+
+def confusion_table(report, threshold):
+    sweep = report['thresholds']
+    i = min(range(len(sweep['threshold'])), key=lambda j: abs(sweep['threshold'][j] - threshold))
+    tp, fp, tn, fn = (int(sweep[key][i]) for key in ('tp', 'fp', 'tn', 'fn'))
+    interval = ''
+    if 'precision_low' in sweep:
+        interval = (f" ({sweep['precision_low'][i]:.1%} to {sweep['precision_high'][i]:.1%})")
+    return dcc.Markdown(
+        f"""
+        | | Predicted check-out | Predicted cancellation |
+        |---|---|---|
+        | **Checked out** | {tn} | {fp} |
+        | **Cancelled** | {fn} | {tp} |
+
+        Precision {sweep['precision'][i]:.1%}{interval}, recall {sweep['recall'][i]:.1%}
+        """
+    )
+
+
+@app.callback([Output('evaluation-summary', 'children'),
+               Output('evaluation-roc', 'children'),
+               Output('evaluation-calibration', 'children'),
+               Output('evaluation-sweep', 'children'),
+               Output('evaluation-confusion', 'children')],
+              [Input('evaluation_threshold', 'value')])
+def show_evaluation(threshold):
+    report = get_report()
+    if report is None:
+        # The notebook's images, when no report has been saved with the model
+        return ('No evaluation report has been saved with the model.',
+                image('ROC.jpg', sizes=HALF_WIDTH, className='img-fluid'), None, None,
+                image('confusion2.jpg', sizes=HALF_WIDTH, className='img-fluid'))
+    auc = report['auc']
+    summary = f"ROC-AUC {auc['value']:.3f}"
+    if 'low' in auc:
+        summary += (f" ({report['confidence']:.0%} interval {auc['low']:.3f} to {auc['high']:.3f}, "
+                    f"from {report['bootstrap']} bootstrap resamples)")
+    summary += f", on {report['rows']} held-out reservations."
+    config = {'displayModeBar': False}
+    return (summary,
+            dcc.Graph(figure=roc_figure(report), config=config),
+            dcc.Graph(figure=calibration_figure(report), config=config),
+            dcc.Graph(figure=sweep_figure(report, threshold), config=config),
+            confusion_table(report, threshold))
@@ -0,0 +1,219 @@
+# Imports from 3rd party libraries
+import base64
+import csv
+import hashlib
+import io
+import os
+import threading
+
+import dash
+import dash_bootstrap_components as dbc
+import dash_core_components as dcc
+import dash_html_components as html
+from dash.dependencies import Input, Output, State
+import dash_daq as daq
+import datetime as dt
+import plotly.graph_objs as go
+
+# Imports from this application
+from app import app
+from scoring import schema
+from scoring.cache import PredictionCache
+from scoring.estimators import loaded_version
+from scoring.occupancy import forecast_book
+
+# Forecasts of the books uploaded in this process, and of each with the
+# cancellations made so far. Dropped at the end of the day, as lead times change
+forecast_cache = PredictionCache(int(os.environ.get('HOTEL_FORECAST_CACHE_SIZE', 8)))
+_forecast_lock = threading.Lock()
+
+column1 = dbc.Col(
+    [
+        dcc.Markdown(
+            """
+
+            ## Occupancy
+
+            Upload the book of reservations, a CSV with the fields of the reservation form
+            (arrival_date, num_adults, num_nights, meal_plan, hotel, num_cars, num_sr,
+            prev_stay, num_prev_cxl, deposit_type) and an optional id, coded as on the
+            predictions page (deposit_type is 0 for none, 1 refundable and 2 non-refundable).
+            Every reservation is scored for cancellation, and for each night we work out the
+            chance of every possible number of rooms being occupied, to decide how far to
+            overbook.
+
+            """
+        ),
+        dcc.Upload(
+            id='book-upload',
+            children=html.Div(['Drag and drop or ', html.A('select a CSV')]),
+            style={'borderWidth': '1px', 'borderStyle': 'dashed', 'borderRadius': '5px',
+                   'textAlign': 'center', 'padding': '20px'}
+        ),
+        dcc.Markdown(id='book-status'),
+
+        dcc.Dropdown(
+            id='occupancy_hotel',
+            options=schema.options('hotel', {'City Hotel': 'City', 'Resort Hotel': 'Resort'}),
+            value=schema.HOTEL['City Hotel']
+        ),
+        dcc.Markdown('Choose which location'),
+
+        daq.NumericInput(
+            id='occupancy_rooms',
+            min=1,
+            max=1000,
+            value=100
+        ),
+        dcc.Markdown('How many rooms does it have?'),
+
+        dcc.Input(id='cancel_booking', type='text', placeholder='Booking id'),
+        html.Button('Cancel booking', id='cancel-button', n_clicks=0, className='ml-2'),
+        dcc.Markdown('Cancel a booking to update the forecast'),
+
+        dcc.Store(id='book'),
+        dcc.Store(id='cancelled', data=[])
+    ],
+    md=4,
+)
+
+column2 = dbc.Col(
+    [
+        dcc.Graph(id='occupancy-forecast', config={'displayModeBar': False}),
+        dcc.Markdown('Click a night to see how many rooms are likely occupied'),
+        dcc.Graph(id='occupancy-night', config={'displayModeBar': False})
+    ]
+)
+
+layout = dbc.Row([column1, column2])
+
+
+def read_book(text):
+    # Returns the booking ids and the reservations. Rows are numbered from 0
+    # unless the book has an id column
+    records = list(csv.DictReader(io.StringIO(text)))
+    ids = [str(record.get('id', row)) for row, record in enumerate(records)]
+    if len(set(ids)) != len(ids):
+        duplicate = next(booking for booking in ids if ids.count(booking) > 1)
+        raise ValueError(f'booking id {duplicate} appears more than once')
+    return ids, records
+
+
+def get_forecast(text, cancelled):
+    # The book's forecast with the given bookings cancelled. The forecast of
+    # the whole book is cached and never changed: each set of cancellations
+    # is a view derived from it and cached under its own key, so every tab
+    # and user gets the same answer for the same book and cancellations
+    key = (hashlib.sha1(text.encode()).hexdigest(), loaded_version('cancellation'))
+    view_key = key + (frozenset(cancelled),)
+    with _forecast_lock:
+        view = forecast_cache.get(view_key)
+        if view is not None:
+            return view
+        forecast = forecast_cache.get(key + (frozenset(),))
+        if forecast is None:
+            ids, records = read_book(text)
+            forecast = forecast_book(records, ids)
+            forecast_cache.put(key + (frozenset(),), forecast)
+        if cancelled:
+            view = forecast.without(cancelled)
+            forecast_cache.put(view_key, view)
+            return view
+        return forecast
+
+
+@app.callback(
+    [Output('book', 'data'),
+     Output('cancelled', 'data'),
+     Output('book-status', 'children')],
+    [Input('book-upload', 'contents'),
+     Input('cancel-button', 'n_clicks')],
+    [State('book-upload', 'filename'),
+     State('cancel_booking', 'value'),
+     State('book', 'data'),
+     State('cancelled', 'data')]
+)
+def update_book(contents, n_clicks, filename, booking, book, cancelled):
+    triggered = [t['prop_id'] for t in dash.callback_context.triggered]
+    if 'book-upload.contents' in triggered and contents:
+        # A new book starts with no cancellations
+        text = base64.b64decode(contents.split(',', 1)[1]).decode('utf-8')
+        try:
+            ids, _ = read_book(text)
+            get_forecast(text, [])
+        except (KeyError, ValueError) as e:
+            return None, [], f'Could not read {filename}: {e}'
+        return text, [], f'{len(ids)} bookings in {filename}'
+    if book is None:
+        return dash.no_update, dash.no_update, 'No book uploaded yet'
+    if 'cancel-button.n_clicks' in triggered and booking:
+        if booking not in read_book(book)[0]:
+            return dash.no_update, dash.no_update, f'There is no booking {booking}'
+        cancelled = sorted(set(cancelled) | {booking})
+    return dash.no_update, cancelled, f'{len(cancelled)} bookings cancelled'
+
+
+@app.callback(
+    Output('occupancy-forecast', 'figure'),
+    [Input('book', 'data'),
+     Input('cancelled', 'data'),
+     Input('occupancy_hotel', 'value'),
+     Input('occupancy_rooms', 'value')]
+)
+def plot_forecast(book, cancelled, hotel, rooms):
+    if book is None:
+        return go.Figure(layout={'xaxis': {'visible': False}, 'yaxis': {'visible': False}})
+    rows = get_forecast(book, cancelled).summary(hotel, rooms)
+    nights = [row['night'] for row in rows]
+    # The number of rooms is empty while it is being typed
+    overbooked = [f"{row['prob_overbooked']:.1%} chance of more than {rooms} rooms"
+                  if rooms is not None else '' for row in rows]
+    data = [
+        go.Bar(x=nights, y=[row['booked'] for row in rows], name='Booked',
+               marker={'color': 'rgba(160, 160, 160, 0.5)'}),
+        go.Scatter(x=nights, y=[row['p90'] for row in rows], mode='lines',
+                   line={'width': 0}, hoverinfo='skip', showlegend=False),
+        go.Scatter(x=nights, y=[row['p10'] for row in rows], mode='lines', fill='tonexty',
+                   line={'width': 0}, fillcolor='rgba(89, 49, 150, 0.2)',
+                   name='80% of outcomes', hoverinfo='skip'),
+        go.Scatter(x=nights, y=[row['expected'] for row in rows], mode='lines',
+                   line={'color': '#593196', 'width': 3}, name='Expected occupied',
+                   text=overbooked, hovertemplate='%{y:.1f} rooms<br>%{text}'),
+    ]
+    return go.Figure(data=data, layout={
+        'yaxis': {'title': 'Rooms'}, 'margin': {'t': 10}, 'hovermode': 'x',
+        'legend': {'orientation': 'h'},
+        'shapes': [{'type': 'line', 'xref': 'paper', 'x0': 0, 'x1': 1, 'y0': rooms,
+                    'y1': rooms, 'line': {'color': 'firebrick', 'dash': 'dash'}}]
+                  if rooms is not None else []})
+
+
+@app.callback(
+    Output('occupancy-night', 'figure'),
+    [Input('occupancy-forecast', 'clickData'),
+     Input('book', 'data'),
+     Input('cancelled', 'data'),
+     Input('occupancy_hotel', 'value'),
+     Input('occupancy_rooms', 'value')]
+)
+def plot_night(click_data, book, cancelled, hotel, rooms):
+    empty = go.Figure(layout={'xaxis': {'visible': False}, 'yaxis': {'visible': False}})
+    if book is None or not click_data:
+        return empty
+    night = dt.date.fromisoformat(click_data['points'][0]['x'][:10])
+    distribution = get_forecast(book, cancelled).nights.get((hotel, night))
+    if distribution is None:
+        return empty
+    pmf = distribution.pmf
+    if rooms is None:
+        title = f'{night:%d %b %Y}'
+    else:
+        title = (f'{night:%d %b %Y}: {distribution.prob_above(rooms):.1%} chance '
+                 f'of more than {rooms} rooms occupied')
+    return go.Figure(
+        data=[go.Bar(x=list(range(len(pmf))), y=pmf,
+                     marker={'color': ['firebrick' if rooms is not None and n > rooms
+                                       else '#593196' for n in range(len(pmf))]})],
+        layout={'title': title,
+                'xaxis': {'title': 'Rooms occupied'}, 'yaxis': {'title': 'Probability'},
+                'margin': {'t': 40}})
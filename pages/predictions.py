@@ -3,20 +3,31 @@ import dash
 import dash_bootstrap_components as dbc
 import dash_core_components as dcc
 import dash_html_components as html
-from dash.dependencies import Input, Output
+from dash.dependencies import ClientsideFunction, Input, Output
 import dash_daq as daq
 import datetime as dt
-
-from sklearn.tree import DecisionTreeRegressor
-from sklearn.ensemble import RandomForestClassifier
-
-# Estimators
-from joblib import load
-price_estimator = load('models/price_model.joblib')
-cxl_estimator = load('models/cancellation_model.joblib')
+import numpy as np
+import plotly.graph_objs as go
 
 # Imports from this application
 from app import app
+from scoring import drift, estimators, features, price_bands, price_tree, schema
+from scoring.metrics import stage, timed
+from scoring.arrivals import score_arrival_dates
+from scoring.cache import prediction_cache
+from scoring.explain import explain_prediction
+from scoring.estimators import loaded_version, predict_cancellation, predict_price
+
+# Last arrival date that can be booked
+LAST_ARRIVAL_DATE = dt.date(2022, 12, 31)
+
+# A new price model is exported for the browser as soon as it is loaded
+estimators.on_reload('price', price_tree.refresh_asset)
+
+# Features shown in the explanation of a prediction
+MAX_EXPLAINED_FEATURES = 10
+EXPLAINER_NAMES = {'path': 'Saabas path attributions, not SHAP values',
+                   'tree_shap': 'TreeSHAP values', 'sequential': 'feature by feature'}
 
 # 2 column layout. 1st column width = 4/12
 # https://dash-bootstrap-components.opensource.faculty.ai/l/components/layout
@@ -36,7 +47,7 @@ column1 = dbc.Col(
     dcc.DatePickerSingle(
         id='arrival_date',
         min_date_allowed=dt.date.today(),
-        max_date_allowed=dt.date(2022, 12, 31),
+        max_date_allowed=LAST_ARRIVAL_DATE,
         initial_visible_month=dt.date.today(),
         date=dt.date.today()
     ),
@@ -44,11 +55,8 @@ column1 = dbc.Col(
 
     dcc.Dropdown(
         id='hotel',
-        options=[
-            {'label': 'City', 'value': 1},
-            {'label': 'Resort', 'value': 2}
-        ],
-        value=1
+        options=schema.options('hotel', {'City Hotel': 'City', 'Resort Hotel': 'Resort'}),
+        value=schema.HOTEL['City Hotel']
     ),
     dcc.Markdown('Choose which location'),
 
@@ -70,13 +78,10 @@ column1 = dbc.Col(
 
     dcc.Dropdown(
         id='meal_plan',
-        options=[
-            {'label': 'None', 'value': 0},
-            {'label': 'Breakfast', 'value': 1},
-            {'label': 'Breakfast and dinner', 'value': 2},
-            {'label': 'Full meal plan','value': 3 }
-        ],
-        value=3
+        options=schema.options('meal_plan', {'SC': 'None', 'BB': 'Breakfast',
+                                             'HB': 'Breakfast and dinner',
+                                             'FB': 'Full meal plan'}),
+        value=schema.MEAL['FB']
     ),
     dcc.Markdown('Choose a meal plan'),
 
@@ -117,12 +122,12 @@ column1 = dbc.Col(
 
     dcc.RadioItems(
         id='deposit_type',
-        options=[
-            {'label': 'None', 'value': 1},
-            {'label': 'Refundable', 'value': 2},
-            {'label': 'Non-refundable', 'value': 3}
-        ],
-        value=1,
+        # Coded as in training. Was 1, 2 and 3 here, which the model read as
+        # one step more restrictive than chosen
+        options=schema.options('deposit_type', {'No Deposit': 'None',
+                                                'Refundable': 'Refundable',
+                                                'Non Refund': 'Non-refundable'}),
+        value=schema.DEPOSIT_TYPE['No Deposit'],
         labelStyle={'display': 'inline-block', 'padding': '5px'}
     ),
     dcc.Markdown('Will you make a deposit?')
@@ -136,13 +141,80 @@ column1 = dbc.Col(
 
 column2 = dbc.Col(
     [
-        html.Div(id='price-output'), 
-        html.Div(id='cxl-output')
+        dcc.Markdown(id='price-output', style={'text-align': 'center', 'margin-top': '40px'}),
+        # The price the server worked out for the cancellation prediction
+        dcc.Store(id='server-price'),
+        html.Div(id='cxl-output'),
+
+        dcc.Markdown('#### Why this probability?'),
+        dcc.Graph(id='cxl-explanation', config={'displayModeBar': False}),
+
+        dcc.Markdown('#### Compare arrival dates'),
+        dcc.RadioItems(
+            id='heatmap_metric',
+            options=[
+                {'label': 'Probability of cancellation', 'value': 'cxl'},
+                {'label': 'Nightly rate', 'value': 'price'}
+            ],
+            value='cxl',
+            labelStyle={'display': 'inline-block', 'padding': '5px'}
+        ),
+        dcc.Graph(id='arrival-heatmap', config={'displayModeBar': False}),
+        dcc.Markdown('Click a day to make it the arrival date')
     ]
 )
 
+# The nightly rate and total cost are worked out in the browser from the
+# exported price model (see scoring/price_tree.py), so they update without a
+# round trip to the server. Once the server's price for the same inputs comes
+# back with the cancellation prediction it is shown instead, which only
+# differs when the page was opened before the model was reloaded
+app.clientside_callback(
+    ClientsideFunction(namespace='hotel', function_name='estimatePrice'),
+    Output('price-output', 'children'),
+    [Input('arrival_date', 'date'),
+     Input('num_adults', 'value'),
+     Input('num_nights', 'value'),
+     Input('meal_plan', 'value'),
+     Input('hotel', 'value'),
+     Input('server-price', 'data')],
+)
+
+def cancellation_input(week, lead_time, num_adults, num_nights, meal_plan, hotel, num_cars,
+                       num_sr, prev_stay, num_prev_cxl, deposit_type):
+    # Get estimated price of this stay
+    with stage('price_features'):
+        input1 = features.price_input(week, hotel, num_adults, num_nights)
+    with stage('price_model'):
+        price = predict_price(input1[np.newaxis])[0]
+
+    # Input for the cancellation model. Rolls in the ADR from previous step
+    with stage('cancellation_features'):
+        adr = features.nightly_rate(price, meal_plan)
+        return features.cancellation_input(hotel, lead_time, week, num_adults, meal_plan,
+                                           prev_stay, num_prev_cxl, deposit_type, adr,
+                                           num_cars, num_sr, num_nights)
+
+
+def banded_cancellation_inputs(week, lead_time, num_adults, num_nights, meal_plan, hotel,
+                               num_cars, num_sr, prev_stay, num_prev_cxl, deposit_type):
+    # The estimated nightly rate and the low and high ends of its band, from
+    # one walk of the price tree, and an input for the cancellation model at each
+    with stage('price_features'):
+        input1 = features.price_input(week, hotel, num_adults, num_nights)
+    with stage('price_model'):
+        prices = price_bands.predict_banded(input1[np.newaxis])[0]
+    with stage('cancellation_features'):
+        rates = [features.nightly_rate(price, meal_plan) for price in prices]
+        # A row at each rate, in one block
+        rows = features.cancellation_input(hotel, lead_time, week, num_adults, meal_plan,
+                                           prev_stay, num_prev_cxl, deposit_type,
+                                           np.array(rates), num_cars, num_sr, num_nights)
+    return rates, rows
+
+
 @app.callback(
-    [Output('price-output', 'children'), Output('cxl-output', 'children')],
+    [Output('cxl-output', 'children'), Output('server-price', 'data')],
     [Input('arrival_date', 'date'), 
      Input('num_adults', 'value'),
      Input('num_nights', 'value'),
@@ -154,54 +226,184 @@ column2 = dbc.Col(
      Input('num_prev_cxl', 'value'),
      Input('deposit_type', 'value')],
 )
+@timed('predict')
 def predict(arrival_date, num_adults, num_nights, meal_plan, hotel, num_cars,
             num_sr, prev_stay, num_prev_cxl, deposit_type):
 
     # Get the week of the year and lead time from the arrival date
-    arrival = dt.datetime.strptime(arrival_date, '%Y-%m-%d')
-    week = arrival.isocalendar()[1]
-    lead_time = (arrival.date() - dt.date.today()).days
+    with stage('parse_date'):
+        week, lead_time = features.arrival_features(arrival_date)
 
-    # Features used in the model not exposed in this app, but will be hard coded
-    market_seg = 1
-    room_type_changed = False
-    customer_type = 1
-    days_in_waiting_list = 0
-    booking_changes = 0
+    # Repeat inputs are answered from the cache without calling either model.
+    # The key holds every derived feature, lead time included, the versions
+    # of the models and whether there are price bands.
+    bands = price_bands.get_bands()
+    key = (week, lead_time, hotel, num_adults, num_nights, meal_plan, num_cars,
+           num_sr, prev_stay, num_prev_cxl, deposit_type, loaded_version('price'),
+           loaded_version('cancellation'), bands is not None)
+    cached = prediction_cache.get(key)
+    if cached is not None:
+        probability, band, input2 = cached
+    elif bands is None:
+        input2 = cancellation_input(week, lead_time, num_adults, num_nights, meal_plan, hotel,
+                                    num_cars, num_sr, prev_stay, num_prev_cxl, deposit_type)
 
-    # Input for the price model. Already encoded. 
-    # ['arrival_date_week_number', 'hotel', 'adults', 'nights_stay']
-    input1 = [week, hotel, num_adults, num_nights]
+        # Predict probabilities of staying, and cancelling
+        with stage('cancellation_model'):
+            probability = predict_cancellation(input2[np.newaxis])[0]
+        band = None
+        prediction_cache.put(key, (probability, band, input2))
+    else:
+        rates, rows = banded_cancellation_inputs(week, lead_time, num_adults, num_nights,
+                                                 meal_plan, hotel, num_cars, num_sr, prev_stay,
+                                                 num_prev_cxl, deposit_type)
 
-    # Get estimated price of this stay
-    adr = round(price_estimator.predict([input1])[0] + meal_plan * 10, 2)
-    total = round(adr * num_nights, 2)
+        # Probabilities at the estimated rate and either end of its band, in one call
+        with stage('cancellation_model'):
+            probabilities = predict_cancellation(rows)
+        probability = probabilities[0]
+        band = rates[1], rates[2], probabilities.min(), probabilities.max()
+        # Only the reservation at its estimated rate, not at the ends of the band
+        input2 = rows[0]
+        prediction_cache.put(key, (probability, band, input2))
 
-    # Generate the output
-    output1 = [html.P(f'Estimated nightly rate {adr} Euros', style={'text-align': 'center',
-                                                                    'margin-top': '40px'}),
-               html.P(f'Total cost {total} Euros', style={'text-align': 'center'})]
+    # Cached or not, every prediction is traffic to watch for drift
+    drift.record(input2)
 
-    # Input for the cancellation model. Rolls in the ADR from previous step
-    input2 = [hotel, lead_time, week, num_adults, meal_plan, market_seg, prev_stay, 
-        num_prev_cxl, booking_changes, deposit_type, days_in_waiting_list, 
-        customer_type, adr, num_cars, num_sr, num_nights, room_type_changed]
+    # Generate the output as guage
+    with stage('gauge'):
+        output2 = daq.Gauge(
+                showCurrentValue=True,
+                units="percentage points",
+                value= probability * 100,
+                label=f'{round(probability * 100, 2)} % probability of cancellation',
+                size=280,
+                labelPosition='bottom',
+                max=100,
+                min=0,
+    )  
 
-    # Predict probabilities of staying, and cancelling
-    probabilities = cxl_estimator.predict_proba([input2])
+    # The text estimatePrice in assets/clientside.js shows for these inputs
+    adr = float(input2[schema.CANCELLATION.columns['adr']])
+    price = f'Estimated nightly rate {adr} Euros\n\nTotal cost {round(adr * num_nights, 2)} Euros'
+    if band is not None:
+        price += f'\n\nLikely between {float(band[0])} and {float(band[1])} Euros a night'
+    server_price = {'inputs': [arrival_date, num_adults, num_nights, meal_plan, hotel],
+                    'text': price}
+
+    if band is None:
+        return output2, server_price
+    adr_low, adr_high, lowest, highest = band
+    return [output2, dcc.Markdown(
+        f'{round(lowest * 100, 2)} to {round(highest * 100, 2)} % for a nightly rate '
+        f'from {adr_low} to {adr_high} Euros',
+        style={'text-align': 'center'})], server_price
+
+
+@app.callback(
+    Output('cxl-explanation', 'figure'),
+    [Input('arrival_date', 'date'),
+     Input('num_adults', 'value'),
+     Input('num_nights', 'value'),
+     Input('meal_plan', 'value'),
+     Input('hotel', 'value'),
+     Input('num_cars', 'value'),
+     Input('num_sr', 'value'),
+     Input('prev_stay', 'value'),
+     Input('num_prev_cxl', 'value'),
+     Input('deposit_type', 'value')],
+)
+def explain_cancellation(arrival_date, *form):
+    # Contribution of each feature to this reservation's probability of
+    # cancellation, largest first, on top of the average probability
+    week, lead_time = features.arrival_features(arrival_date)
+    input2 = cancellation_input(week, lead_time, *form)
+    method, base_value, contributions = explain_prediction(input2)
+
+    order = sorted(range(len(input2)), key=lambda i: abs(contributions[i]))
+    order = [i for i in order if contributions[i] != 0][-MAX_EXPLAINED_FEATURES:]
+    bars = go.Bar(
+        x=[contributions[i] * 100 for i in order],
+        y=[f'{features.CXL_FEATURES[i]} = {input2[i]:g}' for i in order],
+        orientation='h',
+        marker={'color': ['#d9534f' if contributions[i] > 0 else '#5cb85c' for i in order]},
+        hovertemplate='%{x:+.2f} percentage points<extra></extra>',
+    )
+    return go.Figure(data=[bars],
+                     layout={'title': {'text': f'Average reservation {round(base_value * 100, 2)} % '
+                                               f'({EXPLAINER_NAMES[method]})',
+                                       'font': {'size': 14}},
+                             'xaxis': {'title': 'Percentage points of probability of cancellation'},
+                             'margin': {'t': 40, 'l': 10},
+                             'yaxis': {'automargin': True}})
+
+
+def arrival_heatmap(dates, results, metric):
+    # Calendar of the arrival dates, a column per week and a row per weekday
+    first_monday = dates[0] - dt.timedelta(days=dates[0].weekday())
+    weeks = (dates[-1] - first_monday).days // 7 + 1
+    z = [[None] * weeks for _ in range(7)]
+    text = [[''] * weeks for _ in range(7)]
+    when = [[None] * weeks for _ in range(7)]
+    for date, (adr, total, probability) in zip(dates, results):
+        day, week = date.weekday(), (date - first_monday).days // 7
+        z[day][week] = probability * 100 if metric == 'cxl' else adr
+        text[day][week] = (f'{date:%a %d %b %Y}<br>{adr} Euros a night<br>'
+                           f'{round(probability * 100, 2)} % probability of cancellation')
+        when[day][week] = date.isoformat()
+
+    heatmap = go.Heatmap(
+        z=z,
+        x=[first_monday + dt.timedelta(weeks=i) for i in range(weeks)],
+        y=['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+        text=text,
+        customdata=when,
+        hoverinfo='text',
+        colorscale='RdYlGn_r',
+        colorbar={'title': '%' if metric == 'cxl' else 'Euros'},
+        xgap=2,
+        ygap=2,
+    )
+    return go.Figure(data=[heatmap],
+                     layout={'yaxis': {'autorange': 'reversed'},
+                             'margin': {'t': 10, 'b': 40}})
+
+
+@app.callback(
+    Output('arrival-heatmap', 'figure'),
+    [Input('heatmap_metric', 'value'),
+     Input('num_adults', 'value'),
+     Input('num_nights', 'value'),
+     Input('meal_plan', 'value'),
+     Input('hotel', 'value'),
+     Input('num_cars', 'value'),
+     Input('num_sr', 'value'),
+     Input('prev_stay', 'value'),
+     Input('num_prev_cxl', 'value'),
+     Input('deposit_type', 'value')],
+)
+def compare_arrival_dates(metric, *form):
+    # Every date that can be booked is scored in one batch, and cached
+    try:
+        dates, results = score_arrival_dates(dt.date.today(), LAST_ARRIVAL_DATE, *form)
+    except ValueError:
+        dates = []
+    if not dates:
+        return go.Figure(layout={'annotations': [{'text': 'No arrival dates to compare',
+                                                  'showarrow': False}],
+                                 'xaxis': {'visible': False}, 'yaxis': {'visible': False}})
+    return arrival_heatmap(dates, results, metric)
+
+
+@app.callback(
+    Output('arrival_date', 'date'),
+    [Input('arrival-heatmap', 'clickData')],
+)
+def pick_arrival_date(click_data):
+    # Clicking a day on the calendar makes it the arrival date
+    if not click_data or not click_data['points'][0].get('customdata'):
+        raise dash.exceptions.PreventUpdate
+    return click_data['points'][0]['customdata']
 
-    # Generate the output as guage
-    output2 = daq.Gauge(
-            showCurrentValue=True,
-            units="percentage points",
-            value= probabilities[0][1] * 100,
-            label=f'{round(probabilities[0][1] * 100, 2)} % probability of cancellation',
-            size=280,
-            labelPosition='bottom',
-            max=100,
-            min=0,
-)  
-
-    return output1, output2
 
 layout = dbc.Row([column1, column2])
\ No newline at end of file
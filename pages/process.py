@@ -7,6 +7,7 @@ from dash.dependencies import Input, Output
 
 # Imports from this application
 from app import app
+from static_assets import image
 
 # 1 column layout
 # https://dash-bootstrap-components.opensource.faculty.ai/l/components/layout
@@ -84,7 +85,7 @@ column2 = dbc.Col(
     [
         html.P(
             [
-                html.Img(src='assets/targets.jpg', className='img-fluid')
+                image('targets.jpg', sizes='(min-width: 768px) 50vw, 100vw', className='img-fluid')
             ] 
         ),
 
@@ -116,8 +117,8 @@ column2 = dbc.Col(
         ),
 
         
-        html.Img(src='assets/ROC.jpg', className='img-fluid', style={'height': '300px', 'width': '400px',
-                                                                    'margin-left': '20px'}),
+        image('ROC.jpg', sizes='400px', className='img-fluid', style={'height': '300px', 'width': '400px',
+                                                                     'margin-left': '20px'}),
         
         
     ], 
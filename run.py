@@ -7,7 +7,9 @@ from dash.dependencies import Input, Output
 
 # Imports from this application
 from app import app, server
-from pages import index, predictions, insights, process
+from pages import index, predictions, insights, process, occupancy
+from scoring.metrics import timed
+import api
 
 # Navbar docs: https://dash-bootstrap-components.opensource.faculty.ai/l/components/navbar
 navbar = dbc.NavbarSimple(
@@ -15,6 +17,7 @@ navbar = dbc.NavbarSimple(
     brand_href='/', 
     children=[
         dbc.NavItem(dcc.Link('Predictions', href='/predictions', className='nav-link')),  
+        dbc.NavItem(dcc.Link('Occupancy', href='/occupancy', className='nav-link')),
         dbc.NavItem(dcc.Link('Process', href='/process', className='nav-link')),
         dbc.NavItem(dcc.Link('Insights', href='/insights', className='nav-link'))
     ],
@@ -62,6 +65,7 @@ app.layout = html.Div([
 # URL Routing for Multi-Page Apps: https://dash.plot.ly/urls
 @app.callback(Output('page-content', 'children'),
               [Input('url', 'pathname')])
+@timed('display_page')
 def display_page(pathname):
     if pathname == '/':
         return index.layout
@@ -71,6 +75,8 @@ def display_page(pathname):
         return insights.layout
     elif pathname == '/process':
         return process.layout
+    elif pathname == '/occupancy':
+        return occupancy.layout
     else:
         return dcc.Markdown('## Page not found')
 
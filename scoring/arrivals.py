@@ -0,0 +1,32 @@
+# Price and probability of cancellation of a reservation for every arrival
+# date in a range, all scored as one batch. Results are cached per form state
+# and day, so redrawing the same view doesn't touch the models.
+import datetime as dt
+import os
+
+from scoring import batch
+from scoring.estimators import loaded_version
+from scoring.cache import PredictionCache
+
+arrival_cache = PredictionCache(int(os.environ.get('HOTEL_ARRIVAL_CACHE_SIZE', 64)))
+
+
+def score_arrival_dates(first, last, num_adults, num_nights, meal_plan, hotel, num_cars,
+                        num_sr, prev_stay, num_prev_cxl, deposit_type):
+    # Returns the dates from first to last, and the (adr, total, probability
+    # of cancellation) of the reservation arriving on each
+    if last < first:
+        return [], []
+    form = (num_adults, num_nights, meal_plan, hotel, num_cars, num_sr, prev_stay,
+            num_prev_cxl, deposit_type)
+    key = (first, last, loaded_version('price'), loaded_version('cancellation')) + form
+    cached = arrival_cache.get(key)
+    if cached is not None:
+        return cached
+
+    dates = [first + dt.timedelta(days=i) for i in range((last - first).days + 1)]
+    records = [dict(zip(batch.FIELDS, (date.isoformat(),) + form)) for date in dates]
+    # Made up arrival dates, not traffic to monitor for drift
+    result = dates, batch.score(records, record=False)
+    arrival_cache.put(key, result)
+    return result
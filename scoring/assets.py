@@ -0,0 +1,205 @@
+# Build of the static files, served by static_assets. For each image in
+# assets/ it writes a copy named by a hash of its content and, with Pillow,
+# narrower variants and WebP versions of each for srcset. For the Dash
+# bundles and the app's own scripts it writes gzip and, with the brotli
+# package, brotli copies, compressed once at the highest levels rather than
+# on every response. A manifest maps each source to what was built from it.
+#
+# Run after changing an image or upgrading Dash, and on deploy:
+#
+#   python -m scoring.assets [--out build]
+#
+# Sources that changed since the build are served as they are until the next
+# one, so a stale build is slower but never wrong.
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+import pkgutil
+import shutil
+import sys
+import time
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_DIR = os.path.join(ROOT, 'assets')
+STATIC_DIR = os.environ.get('HOTEL_STATIC_DIR', os.path.join(ROOT, 'build'))
+MANIFEST = 'manifest.json'
+
+# Widths of the image variants, in pixels. Only those narrower than the
+# image are made
+WIDTHS = (480, 960, 1600)
+IMAGE_TYPES = ('.jpg', '.jpeg', '.png')
+JPEG_QUALITY = 82
+WEBP_QUALITY = 80
+
+# Files smaller than this gain little from compression
+MIN_COMPRESS_SIZE = 1024
+
+
+def digest(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _image_formats(ext):
+    # Formats variants are saved in, the source's own first
+    own = 'JPEG' if ext in ('.jpg', '.jpeg') else 'PNG'
+    return [(own, ext)] + ([('WEBP', '.webp')] if Image is not None else [])
+
+
+def build_image(path, out):
+    # Hashed copy of the image, and resized variants of it with Pillow
+    with open(path, 'rb') as f:
+        data = f.read()
+    name = os.path.basename(path)
+    stem, ext = os.path.splitext(name)
+    stem = stem.replace(' ', '-')
+    ext = ext.lower()
+    tag = digest(data)
+    original = f'{stem}.{tag}{ext}'
+    with open(os.path.join(out, original), 'wb') as f:
+        f.write(data)
+    entry = {'hash': tag, 'src': original, 'variants': {}}
+    if Image is None:
+        return name, entry
+
+    with Image.open(path) as image:
+        image.load()
+    entry['width'], entry['height'] = image.size
+    widths = [w for w in WIDTHS if w < image.width] + [image.width]
+    for fmt, suffix in _image_formats(ext):
+        variants = entry['variants'][suffix.lstrip('.')] = []
+        for width in widths:
+            if width == image.width and fmt != 'WEBP':
+                # The original is already the full width one
+                variants.append([original, width])
+                continue
+            resized = image.resize((width, round(image.height * width / image.width)),
+                                   Image.LANCZOS) if width < image.width else image
+            if fmt == 'JPEG' and resized.mode not in ('RGB', 'L'):
+                resized = resized.convert('RGB')
+            filename = f'{stem}.{tag}.{width}{suffix}'
+            options = {'JPEG': {'quality': JPEG_QUALITY, 'optimize': True, 'progressive': True},
+                       'PNG': {'optimize': True},
+                       'WEBP': {'quality': WEBP_QUALITY, 'method': 6}}[fmt]
+            resized.save(os.path.join(out, filename), fmt, **options)
+            variants.append([filename, width])
+    return name, entry
+
+
+def compress(data, path):
+    # Writes path.gz and, with brotli, path.br. Returns the encodings written
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    encodings = {}
+    with open(path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, 9, mtime=0))
+    encodings['gzip'] = os.path.basename(path) + '.gz'
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+        encodings['br'] = os.path.basename(path) + '.br'
+    return encodings
+
+
+def dash_resources():
+    # (package, path in package) of every script and stylesheet Dash serves
+    # for the app, as registered when it renders its index page
+    sys.path.insert(0, ROOT)
+    import run
+    with run.server.test_request_context('/'):
+        run.app.index()
+    return sorted((package, path) for package, paths in run.app.registered_paths.items()
+                  for path in paths)
+
+
+def build_bundles(out):
+    bundles = {}
+    for package, path in dash_resources():
+        # Source maps are only fetched by developer tools
+        if path.endswith('.map'):
+            continue
+        # and some registered files aren't shipped at all
+        try:
+            data = pkgutil.get_data(package, path)
+        except OSError:
+            continue
+        if data is None or len(data) < MIN_COMPRESS_SIZE:
+            continue
+        target = os.path.join(out, 'bundles', package, path)
+        bundles[f'{package}/{path}'] = {
+            'version': getattr(sys.modules[package], '__version__', None),
+            'dir': os.path.dirname(os.path.join('bundles', package, path)),
+            'encodings': compress(data, target)}
+    return bundles
+
+
+def build_scripts(out):
+    # The app's own scripts and stylesheets, served by Dash from assets/
+    scripts = {}
+    for path in sorted(glob.glob(os.path.join(ASSETS_DIR, '*.js')) +
+                       glob.glob(os.path.join(ASSETS_DIR, '*.css'))):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < MIN_COMPRESS_SIZE:
+            continue
+        name = os.path.basename(path)
+        scripts[name] = {'hash': digest(data), 'dir': 'scripts',
+                         'encodings': compress(data, os.path.join(out, 'scripts', name))}
+    return scripts
+
+
+def build(out=STATIC_DIR):
+    # Everything is built in a new directory that then replaces the old one
+    start = time.perf_counter()
+    staging = out.rstrip(os.sep) + '.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(os.path.join(staging, 'images'))
+
+    images = dict(build_image(path, os.path.join(staging, 'images'))
+                  for path in sorted(glob.glob(os.path.join(ASSETS_DIR, '*')))
+                  if path.lower().endswith(IMAGE_TYPES))
+    manifest = {'images': images, 'bundles': build_bundles(staging),
+                'scripts': build_scripts(staging),
+                'resized': Image is not None, 'brotli': brotli is not None}
+    with open(os.path.join(staging, MANIFEST), 'w') as f:
+        json.dump(manifest, f, indent=1)
+
+    previous = out.rstrip(os.sep) + '.old'
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(out):
+        os.rename(out, previous)
+    os.rename(staging, out)
+    shutil.rmtree(previous, ignore_errors=True)
+    manifest['seconds'] = time.perf_counter() - start
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build resized, hashed and compressed '
+                                                 'static files')
+    parser.add_argument('--out', default=STATIC_DIR)
+    args = parser.parse_args()
+
+    manifest = build(args.out)
+    if Image is None:
+        print('Pillow is not installed: images are copied, not resized or converted to WebP')
+    if brotli is None:
+        print('brotli is not installed: bundles are compressed with gzip only')
+    print(f"Built {len(manifest['images'])} images, {len(manifest['bundles'])} Dash bundles "
+          f"and {len(manifest['scripts'])} scripts into {args.out} "
+          f"in {manifest['seconds']:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+# Batch scoring of many reservations at once. Each model is called a single
+# time over the whole matrix rather than once per reservation.
+import datetime as dt
+
+import numpy as np
+
+import scoring.explain
+from scoring import drift, features, price_bands, schema
+from scoring.estimators import get_price_estimator, predict_cancellation
+
+# Reservation fields, named as in the predictions page callback
+FIELDS = ['arrival_date', 'num_adults', 'num_nights', 'meal_plan', 'hotel',
+          'num_cars', 'num_sr', 'prev_stay', 'num_prev_cxl', 'deposit_type']
+
+
+def _parse(record, row, today):
+    missing = [field for field in FIELDS if record.get(field) in (None, '')]
+    if missing:
+        raise ValueError(f'Reservation {row} is missing {", ".join(missing)}')
+    try:
+        return features.arrival_features(str(record['arrival_date']), today)
+    except ValueError as e:
+        raise ValueError(f'Reservation {row} is invalid: {e}')
+
+
+def _column(records, field):
+    # The field of every reservation as the models take it, checked against
+    # the schema a column at a time
+    feature = schema.CANCELLATION.fields[field]
+    try:
+        values = np.array([record[field] for record in records], dtype=float)
+        # Lists of one number would make a column of rows
+        if values.ndim == 1 and feature.valid(values).all():
+            return values
+    except (TypeError, ValueError, OverflowError):
+        pass
+    # Find the first reservation that isn't
+    for row, record in enumerate(records):
+        try:
+            feature.parse(record[field])
+        except ValueError as e:
+            raise ValueError(f'Reservation {row} is invalid: {e}')
+    raise ValueError(f'{field} must be {feature.expected} in every reservation')
+
+
+def score(records, today=None, explain=False, bands=False, record=True):
+    # Returns a list of (adr, total, probability of cancellation), one per
+    # record. With bands, each also has the low and high ends of the nightly
+    # rate's band and the probability of cancellation at each, see
+    # scoring.price_bands. With explain, each ends with the contribution of
+    # every feature to the probability, see scoring.explain. Scored inputs
+    # are recorded for drift monitoring unless record is False, for
+    # reservations that were made up rather than received.
+    if today is None:
+        today = dt.date.today()
+    parsed = [_parse(record, row, today) for row, record in enumerate(records)]
+    if not parsed:
+        return []
+    columns = {field: _column(records, field) for field in FIELDS[1:]}
+    leaf_bands = price_bands.get_bands() if bands else None
+    if bands and leaf_bands is None:
+        raise ValueError('There are no price bands for this price model')
+
+    # The models' inputs are built a block at a time, from the columns
+    weeks, lead_times = np.array(parsed, dtype=float).T
+
+    # Estimated price of every stay in one call
+    input1 = features.price_input(weeks, columns['hotel'], columns['num_adults'],
+                                  columns['num_nights'])
+    if bands:
+        prices, lows, highs = price_bands.predict(get_price_estimator(), leaf_bands, input1)
+    else:
+        prices = get_price_estimator().predict(input1)
+
+    # Rounded exactly as the predictions page does
+    meal_plans, nights = columns['meal_plan'].tolist(), columns['num_nights'].tolist()
+    adrs = [features.nightly_rate(price, meal_plan)
+            for price, meal_plan in zip(prices, meal_plans)]
+    totals = [round(adr * num_nights, 2) for adr, num_nights in zip(adrs, nights)]
+    rates = [adrs]
+    if bands:
+        rates += [[features.nightly_rate(price, meal_plan)
+                   for price, meal_plan in zip(ends, meal_plans)] for ends in (lows, highs)]
+
+    # Probability of cancelling for every stay in one call, at the low and
+    # high nightly rates as well with bands
+    input2 = features.cancellation_input(
+        columns['hotel'], lead_times, weeks, columns['num_adults'], columns['meal_plan'],
+        columns['prev_stay'], columns['num_prev_cxl'], columns['deposit_type'], np.array(rates),
+        columns['num_cars'], columns['num_sr'], columns['num_nights'],
+    ).reshape(-1, len(schema.CANCELLATION))
+    probabilities = predict_cancellation(input2).reshape(len(rates), -1)
+    if record:
+        drift.record(input2[:len(parsed)])
+
+    results = [adrs, totals, probabilities[0].tolist()]
+    if bands:
+        results += [rates[1], rates[2], probabilities[1].tolist(), probabilities[2].tolist()]
+    if explain:
+        # Explained in one call as well
+        _, _, contributions = scoring.explain.explain(input2[:len(parsed)])
+        results.append(contributions)
+    return list(zip(*results))
@@ -0,0 +1,140 @@
+# Micro-batching of model calls made one reservation at a time. Under burst
+# load many callbacks each score a single row, and most of a call to the
+# model is fixed overhead (input checks and, with sklearn, dispatching the
+# forest's trees) rather than walking the trees. With HOTEL_MICRO_BATCH=1 the
+# rows submitted by concurrent requests within HOTEL_BATCH_WINDOW_MS of the
+# first are scored together, in one call of at most HOTEL_BATCH_MAX_SIZE
+# rows on a thread of the worker, and each caller is handed back its own
+# results. A row equal to one already waiting or being scored isn't scored
+# again: its caller shares the result.
+#
+# A window of 0, the default, still batches whatever arrived while the
+# previous batch was being scored, without waiting for more. Measured, a
+# longer window only paid off for the sklearn forest at low concurrency (see
+# benchmarks/batching.py). Calls of as many rows as a batch holds or more
+# (batch scoring, the arrivals calendar) go straight to the model.
+#
+# A caller waits at most HOTEL_BATCH_TIMEOUT seconds for its results, by
+# default half of gunicorn's worker timeout (gunicorn.conf.py sets it from
+# the configured one), so a stuck batch fails the request instead of the
+# worker being killed with every request it holds.
+import concurrent.futures
+import logging
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from scoring.metrics import stage
+
+logger = logging.getLogger(__name__)
+
+MICRO_BATCH = os.environ.get('HOTEL_MICRO_BATCH', '0') == '1'
+WINDOW = float(os.environ.get('HOTEL_BATCH_WINDOW_MS', 0)) / 1000
+MAX_SIZE = int(os.environ.get('HOTEL_BATCH_MAX_SIZE', 64))
+TIMEOUT = float(os.environ.get('HOTEL_BATCH_TIMEOUT', 15))
+
+
+class MicroBatcher:
+
+    def __init__(self, name, score, window=WINDOW, max_size=MAX_SIZE):
+        # score takes a matrix and returns a result per row, rows first
+        self.name = name
+        self.score = score
+        self.window = window
+        self.max_size = max_size
+        self._queue = queue.Queue()
+        # Row to the future of its result, from submission until it is scored
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.batches = self.rows = self.deduplicated = self.errors = self.timeouts = 0
+
+    def _start(self):
+        # Started in the worker that uses it, not in a parent before a fork
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f'{self.name}-batching',
+                                                daemon=True)
+                self._thread.start()
+
+    def submit(self, row):
+        # Future of the result of one row
+        key = tuple(row)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                self.deduplicated += 1
+                return future
+            future = self._pending[key] = concurrent.futures.Future()
+        self._queue.put(key)
+        return future
+
+    def predict(self, X):
+        # Results of the rows of X in order, scored along with other callers' rows
+        if len(X) >= self.max_size:
+            return self.score(X)
+        if self._thread is None:
+            self._start()
+        futures = [self.submit(row) for row in X]
+        # Read at call time, as gunicorn.conf.py sets it after import
+        deadline = time.monotonic() + TIMEOUT
+        try:
+            return np.array([future.result(max(0.0, deadline - time.monotonic()))
+                             for future in futures])
+        except concurrent.futures.TimeoutError:
+            # Which is the builtin TimeoutError only from Python 3.11
+            with self._lock:
+                self.timeouts += 1
+            logger.error('Gave up waiting %.1f s for a batch of the %s model', TIMEOUT, self.name)
+            raise
+
+    def _collect(self):
+        # Waits for a row, then takes the ones that follow within the window
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_size:
+            remaining = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0
+                             else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            keys = self._collect()
+            error = results = None
+            try:
+                with stage(f'{self.name}_batch'):
+                    results = self.score(np.array(keys, dtype=float))
+            except Exception as e:
+                logger.exception('Scoring a batch of %d rows with the %s model failed',
+                                 len(keys), self.name)
+                error = e
+            with self._lock:
+                futures = [self._pending.pop(key) for key in keys]
+                self.batches += 1
+                self.rows += len(keys)
+                self.errors += error is not None
+            for i, future in enumerate(futures):
+                if error is None:
+                    future.set_result(results[i])
+                else:
+                    future.set_exception(error)
+
+    def stats(self):
+        with self._lock:
+            return {'window_ms': self.window * 1000, 'max_size': self.max_size,
+                    'batches': self.batches, 'rows': self.rows,
+                    'mean_size': self.rows / self.batches if self.batches else 0.0,
+                    'deduplicated': self.deduplicated, 'errors': self.errors,
+                    'timeouts': self.timeouts}
@@ -0,0 +1,71 @@
+# Process-local, size-bounded LRU cache of predictions. Keys are the fully
+# derived feature tuples, which include the lead time and so depend on
+# today's date; everything is dropped when the day rolls over.
+import datetime as dt
+import os
+import threading
+from collections import OrderedDict
+
+
+class PredictionCache:
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._day = dt.date.today()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _roll_over(self):
+        today = dt.date.today()
+        if today != self._day:
+            self.expirations += len(self._entries)
+            self._entries.clear()
+            self._day = today
+
+    def get(self, key):
+        with self._lock:
+            self._roll_over()
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._roll_over()
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'size': len(self._entries),
+                    'maxsize': self.maxsize,
+                    'hits': self.hits,
+                    'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'evictions': self.evictions,
+                    'expirations': self.expirations,
+                    'day': self._day.isoformat()}
+
+
+# Probabilities of cancellation shown on the predictions page, with their
+# range across the price band when there is one and the model input they
+# were scored from
+prediction_cache = PredictionCache(int(os.environ.get('HOTEL_CACHE_SIZE', 1024)))
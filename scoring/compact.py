@@ -0,0 +1,214 @@
+# Compact version of the cancellation forest: smaller on disk and in memory,
+# traded against a little accuracy, for the app to load in place of the
+# joblib model (HOTEL_COMPACT_MODELS=1).
+#
+#   python -m scoring.compact models/cancellation_model.joblib data/bookings \
+#       [--max-depth 20] [--trees 50] [--bits 8] [--sweep]
+#
+# Starting from the compiled forest:
+#
+#   nodes        are laid out depth first, so left children need not be
+#                stored (see CompiledTrees).
+#   thresholds   are stored as float32, rounded down. Inputs are compared as
+#                float32, so no comparison changes.
+#   leaf values  are quantized to 8 or 16 bit integers, of which the class
+#                probabilities of a node add up to 2**bits - 1.
+#   depth        nodes below --max-depth are dropped, their parent predicting
+#                the class fractions of its own training samples.
+#   trees        only the first --trees of the forest are kept.
+#   redundancy   splits whose two leaves predict the same quantized values are
+#                collapsed into a single leaf, which changes no prediction.
+#   cover        the training weight of each node is kept as float32, for
+#                TreeSHAP explanations (see scoring.explain).
+#
+# The data (a CSV or a scoring.datastore store) gives the held-out test set
+# the report is scored on, the same split as scoring.train. The report has the
+# size, load time, single row latency and ROC-AUC of the original and compact
+# models, one JSON object per line. --sweep reports a range of settings
+# without saving any.
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+import numpy as np
+from joblib import Memory, load
+from sklearn.metrics import roc_auc_score
+
+from scoring import datastore
+from scoring.compiled import CompiledTrees, compile_estimator
+from scoring.train import CACHE_DIR, prepare_data
+
+# Settings reported by --sweep, as (max depth, trees, bits)
+SWEEP = [(None, None, 16), (None, None, 8), (25, None, 8), (20, None, 8), (15, None, 8),
+         (12, None, 8), (20, 50, 8), (15, 50, 8), (12, 25, 8)]
+
+
+def _float32_floor(threshold):
+    # Largest float32 no greater than each threshold, so that x <= t holds for
+    # a float32 x exactly when it did against the float64 threshold
+    rounded = threshold.astype(np.float32)
+    over = rounded.astype(np.float64) > threshold
+    rounded[over] = np.nextafter(rounded[over], np.float32(-np.inf))
+    return rounded
+
+
+def _quantize(value, bits):
+    # Class probabilities to integers adding up to the scale
+    scale = 2 ** bits - 1
+    quantized = np.round(value * scale).astype(np.int64)
+    quantized[:, -1] = scale - quantized[:, :-1].sum(axis=1)
+    return quantized, scale
+
+
+def _compact_tree(left, right, value, max_depth):
+    # Nodes kept, in depth first order, and which of them are now leaves.
+    # Nodes are indexed from the tree's root at 0 and children come after
+    # their parent, as sklearn builds them
+    leaf = left == np.arange(len(left))
+    left, right = left.tolist(), right.tolist()
+    depth = [0] * len(left)
+    for node in range(len(left)):
+        if not leaf[node]:
+            depth[left[node]] = depth[right[node]] = depth[node] + 1
+    if max_depth is not None:
+        leaf |= np.array(depth) >= max_depth
+    leaf = leaf.tolist()
+
+    # Collapsed bottom up, so whole redundant subtrees fold into one leaf
+    value = value.tolist()
+    for node in reversed(range(len(left))):
+        if (not leaf[node] and leaf[left[node]] and leaf[right[node]]
+                and value[left[node]] == value[right[node]]):
+            leaf[node] = True
+            value[node] = value[left[node]]
+
+    kept, stack = [], [0]
+    while stack:
+        node = stack.pop()
+        kept.append(node)
+        if not leaf[node]:
+            stack += [right[node], left[node]]
+    return kept, leaf, value, max(depth[node] for node in kept)
+
+
+def compact(compiled, max_depth=None, n_trees=None, bits=8):
+    if compiled.classes_ is None:
+        raise TypeError('Only classifiers can be compacted')
+    dtype = {8: np.uint8, 16: np.uint16}[bits]
+    quantized, scale = _quantize(np.asarray(compiled.value), bits)
+    threshold = _float32_floor(np.asarray(compiled.threshold))
+    ends = list(compiled.roots[1:]) + [len(compiled.left)]
+
+    right, feature, thresholds, value, roots, cover = [], [], [], [], [], []
+    offset = depth = 0
+    for root, end in list(zip(compiled.roots, ends))[:n_trees]:
+        kept, leaf, tree_value, tree_depth = _compact_tree(
+            compiled.left[root:end] - root, compiled.right[root:end] - root,
+            quantized[root:end], max_depth)
+        kept = np.array(kept)
+        new_index = np.empty(end - root, dtype=np.int64)
+        new_index[kept] = np.arange(len(kept)) + offset
+        is_leaf = np.array(leaf)[kept]
+
+        # Kept in depth first order, so left children are implicit
+        right.append(np.where(is_leaf, new_index[kept],
+                              new_index[compiled.right[root + kept] - root]))
+        feature.append(np.where(is_leaf, 0, compiled.feature[root + kept]))
+        thresholds.append(np.where(is_leaf, np.float32(-np.inf), threshold[root + kept]))
+        value.append(np.array(tree_value)[kept])
+        if compiled.cover is not None:
+            cover.append(compiled.cover[root + kept])
+        roots.append(offset)
+        offset += len(kept)
+        depth = max(depth, tree_depth)
+
+    feature = np.concatenate(feature)
+    return CompiledTrees(None, np.concatenate(right).astype(np.int32),
+                         feature.astype(np.uint8 if feature.max() < 256 else np.int32),
+                         np.concatenate(thresholds),
+                         np.concatenate(value).astype(dtype),
+                         np.array(roots, dtype=np.int32),
+                         depth, compiled.classes_, scale,
+                         np.concatenate(cover).astype(np.float32) if cover else None)
+
+
+def save(compiled, directory):
+    # Written beside the destination and renamed into place, so a worker
+    # never loads a partial model
+    staging = directory.rstrip(os.sep) + '.tmp'
+    shutil.rmtree(staging, ignore_errors=True)
+    compiled.save(staging)
+    shutil.rmtree(directory, ignore_errors=True)
+    os.rename(staging, directory)
+
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+
+def latency_ms(estimator, X, repeat=200):
+    # Median time to score a single row
+    times = []
+    for row in X[:repeat]:
+        start = time.perf_counter()
+        estimator.predict_proba(row[np.newaxis, :])
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000
+
+
+def measure(name, size, load_model, X, y, baseline=None):
+    start = time.perf_counter()
+    model = load_model()
+    model.predict_proba(X[:1])
+    load_s = time.perf_counter() - start
+    roc_auc = roc_auc_score(y, model.predict_proba(X)[:, 1])
+    result = {'model': name, 'size_mb': size / 2 ** 20, 'load_s': load_s,
+              'latency_ms': latency_ms(model, X), 'roc_auc': roc_auc,
+              'roc_auc_delta': 0.0 if baseline is None else roc_auc - baseline}
+    if isinstance(model, CompiledTrees):
+        result['nodes'] = len(model.right)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export a compact cancellation model')
+    parser.add_argument('model', help='joblib file of the forest')
+    parser.add_argument('data', help='bookings CSV or store to evaluate on')
+    parser.add_argument('--max-depth', type=int, default=None)
+    parser.add_argument('--trees', type=int, default=None, help='default: all of them')
+    parser.add_argument('--bits', type=int, choices=[8, 16], default=8)
+    parser.add_argument('--out', help='default: the model path with .compact')
+    parser.add_argument('--sweep', action='store_true',
+                        help='report a range of settings instead of saving one')
+    args = parser.parse_args()
+
+    data = Memory(CACHE_DIR, verbose=0).cache(prepare_data)(args.data,
+                                                            datastore.version(args.data))
+    X, y = data['X_test'], data['y_test']
+    original = measure('original', os.path.getsize(args.model), lambda: load(args.model), X, y)
+    print(json.dumps(original))
+    try:
+        compiled = compile_estimator(load(args.model))
+    except TypeError as e:
+        sys.exit(f'{args.model} has no trees to compact: {e}')
+
+    out = args.out or os.path.splitext(args.model)[0] + '.compact'
+    settings = SWEEP if args.sweep else [(args.max_depth, args.trees, args.bits)]
+    for max_depth, n_trees, bits in settings:
+        directory = out + '.sweep' if args.sweep else out
+        save(compact(compiled, max_depth, n_trees, bits), directory)
+        result = measure(f'compact max_depth={max_depth} trees={n_trees} bits={bits}',
+                         directory_size(directory), lambda: CompiledTrees.load(directory),
+                         X, y, original['roc_auc'])
+        print(json.dumps(result))
+        if args.sweep:
+            shutil.rmtree(directory)
+    if not args.sweep:
+        print(f'Saved {out}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+# Compiled inference for the tree models. The nodes of every tree are packed
+# into a handful of flat arrays, and all trees are walked together for all
+# rows with vectorized NumPy steps, which avoids sklearn's per call input
+# validation, joblib dispatch and per tree Python overhead.
+#
+# Results are bit-identical to sklearn: inputs are cast to float32 as sklearn
+# does before comparing to the thresholds, leaf probabilities are normalized
+# exactly as the tree does, and the trees are summed in the forest's order.
+import json
+import os
+import sys
+
+import numpy as np
+
+# Rows walked through the trees at a time
+CHUNK_ROWS = 4096
+
+# Node arrays written to disk, one .npy file each, by CompiledTrees.save
+ARRAYS = ['left', 'right', 'feature', 'threshold', 'value', 'roots', 'cover']
+
+
+def _node_values(tree, is_classifier):
+    value = tree.value[:, 0, :]
+    if not is_classifier:
+        return value[:, :1].astype(np.float64)
+
+    # Older sklearn stores class counts at each node and normalizes them when
+    # predicting, newer releases store the fractions directly
+    proba = value.astype(np.float64)
+    normalizer = proba.sum(axis=1)[:, np.newaxis]
+    if not np.allclose(normalizer, 1.0):
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+    return proba
+
+
+class CompiledTrees:
+
+    def __init__(self, left, right, feature, threshold, value, roots, depth,
+                 classes=None, value_scale=None, cover=None):
+        # Without left, nodes are laid out depth first, so a left child
+        # follows its parent, and leaves have a threshold of -inf so every row
+        # steps right, back to the leaf
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.value = value
+        self.roots = roots
+        self.depth = depth
+        self.classes_ = classes
+        # Set when the values are quantized to integers (see scoring.compact),
+        # which are divided by it after summing the trees
+        self.value_scale = value_scale
+        # Training weight reaching each node, which TreeSHAP needs (see
+        # scoring.explain). Models packed before it was kept have none
+        self.cover = cover
+
+    @classmethod
+    def from_estimator(cls, estimator):
+        # Imported here so workers that only load packed arrays never import sklearn
+        from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+        from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+        if isinstance(estimator, (RandomForestClassifier, RandomForestRegressor)):
+            trees = [e.tree_ for e in estimator.estimators_]
+        elif isinstance(estimator, (DecisionTreeClassifier, DecisionTreeRegressor)):
+            trees = [estimator.tree_]
+        else:
+            raise TypeError(f'Cannot compile {type(estimator).__name__}')
+        is_classifier = isinstance(estimator, (RandomForestClassifier,
+                                               DecisionTreeClassifier))
+
+        left, right, feature, threshold, value, roots, cover = [], [], [], [], [], [], []
+        offset = 0
+        for tree in trees:
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left == -1
+
+            # Leaves point back at themselves so every row can take the same
+            # number of steps, whatever the depth of the leaf it ends in
+            left.append(np.where(leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(leaf, nodes, tree.children_right) + offset)
+            feature.append(np.where(leaf, 0, tree.feature))
+            threshold.append(tree.threshold)
+            value.append(_node_values(tree, is_classifier))
+            cover.append(tree.weighted_n_node_samples)
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(np.concatenate(left).astype(np.int32),
+                   np.concatenate(right).astype(np.int32),
+                   np.concatenate(feature).astype(np.int32),
+                   np.concatenate(threshold).astype(np.float64),
+                   np.concatenate(value),
+                   np.array(roots, dtype=np.int32),
+                   max(tree.max_depth for tree in trees),
+                   getattr(estimator, 'classes_', None),
+                   cover=np.concatenate(cover).astype(np.float64))
+
+    @classmethod
+    def load(cls, directory, mmap_mode='r'):
+        # Memory mapped by default, so processes loading the same files share
+        # the pages instead of each holding a private copy of the trees
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        arrays = [np.load(os.path.join(directory, name + '.npy'), mmap_mode=mmap_mode)
+                  if os.path.exists(os.path.join(directory, name + '.npy')) else None
+                  for name in ARRAYS]
+        classes = None
+        if meta['classes'] is not None:
+            classes = np.array(meta['classes'], dtype=meta['classes_dtype'])
+        *arrays, cover = arrays
+        return cls(*arrays, meta['depth'], classes, meta.get('value_scale'), cover)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for name in ARRAYS:
+            if getattr(self, name) is not None:
+                np.save(os.path.join(directory, name + '.npy'), getattr(self, name))
+        meta = {'depth': int(self.depth), 'classes': None, 'classes_dtype': None,
+                'value_scale': self.value_scale}
+        if self.classes_ is not None:
+            meta['classes'] = self.classes_.tolist()
+            meta['classes_dtype'] = self.classes_.dtype.str
+        with open(os.path.join(directory, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    def left_child(self, nodes):
+        return nodes + 1 if self.left is None else self.left[nodes]
+
+    def apply(self, X):
+        # Leaf reached in every tree by every row, shape (n_trees, n_rows)
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        nodes = np.repeat(self.roots, X.shape[0])
+        rows = np.tile(np.arange(X.shape[0]), self.n_trees)
+
+        # Only (tree, row) pairs that haven't reached a leaf take another step
+        active = np.arange(len(nodes))
+        for _ in range(self.depth):
+            current = nodes[active]
+            go_left = X[rows[active], self.feature[current]] <= self.threshold[current]
+            step = np.where(go_left, self.left_child(current), self.right[current])
+            nodes[active] = step
+            active = active[step != current]
+            if not len(active):
+                break
+        return nodes.reshape(self.n_trees, X.shape[0])
+
+    def _accumulate(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        out = np.zeros((X.shape[0], self.value.shape[1]), dtype=np.float64)
+
+        # Large batches are walked in blocks to bound the (trees x rows) arrays
+        for start in range(0, X.shape[0], CHUNK_ROWS):
+            block = out[start:start + CHUNK_ROWS]
+            for tree_leaves in self.apply(X[start:start + CHUNK_ROWS]):
+                block += self.value[tree_leaves]
+        if self.n_trees > 1 or self.value_scale:
+            out /= self.n_trees * (self.value_scale or 1)
+        return out
+
+    def predict_proba(self, X):
+        return self._accumulate(X)
+
+    def predict(self, X):
+        out = self._accumulate(X)
+        if self.classes_ is not None:
+            return self.classes_[np.argmax(out, axis=1)]
+        return out[:, 0]
+
+
+def compile_estimator(estimator):
+    return CompiledTrees.from_estimator(estimator)
+
+
+if __name__ == '__main__':
+    # Pack the models next to their joblib files, e.g.
+    #   python -m scoring.compiled models/price_model.joblib models/cancellation_model.joblib
+    from joblib import load
+
+    for path in sys.argv[1:]:
+        packed = os.path.splitext(path)[0] + '.packed'
+        try:
+            compile_estimator(load(path)).save(packed)
+        except TypeError as e:
+            # Served by sklearn whatever the backend
+            print(f'Not packing {path}: {e}')
+            continue
+        print(f'Saved {packed}')
@@ -0,0 +1,175 @@
+# Drift of the reservations scored in this process from the ones the
+# cancellation model was trained on. scoring.train saves a profile of the
+# training matrix next to the models: for each feature, bin edges at its
+# deciles and the share of training rows in each bin. Every scored input is
+# counted into the same bins, in a fixed array of counts, so recording costs
+# a few microseconds and memory never grows with traffic.
+#
+# drift_scores() compares the two per feature with the population stability
+# index (PSI, above 0.1 is worth a look and above 0.2 is drift) and the KS
+# distance between the binned distributions. Served at /api/drift.
+#
+# For models trained elsewhere, rebuild the profile from their training split:
+#
+#   python -m scoring.drift data/bookings
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+
+from scoring import estimators
+from scoring.features import CXL_FEATURES
+
+# Set HOTEL_DRIFT_MONITOR=0 to not record scored inputs
+DRIFT_MONITOR = os.environ.get('HOTEL_DRIFT_MONITOR', '1') == '1'
+
+PROFILE = 'drift_profile.json'
+BINS = 10
+
+# Features the app doesn't ask for and always sends the same value of (see
+# scoring.features), so they show as drifted by design
+HARD_CODED = ['market_segment', 'booking_changes', 'days_in_waiting_list', 'customer_type',
+              'room_type_changed']
+
+# Rows binned at once, bounding the temporary arrays of a large batch
+CHUNK = 4096
+
+_monitor = {}
+_monitor_lock = threading.Lock()
+
+
+def reference_profile(X, bins=BINS):
+    # Bin edges and shares of the rows in each bin, per feature of X
+    X = np.asarray(X, dtype=float)
+    edges, proportions = {}, {}
+    for column, feature in enumerate(CXL_FEATURES):
+        values = X[:, column]
+        cuts = np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1]))
+        # A value equal to a cut goes below it, so a feature that is mostly
+        # 0 still has a bin of its own for the rest
+        counts = np.bincount(np.searchsorted(cuts, values), minlength=len(cuts) + 1)
+        edges[feature] = cuts.tolist()
+        proportions[feature] = (counts / len(values)).tolist()
+    return {'features': CXL_FEATURES, 'rows': len(X), 'edges': edges,
+            'proportions': proportions}
+
+
+def save_profile(profile, path):
+    # Written beside the destination and moved into place
+    with open(path + '.tmp', 'w') as f:
+        json.dump(profile, f)
+    os.replace(path + '.tmp', path)
+
+
+class DriftMonitor:
+
+    def __init__(self, profile):
+        self.profile = profile
+        cuts = [profile['edges'][feature] for feature in CXL_FEATURES]
+        self.width = max(len(c) for c in cuts) + 1
+        # Edges padded with inf, so every feature has as many and the extra
+        # bins stay empty
+        self.edges = np.full((len(CXL_FEATURES), self.width - 1), np.inf)
+        for column, c in enumerate(cuts):
+            self.edges[column, :len(c)] = c
+        self.offsets = np.arange(len(CXL_FEATURES)) * self.width
+        self.counts = np.zeros(len(CXL_FEATURES) * self.width, dtype=np.int64)
+        self.rows = 0
+        self._lock = threading.Lock()
+
+    def record(self, X):
+        X = np.asarray(X, dtype=float).reshape(-1, len(CXL_FEATURES))
+        for start in range(0, len(X), CHUNK):
+            chunk = X[start:start + CHUNK]
+            # Bin of every value, as searchsorted per feature
+            bins = (chunk[:, :, np.newaxis] > self.edges).sum(axis=2) + self.offsets
+            counts = np.bincount(bins.ravel(), minlength=len(self.counts))
+            with self._lock:
+                self.counts += counts
+                self.rows += len(chunk)
+
+    def add(self, counts, rows):
+        # Counts of rows recorded by a monitor of the same profile elsewhere,
+        # such as in another process
+        with self._lock:
+            self.counts += counts
+            self.rows += rows
+
+    def reset(self):
+        with self._lock:
+            self.counts[:] = 0
+            self.rows = 0
+
+    def scores(self):
+        with self._lock:
+            counts = self.counts.reshape(len(CXL_FEATURES), self.width).copy()
+            rows = self.rows
+        result = {'rows': rows, 'reference_rows': self.profile['rows'], 'features': {}}
+        if not rows:
+            return result
+        for column, feature in enumerate(CXL_FEATURES):
+            expected = np.array(self.profile['proportions'][feature])
+            actual = counts[column, :len(expected)] / rows
+            # Empty bins would make the PSI infinite
+            e, a = np.clip(expected, 1e-4, None), np.clip(actual, 1e-4, None)
+            result['features'][feature] = {
+                'psi': float(np.sum((a - e) * np.log(a / e))),
+                'ks': float(np.abs(np.cumsum(actual) - np.cumsum(expected)).max()),
+                'hard_coded': feature in HARD_CODED,
+            }
+        return result
+
+
+def load_profile(model_dir=None):
+    path = os.path.join(model_dir or estimators.MODEL_DIR, PROFILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def get_monitor():
+    # Monitor of the loaded cancellation model, or None without a profile.
+    # A new model version starts a new monitor from its own profile
+    version = estimators.loaded_version('cancellation')
+    entry = _monitor.get('entry')
+    if entry is None or entry[0] != version:
+        with _monitor_lock:
+            entry = _monitor.get('entry')
+            if entry is None or entry[0] != version:
+                profile = load_profile()
+                entry = _monitor['entry'] = (version,
+                                             DriftMonitor(profile) if profile else None)
+    return entry[1]
+
+
+def record(X):
+    # Counts scored cancellation model inputs, rows of CXL_FEATURES
+    if not DRIFT_MONITOR:
+        return
+    monitor = get_monitor()
+    if monitor is not None:
+        monitor.record(X)
+
+
+def drift_scores():
+    # PSI and KS per feature since the model was loaded, or None without a profile
+    monitor = get_monitor()
+    return None if monitor is None else monitor.scores()
+
+
+if __name__ == '__main__':
+    from joblib import Memory
+
+    from scoring import datastore
+    from scoring.train import CACHE_DIR, prepare_data
+
+    if len(sys.argv) != 2:
+        sys.exit('usage: python -m scoring.drift bookings.csv|store')
+    data = Memory(CACHE_DIR, verbose=0).cache(prepare_data)(sys.argv[1],
+                                                            datastore.version(sys.argv[1]))
+    path = os.path.join(estimators.MODEL_DIR, PROFILE)
+    save_profile(reference_profile(data['X_train']), path)
+    print(f'Saved {path}')
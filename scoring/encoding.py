@@ -0,0 +1,86 @@
+# Preparation of raw bookings, shaped like hotel_bookings.csv, into the
+# encoded feature matrix of the cancellation model. Follows the notebook:
+# tools.wrangleData derives the stay length and room change and keeps the
+# model's columns, ce.OrdinalEncoder(mapping=cat_map) encodes the
+# categoricals (unknown values become -1, missing ones -2), and a
+# SimpleImputer fills any remaining gaps with the training means.
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from scoring.features import CXL_FEATURES, cat_map
+
+# Columns of the export the features are derived from
+RAW_COLUMNS = ['hotel', 'lead_time', 'arrival_date_week_number', 'adults', 'meal',
+               'market_segment', 'is_repeated_guest', 'previous_cancellations',
+               'booking_changes', 'deposit_type', 'days_in_waiting_list', 'customer_type',
+               'adr', 'required_car_parking_spaces', 'total_of_special_requests',
+               'stays_in_weekend_nights', 'stays_in_week_nights', 'reserved_room_type',
+               'assigned_room_type']
+
+# Codes for categories missing from cat_map, as category_encoders gives them
+UNKNOWN = -1
+MISSING = -2
+
+# Model metadata written at training time, holding the imputer's means
+METADATA = 'metadata.json'
+
+
+def fix_target(df):
+    # A check-out on the day of arrival means there was no stay, so it was
+    # really a no-show
+    no_stay = ((df['reservation_status'] == 'Check-Out') &
+               (df['stays_in_weekend_nights'] + df['stays_in_week_nights'] == 0))
+    df = df.copy()
+    df.loc[no_stay, 'reservation_status'] = 'No-Show'
+    return df
+
+
+def wrangle(df):
+    df = df.copy()
+    df['nights_stay'] = df['stays_in_weekend_nights'] + df['stays_in_week_nights']
+    df['room_type_changed'] = df['reserved_room_type'] != df['assigned_room_type']
+    return df[CXL_FEATURES]
+
+
+def encode(df):
+    df = df.copy()
+    for column in cat_map:
+        values = df[column['col']]
+        codes = values.map(column['mapping'])
+        codes[codes.isna() & values.notna()] = UNKNOWN
+        df[column['col']] = codes.fillna(MISSING)
+    return df.astype(float)
+
+
+def load_imputer_means(model_dir):
+    # Training means of each feature, or None if the models have no metadata
+    path = os.path.join(model_dir, METADATA)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        means = json.load(f).get('imputer_means')
+    return None if means is None else np.array([means[c] for c in CXL_FEATURES])
+
+
+def impute(X, means=None):
+    # Without training means, gaps are filled with 0
+    X = np.array(X, dtype=float)
+    gaps = np.isnan(X)
+    if gaps.any():
+        fill = np.zeros(X.shape[1]) if means is None else means
+        X[gaps] = np.take(fill, np.nonzero(gaps)[1])
+    return X
+
+
+def prepare(df, means=None):
+    # Raw bookings to the cancellation model's input matrix
+    return impute(encode(wrangle(df)).to_numpy(), means)
+
+
+def read_bookings(path, chunksize=None, extra_columns=()):
+    # Only the columns the model needs are parsed
+    columns = RAW_COLUMNS + [c for c in extra_columns if c not in RAW_COLUMNS]
+    return pd.read_csv(path, usecols=columns, chunksize=chunksize)
@@ -0,0 +1,245 @@
+# Estimators, shared by the pages and the scoring API. Each model is loaded on
+# first use rather than at import, so a worker can serve the pages that don't
+# need them straight away; call warm_up() to load them ahead of the first
+# prediction instead.
+#
+# Loaded models are versioned by their files. At most every
+# HOTEL_RELOAD_INTERVAL seconds a request checks whether a file has changed,
+# and if it has the new version is loaded on a background thread and swapped
+# in once ready. Requests keep the model they started with, so none waits or
+# fails during a reload. Replace model files atomically (scoring.train does).
+import datetime as dt
+import logging
+import os
+import threading
+import time
+
+import numpy as np
+from joblib import load
+
+from scoring import features, shared
+from scoring.batching import MICRO_BATCH, MicroBatcher
+from scoring.compiled import CompiledTrees, compile_estimator
+from scoring.price_table import TABLE, PriceTable
+from scoring.shadow import shadow
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the model files
+MODEL_DIR = os.environ.get('HOTEL_MODEL_DIR', 'models')
+
+# Attach to models packed once into shared memory (see scoring.shared)
+# instead of each worker loading its own copy. Implies the compiled backend.
+SHARED_MODELS = os.environ.get('HOTEL_SHARED_MODELS', '0') == '1'
+
+# Inference backend, chosen at startup: 'sklearn' (default) or 'compiled'
+INFERENCE_BACKEND = 'compiled' if SHARED_MODELS else os.environ.get('HOTEL_INFERENCE', 'sklearn')
+if INFERENCE_BACKEND not in ('sklearn', 'compiled'):
+    raise ValueError(f'Unknown inference backend {INFERENCE_BACKEND!r}')
+
+# Load <name>.compact (python -m scoring.compact) in place of a model where
+# there is one, a smaller and slightly less accurate version of it
+COMPACT_MODELS = os.environ.get('HOTEL_COMPACT_MODELS', '0') == '1'
+
+# Answer price queries from a precomputed table instead of the price model
+PRICE_TABLE = os.environ.get('HOTEL_PRICE_TABLE', '0') == '1'
+
+# Seconds between checks of the model files for a new version, 0 to never check
+RELOAD_INTERVAL = float(os.environ.get('HOTEL_RELOAD_INTERVAL', 5))
+
+# Name to (version, estimator), replaced whole when a new version is loaded
+_estimators = {}
+_lock = threading.Lock()
+_checked = {}
+_reloading = set()
+
+
+def _compact_path(name):
+    path = os.path.join(MODEL_DIR, name + '.compact')
+    return path if COMPACT_MODELS and os.path.isdir(path) else None
+
+
+def _load_model(name):
+    # Memory mapped like packed models, whatever the backend
+    if _compact_path(name):
+        return CompiledTrees.load(_compact_path(name))
+    if SHARED_MODELS:
+        try:
+            return CompiledTrees.load(shared.publish(name, MODEL_DIR))
+        except TypeError as e:
+            # A model without trees (scoring.train can pick a logistic
+            # regression) is loaded by each worker, as with the sklearn backend
+            logger.warning('Using sklearn inference for %s: %s', name, e)
+            return load(os.path.join(MODEL_DIR, name + '.joblib'))
+
+    path = os.path.join(MODEL_DIR, name)
+    if INFERENCE_BACKEND == 'sklearn':
+        return load(path + '.joblib')
+
+    # Packed node arrays (python -m scoring.compiled) are memory mapped,
+    # so they load without unpickling and their pages are shared
+    if _is_current(os.path.join(path + '.packed', 'meta.json'), path + '.joblib'):
+        return CompiledTrees.load(path + '.packed')
+    estimator = load(path + '.joblib')
+    try:
+        return compile_estimator(estimator)
+    except TypeError as e:
+        # Keep the sklearn estimator if the model can't be compiled
+        logger.warning('Using sklearn inference for %s: %s', name, e)
+        return estimator
+
+
+def _load_price_estimator():
+    estimator = _load_model('price_model')
+    if PRICE_TABLE:
+        # Use the table shipped with the model if there is one, else build it now
+        table_path = os.path.join(MODEL_DIR, TABLE)
+        if _is_current(table_path, os.path.join(MODEL_DIR, 'price_model.joblib')):
+            return PriceTable.load(estimator, table_path)
+        return PriceTable.build(estimator)
+    return estimator
+
+
+def _is_current(derived, source):
+    # Whether a file derived from a model exists and is no older than it, so
+    # a retrained model isn't served through the previous one's packed
+    # arrays or price table
+    if not os.path.exists(derived):
+        return False
+    return not os.path.exists(source) or os.path.getmtime(derived) >= os.path.getmtime(source)
+
+
+# Name of each estimator, its model file and how it is loaded
+_MODELS = {'price': 'price_model', 'cancellation': 'cancellation_model'}
+_LOADERS = {'price': _load_price_estimator,
+            'cancellation': lambda: _load_model('cancellation_model')}
+# Called with the new version once a model is reloaded, see on_reload
+_HOOKS = {name: [] for name in _MODELS}
+
+
+def on_reload(name, hook):
+    _HOOKS[name].append(hook)
+
+
+def _reload(name, version):
+    try:
+        _estimators[name] = (version, _LOADERS[name]())
+        logger.info('Loaded %s version %s', _MODELS[name], version)
+    except Exception:
+        logger.exception('Keeping the loaded %s, version %s failed to load',
+                         _MODELS[name], version)
+        return
+    finally:
+        _reloading.discard(name)
+    for hook in _HOOKS[name]:
+        try:
+            hook(version)
+        except Exception:
+            logger.exception('Updating after loading %s version %s failed',
+                             _MODELS[name], version)
+
+
+def _check(name, loaded_version):
+    now = time.monotonic()
+    if now - _checked.get(name, 0) < RELOAD_INTERVAL:
+        return
+    _checked[name] = now
+    try:
+        version = model_version(_MODELS[name])
+    except OSError:
+        # Missing for a moment while being replaced
+        return
+    with _lock:
+        if version == loaded_version or name in _reloading:
+            return
+        _reloading.add(name)
+    threading.Thread(target=_reload, args=(name, version), daemon=True).start()
+
+
+def get_versioned(name):
+    # (version, estimator) of 'price' or 'cancellation', read together so a
+    # result can be cached under the version of the model that produced it
+    entry = _estimators.get(name)
+    if entry is None:
+        with _lock:
+            entry = _estimators.get(name)
+            if entry is None:
+                # Versioned before loading, so a file replaced meanwhile is
+                # picked up by the next check
+                version = model_version(_MODELS[name])
+                entry = _estimators[name] = (version, _LOADERS[name]())
+    elif RELOAD_INTERVAL:
+        _check(name, entry[0])
+    return entry
+
+
+def get_price_estimator():
+    return get_versioned('price')[1]
+
+
+def get_cxl_estimator():
+    return get_versioned('cancellation')[1]
+
+
+def loaded_version(name):
+    return get_versioned(name)[0]
+
+
+def _score_cancellation(X):
+    # With a shadow model, the rows are queued for it as well
+    estimator = get_cxl_estimator()
+    start = time.perf_counter()
+    probabilities = estimator.predict_proba(X)[:, 1]
+    if shadow is not None:
+        shadow.submit(X, probabilities, time.perf_counter() - start)
+    return probabilities
+
+
+def _score_price(X):
+    return get_price_estimator().predict(X)
+
+
+# Rows of concurrent requests scored together (see scoring.batching)
+cancellation_batcher = MicroBatcher('cancellation', _score_cancellation) if MICRO_BATCH else None
+price_batcher = MicroBatcher('price', _score_price) if MICRO_BATCH else None
+
+
+def predict_cancellation(X):
+    # Probability of cancellation of each row of X
+    if cancellation_batcher is not None:
+        return cancellation_batcher.predict(X)
+    return _score_cancellation(X)
+
+
+def predict_price(X):
+    # Estimated price of each row of X, of features.price_input
+    if price_batcher is not None:
+        return price_batcher.predict(X)
+    return _score_price(X)
+
+
+def file_version(path):
+    # Size and modification time of a file, enough to tell a retrained model
+    # or a regenerated data file from the one before
+    stat = os.stat(path)
+    return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+
+def model_version(name):
+    if _compact_path(name):
+        return file_version(os.path.join(_compact_path(name), 'meta.json'))
+    return file_version(os.path.join(MODEL_DIR, name + '.joblib'))
+
+
+def warm_up():
+    # Load both models and score one reservation, so the first real
+    # prediction doesn't pay for loading or first touch of the trees
+    start = time.perf_counter()
+    week, lead_time = features.arrival_features(dt.date.today().isoformat())
+    price = get_price_estimator().predict(features.price_input(week, 1, 2, 1)[np.newaxis])[0]
+    adr = features.nightly_rate(price, 0)
+    get_cxl_estimator().predict_proba(features.cancellation_input(
+        1, lead_time, week, 2, 0, 0, 0, 0, adr, 0, 0, 1)[np.newaxis])
+    elapsed = time.perf_counter() - start
+    logger.info('Models warmed up in %.3f s', elapsed)
+    return elapsed
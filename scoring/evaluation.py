@@ -0,0 +1,215 @@
+# Evaluation report of the cancellation model on the held-out test split,
+# rendered on the insights page. The model scores the split once; every
+# metric then comes from cumulative sums over the rows sorted by probability:
+# the true and false positives above every cut-off between distinct
+# probabilities give the exact ROC curve and its area, the same sums at a
+# fixed grid of thresholds, 0 to 1 in steps of 0.01 like the insights page's
+# slider, give precision, recall and cost, and binned sums give the
+# calibration curve.
+#
+# Confidence intervals are from bootstrap resamples. A resample only weights
+# the rows by how often it drew them, so it reuses the same sort and each is
+# a few weighted cumulative sums. Resamples run in batches across processes.
+#
+# scoring.train writes the report with the models. For a model trained
+# elsewhere, or with more resamples:
+#
+#   python -m scoring.evaluation data/bookings [--bootstrap 1000] [--jobs -1]
+import argparse
+import datetime as dt
+import json
+import os
+import threading
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from scoring import estimators
+
+EVALUATION = 'evaluation.json'
+
+# Thresholds the sweep is reported at, a fixed grid rather than every
+# distinct probability, false positive rates of the ROC curve and
+# calibration bins
+THRESHOLDS = np.linspace(0, 1, 101)
+FPR_GRID = np.linspace(0, 1, 101)
+CALIBRATION_BINS = 10
+
+# Cost of each kind of error, per reservation: a predicted cancellation that
+# shows up (a walked guest if the room was resold) and a missed one (an empty room)
+COST_FALSE_POSITIVE = 1.0
+COST_FALSE_NEGATIVE = 1.0
+
+CONFIDENCE = 0.95
+BOOTSTRAP = 200
+RANDOM_STATE = 42
+
+_report = {}
+_report_lock = threading.Lock()
+
+
+def _curves(sorted_y, weights, cutoffs, positions, bins, costs):
+    # Every metric of one (re)sample. sorted_y are the labels by decreasing
+    # probability and weights how often each row counts; cutoffs and
+    # positions are the number of rows at or above each distinct probability
+    # and each threshold, bins the calibration bin of each row
+    tp = np.concatenate([[0.0], np.cumsum(weights * sorted_y)])
+    fp = np.concatenate([[0.0], np.cumsum(weights * (1 - sorted_y))])
+    positives, negatives = tp[-1], fp[-1]
+
+    # ROC at every cut-off between distinct probabilities, tied rows together
+    tpr, fpr = tp[cutoffs] / max(positives, 1e-12), fp[cutoffs] / max(negatives, 1e-12)
+    auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+
+    # At each reported threshold
+    tp_t, fp_t = tp[positions], fp[positions]
+    fn_t, tn_t = positives - tp_t, negatives - fp_t
+    with np.errstate(invalid='ignore', divide='ignore'):
+        precision = np.where(tp_t + fp_t > 0, tp_t / (tp_t + fp_t), 1.0)
+    recall = tp_t / max(positives, 1e-12)
+    cost = (costs[0] * fp_t + costs[1] * fn_t) / (positives + negatives)
+
+    # Share of cancellations in each calibration bin
+    counts = np.bincount(bins, weights=weights, minlength=CALIBRATION_BINS)
+    cancelled = np.bincount(bins, weights=weights * sorted_y, minlength=CALIBRATION_BINS)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        observed = cancelled / counts
+
+    return {'auc': auc, 'roc': np.interp(FPR_GRID, fpr, tpr), 'precision': precision,
+            'recall': recall, 'cost': cost, 'observed': observed,
+            'counts': (tp_t, fp_t, tn_t, fn_t)}
+
+
+def _bootstrap(sorted_y, cutoffs, positions, bins, costs, resamples, seed):
+    # Metrics of a batch of resamples, stacked
+    rng = np.random.default_rng(seed)
+    n = len(sorted_y)
+    results = {key: [] for key in ('auc', 'roc', 'precision', 'recall', 'cost', 'observed')}
+    for _ in range(resamples):
+        weights = np.bincount(rng.integers(0, n, n), minlength=n).astype(float)
+        curves = _curves(sorted_y, weights, cutoffs, positions, bins, costs)
+        for key in results:
+            results[key].append(curves[key])
+    return {key: np.array(values) for key, values in results.items()}
+
+
+def _interval(samples):
+    # Percentile interval at CONFIDENCE, NaN where a resample had no rows
+    alpha = (1 - CONFIDENCE) / 2 * 100
+    low, high = np.nanpercentile(samples, [alpha, 100 - alpha], axis=0)
+    return low, high
+
+
+def _list(values):
+    # NaN isn't valid JSON
+    return [None if np.isnan(v) else round(float(v), 6) for v in np.atleast_1d(values)]
+
+
+def evaluate(y, probabilities, bootstrap=BOOTSTRAP, jobs=-1, costs=None,
+             random_state=RANDOM_STATE):
+    # Report of probabilities against the true labels y, see the top
+    costs = costs or (COST_FALSE_POSITIVE, COST_FALSE_NEGATIVE)
+    order = np.argsort(-np.asarray(probabilities, dtype=float), kind='stable')
+    sorted_p = np.asarray(probabilities, dtype=float)[order]
+    sorted_y = np.asarray(y, dtype=float)[order]
+    cutoffs = np.concatenate([[0], np.nonzero(np.diff(sorted_p))[0] + 1, [len(sorted_p)]])
+    # Rows predicted to cancel at each threshold: probability >= threshold
+    positions = np.searchsorted(-sorted_p, -THRESHOLDS, side='right')
+    bins = np.minimum((sorted_p * CALIBRATION_BINS).astype(int), CALIBRATION_BINS - 1)
+
+    point = _curves(sorted_y, np.ones(len(sorted_y)), cutoffs, positions, bins, costs)
+    report = {
+        'created': dt.datetime.now().isoformat(timespec='seconds'),
+        'rows': len(sorted_y), 'positives': int(sorted_y.sum()),
+        'confidence': CONFIDENCE, 'bootstrap': bootstrap,
+        'costs': {'false_positive': costs[0], 'false_negative': costs[1]},
+        'auc': {'value': point['auc']},
+        'roc': {'fpr': _list(FPR_GRID), 'tpr': _list(point['roc'])},
+        'thresholds': {'threshold': _list(THRESHOLDS), 'precision': _list(point['precision']),
+                       'recall': _list(point['recall']), 'cost': _list(point['cost']),
+                       **{name: _list(counts) for name, counts
+                          in zip(('tp', 'fp', 'tn', 'fn'), point['counts'])}},
+        'calibration': {
+            'predicted': _list(np.bincount(bins, weights=sorted_p, minlength=CALIBRATION_BINS)
+                               / np.maximum(np.bincount(bins, minlength=CALIBRATION_BINS), 1)),
+            'observed': _list(point['observed']),
+            'rows': np.bincount(bins, minlength=CALIBRATION_BINS).tolist()},
+    }
+    if not bootstrap:
+        return report
+
+    # Batches of resamples, each with its own independent stream of draws
+    workers = os.cpu_count() if jobs == -1 else max(jobs, 1)
+    sizes = [len(chunk) for chunk in np.array_split(np.arange(bootstrap),
+                                                     min(bootstrap, workers * 4))]
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    parts = Parallel(n_jobs=jobs)(
+        delayed(_bootstrap)(sorted_y, cutoffs, positions, bins, costs, size, seed)
+        for size, seed in zip(sizes, seeds))
+    samples = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+    low, high = _interval(samples['auc'])
+    report['auc'].update(low=float(low), high=float(high))
+    low, high = _interval(samples['roc'])
+    report['roc'].update(low=_list(low), high=_list(high))
+    for key in ('precision', 'recall', 'cost'):
+        low, high = _interval(samples[key])
+        report['thresholds'][f'{key}_low'], report['thresholds'][f'{key}_high'] = (
+            _list(low), _list(high))
+    low, high = _interval(samples['observed'])
+    report['calibration'].update(observed_low=_list(low), observed_high=_list(high))
+    return report
+
+
+def save_report(report, path):
+    # Written beside the destination and moved into place
+    with open(path + '.tmp', 'w') as f:
+        json.dump(report, f)
+    os.replace(path + '.tmp', path)
+
+
+def get_report():
+    # The report of the loaded models, or None if there is none. Read again
+    # when the file changes
+    path = os.path.join(estimators.MODEL_DIR, EVALUATION)
+    if not os.path.exists(path):
+        return None
+    version = estimators.file_version(path)
+    with _report_lock:
+        if _report.get('version') != version:
+            with open(path) as f:
+                _report.update(version=version, report=json.load(f))
+        return _report['report']
+
+
+def main():
+    from joblib import Memory
+
+    from scoring import datastore
+    from scoring.train import CACHE_DIR, prepare_data
+
+    parser = argparse.ArgumentParser(description='Evaluate the cancellation model')
+    parser.add_argument('data', help='CSV shaped like hotel_bookings.csv, or a store of one')
+    parser.add_argument('--bootstrap', type=int, default=BOOTSTRAP, help='resamples')
+    parser.add_argument('--jobs', type=int, default=-1, help='processes, default: one per core')
+    parser.add_argument('--cost-fp', type=float, default=COST_FALSE_POSITIVE)
+    parser.add_argument('--cost-fn', type=float, default=COST_FALSE_NEGATIVE)
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    data = Memory(args.cache_dir, verbose=0).cache(prepare_data)(args.data,
+                                                                 datastore.version(args.data))
+    probabilities = estimators.get_cxl_estimator().predict_proba(data['X_test'])[:, 1]
+    report = evaluate(data['y_test'], probabilities, args.bootstrap, args.jobs,
+                      (args.cost_fp, args.cost_fn))
+    report['model_version'] = estimators.loaded_version('cancellation')
+    path = os.path.join(estimators.MODEL_DIR, EVALUATION)
+    save_report(report, path)
+    auc = report['auc']
+    print(f"ROC-AUC {auc['value']:.4f} ({auc.get('low', np.nan):.4f} to "
+          f"{auc.get('high', np.nan):.4f}) on {report['rows']} held-out reservations")
+    print(f'Saved {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,289 @@
+# Explanations of the cancellation model, computed from the loaded model
+# rather than rendered offline in the notebook.
+#
+# Contributions of each feature to a single prediction come from one of two
+# tree specific algorithms, chosen with HOTEL_EXPLAINER:
+#
+#   'tree_shap' (default)  Exact path dependent TreeSHAP, computed on the
+#                          packed node arrays of scoring.compiled with any
+#                          backend. Consistent, and independent of the order
+#                          of the features, but visits every leaf of every
+#                          tree, so takes from milliseconds to a second or
+#                          more on a deep forest.
+#   'path'                 Saabas path attributions. Each split a reservation
+#                          passes through credits its feature with the change
+#                          in the node's expected probability. Walks one path
+#                          per tree, so takes about a millisecond. These are
+#                          not SHAP values: they give more credit to features
+#                          split on near the roots, and are labelled Saabas
+#                          wherever shown.
+#
+# Both add up exactly to the prediction less the average prediction. Models
+# packed before the training cover of each node was kept, which TreeSHAP
+# needs, are explained with path attributions. A model without trees
+# (scoring.train can pick a logistic regression) is explained feature by
+# feature instead: starting from the average reservation of the reference
+# sample, the features are switched to the row's values one at a time, in
+# column order, and each is credited with the change in probability. These
+# add up exactly to the prediction less the average reservation's, but
+# depend on the order. Explanations are memoized per model version and
+# feature vector.
+#
+# Partial dependence (PDP) and individual conditional expectation (ICE)
+# curves are taken over a reference sample of encoded training rows, saved
+# with save_reference_sample(). Every (grid point, sample row) pair is scored
+# in a single batch, and curves are cached per model version, sample
+# version, feature and grid.
+import logging
+import math
+import os
+import threading
+
+import numpy as np
+
+from scoring import estimators
+from scoring.cache import PredictionCache
+from scoring.compiled import CompiledTrees, compile_estimator
+from scoring import schema
+from scoring.features import CXL_FEATURES
+
+logger = logging.getLogger(__name__)
+
+EXPLAINER = os.environ.get('HOTEL_EXPLAINER', 'tree_shap')
+if EXPLAINER not in ('path', 'tree_shap'):
+    raise ValueError(f'Unknown explainer {EXPLAINER!r}')
+
+REFERENCE_SAMPLE = 'reference_sample.npy'
+
+pdp_cache = PredictionCache(int(os.environ.get('HOTEL_PDP_CACHE_SIZE', 128)))
+explanation_cache = PredictionCache(int(os.environ.get('HOTEL_EXPLANATION_CACHE_SIZE', 1024)))
+
+_sample = {}
+_sample_lock = threading.Lock()
+_explainer = {}
+_explainer_lock = threading.Lock()
+
+# Name of each method's contributions as the scoring API reports them
+METHOD_NAMES = {'path': 'saabas', 'tree_shap': 'tree_shap', 'sequential': 'sequential'}
+
+
+def save_reference_sample(X, path, size=500, random_state=42):
+    # A random subset of encoded rows, columns in CXL_FEATURES order
+    X = np.asarray(X, dtype=float)
+    rng = np.random.default_rng(random_state)
+    rows = rng.choice(len(X), size=min(size, len(X)), replace=False)
+    np.save(path, X[np.sort(rows)])
+
+
+def get_reference_sample():
+    # Returns (version, sample), or (None, None) if no sample has been saved
+    path = os.path.join(estimators.MODEL_DIR, REFERENCE_SAMPLE)
+    if not os.path.exists(path):
+        return None, None
+    version = estimators.file_version(path)
+    with _sample_lock:
+        if _sample.get('version') != version:
+            _sample['sample'] = np.load(path)
+            _sample['version'] = version
+        return _sample['version'], _sample['sample']
+
+
+def feature_grid(values, points=20):
+    # Every value the feature takes in the sample if there are few enough,
+    # else evenly spaced percentiles of it
+    unique = np.unique(values)
+    if len(unique) <= points:
+        return unique
+    grid = np.percentile(values, np.linspace(0, 100, points))
+    if np.array_equal(values, np.round(values)):
+        grid = np.round(grid)
+    return np.unique(grid)
+
+
+def partial_dependence(estimator, sample, feature, grid):
+    # ICE curves, shape (rows in sample, grid points), and their mean, the PDP
+    column = CXL_FEATURES.index(feature)
+    X = np.repeat(sample, len(grid), axis=0)
+    X[:, column] = np.tile(grid, len(sample))
+    ice = estimator.predict_proba(X)[:, 1].reshape(len(sample), len(grid))
+    return ice, ice.mean(axis=0)
+
+
+def cached_partial_dependence(feature, points=20):
+    # Returns (grid, ice, pdp) from the loaded model and reference sample,
+    # or None if there is no reference sample
+    sample_version, sample = get_reference_sample()
+    if sample is None:
+        return None
+    grid = feature_grid(sample[:, CXL_FEATURES.index(feature)], points)
+    key = (estimators.loaded_version('cancellation'), sample_version, feature,
+           tuple(grid.tolist()))
+    cached = pdp_cache.get(key)
+    if cached is None:
+        ice, pdp = partial_dependence(estimators.get_cxl_estimator(), sample, feature, grid)
+        cached = grid, ice, pdp
+        pdp_cache.put(key, cached)
+    return cached
+
+
+def path_contributions(compiled, X, output=1):
+    # Returns the average prediction of the forest and, for each row, the
+    # contribution of each feature to its prediction of class `output`
+    X = np.asarray(X, dtype=np.float32)
+    if X.ndim == 1:
+        X = X[np.newaxis, :]
+    expected = compiled.value[:, output]
+    contributions = np.zeros(X.shape, dtype=np.float64)
+    nodes = np.repeat(compiled.roots, X.shape[0])
+    rows = np.tile(np.arange(X.shape[0]), compiled.n_trees)
+
+    active = np.arange(len(nodes))
+    for _ in range(compiled.depth):
+        current = nodes[active]
+        feature = compiled.feature[current]
+        go_left = X[rows[active], feature] <= compiled.threshold[current]
+        step = np.where(go_left, compiled.left_child(current), compiled.right[current])
+        np.add.at(contributions, (rows[active], feature),
+                  expected[step].astype(np.float64) - expected[current])
+        nodes[active] = step
+        active = active[step != current]
+        if not len(active):
+            break
+
+    # Quantized values (scoring.compact) are scaled back to probabilities
+    scale = compiled.n_trees * (compiled.value_scale or 1)
+    base_value = expected[compiled.roots].mean() / (compiled.value_scale or 1)
+    return base_value, contributions / scale
+
+
+def _leaf_paths(compiled, root, n_features):
+    # Every leaf of the tree at root, and for each feature the interval
+    # (low, high] of values that follow the leaf's path at its splits, and the
+    # fraction of the training cover that does. Features not split on have
+    # (-inf, inf] and a fraction of 1. Walked a level at a time
+    nodes = np.array([root])
+    low = np.full((1, n_features), -np.inf)
+    high = np.full((1, n_features), np.inf)
+    zero = np.ones((1, n_features))
+    leaves = []
+    while len(nodes):
+        leaf = compiled.right[nodes] == nodes
+        leaves.append((nodes[leaf], low[leaf], high[leaf], zero[leaf]))
+        nodes, low, high, zero = nodes[~leaf], low[~leaf], high[~leaf], zero[~leaf]
+
+        # Left children first, then right ones
+        children = np.concatenate([compiled.left_child(nodes), compiled.right[nodes]])
+        rows = np.arange(len(children))
+        feature = np.tile(compiled.feature[nodes], 2)
+        threshold = np.tile(compiled.threshold[nodes], 2)
+        low, high, zero = np.tile(low, (2, 1)), np.tile(high, (2, 1)), np.tile(zero, (2, 1))
+        left = rows < len(nodes)
+        high[rows[left], feature[left]] = np.minimum(high[rows[left], feature[left]],
+                                                     threshold[left])
+        low[rows[~left], feature[~left]] = np.maximum(low[rows[~left], feature[~left]],
+                                                      threshold[~left])
+        zero[rows, feature] *= compiled.cover[children] / np.tile(compiled.cover[nodes], 2)
+        nodes = children
+    return (np.concatenate(arrays) for arrays in zip(*leaves))
+
+
+def tree_shap(compiled, X, output=1):
+    # Returns the average prediction of the forest and, for each row, the
+    # TreeSHAP value of each feature for its prediction of class `output`.
+    #
+    # Each leaf adds its value times, for every feature on its path, the
+    # fraction of the cover following the path at the feature's splits: 1 or
+    # 0 for a feature that is known, as the row does or doesn't follow them,
+    # and the training fraction z for one that isn't. The Shapley value of a
+    # feature i in that product is the leaf's value times (o_i - z_i) times
+    # the integral over u from 0 to 1 of the product of z_j + u (o_j - z_j)
+    # over the other features, a polynomial of degree below the number of
+    # features, so Gauss-Legendre quadrature gives it exactly.
+    X = np.asarray(X, dtype=np.float32)
+    if X.ndim == 1:
+        X = X[np.newaxis, :]
+    points, weights = np.polynomial.legendre.leggauss(max(1, (X.shape[1] + 1) // 2))
+    # Moved from [-1, 1] to [0, 1]
+    points, weights = (points + 1) / 2, weights / 2
+
+    contributions = np.zeros(X.shape, dtype=np.float64)
+    base_value = 0.0
+    for root in compiled.roots:
+        leaves, low, high, zero = _leaf_paths(compiled, root, X.shape[1])
+        value = compiled.value[leaves, output].astype(np.float64)
+        base_value += value @ zero.prod(axis=1)
+        for row, x in enumerate(X):
+            known = ((x > low) & (x <= high)) - zero
+            integrals = np.zeros_like(known)
+            for u, weight in zip(points, weights):
+                factors = zero + u * known
+                integrals += (weight * factors.prod(axis=1))[:, np.newaxis] / factors
+            contributions[row] += value @ (known * integrals)
+
+    # Quantized values (scoring.compact) are scaled back to probabilities
+    scale = compiled.n_trees * (compiled.value_scale or 1)
+    return base_value / scale, contributions / scale
+
+
+def sequential_contributions(estimator, X, baseline):
+    # Returns the prediction for the baseline row and, for each row of X, the
+    # contribution of each feature, switched from the baseline in turn
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[np.newaxis, :]
+    # Step k has the first k features of the row and the rest of the baseline
+    steps = np.tri(X.shape[1] + 1, X.shape[1], -1, dtype=bool)
+    Z = np.where(steps, X[:, np.newaxis, :], baseline)
+    probabilities = estimator.predict_proba(Z.reshape(-1, X.shape[1]))[:, 1]
+    probabilities = probabilities.reshape(len(X), X.shape[1] + 1)
+    return float(probabilities[0, 0]), np.diff(probabilities, axis=1)
+
+
+def _get_explainer(estimator):
+    # Built once for each loaded model
+    with _explainer_lock:
+        if _explainer.get('estimator') is not estimator:
+            method = EXPLAINER
+            explainer = estimator
+            if not isinstance(estimator, CompiledTrees):
+                try:
+                    explainer = compile_estimator(estimator)
+                except TypeError as e:
+                    logger.warning('Explaining the cancellation model feature by feature: %s', e)
+                    method = 'sequential'
+            if method == 'tree_shap' and explainer.cover is None:
+                logger.warning('TreeSHAP needs the cover of each node, which this packed '
+                               'model lacks, using path attributions')
+                method = 'path'
+            _explainer.update(estimator=estimator, method=method, explainer=explainer)
+        return _explainer['method'], _explainer['explainer']
+
+
+def explanation_method():
+    # Name of the method explaining the loaded model, see METHOD_NAMES
+    return METHOD_NAMES[_get_explainer(estimators.get_cxl_estimator())[0]]
+
+
+def explain(X):
+    # Returns (method, average prediction, contributions of each feature to
+    # the probability of cancellation of each row of X)
+    method, explainer = _get_explainer(estimators.get_cxl_estimator())
+    if method == 'path':
+        return (method,) + path_contributions(explainer, X)
+    if method == 'tree_shap':
+        return (method,) + tree_shap(explainer, X)
+    sample = get_reference_sample()[1]
+    baseline = schema.CANCELLATION.template if sample is None else sample.mean(axis=0)
+    return (method,) + sequential_contributions(explainer, X, baseline)
+
+
+def explain_prediction(input2):
+    # Memoized explanation of one feature vector, as (method, average
+    # prediction, contributions)
+    key = (estimators.loaded_version('cancellation'), tuple(input2))
+    cached = explanation_cache.get(key)
+    if cached is None:
+        method, base_value, contributions = explain([input2])
+        cached = method, base_value, contributions[0]
+        explanation_cache.put(key, cached)
+    return cached
@@ -0,0 +1,54 @@
+# Feature derivation for a reservation. Shared by the predictions page and
+# the batch scoring API so both hand the models exactly the same inputs.
+# Each input is a row, or given arrays of values a block of rows, written
+# into a new array of the schema's defaults or into out.
+import datetime as dt
+
+import numpy as np
+
+from scoring import schema
+
+# Columns of the two models, in the order they take them (see scoring.schema)
+PRICE_FEATURES = schema.PRICE.names
+CXL_FEATURES = schema.CANCELLATION.names
+
+# Ordinal encodings of the categorical columns, as used to train the models
+cat_map = [{'col': f.name, 'mapping': f.encoding}
+           for f in schema.CANCELLATION.features if f.encoding is not None]
+
+# Columns each input below writes, in the order of its arguments
+_PRICE_COLUMNS = np.array([schema.PRICE.columns[name] for name in (
+    'arrival_date_week_number', 'hotel', 'adults', 'nights_stay')])
+_CXL_COLUMNS = np.array([schema.CANCELLATION.columns[name] for name in (
+    'hotel', 'lead_time', 'arrival_date_week_number', 'adults', 'meal', 'is_repeated_guest',
+    'previous_cancellations', 'deposit_type', 'adr', 'required_car_parking_spaces',
+    'total_of_special_requests', 'nights_stay')])
+
+
+def arrival_features(arrival_date, today=None):
+    # Get the week of the year and lead time from the arrival date
+    if today is None:
+        today = dt.date.today()
+    arrival = dt.datetime.strptime(arrival_date, '%Y-%m-%d')
+    week = arrival.isocalendar()[1]
+    lead_time = (arrival.date() - today).days
+    return week, lead_time
+
+
+def price_input(week, hotel, num_adults, num_nights, out=None):
+    # Input for the price model. Already encoded
+    return schema.PRICE.write(_PRICE_COLUMNS, (week, hotel, num_adults, num_nights), out)
+
+
+def nightly_rate(price, meal_plan):
+    # The price model leaves out board, so add a flat 10 Euros per meal
+    return round(price + meal_plan * 10, 2)
+
+
+def cancellation_input(hotel, lead_time, week, num_adults, meal_plan, prev_stay,
+                       num_prev_cxl, deposit_type, adr, num_cars, num_sr, num_nights, out=None):
+    # Input for the cancellation model. Rolls in the ADR from the price model.
+    # Features the app doesn't ask for keep the schema's defaults
+    return schema.CANCELLATION.write(
+        _CXL_COLUMNS, (hotel, lead_time, week, num_adults, meal_plan, prev_stay, num_prev_cxl,
+                       deposit_type, adr, num_cars, num_sr, num_nights), out)
@@ -0,0 +1,161 @@
+# Latency histograms of the callbacks and of the stages inside them, with
+# request counts, served at /metrics in the Prometheus text format (see api).
+# Each histogram is a fixed set of buckets, so recording a duration is a
+# bisect and two additions under a lock, and memory doesn't grow with traffic.
+#
+# HOTEL_METRICS=0 turns it all off: timed() then returns the callback itself,
+# stage() a shared context that does nothing, no request hooks are installed
+# and /metrics answers 404.
+import bisect
+import contextlib
+import os
+import threading
+import time
+
+METRICS = os.environ.get('HOTEL_METRICS', '1') == '1'
+
+# Upper bounds of the buckets in seconds, from 50 us to 10 s
+BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NOOP = contextlib.nullcontext()
+
+
+class Histogram:
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        # One count per bucket, and one for durations above the last bound
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        i = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += seconds
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.counts), self.sum
+
+
+# Name of a callback or a stage to its histogram, and (route, status) to the
+# number of requests answered
+histograms = {}
+requests = {}
+_lock = threading.Lock()
+
+
+def histogram(name):
+    hist = histograms.get(name)
+    if hist is None:
+        with _lock:
+            hist = histograms.setdefault(name, Histogram())
+    return hist
+
+
+@contextlib.contextmanager
+def _stage(name):
+    hist = histogram(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        hist.observe(time.perf_counter() - start)
+
+
+def stage(name):
+    # with stage('price_model'): ... times the block into its histogram
+    return _stage(name) if METRICS else _NOOP
+
+
+def timed(name):
+    # Decorator timing a whole callback. Goes under @app.callback, so Dash
+    # registers the timed function
+    def decorate(function):
+        if not METRICS:
+            return function
+
+        hist = histogram(name)
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                hist.observe(time.perf_counter() - start)
+
+        wrapper.__name__ = function.__name__
+        wrapper.__doc__ = function.__doc__
+        wrapper.__wrapped__ = function
+        return wrapper
+    return decorate
+
+
+def count_request(route, status):
+    key = route, status
+    with _lock:
+        requests[key] = requests.get(key, 0) + 1
+
+
+def install(server):
+    # Counts every request of a Flask server by route and status
+    if not METRICS:
+        return
+
+    from flask import request
+
+    @server.after_request
+    def _count(response):
+        count_request(request.url_rule.rule if request.url_rule else 'unmatched',
+                      response.status_code)
+        return response
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels.items()) + '}'
+
+
+def render(caches=None, versions=None, batchers=None):
+    # Prometheus text exposition of the histograms, request counts, the
+    # stats of the given caches (name to PredictionCache), model versions
+    # and micro-batchers (name to MicroBatcher)
+    lines = ['# HELP hotel_latency_seconds Time spent in each callback and stage',
+             '# TYPE hotel_latency_seconds histogram']
+    for name, hist in sorted(histograms.items()):
+        counts, total = hist.snapshot()
+        cumulative = 0
+        for bound, count in zip(hist.buckets + (float('inf'),), counts):
+            cumulative += count
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            lines.append(f'hotel_latency_seconds_bucket{_labels(stage=name, le=le)} {cumulative}')
+        lines.append(f'hotel_latency_seconds_sum{_labels(stage=name)} {total}')
+        lines.append(f'hotel_latency_seconds_count{_labels(stage=name)} {cumulative}')
+
+    lines += ['# HELP hotel_requests_total Requests answered by route and status',
+              '# TYPE hotel_requests_total counter']
+    with _lock:
+        counted = sorted(requests.items())
+    for (route, status), count in counted:
+        lines.append(f'hotel_requests_total{_labels(route=route, status=status)} {count}')
+
+    stats = {name: cache.stats() for name, cache in sorted((caches or {}).items())}
+    for field, kind in (('hits', 'counter'), ('misses', 'counter'), ('evictions', 'counter'),
+                        ('size', 'gauge')):
+        lines.append(f'# TYPE hotel_cache_{field} {kind}')
+        for name, values in stats.items():
+            lines.append(f'hotel_cache_{field}{_labels(cache=name)} {values[field]}')
+
+    stats = {name: batcher.stats() for name, batcher in sorted((batchers or {}).items())}
+    for field in ('batches', 'rows', 'deduplicated', 'errors'):
+        lines.append(f'# TYPE hotel_batch_{field}_total counter')
+        for name, values in stats.items():
+            lines.append(f'hotel_batch_{field}_total{_labels(model=name)} {values[field]}')
+
+    lines += ['# HELP hotel_model_info Version of each loaded model',
+              '# TYPE hotel_model_info gauge']
+    for name, version in sorted((versions or {}).items()):
+        lines.append(f'hotel_model_info{_labels(model=name, version=version)} 1')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,200 @@
+# Occupancy forecast of a book of reservations. Every reservation staying on
+# a night either shows up or cancels, independently and with its own
+# probability from the cancellation model, so the number of rooms occupied
+# that night follows a Poisson-binomial distribution. Its exact probability
+# mass function is the product of the reservations' generating polynomials
+# (1 - p + p z), multiplied out pairwise with FFT convolutions.
+#
+# Each night keeps these products in a binary tree, so adding or cancelling a
+# reservation only recomputes the products on the path from its leaf to the
+# root, log2(n) multiplications rather than all n. Dividing the pmf by the
+# cancelled reservation's polynomial would be cheaper, but its rounding
+# errors compound quickly for probabilities near 1/2.
+import datetime as dt
+
+import numpy as np
+
+from scoring import batch
+
+# Polynomials longer than this are multiplied by FFT, shorter ones directly
+FFT_SIZE = 64
+
+
+def _multiply(a, b):
+    if min(len(a), len(b)) < FFT_SIZE:
+        return np.convolve(a, b)
+    size = len(a) + len(b) - 1
+    product = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)
+    # FFT rounding can leave tiny negative masses
+    return np.clip(product, 0.0, None)
+
+
+def poisson_binomial(probabilities):
+    # Probability of exactly 0, 1, ..., n of the events happening
+    polynomials = [np.array([1.0 - p, p]) for p in probabilities] or [np.ones(1)]
+    while len(polynomials) > 1:
+        polynomials = _multiply_pairs(polynomials)
+    return polynomials[0] / polynomials[0].sum()
+
+
+def _multiply_pairs(polynomials):
+    # An odd one out is carried up as it is
+    pairs = [_multiply(a, b) for a, b in zip(polynomials[::2], polynomials[1::2])]
+    return pairs + polynomials[len(pairs) * 2:]
+
+
+class NightDistribution:
+
+    def __init__(self, probabilities=None):
+        # Probability of showing up of each reservation, by id, and the leaf
+        # of the product tree holding it
+        self.probabilities = dict(probabilities or {})
+        self._slots = {booking: slot for slot, booking in enumerate(self.probabilities)}
+        self._build()
+
+    def _build(self):
+        # Leaves padded to a power of two, with a spare slot at least, and
+        # every level of products above them
+        leaves = [np.ones(1)] * (1 << max(1, len(self.probabilities)).bit_length())
+        for booking, slot in self._slots.items():
+            leaves[slot] = np.array([1.0 - self.probabilities[booking],
+                                     self.probabilities[booking]])
+        self._free = sorted(set(range(len(leaves))) - set(self._slots.values()), reverse=True)
+        self._levels = [leaves]
+        while len(self._levels[-1]) > 1:
+            self._levels.append(_multiply_pairs(self._levels[-1]))
+
+    def copy(self):
+        # Products are replaced, never changed in place, so the copy can
+        # share them and only needs lists of its own
+        night = NightDistribution.__new__(NightDistribution)
+        night.probabilities = dict(self.probabilities)
+        night._slots = dict(self._slots)
+        night._free = list(self._free)
+        night._levels = [list(level) for level in self._levels]
+        return night
+
+    def _update(self, slot, polynomial):
+        self._levels[0][slot] = polynomial
+        for level in range(1, len(self._levels)):
+            slot //= 2
+            below = self._levels[level - 1]
+            self._levels[level][slot] = _multiply(below[2 * slot], below[2 * slot + 1])
+
+    def add(self, booking, p):
+        if booking in self.probabilities:
+            self.remove(booking)
+        self.probabilities[booking] = p
+        if not self._free:
+            # Twice the leaves, renumbered in order
+            self._slots = {b: i for i, b in enumerate(self._slots)}
+            self._slots[booking] = len(self._slots)
+            self._build()
+            return
+        self._slots[booking] = self._free.pop()
+        self._update(self._slots[booking], np.array([1.0 - p, p]))
+
+    def remove(self, booking):
+        del self.probabilities[booking]
+        slot = self._slots.pop(booking)
+        self._free.append(slot)
+        self._update(slot, np.ones(1))
+
+    @property
+    def pmf(self):
+        root = self._levels[-1][0]
+        return root / root.sum()
+
+    @property
+    def booked(self):
+        return len(self.probabilities)
+
+    def mean(self):
+        pmf = self.pmf
+        return float(np.dot(np.arange(len(pmf)), pmf))
+
+    def quantile(self, q):
+        return int(np.searchsorted(np.cumsum(self.pmf), q - 1e-12))
+
+    def prob_above(self, rooms):
+        # Probability that more than `rooms` rooms are occupied
+        return float(self.pmf[rooms + 1:].sum())
+
+
+class OccupancyForecast:
+
+    def __init__(self):
+        # (hotel, night) to its distribution, and booking id to (hotel, nights)
+        self.nights = {}
+        self.bookings = {}
+
+    @classmethod
+    def from_bookings(cls, bookings):
+        # Bookings as (id, hotel, arrival date, nights, probability of showing
+        # up). Each night is computed once from all of its reservations
+        forecast = cls()
+        stays = {}
+        for booking, hotel, arrival, nights, p in bookings:
+            if booking in forecast.bookings:
+                raise ValueError(f'Booking {booking} appears more than once')
+            keys = [(hotel, arrival + dt.timedelta(days=i)) for i in range(nights)]
+            forecast.bookings[booking] = keys
+            for key in keys:
+                stays.setdefault(key, {})[booking] = p
+        forecast.nights = {key: NightDistribution(probabilities)
+                           for key, probabilities in stays.items()}
+        return forecast
+
+    def add(self, booking, hotel, arrival, nights, p):
+        if booking in self.bookings:
+            self.cancel(booking)
+        keys = [(hotel, arrival + dt.timedelta(days=i)) for i in range(nights)]
+        self.bookings[booking] = keys
+        for key in keys:
+            self.nights.setdefault(key, NightDistribution()).add(booking, p)
+
+    def without(self, cancelled):
+        # A new forecast with the given bookings cancelled, leaving this one
+        # as it is. Nights no cancelled booking stays on are shared with it
+        forecast = OccupancyForecast()
+        forecast.bookings = dict(self.bookings)
+        forecast.nights = dict(self.nights)
+        cancelled = [booking for booking in cancelled if booking in self.bookings]
+        for key in {key for booking in cancelled for key in self.bookings[booking]}:
+            forecast.nights[key] = self.nights[key].copy()
+        for booking in cancelled:
+            forecast.cancel(booking)
+        return forecast
+
+    def cancel(self, booking):
+        for key in self.bookings.pop(booking):
+            night = self.nights[key]
+            night.remove(booking)
+            if not night.booked:
+                del self.nights[key]
+
+    def summary(self, hotel, rooms=None):
+        # One row per night with reservations at the hotel, in date order
+        rows = []
+        for (night_hotel, night), distribution in sorted(self.nights.items()):
+            if night_hotel != hotel:
+                continue
+            row = {'night': night, 'booked': distribution.booked,
+                   'expected': distribution.mean(),
+                   'p10': distribution.quantile(0.1), 'p50': distribution.quantile(0.5),
+                   'p90': distribution.quantile(0.9)}
+            if rooms is not None:
+                row['prob_overbooked'] = distribution.prob_above(rooms)
+            rows.append(row)
+        return rows
+
+
+def forecast_book(records, ids=None, today=None):
+    # Scores a book of reservations (see scoring.batch.FIELDS) in one batch
+    # and forecasts its occupancy. Bookings are numbered unless given ids
+    results = batch.score(records, today)
+    ids = range(len(records)) if ids is None else ids
+    return OccupancyForecast.from_bookings(
+        (booking, int(record['hotel']), dt.date.fromisoformat(str(record['arrival_date'])[:10]),
+         int(record['num_nights']), 1.0 - probability)
+        for booking, record, (_, _, probability) in zip(ids, records, results))
@@ -0,0 +1,153 @@
+# Scores a whole book of reservations, e.g. a nightly PMS export shaped like
+# hotel_bookings.csv, with the cancellation model.
+#
+#   python -m scoring.portfolio bookings.csv scores.csv [--workers 4] [--chunksize 50000]
+#
+# The export is read in chunks, so memory stays bounded however many rows it
+# has. It can also be a store ingested with scoring.datastore, which each
+# worker maps and reads its own rows from, already encoded. Chunks are
+# prepared and scored across a pool of processes, each loading the model
+# once, and the results are written in order as they complete. Throughput
+# and peak memory are reported at the end.
+#
+# The scored rows are binned like the app's traffic (see scoring.drift) in
+# each worker, and the drift of the whole export from the training data is
+# written beside the scores, to destination.drift.json unless --drift-report
+# says otherwise.
+import argparse
+import collections
+import concurrent.futures
+import csv
+import json
+import os
+import resource
+import sys
+import time
+
+from scoring import datastore, drift, encoding, estimators
+
+_means = None
+_store = None
+_profile = None
+
+
+def _init_worker(store=None):
+    global _means, _store, _profile
+    _means = encoding.load_imputer_means(estimators.MODEL_DIR)
+    _store = datastore.open_store(store) if store else None
+    _profile = drift.load_profile() if drift.DRIFT_MONITOR else None
+    estimator = estimators.get_cxl_estimator()
+    # The pool already uses every core, so sklearn shouldn't add threads
+    if hasattr(estimator, 'n_jobs'):
+        estimator.n_jobs = 1
+
+
+def _score_chunk(chunk, id_column):
+    if _store is not None:
+        # Rows start to stop of the store
+        X = encoding.impute(datastore.matrix(_store, slice(*chunk)), _means)
+        ids = list(range(*chunk))
+    else:
+        X = encoding.prepare(chunk, _means)
+        ids = chunk[id_column].tolist() if id_column else chunk.index.tolist()
+    probabilities = estimators.get_cxl_estimator().predict_proba(X)[:, 1]
+    # Binned here, so only the counts go back to be added up
+    counts = None
+    if _profile is not None:
+        monitor = drift.DriftMonitor(_profile)
+        monitor.record(X)
+        counts = monitor.counts
+    return ids, probabilities.tolist(), counts
+
+
+def _store_chunks(store, chunksize):
+    rows = datastore.row_count(store)
+    for start in range(0, rows, chunksize):
+        yield start, min(start + chunksize, rows)
+
+
+def score_file(source, destination, workers=None, chunksize=50000, id_column=None,
+               drift_report=None):
+    # Returns the number of rows scored and, with drift_report, their drift
+    # from the training data, also written to it. Without a profile saved
+    # with the model the drift is None
+    workers = workers or os.cpu_count()
+    profile = drift.load_profile() if drift_report and drift.DRIFT_MONITOR else None
+    monitor = drift.DriftMonitor(profile) if profile else None
+    store = source if datastore.is_store(source) else None
+    if store and id_column:
+        raise ValueError('A store has no id column, its rows are numbered')
+    if store:
+        chunks = _store_chunks(store, chunksize)
+    else:
+        chunks = encoding.read_bookings(source, chunksize, [id_column] if id_column else [])
+    rows = 0
+    with open(destination, 'w', newline='') as f, \
+            concurrent.futures.ProcessPoolExecutor(workers, initializer=_init_worker,
+                                                   initargs=(store,)) as pool:
+        writer = csv.writer(f)
+        writer.writerow([id_column or 'row', 'cancellation_probability'])
+
+        # At most two chunks per worker are read ahead of the writer
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk, chunk, id_column))
+            while len(pending) >= 2 * workers:
+                rows += _write(writer, pending.popleft().result(), monitor)
+        while pending:
+            rows += _write(writer, pending.popleft().result(), monitor)
+    if monitor is None:
+        return rows, None
+    scores = monitor.scores()
+    with open(drift_report + '.tmp', 'w') as f:
+        json.dump(scores, f, indent=2)
+    os.replace(drift_report + '.tmp', drift_report)
+    return rows, scores
+
+
+def _write(writer, result, monitor):
+    ids, probabilities, counts = result
+    writer.writerows(zip(ids, probabilities))
+    if monitor is not None and counts is not None:
+        monitor.add(counts, len(ids))
+    return len(ids)
+
+
+def peak_memory_mb():
+    # Largest resident size of this process and of any worker, in MB (Linux
+    # reports ru_maxrss in KB)
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own / 1024, workers / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score a bookings export for cancellation')
+    parser.add_argument('source', help='CSV shaped like hotel_bookings.csv, or a store of one')
+    parser.add_argument('destination', help='CSV to write the probabilities to')
+    parser.add_argument('--workers', type=int, default=None, help='default: one per core')
+    parser.add_argument('--chunksize', type=int, default=50000)
+    parser.add_argument('--id-column', default=None,
+                        help='column identifying each booking, default: its row number')
+    parser.add_argument('--drift-report', default=None,
+                        help='JSON to write the drift to, default: destination.drift.json')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    drift_report = args.drift_report or args.destination + '.drift.json'
+    rows, scores = score_file(args.source, args.destination, args.workers, args.chunksize,
+                              args.id_column, drift_report)
+    elapsed = time.perf_counter() - start
+    own, workers = peak_memory_mb()
+    print(f'Scored {rows} rows in {elapsed:.1f} s ({rows / elapsed:.0f} rows/s), '
+          f'peak memory {own:.0f} MB main, {workers:.0f} MB largest worker',
+          file=sys.stderr)
+    if scores is not None:
+        drifted = [feature for feature, score in scores['features'].items()
+                   if score['psi'] > 0.2 and not score['hard_coded']]
+        print(f'Drift written to {drift_report}, PSI above 0.2 for: '
+              f'{", ".join(drifted) or "none"}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# Uncertainty bands of the price model. The training ADRs that end in each
+# leaf of the decision tree are summarized by their quantiles once, when the
+# model is trained, and saved by node next to it. A reservation's band is
+# looked up by the leaf it reaches, in the same walk of the tree that gives
+# its price, so serving a band costs no more than the price alone.
+#
+# scoring.train writes the bands with the models. For a price model trained
+# elsewhere, rebuild them from its training split with
+#
+#   python -m scoring.price_bands data/bookings
+import logging
+import os
+import sys
+import threading
+
+import numpy as np
+
+from scoring import estimators
+from scoring.batching import MICRO_BATCH, MicroBatcher
+from scoring.compiled import CompiledTrees
+
+logger = logging.getLogger(__name__)
+
+# Lower and upper quantile of the ADR of the stays in a leaf
+QUANTILES = (0.1, 0.9)
+
+BANDS = 'price_bands.npy'
+
+_bands = {}
+_bands_lock = threading.Lock()
+
+
+def _tree(estimator):
+    # The decision tree behind a price table
+    return getattr(estimator, 'estimator', estimator)
+
+
+def _node_count(tree):
+    return len(tree.value) if isinstance(tree, CompiledTrees) else tree.tree_.node_count
+
+
+def _values(tree, nodes):
+    # Prices of the nodes of a tree
+    if isinstance(tree, CompiledTrees):
+        return tree.value[nodes, 0]
+    return tree.tree_.value[nodes, 0, 0]
+
+
+def leaf_bands(estimator, X, y, quantiles=QUANTILES):
+    # Array of (nodes, quantiles). Nodes no training stay ends in, which a
+    # price model trained on other data can have, get a band of their price
+    tree = _tree(estimator)
+    leaves = tree.apply(np.asarray(X, dtype=np.float32))
+    if isinstance(tree, CompiledTrees):
+        leaves = leaves[0]
+    bands = np.repeat(_values(tree, np.arange(_node_count(tree)))[:, np.newaxis],
+                      len(quantiles), axis=1)
+    order = np.argsort(leaves, kind='stable')
+    nodes, starts = np.unique(leaves[order], return_index=True)
+    for node, targets in zip(nodes, np.split(np.asarray(y)[order], starts[1:])):
+        bands[node] = np.quantile(targets, quantiles)
+    return bands
+
+
+def save_bands(bands, path):
+    # Written beside the destination and moved into place
+    with open(path + '.tmp', 'wb') as f:
+        np.save(f, bands)
+    os.replace(path + '.tmp', path)
+
+
+def get_bands():
+    # Bands of the loaded price model, or None if there are none for it
+    path = os.path.join(estimators.MODEL_DIR, BANDS)
+    if not os.path.exists(path):
+        return None
+    # Checked again whenever the bands or the price model change
+    version = estimators.file_version(path), estimators.loaded_version('price')
+    with _bands_lock:
+        if _bands.get('version') != version:
+            bands = np.load(path)
+            if len(bands) != _node_count(_tree(estimators.get_price_estimator())):
+                logger.warning('%s is for another price model, not using it', path)
+                bands = None
+            _bands.update(version=version, bands=bands)
+        return _bands['bands']
+
+
+def predict(estimator, bands, X):
+    # Returns the prices, and the lower and upper ends of their bands. Bands
+    # saved before empty leaves were filled in are NaN there, and fall back to
+    # the price
+    tree = _tree(estimator)
+    X = np.asarray(X, dtype=np.float32)
+    leaves = tree.apply(X)[0] if isinstance(tree, CompiledTrees) else tree.apply(X)
+    prices = _values(tree, leaves)
+    lower, upper = bands[leaves, 0], bands[leaves, -1]
+    return (prices, np.where(np.isnan(lower), prices, lower),
+            np.where(np.isnan(upper), prices, upper))
+
+
+def _score_banded(X):
+    return np.column_stack(predict(estimators.get_price_estimator(), get_bands(), X))
+
+
+banded_batcher = MicroBatcher('price_bands', _score_banded) if MICRO_BATCH else None
+
+
+def predict_banded(X):
+    # Rows of (price, lower end, upper end) from the loaded model and bands,
+    # batched with concurrent requests like estimators.predict_price
+    if banded_batcher is not None:
+        return banded_batcher.predict(X)
+    return _score_banded(X)
+
+
+if __name__ == '__main__':
+    from joblib import Memory, load
+
+    from scoring import datastore
+    from scoring.train import CACHE_DIR, prepare_data
+
+    if len(sys.argv) != 2:
+        sys.exit('usage: python -m scoring.price_bands bookings.csv|store')
+    data = Memory(CACHE_DIR, verbose=0).cache(prepare_data)(sys.argv[1],
+                                                            datastore.version(sys.argv[1]))
+    path = os.path.join(estimators.MODEL_DIR, BANDS)
+    save_bands(leaf_bands(load(os.path.join(estimators.MODEL_DIR, 'price_model.joblib')),
+                          data['price_X_train'], data['price_y_train']), path)
+    print(f'Saved {path}')
@@ -0,0 +1,70 @@
+# Dense lookup table of the price model. The model only takes the week,
+# hotel, number of adults and number of nights, and the reservation form
+# bounds all four, so every price it can be asked for is computed once and
+# then answered by indexing. Anything outside the table goes to the model.
+#
+# Build it ahead of time, next to the model, with
+#
+#   python -m scoring.price_table [model directory]
+#
+# and rebuild it whenever the price model is retrained. The directory
+# defaults to the app's, HOTEL_MODEL_DIR or models.
+import os
+import sys
+
+import numpy as np
+
+TABLE = 'price_table.npy'
+
+# Inclusive bounds of ['arrival_date_week_number', 'hotel', 'adults', 'nights_stay']
+BOUNDS = np.array([[1, 53], [1, 2], [1, 4], [1, 30]])
+SHAPE = tuple(BOUNDS[:, 1] - BOUNDS[:, 0] + 1)
+
+
+def build_table(estimator):
+    grid = np.indices(SHAPE).reshape(len(SHAPE), -1).T + BOUNDS[:, 0]
+    return estimator.predict(grid.astype(float)).reshape(SHAPE)
+
+
+class PriceTable:
+
+    def __init__(self, table, estimator):
+        if table.shape != SHAPE:
+            raise ValueError(f'Price table has shape {table.shape}, expected {SHAPE}')
+        self.table = table
+        self.estimator = estimator
+
+    @classmethod
+    def build(cls, estimator):
+        return cls(build_table(estimator), estimator)
+
+    @classmethod
+    def load(cls, estimator, path):
+        return cls(np.load(path), estimator)
+
+    def predict(self, X):
+        X = np.asarray(X, dtype=float)
+        index = X.astype(int) - BOUNDS[:, 0]
+        in_table = ((X == X.astype(int)) & (index >= 0) & (index < SHAPE)).all(axis=1)
+
+        prices = np.empty(len(X))
+        prices[in_table] = self.table[tuple(index[in_table].T)]
+        if not in_table.all():
+            prices[~in_table] = self.estimator.predict(X[~in_table])
+        return prices
+
+
+if __name__ == '__main__':
+    from joblib import load
+
+    from scoring import estimators
+
+    if len(sys.argv) > 2:
+        sys.exit('usage: python -m scoring.price_table [model directory]')
+    model_dir = sys.argv[1] if len(sys.argv) > 1 else estimators.MODEL_DIR
+    path = os.path.join(model_dir, TABLE)
+    # Written beside the destination and moved into place
+    with open(path + '.tmp', 'wb') as f:
+        np.save(f, build_table(load(os.path.join(model_dir, 'price_model.joblib'))))
+    os.replace(path + '.tmp', path)
+    print(f'Saved {path}')
@@ -0,0 +1,125 @@
+# Export of the price model for the browser. The decision tree is written to
+# assets/price_tree.js, which Dash serves with every page, and the clientside
+# callback in assets/clientside.js walks it to show the nightly rate and total
+# cost without a round trip to the server.
+#
+#   python -m scoring.price_tree [price_model.joblib]
+#
+# which exports the price model of the app's model directory unless given one.
+#
+# The export is checked against the estimator over every input the form
+# allows before it is written. The price bands saved beside the model, if
+# any, are exported with it. The predictions page exports the model again
+# whenever it reloads a new one (see refresh_asset), so pages opened after
+# that walk the new tree; pages already open show the server's price once it
+# comes back with the cancellation prediction. Every worker reloads, but the
+# file is only rewritten when the export changes, so the first worker to load
+# a new model writes it and the shipped model's export is never touched.
+import json
+import logging
+import os
+import sys
+import tempfile
+
+import numpy as np
+from joblib import load
+
+from scoring import estimators
+from scoring.assets import ASSETS_DIR
+from scoring.price_bands import BANDS
+from scoring.price_table import build_table, BOUNDS, SHAPE
+
+logger = logging.getLogger(__name__)
+
+ASSET_PATH = os.path.join(ASSETS_DIR, 'price_tree.js')
+
+
+def export_tree(estimator, bands=None):
+    # With the price bands (see scoring.price_bands), the low and high end of
+    # the band of every leaf as well
+    tree = estimator.tree_
+    leaf = tree.children_left == -1
+    exported = {'left': tree.children_left.tolist(),
+                'right': tree.children_right.tolist(),
+                'feature': np.where(leaf, -1, tree.feature).tolist(),
+                'threshold': np.where(leaf, 0, tree.threshold).tolist(),
+                'value': np.where(leaf, tree.value[:, 0, 0], 0).tolist()}
+    if bands is not None:
+        # Leaves no training stay reached have no band, given as null
+        for name, ends in (('low', bands[:, 0]), ('high', bands[:, -1])):
+            exported[name] = [None if not is_leaf or np.isnan(end) else end
+                              for is_leaf, end in zip(leaf.tolist(), ends.tolist())]
+    return exported
+
+
+def evaluate(exported, x):
+    # Same walk as estimatePrice in assets/clientside.js
+    node = 0
+    while exported['left'][node] != -1:
+        if x[exported['feature'][node]] <= exported['threshold'][node]:
+            node = exported['left'][node]
+        else:
+            node = exported['right'][node]
+    return exported['value'][node]
+
+
+def check(exported, estimator):
+    # The exported tree must give exactly the estimator's price everywhere
+    expected = build_table(estimator)
+    for index in np.ndindex(*SHAPE):
+        x = [int(i) for i in np.array(index) + BOUNDS[:, 0]]
+        if evaluate(exported, x) != expected[index]:
+            raise ValueError(f'Exported tree gives a different price for {x}')
+
+
+def write_asset(exported, path=ASSET_PATH):
+    # Returns whether the file was written. It is written to a temporary file
+    # of its own beside the destination and moved into place, as Dash may be
+    # serving it and other workers writing it
+    content = ('// Generated by `python -m scoring.price_tree` from the price model. '
+               'Do not edit.\n'
+               f'window.priceTree = {json.dumps(exported, separators=(",", ":"))};\n')
+    try:
+        with open(path) as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    # Not named .js, which Dash would serve
+    with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path), suffix='.tmp',
+                                     delete=False) as f:
+        f.write(content)
+    try:
+        os.chmod(f.name, 0o644)
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+    return True
+
+
+def export_model(path, asset_path=ASSET_PATH):
+    # Exports the model saved at path, with its bands, checked
+    estimator = load(path)
+    bands_path = os.path.join(os.path.dirname(path), BANDS)
+    bands = np.load(bands_path) if os.path.exists(bands_path) else None
+    exported = export_tree(estimator, bands)
+    check(exported, estimator)
+    return write_asset(exported, asset_path)
+
+
+def refresh_asset(version):
+    # Hook for estimators.on_reload of the price model
+    path = os.path.join(estimators.MODEL_DIR, 'price_model.joblib')
+    if not os.path.exists(path):
+        # A compact model only, which can't be exported
+        return
+    if export_model(path, ASSET_PATH):
+        logger.info('Exported price model version %s to %s', version, ASSET_PATH)
+
+
+if __name__ == '__main__':
+    path = (sys.argv[1] if len(sys.argv) > 1
+            else os.path.join(estimators.MODEL_DIR, 'price_model.joblib'))
+    export_model(path)
+    print(f'Saved {ASSET_PATH}')
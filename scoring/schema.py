@@ -0,0 +1,136 @@
+# Schema of the two models' inputs, the one definition of them shared by the
+# predictions page, batch scoring and training. For each feature, in the
+# order the model takes them: its dtype, the reservation field it is read
+# from (None for features derived from the arrival date or the price, and
+# for those the app doesn't ask for), the encoding of its categories as the
+# models were trained with, and its default.
+#
+# Categorical fields hold training codes from the form onwards: the page's
+# options are made from the encodings here, so what a user picks is what the
+# model was trained on.
+#
+# Inputs are float64, as the models take them, whatever each feature's
+# dtype: the dtypes say which values are valid. They are written a row or a
+# block of rows at a time into a new array copied from a template row of the
+# defaults, or into one the caller passes as out.
+import numpy as np
+
+# Ordinal encodings of the categorical columns, as used to train the models
+HOTEL = {'City Hotel': 1, 'Resort Hotel': 2}
+MEAL = {'SC': 0, 'BB': 1, 'HB': 2, 'FB': 3}
+DEPOSIT_TYPE = {'No Deposit': 0, 'Refundable': 1, 'Non Refund': 2}
+MARKET_SEGMENT = {'Direct': 1, 'Corporate': 2, 'Online TA': 3, 'Complementary': 0,
+                  'Aviation': 4, 'Offline TA/TO': 5, 'Undefined': 1}
+CUSTOMER_TYPE = {'Transient': 1, 'Transient-Party': 2, 'Contract': 3, 'Group': 4}
+
+
+class Feature:
+
+    def __init__(self, name, dtype, field=None, encoding=None, default=0):
+        self.name = name
+        self.dtype = np.dtype(dtype)
+        self.field = field
+        self.encoding = encoding
+        self.default = default
+        self.codes = None if encoding is None else np.unique(list(encoding.values()))
+        if self.codes is not None:
+            self.expected = 'one of ' + ', '.join(str(code) for code in self.codes)
+        elif self.dtype.kind == 'b':
+            self.expected = '0 or 1'
+        elif self.dtype.kind in 'iu':
+            self.expected = 'a whole number'
+        else:
+            self.expected = 'a number'
+
+    def valid(self, values):
+        # Which of an array of values the feature can take
+        ok = np.isfinite(values)
+        if self.dtype.kind in 'biu':
+            ok &= values == np.round(values)
+        if self.codes is not None:
+            ok &= np.isin(values, self.codes)
+        if self.dtype.kind == 'b':
+            ok &= (values == 0) | (values == 1)
+        return ok
+
+    def parse(self, value):
+        # A value of the feature's field from a form or a CSV, as the model
+        # takes it. Raises ValueError for anything else
+        try:
+            number = float(value)
+        except (TypeError, ValueError, OverflowError):
+            number = np.nan
+        if not self.valid(np.array([number]))[0]:
+            raise ValueError(f'{self.field} must be {self.expected}, not {value!r}')
+        return number
+
+
+class Schema:
+
+    def __init__(self, features):
+        self.features = features
+        self.names = [f.name for f in features]
+        self.columns = {f.name: i for i, f in enumerate(features)}
+        self.fields = {f.field: f for f in features if f.field is not None}
+        self.template = np.array([f.default for f in features], dtype=float)
+        self.template.flags.writeable = False
+
+    def __len__(self):
+        return len(self.features)
+
+    def empty(self, shape=()):
+        # Inputs of the given shape, a row for (), holding the defaults
+        out = np.empty(tuple(shape) + (len(self.features),))
+        out[...] = self.template
+        return out
+
+    def write(self, columns, values, out=None):
+        # values into the columns (an index array) of out, or of a new row
+        # of defaults. Given arrays of values, a block of rows of their shape
+        if out is None and not any(isinstance(value, np.ndarray) for value in values):
+            out = self.template.copy()
+        if out is not None and out.ndim == 1:
+            out[columns] = values
+            return out
+        values = np.broadcast_arrays(*values)
+        if out is None:
+            out = self.empty(values[0].shape)
+        out[..., columns] = np.stack(values, axis=-1)
+        return out
+
+
+PRICE = Schema([
+    Feature('arrival_date_week_number', 'int8'),
+    Feature('hotel', 'int8', 'hotel', HOTEL, HOTEL['City Hotel']),
+    Feature('adults', 'int8', 'num_adults', default=2),
+    Feature('nights_stay', 'int16', 'num_nights', default=1),
+])
+
+CANCELLATION = Schema([
+    Feature('hotel', 'int8', 'hotel', HOTEL, HOTEL['City Hotel']),
+    Feature('lead_time', 'int16'),
+    Feature('arrival_date_week_number', 'int8'),
+    Feature('adults', 'int8', 'num_adults', default=2),
+    Feature('meal', 'int8', 'meal_plan', MEAL, MEAL['SC']),
+    # Not asked for by the app, so always the default
+    Feature('market_segment', 'int8', encoding=MARKET_SEGMENT, default=MARKET_SEGMENT['Direct']),
+    Feature('is_repeated_guest', 'bool', 'prev_stay'),
+    Feature('previous_cancellations', 'int16', 'num_prev_cxl'),
+    Feature('booking_changes', 'int16'),
+    Feature('deposit_type', 'int8', 'deposit_type', DEPOSIT_TYPE, DEPOSIT_TYPE['No Deposit']),
+    Feature('days_in_waiting_list', 'int16'),
+    Feature('customer_type', 'int8', encoding=CUSTOMER_TYPE,
+            default=CUSTOMER_TYPE['Transient']),
+    Feature('adr', 'float64'),
+    Feature('required_car_parking_spaces', 'int8', 'num_cars'),
+    Feature('total_of_special_requests', 'int8', 'num_sr'),
+    Feature('nights_stay', 'int16', 'num_nights', default=1),
+    Feature('room_type_changed', 'bool'),
+])
+
+
+def options(field, labels):
+    # Options of a form input for a categorical field, labels by category,
+    # with the training code of each as its value
+    encoding = CANCELLATION.fields[field].encoding
+    return [{'label': label, 'value': encoding[category]} for category, label in labels.items()]
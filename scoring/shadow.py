@@ -0,0 +1,130 @@
+# Shadow scoring of a candidate cancellation model, set with
+# HOTEL_SHADOW_MODEL to its joblib file (or a packed or compact directory).
+# Every batch the live model scores on the request path is queued here and
+# scored again by the candidate on a background thread, so the candidate
+# never slows a response. The latency of both and the differences between
+# their probabilities are accumulated, logged every LOG_EVERY batches and
+# served at /api/shadow.
+#
+# When the queue is full, because the candidate is slower than the traffic,
+# batches are dropped and counted rather than queued without bound. Promote a
+# candidate by moving its file over the live model's; the workers pick it up
+# without a restart (see scoring.estimators).
+import logging
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+from joblib import load
+
+from scoring.compiled import CompiledTrees
+
+logger = logging.getLogger(__name__)
+
+SHADOW_MODEL = os.environ.get('HOTEL_SHADOW_MODEL')
+QUEUE_SIZE = int(os.environ.get('HOTEL_SHADOW_QUEUE_SIZE', 100))
+LOG_EVERY = 100
+
+
+def _version(path):
+    # Changes when the candidate is replaced
+    stat = os.stat(os.path.join(path, 'meta.json') if os.path.isdir(path) else path)
+    return f'{stat.st_size}-{stat.st_mtime_ns}'
+
+
+def load_candidate(path):
+    if os.path.isdir(path):
+        return CompiledTrees.load(path)
+    estimator = load(path)
+    # Scored off the request path, it shouldn't take cores from it
+    if hasattr(estimator, 'n_jobs'):
+        estimator.n_jobs = 1
+    return estimator
+
+
+class Shadow:
+
+    def __init__(self, path, queue_size=QUEUE_SIZE):
+        self.path = path
+        self._queue = queue.Queue(queue_size)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._model = None
+        self._version = None
+        self.reset()
+
+    def reset(self):
+        with self._stats_lock:
+            self.batches = self.rows = self.dropped = self.errors = 0
+            self.live_seconds = self.shadow_seconds = 0.0
+            self.abs_delta_sum = self.max_abs_delta = 0.0
+
+    def submit(self, X, probabilities, seconds):
+        # Called on the request path: never blocks
+        if self._thread is None:
+            # Started in the worker that uses it, not in a parent before a fork
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='shadow-scoring',
+                                                    daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait((np.array(X, dtype=float), probabilities, seconds))
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+
+    def _candidate(self):
+        version = _version(self.path)
+        if version != self._version:
+            self._model = load_candidate(self.path)
+            self._version = version
+            logger.info('Shadow scoring with %s (version %s)', self.path, version)
+        return self._model
+
+    def _run(self):
+        while True:
+            X, live, live_seconds = self._queue.get()
+            try:
+                model = self._candidate()
+                start = time.perf_counter()
+                shadow = model.predict_proba(X)[:, 1]
+                seconds = time.perf_counter() - start
+            except Exception:
+                logger.exception('Shadow scoring failed')
+                with self._stats_lock:
+                    self.errors += 1
+                continue
+
+            delta = np.abs(shadow - live)
+            with self._stats_lock:
+                self.batches += 1
+                self.rows += len(X)
+                self.live_seconds += live_seconds
+                self.shadow_seconds += seconds
+                self.abs_delta_sum += float(delta.sum())
+                self.max_abs_delta = max(self.max_abs_delta, float(delta.max()))
+                log = self.batches % LOG_EVERY == 0
+            if log:
+                stats = self.stats()
+                logger.info('Shadow: %d batches, live %.2f ms, shadow %.2f ms, '
+                            'mean |delta| %.4f, max |delta| %.4f, %d dropped',
+                            stats['batches'], stats['live_ms'], stats['shadow_ms'],
+                            stats['mean_abs_delta'], stats['max_abs_delta'], stats['dropped'])
+
+    def stats(self):
+        with self._stats_lock:
+            batches = max(self.batches, 1)
+            return {'model': self.path, 'version': self._version, 'batches': self.batches,
+                    'rows': self.rows, 'dropped': self.dropped, 'errors': self.errors,
+                    'queued': self._queue.qsize(),
+                    'live_ms': self.live_seconds / batches * 1000,
+                    'shadow_ms': self.shadow_seconds / batches * 1000,
+                    'mean_abs_delta': self.abs_delta_sum / max(self.rows, 1),
+                    'max_abs_delta': self.max_abs_delta}
+
+
+shadow = Shadow(SHADOW_MODEL) if SHADOW_MODEL else None
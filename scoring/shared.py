@@ -0,0 +1,62 @@
+# Shared, read-only residency of the models across worker processes. The node
+# arrays of each model are packed once into a directory on a memory backed
+# filesystem, and every worker memory maps the same files instead of
+# unpickling its own copy, so the trees are resident once per machine.
+#
+# Each packing is named after the size and modification time of the joblib
+# file it came from, so a retrained model is packed afresh, and it is renamed
+# into place when complete so workers never attach to a partial one.
+import os
+import shutil
+import sys
+import tempfile
+
+from joblib import load
+
+from scoring.compiled import compile_estimator
+
+SHARED_DIR = os.environ.get(
+    'HOTEL_SHARED_DIR',
+    os.path.join('/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir(),
+                 'hotel-app'))
+
+
+def packed_path(name, model_dir):
+    stat = os.stat(os.path.join(model_dir, name + '.joblib'))
+    return os.path.join(SHARED_DIR, f'{name}-{stat.st_size}-{stat.st_mtime_ns}.packed')
+
+
+def publish(name, model_dir):
+    # Pack the model into the shared directory unless it already is, and
+    # return the path to attach to
+    path = packed_path(name, model_dir)
+    if os.path.isdir(path):
+        return path
+
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=f'.{name}-', dir=SHARED_DIR)
+    try:
+        compile_estimator(load(os.path.join(model_dir, name + '.joblib'))).save(staging)
+        os.rename(staging, path)
+    except OSError:
+        # Another process published the same version first
+        if not os.path.isdir(path):
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    # Drop packings of older versions of this model
+    for entry in os.listdir(SHARED_DIR):
+        stale = os.path.join(SHARED_DIR, entry)
+        if entry.startswith(name + '-') and entry.endswith('.packed') and stale != path:
+            shutil.rmtree(stale, ignore_errors=True)
+    return path
+
+
+if __name__ == '__main__':
+    # Publish the models in a model directory, e.g. python -m scoring.shared models
+    for name in ('price_model', 'cancellation_model'):
+        try:
+            print(publish(name, sys.argv[1]))
+        except TypeError as e:
+            print(f'Not publishing {name}, served by sklearn instead: {e}')
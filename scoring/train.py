@@ -0,0 +1,217 @@
+# Trains the two models from a bookings file shaped like hotel_bookings.csv,
+# or a store ingested from one with scoring.datastore, following
+# notebooks/Model.ipynb, and writes them with their metadata into the model
+# directory.
+#
+#   python -m scoring.train hotel_bookings.csv [--out models] [--jobs -1]
+#
+# The prepared data (target fix, train/validation/test split, encoding and
+# imputation) is cached on disk per version of the bookings file, so it is
+# computed once and reused by every candidate and by later runs. Candidate
+# cancellation models are fitted and scored in parallel, one per process,
+# and the one with the best validation ROC-AUC is kept.
+import argparse
+import datetime as dt
+import json
+import os
+import time
+
+import numpy as np
+import sklearn
+from joblib import Memory, Parallel, delayed, dump
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import (accuracy_score, mean_absolute_error, precision_score, r2_score,
+                             recall_score, roc_auc_score)
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeRegressor
+
+try:
+    from imblearn.over_sampling import SMOTE
+except ImportError:
+    SMOTE = None
+
+from scoring import datastore, encoding
+from scoring.drift import PROFILE, reference_profile, save_profile
+from scoring.evaluation import EVALUATION, evaluate as evaluate_model, save_report
+from scoring.explain import REFERENCE_SAMPLE, save_reference_sample
+from scoring.features import CXL_FEATURES, PRICE_FEATURES, cat_map
+from scoring.price_bands import BANDS, QUANTILES, leaf_bands, save_bands
+
+CACHE_DIR = os.path.join('.cache', 'train')
+RANDOM_STATE = 42
+
+# The price model takes its four features in PRICE_FEATURES order
+PRICE_COLUMNS = [CXL_FEATURES.index(f) for f in PRICE_FEATURES]
+
+
+def prepare_data(path, version):
+    # `version` only keys the cache, so changed data is prepared afresh
+    columns = datastore.read(path)
+    X = datastore.matrix(columns)
+    y = np.asarray(columns[datastore.TARGET])
+
+    # Train, validation, test split
+    train, test = train_test_split(np.arange(len(y)), test_size=.3,
+                                   random_state=RANDOM_STATE, stratify=y)
+    train, val = train_test_split(train, test_size=.3, random_state=RANDOM_STATE,
+                                  stratify=y[train])
+
+    # The imputer is fitted on the training set only
+    means = np.nanmean(X[train], axis=0)
+    X = encoding.impute(X, means)
+    adr = CXL_FEATURES.index('adr')
+    return {
+        'X_train': X[train], 'X_val': X[val], 'X_test': X[test],
+        'y_train': y[train], 'y_val': y[val], 'y_test': y[test],
+        'imputer_means': means,
+        'price_X_train': X[np.ix_(train, PRICE_COLUMNS)], 'price_y_train': X[train, adr],
+        'price_X_val': X[np.ix_(val, PRICE_COLUMNS)], 'price_y_val': X[val, adr],
+    }
+
+
+def undersample(X, y, random_state=RANDOM_STATE):
+    # Every row of the minority class and as many drawn from the majority,
+    # as imblearn's RandomUnderSampler
+    rng = np.random.RandomState(random_state)
+    classes, counts = np.unique(y, return_counts=True)
+    keep = [rng.choice(np.flatnonzero(y == c), counts.min(), replace=False) for c in classes]
+    keep = np.sort(np.concatenate(keep))
+    return X[keep], y[keep]
+
+
+def smote(X, y):
+    return SMOTE(random_state=RANDOM_STATE).fit_resample(X, y)
+
+
+def logistic_regression():
+    return make_pipeline(StandardScaler(), LogisticRegression(solver='lbfgs', max_iter=1000))
+
+
+def random_forest():
+    return RandomForestClassifier(random_state=RANDOM_STATE, n_jobs=1, max_depth=35,
+                                  min_samples_leaf=1, min_samples_split=2,
+                                  n_estimators=100)
+
+
+# Candidate cancellation models, the notebook's pipelines: (model, how its
+# training set is resampled). SMOTE needs the optional imbalanced-learn
+CANDIDATES = {
+    'logistic_regression': (logistic_regression, None),
+    'logistic_regression_undersampled': (logistic_regression, undersample),
+    'random_forest': (random_forest, None),
+    'random_forest_undersampled': (random_forest, undersample),
+}
+if SMOTE is not None:
+    CANDIDATES['logistic_regression_smote'] = (logistic_regression, smote)
+    CANDIDATES['random_forest_smote'] = (random_forest, smote)
+
+
+def evaluate(name, X_train, y_train, X_val, y_val):
+    make_model, resample = CANDIDATES[name]
+    if resample is not None:
+        X_train, y_train = resample(X_train, y_train)
+    start = time.perf_counter()
+    model = make_model().fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+
+    probabilities = model.predict_proba(X_val)[:, 1]
+    predictions = probabilities >= 0.5
+    metrics = {'roc_auc': roc_auc_score(y_val, probabilities),
+               'accuracy': accuracy_score(y_val, predictions),
+               'precision': precision_score(y_val, predictions),
+               'recall': recall_score(y_val, predictions),
+               'fit_seconds': fit_seconds}
+    return name, model, metrics
+
+
+def _dump(obj, path):
+    # Written beside the destination and moved into place, so a worker
+    # never loads a half written model
+    dump(obj, path + '.tmp', compress=True)
+    os.replace(path + '.tmp', path)
+
+
+def train(path, out='models', jobs=-1, candidates=None, cache_dir=CACHE_DIR):
+    start = time.perf_counter()
+    memory = Memory(cache_dir, verbose=0)
+    data = memory.cache(prepare_data)(path, datastore.version(path))
+
+    names = candidates or list(CANDIDATES)
+    results = Parallel(n_jobs=jobs)(
+        delayed(evaluate)(name, data['X_train'], data['y_train'], data['X_val'], data['y_val'])
+        for name in names)
+    best_name, best_model, _ = max(results, key=lambda result: result[2]['roc_auc'])
+
+    # Serve with every core, as the notebook's model did
+    if isinstance(best_model, RandomForestClassifier):
+        best_model.n_jobs = -1
+    price_model = DecisionTreeRegressor(random_state=RANDOM_STATE).fit(
+        data['price_X_train'], data['price_y_train'])
+    price_predictions = price_model.predict(data['price_X_val'])
+
+    os.makedirs(out, exist_ok=True)
+    _dump(best_model, os.path.join(out, 'cancellation_model.joblib'))
+    _dump(price_model, os.path.join(out, 'price_model.joblib'))
+    save_bands(leaf_bands(price_model, data['price_X_train'], data['price_y_train']),
+               os.path.join(out, BANDS))
+    save_reference_sample(data['X_val'], os.path.join(out, REFERENCE_SAMPLE))
+    save_profile(reference_profile(data['X_train']), os.path.join(out, PROFILE))
+    # The chosen model on the test split, untouched until now
+    report = evaluate_model(data['y_test'], best_model.predict_proba(data['X_test'])[:, 1],
+                            jobs=jobs)
+    save_report(report, os.path.join(out, EVALUATION))
+
+    metadata = {
+        'created': dt.datetime.now().isoformat(timespec='seconds'),
+        'data': os.path.abspath(path),
+        'data_version': datastore.version(path),
+        'rows': {'train': len(data['y_train']), 'validation': len(data['y_val']),
+                 'test': len(data['y_test'])},
+        'sklearn_version': sklearn.__version__,
+        'cancellation_model': best_name,
+        'features': CXL_FEATURES,
+        'price_features': PRICE_FEATURES,
+        # Codes the categoricals were trained with, which the app's inputs use
+        'encodings': {column['col']: column['mapping'] for column in cat_map},
+        'price_band_quantiles': QUANTILES,
+        'candidates': {name: metrics for name, _, metrics in results},
+        'test_roc_auc': report['auc'],
+        'price_metrics': {'mae': mean_absolute_error(data['price_y_val'], price_predictions),
+                          'r2': r2_score(data['price_y_val'], price_predictions)},
+        'imputer_means': dict(zip(CXL_FEATURES, data['imputer_means'].tolist())),
+        'training_seconds': time.perf_counter() - start,
+    }
+    # Written last, and moved into place like the models
+    path = os.path.join(out, encoding.METADATA)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(metadata, f, indent=2)
+    os.replace(path + '.tmp', path)
+    return metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the price and cancellation models')
+    parser.add_argument('data', help='CSV shaped like hotel_bookings.csv, or a store of one')
+    parser.add_argument('--out', default='models', help='model directory to write to')
+    parser.add_argument('--jobs', type=int, default=-1,
+                        help='candidates fitted at once, default: one per core')
+    parser.add_argument('--candidates', nargs='+', choices=list(CANDIDATES),
+                        help='default: all of them')
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    args = parser.parse_args()
+
+    metadata = train(args.data, args.out, args.jobs, args.candidates, args.cache_dir)
+    for name, metrics in metadata['candidates'].items():
+        print(f"{name:34} ROC-AUC {metrics['roc_auc']:.4f}  accuracy {metrics['accuracy']:.4f}  "
+              f"fit {metrics['fit_seconds']:.1f} s")
+    print(f"{'price':34} MAE {metadata['price_metrics']['mae']:.2f}  "
+          f"R2 {metadata['price_metrics']['r2']:.4f}")
+    print(f"Saved {metadata['cancellation_model']} to {args.out} "
+          f"in {metadata['training_seconds']:.1f} s")
+
+
+if __name__ == '__main__':
+    main()
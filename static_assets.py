@@ -0,0 +1,139 @@
+# Serving of the static files built by python -m scoring.assets. Built
+# images are named by a hash of their content, so they are served from
+# /static-assets/ as immutable, cached for a year by browsers and CDNs. The
+# pages show them with image(), which lists the resized variants in srcset
+# and prefers WebP where the browser takes it.
+#
+# Dash bundles and the scripts in assets/ are still requested at Dash's own
+# URLs; where the build has a brotli or gzip copy the browser accepts, it is
+# sent instead of the file, with no compression at request time. Fingerprinted
+# bundles and scripts cache-busted by Dash are immutable as well.
+#
+# Without a build, or for a source changed since it, everything is served as
+# before.
+import json
+import mimetypes
+import os
+import sys
+
+import dash_html_components as html
+from dash.fingerprint import check_fingerprint
+from flask import request, send_file, send_from_directory
+
+from app import app, server
+from scoring.assets import ASSETS_DIR, MANIFEST, STATIC_DIR, digest
+from scoring.estimators import file_version
+
+URL_PREFIX = '/static-assets/'
+IMMUTABLE = 'public, max-age=31536000, immutable'
+
+# Preferred first
+ENCODINGS = ('br', 'gzip')
+
+
+def _current(entries, read):
+    # Entries whose source is unchanged since the build
+    current = {}
+    for name, entry in entries.items():
+        try:
+            if digest(read(name)) == entry['hash']:
+                current[name] = entry
+        except OSError:
+            pass
+    return current
+
+
+def _read_asset(name):
+    with open(os.path.join(ASSETS_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def load_manifest(directory=STATIC_DIR):
+    path = os.path.join(directory, MANIFEST)
+    if not os.path.exists(path):
+        return {'images': {}, 'bundles': {}, 'scripts': {}}
+    with open(path) as f:
+        manifest = json.load(f)
+    manifest['images'] = _current(manifest['images'], _read_asset)
+    manifest['scripts'] = _current(manifest['scripts'], _read_asset)
+    # Scripts can be rewritten while the app runs (scoring.price_tree does)
+    for name, entry in manifest['scripts'].items():
+        entry['version'] = file_version(os.path.join(ASSETS_DIR, name))
+    return manifest
+
+
+manifest = load_manifest()
+
+
+def _srcset(variants):
+    return ', '.join(f'{URL_PREFIX}images/{filename} {width}w' for filename, width in variants)
+
+
+def image(name, sizes='100vw', **kwargs):
+    # An image in assets/ at the size the layout needs: the built variants in
+    # srcset, WebP first, or the original without a build
+    entry = manifest['images'].get(name)
+    if entry is None:
+        return html.Img(src=f'assets/{name}', **kwargs)
+    src = URL_PREFIX + 'images/' + entry['src']
+    variants = dict(entry['variants'])
+    if not variants:
+        return html.Img(src=src, **kwargs)
+    webp = variants.pop('webp', None)
+    own = next(iter(variants.values()))
+    # Width and height reserve the space before the image arrives
+    img = html.Img(src=src, srcSet=_srcset(own), sizes=sizes, width=entry['width'],
+                   height=entry['height'], **kwargs)
+    if webp is None:
+        return img
+    return html.Picture([html.Source(srcSet=_srcset(webp), sizes=sizes, type='image/webp'), img])
+
+
+@server.route(URL_PREFIX + '<path:filename>', methods=['GET'])
+def static_asset(filename):
+    response = send_from_directory(os.path.abspath(STATIC_DIR), filename)
+    response.headers['Cache-Control'] = IMMUTABLE
+    return response
+
+
+def _precompressed(entry, name, immutable):
+    accepted = request.accept_encodings
+    for encoding in ENCODINGS:
+        if encoding in entry['encodings'] and encoding in accepted:
+            path = os.path.join(STATIC_DIR, entry['dir'], entry['encodings'][encoding])
+            response = send_file(os.path.abspath(path),
+                                 mimetype=mimetypes.guess_type(name)[0] or 'application/octet-stream')
+            response.headers['Content-Encoding'] = encoding
+            # send_file names the compressed file, which isn't what was asked for
+            response.headers.pop('Content-Disposition', None)
+            response.headers['Vary'] = 'Accept-Encoding'
+            if immutable:
+                response.headers['Cache-Control'] = IMMUTABLE
+            return response
+    return None
+
+
+@server.before_request
+def serve_precompressed():
+    # Bundles and scripts answered from the build, see the top. Returning
+    # None lets Dash serve the request itself
+    path = request.path
+    suites = app.config.requests_pathname_prefix + '_dash-component-suites/'
+    assets = app.config.requests_pathname_prefix + 'assets/'
+    if path.startswith(suites):
+        package, _, fingerprinted = path[len(suites):].partition('/')
+        name, fingerprint = check_fingerprint(fingerprinted)
+        entry = manifest['bundles'].get(f'{package}/{name}')
+        # Only for the version of the package that was built
+        if entry is None or entry['version'] != getattr(sys.modules.get(package),
+                                                        '__version__', None):
+            return None
+        return _precompressed(entry, name, fingerprint)
+    if path.startswith(assets):
+        name = path[len(assets):]
+        entry = manifest['scripts'].get(name)
+        if entry is None or entry['version'] != file_version(os.path.join(ASSETS_DIR, name)):
+            return None
+        # Dash adds the modification time to the URL of each asset
+        return _precompressed(entry, name, 'm' in request.args)
+    return None
@@ -0,0 +1,74 @@
+# Makes the application's packages, and the benchmarks' stand-in models,
+# importable from the tests, run from the repository root with python -m pytest
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+
+@pytest.fixture(scope='session')
+def model_dir(tmp_path_factory):
+    # Small models of the app's shapes, trained on synthetic reservations
+    from suite import standin_models
+
+    return standin_models(str(tmp_path_factory.mktemp('models')), rows=2000)
+
+
+@pytest.fixture
+def server(model_dir, monkeypatch):
+    # The app's Flask server, serving the stand-in models
+    from scoring import estimators
+    from scoring.cache import prediction_cache
+
+    monkeypatch.setattr(estimators, 'MODEL_DIR', model_dir)
+    monkeypatch.setattr(estimators, '_estimators', {})
+    prediction_cache.clear()
+    import run
+
+    return run.server
+
+
+@pytest.fixture
+def make_bookings():
+    # Raw bookings shaped like hotel_bookings.csv, with their outcomes
+    import numpy as np
+    import pandas as pd
+
+    def make(rows, random_state=0):
+        rng = np.random.default_rng(random_state)
+        lead_time = rng.gamma(1.5, 70, rows).round().astype(int)
+        deposit = rng.choice(['No Deposit', 'Refundable', 'Non Refund'], rows,
+                             p=[0.85, 0.02, 0.13])
+        canceled = rng.random(rows) < 1 / (1 + np.exp(1.5 - 0.008 * lead_time
+                                                      - 3 * (deposit == 'Non Refund')))
+        rooms = rng.choice(list('ABCD'), rows)
+        return pd.DataFrame({
+            'hotel': rng.choice(['City Hotel', 'Resort Hotel'], rows),
+            'lead_time': lead_time,
+            'arrival_date_week_number': rng.integers(1, 54, rows),
+            'adults': rng.integers(1, 5, rows),
+            'meal': rng.choice(['SC', 'BB', 'HB', 'FB'], rows),
+            'market_segment': rng.choice(['Direct', 'Corporate', 'Online TA',
+                                          'Offline TA/TO'], rows),
+            'is_repeated_guest': (rng.random(rows) < 0.05).astype(int),
+            'previous_cancellations': rng.poisson(0.1, rows),
+            'booking_changes': rng.poisson(0.2, rows),
+            'deposit_type': deposit,
+            'days_in_waiting_list': np.zeros(rows, dtype=int),
+            'customer_type': rng.choice(['Transient', 'Transient-Party', 'Contract', 'Group'],
+                                        rows),
+            'adr': rng.normal(100, 35, rows).clip(20, 400).round(2),
+            'required_car_parking_spaces': (rng.random(rows) < 0.06).astype(int),
+            'total_of_special_requests': rng.poisson(0.6, rows),
+            'stays_in_weekend_nights': rng.integers(0, 3, rows),
+            'stays_in_week_nights': rng.integers(0, 6, rows),
+            'reserved_room_type': rooms,
+            'assigned_room_type': np.where(rng.random(rows) < 0.12, 'E', rooms),
+            'reservation_status': np.where(canceled, 'Canceled', 'Check-Out'),
+        })
+
+    return make
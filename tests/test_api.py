@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+
+import pytest
+
+from scoring import batch
+from suite import FORM, forms
+
+
+def reservations(count, random_state=0):
+    return [dict(zip(FORM, form), id=f'r{i}')
+            for i, form in enumerate(forms(count, random_state))]
+
+
+def test_json_reservations_are_scored(server):
+    records = reservations(5)
+    response = server.test_client().post('/api/score', json=records)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    expected = batch.score(records, record=False)
+    assert [row['id'] for row in rows] == [record['id'] for record in records]
+    for row, (adr, total, probability) in zip(rows, expected):
+        assert (row['adr'], row['total']) == (adr, total)
+        assert row['cancellation_probability'] == pytest.approx(probability)
+
+
+def test_reservations_can_be_wrapped_in_an_object(server):
+    response = server.test_client().post('/api/score',
+                                         json={'reservations': reservations(2)})
+    assert response.status_code == 200
+    assert len(response.get_data(as_text=True).splitlines()) == 2
+
+
+def test_csv_reservations_are_scored(server):
+    records = reservations(4)
+    body = io.StringIO()
+    writer = csv.DictWriter(body, ['id'] + FORM)
+    writer.writeheader()
+    writer.writerows(records)
+    response = server.test_client().post('/api/score', data=body.getvalue(),
+                                         content_type='text/csv')
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row['id'] for row in rows] == [record['id'] for record in records]
+    expected = batch.score(records, record=False)
+    assert [float(row['adr']) for row in rows] == [adr for adr, _, _ in expected]
+    assert ([float(row['cancellation_probability']) for row in rows]
+            == pytest.approx([probability for _, _, probability in expected]))
+
+
+@pytest.mark.parametrize('body', [
+    {'not': 'a list'},
+    [{'arrival_date': '2030-01-01'}],
+    [dict(reservations(1)[0], num_adults='two')],
+    [dict(reservations(1)[0], arrival_date='yesterday')],
+])
+def test_missing_or_invalid_fields_are_rejected(server, body):
+    response = server.test_client().post('/api/score', json=body)
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_large_batches_are_streamed(server):
+    records = reservations(5000, random_state=1)
+    response = server.test_client().post('/api/score', json=records)
+    assert response.status_code == 200
+    assert response.is_streamed
+    lines = response.get_data(as_text=True).splitlines()
+    assert len(lines) == 5000
+    assert json.loads(lines[-1])['id'] == 'r4999'
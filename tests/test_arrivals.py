@@ -0,0 +1,58 @@
+import datetime as dt
+
+import pytest
+
+from scoring import batch
+from scoring.arrivals import arrival_cache, score_arrival_dates
+
+# num_adults, num_nights, meal_plan, hotel, num_cars, num_sr, prev_stay,
+# num_prev_cxl, deposit_type
+FORM = (2, 3, 0, 1, 0, 1, 0, 0, 0)
+
+
+def test_every_date_scores_as_it_would_alone(server):
+    first = dt.date.today() + dt.timedelta(days=5)
+    dates, results = score_arrival_dates(first, first + dt.timedelta(days=9), *FORM)
+    assert dates == [first + dt.timedelta(days=i) for i in range(10)]
+    for date, result in zip(dates, results):
+        record = dict(zip(batch.FIELDS, (date.isoformat(),) + FORM))
+        (expected,) = batch.score([record], record=False)
+        assert result[:2] == expected[:2]
+        assert result[2] == pytest.approx(expected[2])
+
+
+def test_a_redraw_is_cached(server):
+    first = dt.date.today() + dt.timedelta(days=1)
+    last = first + dt.timedelta(days=6)
+    hits = arrival_cache.stats()['hits']
+    assert score_arrival_dates(first, last, *FORM) is score_arrival_dates(first, last, *FORM)
+    assert arrival_cache.stats()['hits'] == hits + 1
+    # Another form is another entry
+    other = score_arrival_dates(first, last, *((1,) + FORM[1:]))
+    assert arrival_cache.stats()['hits'] == hits + 1
+    assert other[1] != score_arrival_dates(first, last, *FORM)[1]
+
+
+def test_no_dates_after_the_last(server):
+    today = dt.date.today()
+    assert score_arrival_dates(today, today - dt.timedelta(days=1), *FORM) == ([], [])
+
+
+def test_calendar_has_a_cell_per_date(server):
+    from pages.predictions import arrival_heatmap
+
+    # Wednesday 21 October to Friday 30 October 2026: two weeks from Monday
+    # the 19th, with the Monday and Tuesday of the first and the weekend of
+    # the second empty
+    dates = [dt.date(2026, 10, 21) + dt.timedelta(days=i) for i in range(10)]
+    results = [(100 + i, 300 + i, i / 8) for i in range(10)]
+    heatmap = arrival_heatmap(dates, results, 'cxl').data[0]
+
+    assert list(heatmap.x) == [dt.date(2026, 10, 19), dt.date(2026, 10, 26)]
+    cells = [(day, week) for day in range(7) for week in range(2)
+             if heatmap.z[day][week] is not None]
+    assert len(cells) == 10
+    assert [heatmap.z[day][0] for day in range(7)] == [None, None, 0, 12.5, 25, 37.5, 50]
+    assert [heatmap.z[day][1] for day in range(7)] == [62.5, 75, 87.5, 100, 112.5, None, None]
+    assert heatmap.customdata[4][1] == '2026-10-30'
+    assert arrival_heatmap(dates, results, 'adr').data[0].z[4][1] == 109
@@ -0,0 +1,103 @@
+import concurrent.futures
+import threading
+
+import numpy as np
+import pytest
+
+from scoring import batching
+from scoring.batching import MicroBatcher
+
+
+class Model:
+    # Sums each row, recording the batches it was called with. Waits for
+    # release before scoring, so tests can queue rows behind a batch
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, X):
+        self.release.wait()
+        self.batches.append(np.array(X))
+        if self.fail:
+            raise RuntimeError('model failed')
+        return np.asarray(X).sum(axis=1)
+
+
+def in_threads(predict, rows):
+    # Results of predict([row]) for each row, called from a thread each
+    results, errors = [None] * len(rows), [None] * len(rows)
+
+    def call(i):
+        try:
+            results[i] = predict([rows[i]])
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(rows))]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_each_caller_gets_its_own_rows_results():
+    model = Model()
+    batcher = MicroBatcher('test', model, window=0.05, max_size=64)
+    rows = [[i, 1.0] for i in range(20)]
+    threads, results, errors = in_threads(batcher.predict, rows)
+    for thread in threads:
+        thread.join()
+    assert errors == [None] * 20
+    assert [r.tolist() for r in results] == [[i + 1.0] for i in range(20)]
+    assert batcher.stats()['rows'] == 20
+    assert batcher.stats()['batches'] < 20
+
+
+def test_equal_rows_waiting_together_are_scored_once():
+    model = Model()
+    model.release.clear()
+    batcher = MicroBatcher('test', model, window=0, max_size=64)
+    # The first batch holds the scorer while the duplicates queue up
+    first, _, _ = in_threads(batcher.predict, [[0.0, 0.0]])
+    threads, results, errors = in_threads(batcher.predict, [[1.0, 2.0]] * 10)
+    while batcher.stats()['deduplicated'] < 9:
+        threading.Event().wait(0.001)
+    model.release.set()
+    for thread in first + threads:
+        thread.join()
+    assert [r.tolist() for r in results] == [[3.0]] * 10
+    assert sum((batch == [1.0, 2.0]).all(axis=1).sum() for batch in model.batches) == 1
+    assert batcher.stats()['deduplicated'] == 9
+
+
+def test_a_failed_batch_fails_every_caller_in_it():
+    model = Model(fail=True)
+    batcher = MicroBatcher('test', model, window=0.05, max_size=64)
+    threads, results, errors = in_threads(batcher.predict, [[i, 0.0] for i in range(5)])
+    for thread in threads:
+        thread.join()
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert batcher.stats()['errors'] >= 1
+    # The batcher keeps going after a failure
+    model.fail = False
+    assert batcher.predict([[1.0, 1.0]]).tolist() == [2.0]
+
+
+def test_large_calls_go_straight_to_the_model():
+    model = Model()
+    batcher = MicroBatcher('test', model, max_size=4)
+    X = np.arange(10.0).reshape(5, 2)
+    assert batcher.predict(X).tolist() == X.sum(axis=1).tolist()
+    assert batcher.stats()['batches'] == 0 and len(model.batches) == 1
+
+
+def test_callers_give_up_after_the_timeout(monkeypatch):
+    model = Model()
+    model.release.clear()
+    monkeypatch.setattr(batching, 'TIMEOUT', 0.05)
+    batcher = MicroBatcher('test', model, window=0, max_size=64)
+    with pytest.raises(concurrent.futures.TimeoutError):
+        batcher.predict([[1.0, 1.0]])
+    assert batcher.stats()['timeouts'] == 1
+    model.release.set()
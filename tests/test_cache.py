@@ -0,0 +1,48 @@
+import datetime as dt
+
+from scoring.cache import PredictionCache
+
+
+def test_least_recently_used_is_evicted():
+    cache = PredictionCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_hits_and_misses_are_counted():
+    cache = PredictionCache(maxsize=4)
+    cache.put(('key', 1), 0.25)
+    cache.get(('key', 1))
+    cache.get(('key', 2))
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate'], stats['size']) == (1, 1, 0.5, 1)
+
+
+def test_putting_a_key_again_replaces_it():
+    cache = PredictionCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('a', 2)
+    assert cache.get('a') == 2 and cache.stats()['size'] == 1
+
+
+def test_size_zero_caches_nothing():
+    cache = PredictionCache(maxsize=0)
+    cache.put('a', 1)
+    assert cache.get('a') is None and cache.stats()['size'] == 0
+
+
+def test_entries_expire_when_the_day_rolls_over():
+    cache = PredictionCache(maxsize=4)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    # As if they had been put yesterday
+    cache._day -= dt.timedelta(days=1)
+    assert cache.get('a') is None
+    stats = cache.stats()
+    assert (stats['expirations'], stats['size']) == (2, 0)
+    assert stats['day'] == dt.date.today().isoformat()
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from scoring.compact import _float32_floor, _quantize, compact, save
+from scoring.compiled import CompiledTrees, compile_estimator
+
+
+def forest(seed=0):
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([rng.integers(0, 300, 800), rng.uniform(0, 250, 800),
+                         rng.integers(0, 3, 800)]).astype(float)
+    y = (X[:, 0] / 300 + X[:, 1] / 250 + rng.normal(0, 0.3, 800) > 1).astype(int)
+    model = RandomForestClassifier(n_estimators=10, random_state=seed).fit(X, y)
+    return model, X
+
+
+def test_float32_thresholds_split_float32_inputs_as_before():
+    rng = np.random.default_rng(0)
+    thresholds = rng.uniform(0, 1000, 10000)
+    floor = _float32_floor(thresholds)
+    assert (floor.astype(np.float64) <= thresholds).all()
+    x = np.concatenate([floor, np.nextafter(floor, np.float32(np.inf))])
+    below = np.concatenate([thresholds, thresholds])
+    np.testing.assert_array_equal(x <= np.concatenate([floor, floor]),
+                                  x.astype(np.float64) <= below)
+
+
+@pytest.mark.parametrize('bits', [8, 16])
+def test_quantized_probabilities_add_up_to_the_scale(bits):
+    value = np.random.default_rng(0).dirichlet([1, 1], size=500)
+    quantized, scale = _quantize(value, bits)
+    assert scale == 2 ** bits - 1
+    assert (quantized.sum(axis=1) == scale).all() and (quantized >= 0).all()
+    assert np.abs(quantized / scale - value).max() <= 1 / scale
+
+
+@pytest.mark.parametrize('bits', [8, 16])
+def test_compact_model_is_close_to_the_forest(bits):
+    model, X = forest()
+    compacted = compact(compile_estimator(model), bits=bits)
+    # Each tree's probability is off by at most one step of the scale
+    np.testing.assert_allclose(compacted.predict_proba(X), model.predict_proba(X),
+                               atol=1 / (2 ** bits - 1))
+    # Redundant subtrees are folded, so it is never larger
+    assert len(compacted.right) <= len(compile_estimator(model).right)
+
+
+def test_saved_and_loaded_compact_model_predicts_the_same(tmp_path):
+    model, X = forest(1)
+    compacted = compact(compile_estimator(model), max_depth=6, n_trees=5)
+    save(compacted, str(tmp_path / 'model.compact'))
+    loaded = CompiledTrees.load(str(tmp_path / 'model.compact'))
+    np.testing.assert_array_equal(loaded.predict_proba(X), compacted.predict_proba(X))
+    assert loaded.n_trees == 5 and loaded.depth <= 6 and loaded.value_scale == 255
+
+
+def test_regressors_cant_be_compacted():
+    from sklearn.tree import DecisionTreeRegressor
+
+    model, X = forest()
+    tree = DecisionTreeRegressor(max_depth=3).fit(X, X[:, 1])
+    with pytest.raises(TypeError):
+        compact(compile_estimator(tree))
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
+from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+
+from scoring.compiled import CompiledTrees, compile_estimator
+
+
+def data(seed=0, rows=600):
+    rng = np.random.default_rng(seed)
+    # Whole numbers and codes, like the models' inputs, with repeated values
+    # landing exactly on thresholds
+    X = np.column_stack([rng.integers(0, 300, rows), rng.integers(1, 3, rows),
+                         rng.integers(1, 5, rows), rng.uniform(0, 250, rows)]).astype(float)
+    y = (X[:, 0] / 300 + (X[:, 1] == 2) * 0.3 + rng.normal(0, 0.3, rows) > 0.7).astype(int)
+    return X, y
+
+
+@pytest.mark.parametrize('estimator', [
+    RandomForestClassifier(n_estimators=20, random_state=0),
+    RandomForestClassifier(n_estimators=100, min_samples_leaf=3, random_state=1),
+    RandomForestClassifier(n_estimators=5, max_depth=3, random_state=0),
+    DecisionTreeClassifier(random_state=0),
+])
+def test_classifier_probabilities_match_sklearn(estimator):
+    X, y = data()
+    estimator.fit(X, y)
+    compiled = compile_estimator(estimator)
+    X_test, _ = data(1)
+    np.testing.assert_array_equal(compiled.predict_proba(X_test),
+                                  estimator.predict_proba(X_test))
+    np.testing.assert_array_equal(compiled.predict(X_test), estimator.predict(X_test))
+
+
+@pytest.mark.parametrize('estimator', [RandomForestRegressor(n_estimators=10, random_state=0),
+                                       DecisionTreeRegressor(random_state=0)])
+def test_regressor_predictions_match_sklearn(estimator):
+    X, _ = data()
+    estimator.fit(X, X[:, 3] * 2 + X[:, 1])
+    X_test, _ = data(1)
+    np.testing.assert_array_equal(compile_estimator(estimator).predict(X_test),
+                                  estimator.predict(X_test))
+
+
+def test_leaves_match_sklearn():
+    X, y = data()
+    tree = DecisionTreeClassifier(max_depth=6, random_state=0).fit(X, y)
+    np.testing.assert_array_equal(compile_estimator(tree).apply(X)[0], tree.apply(X))
+
+
+def test_saved_and_loaded_model_predicts_the_same(tmp_path):
+    X, y = data()
+    compiled = compile_estimator(RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y))
+    compiled.save(str(tmp_path / 'packed'))
+    loaded = CompiledTrees.load(str(tmp_path / 'packed'))
+    np.testing.assert_array_equal(loaded.predict_proba(X), compiled.predict_proba(X))
+    np.testing.assert_array_equal(loaded.classes_, compiled.classes_)
+
+
+def test_models_without_trees_are_refused():
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = data()
+    with pytest.raises(TypeError, match='Cannot compile LogisticRegression'):
+        compile_estimator(LogisticRegression().fit(X, y))
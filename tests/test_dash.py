@@ -0,0 +1,22 @@
+import datetime as dt
+
+from load import CALLBACKS, DEFAULTS, _payload
+from suite import dash_payload, forms
+
+
+def test_suite_payload_is_answered(server):
+    response = server.test_client().post('/_dash-update-component',
+                                         json=dash_payload(forms(1)[0]))
+    assert response.status_code == 200
+    body = response.get_json()['response']
+    assert body['cxl-output']['children']
+    assert body['server-price']['data']['text'].startswith('Estimated nightly rate')
+
+
+def test_load_test_payloads_are_answered(server):
+    client = server.test_client()
+    values = dict(DEFAULTS, arrival_date=dt.date.today().isoformat())
+    for output, inputs in CALLBACKS.items():
+        response = client.post('/_dash-update-component',
+                               json=_payload(output, inputs, values, inputs[0]))
+        assert response.status_code == 200, output
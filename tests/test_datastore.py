@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from scoring import datastore, encoding
+from scoring.features import CXL_FEATURES
+
+
+def test_a_store_reads_back_as_the_csv(make_bookings, tmp_path):
+    source = str(tmp_path / 'bookings.csv')
+    bookings = make_bookings(200)
+    bookings.to_csv(source, index=False)
+    store = str(tmp_path / 'store')
+    assert datastore.ingest(source, store) == 200
+    assert datastore.is_store(store) and not datastore.is_store(source)
+    assert datastore.row_count(store) == 200
+
+    columns = datastore.open_store(store)
+    np.testing.assert_array_equal(datastore.matrix(columns),
+                                  encoding.encode(encoding.wrangle(bookings)).to_numpy())
+    np.testing.assert_array_equal(datastore.matrix(columns),
+                                  datastore.matrix(datastore.read(source)))
+    # Check-outs without a night are no-shows, which count as cancellations
+    nights = bookings['stays_in_weekend_nights'] + bookings['stays_in_week_nights']
+    np.testing.assert_array_equal(columns[datastore.TARGET],
+                                  (bookings['reservation_status'] == 'Canceled') | (nights == 0))
+    # Codes are stored narrow, and read without copying
+    assert columns['hotel'].dtype == np.int8
+    assert isinstance(columns['hotel'], np.memmap)
+
+
+def test_rows_are_read_by_slice_or_index(make_bookings, tmp_path):
+    source = str(tmp_path / 'bookings.csv')
+    make_bookings(50).to_csv(source, index=False)
+    datastore.ingest(source, str(tmp_path / 'store'))
+    columns = datastore.open_store(str(tmp_path / 'store'))
+    X = datastore.matrix(columns)
+    np.testing.assert_array_equal(datastore.matrix(columns, slice(10, 20)), X[10:20])
+    np.testing.assert_array_equal(datastore.matrix(columns, np.array([3, 1, 40])), X[[3, 1, 40]])
+    # Past the last row there are none
+    assert datastore.matrix(columns, slice(45, 60)).shape == (5, len(CXL_FEATURES))
+    assert datastore.matrix(columns, slice(60, 70)).shape == (0, len(CXL_FEATURES))
+
+
+def test_missing_and_unknown_values_are_kept(make_bookings, tmp_path):
+    bookings = make_bookings(20)
+    bookings.loc[3, 'adr'] = np.nan
+    bookings.loc[4, 'meal'] = np.nan
+    bookings.loc[5, 'meal'] = 'Undefined'
+    bookings.loc[6, 'lead_time'] = np.nan
+    source = str(tmp_path / 'bookings.csv')
+    bookings.to_csv(source, index=False)
+    datastore.ingest(source, str(tmp_path / 'store'))
+    columns = datastore.open_store(str(tmp_path / 'store'))
+
+    assert np.isnan(columns['adr'][3]) and not np.isnan(np.delete(columns['adr'], 3)).any()
+    assert (columns['meal'][4], columns['meal'][5]) == (encoding.MISSING, encoding.UNKNOWN)
+    # A column with a gap can't be narrowed to integers
+    assert columns['lead_time'].dtype == np.float64 and np.isnan(columns['lead_time'][6])
+    X = encoding.impute(datastore.matrix(columns), np.full(len(CXL_FEATURES), 7.0))
+    assert X[3, CXL_FEATURES.index('adr')] == X[6, CXL_FEATURES.index('lead_time')] == 7.0
+
+
+def test_bookings_without_outcomes_have_no_target(make_bookings, tmp_path):
+    source = str(tmp_path / 'bookings.csv')
+    make_bookings(10).drop(columns='reservation_status').to_csv(source, index=False)
+    datastore.ingest(source, str(tmp_path / 'store'))
+    assert datastore.TARGET not in datastore.open_store(str(tmp_path / 'store'))
+
+
+def test_reingesting_replaces_the_store_and_its_version(make_bookings, tmp_path):
+    source, store = str(tmp_path / 'bookings.csv'), str(tmp_path / 'store')
+    make_bookings(10).to_csv(source, index=False)
+    datastore.ingest(source, store)
+    version = datastore.version(store)
+    make_bookings(30, random_state=1).to_csv(source, index=False)
+    datastore.ingest(source, store)
+    assert datastore.version(store) != version
+    assert datastore.row_count(store) == 30
+    assert not (tmp_path / 'store.tmp').exists()
+
+
+def test_a_missing_column_is_an_error(make_bookings, tmp_path):
+    source = str(tmp_path / 'bookings.csv')
+    make_bookings(10).drop(columns='adr').to_csv(source, index=False)
+    with pytest.raises(ValueError):
+        datastore.ingest(source, str(tmp_path / 'store'))
+    assert not datastore.is_store(str(tmp_path / 'store'))
@@ -0,0 +1,20 @@
+import numpy as np
+
+from scoring.drift import DriftMonitor, reference_profile
+from scoring.features import CXL_FEATURES
+
+
+def test_counts_from_chunks_add_up_to_one_monitor():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3000, len(CXL_FEATURES))).round(1)
+    profile = reference_profile(X[:1000])
+    whole = DriftMonitor(profile)
+    whole.record(X[1000:])
+    merged = DriftMonitor(profile)
+    for chunk in np.array_split(X[1000:], 3):
+        # As scoring.portfolio does with each worker's chunk
+        part = DriftMonitor(profile)
+        part.record(chunk)
+        merged.add(part.counts, len(chunk))
+    assert merged.scores() == whole.scores()
+    assert whole.scores()['rows'] == 2000
@@ -0,0 +1,125 @@
+import os
+import shutil
+import time
+
+import numpy as np
+import pytest
+from joblib import dump, load
+from sklearn.ensemble import RandomForestClassifier
+
+from scoring import estimators
+from scoring.shadow import Shadow
+from suite import forms, synthetic_features
+
+
+def wait_for(condition, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'timed out'
+        time.sleep(0.01)
+
+
+def replace(path, estimator):
+    # As scoring.train does, with a modification time of its own
+    dump(estimator, path + '.tmp')
+    os.replace(path + '.tmp', path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def models(model_dir, tmp_path, monkeypatch):
+    # A copy of the stand-in models to replace, checked on every request
+    directory = str(tmp_path / 'models')
+    shutil.copytree(model_dir, directory)
+    monkeypatch.setattr(estimators, 'MODEL_DIR', directory)
+    monkeypatch.setattr(estimators, 'RELOAD_INTERVAL', 1e-9)
+    monkeypatch.setattr(estimators, '_estimators', {})
+    monkeypatch.setattr(estimators, '_checked', {})
+    monkeypatch.setattr(estimators, '_reloading', set())
+    monkeypatch.setattr(estimators, '_HOOKS', {name: [] for name in estimators._MODELS})
+    return directory
+
+
+def retrained():
+    X, y = synthetic_features(500, random_state=3)
+    return RandomForestClassifier(n_estimators=3, max_depth=4, random_state=1).fit(X, y)
+
+
+def test_a_replaced_model_is_swapped_in_and_hooks_run(models):
+    reloaded = []
+    estimators.on_reload('cancellation', reloaded.append)
+    version, before = estimators.get_versioned('cancellation')
+    path = os.path.join(models, 'cancellation_model.joblib')
+    replace(path, retrained())
+    new_version = estimators.file_version(path)
+    assert new_version != version
+
+    # The request that notices keeps the model it started with
+    assert estimators.get_versioned('cancellation') == (version, before)
+    wait_for(lambda: estimators.loaded_version('cancellation') == new_version)
+    assert estimators.get_cxl_estimator().n_estimators == 3
+    wait_for(lambda: reloaded == [new_version])
+
+
+def test_a_model_that_fails_to_load_is_not_swapped_in(models):
+    reloaded = []
+    estimators.on_reload('cancellation', reloaded.append)
+    entry = estimators.get_versioned('cancellation')
+    path = os.path.join(models, 'cancellation_model.joblib')
+    with open(path, 'wb') as f:
+        f.write(b'not a model')
+    estimators.get_versioned('cancellation')
+    wait_for(lambda: 'cancellation' not in estimators._reloading)
+    assert estimators.get_versioned('cancellation') == entry
+    assert reloaded == []
+
+
+def test_predictions_are_cached_by_model_version(server, models):
+    from pages import predictions
+    from scoring.cache import prediction_cache
+
+    form = forms(1)[0]
+    predictions.predict(*form)
+    predictions.predict(*form)
+    assert prediction_cache.stats()['hits'] == 1
+
+    path = os.path.join(models, 'cancellation_model.joblib')
+    replace(path, retrained())
+    wait_for(lambda: (estimators.get_versioned('cancellation')[0]
+                      == estimators.file_version(path)))
+    predictions.predict(*form)
+    stats = prediction_cache.stats()
+    assert (stats['hits'], stats['size']) == (1, 2)
+
+
+def test_shadow_scoring_does_not_change_the_served_result(models, tmp_path, monkeypatch):
+    candidate = str(tmp_path / 'candidate.joblib')
+    dump(retrained(), candidate)
+    shadow = Shadow(candidate)
+    monkeypatch.setattr(estimators, 'shadow', shadow)
+    monkeypatch.setattr(estimators, 'cancellation_batcher', None)
+    X, _ = synthetic_features(50, random_state=4)
+
+    served = estimators.predict_cancellation(X)
+    live = load(os.path.join(models, 'cancellation_model.joblib')).predict_proba(X)[:, 1]
+    np.testing.assert_array_equal(served, live)
+    wait_for(lambda: shadow.stats()['batches'] == 1)
+    stats = shadow.stats()
+    expected = np.abs(load(candidate).predict_proba(X)[:, 1] - live)
+    assert stats['rows'] == 50 and stats['errors'] == 0
+    assert stats['max_abs_delta'] == pytest.approx(expected.max())
+
+
+def test_a_failing_shadow_model_does_not_change_the_served_result(models, tmp_path,
+                                                                   monkeypatch):
+    candidate = tmp_path / 'candidate.joblib'
+    candidate.write_bytes(b'not a model')
+    shadow = Shadow(str(candidate))
+    monkeypatch.setattr(estimators, 'shadow', shadow)
+    monkeypatch.setattr(estimators, 'cancellation_batcher', None)
+    X, _ = synthetic_features(10, random_state=5)
+
+    served = estimators.predict_cancellation(X)
+    np.testing.assert_array_equal(served, estimators.get_cxl_estimator().predict_proba(X)[:, 1])
+    wait_for(lambda: shadow.stats()['errors'] == 1)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from sklearn.metrics import precision_score, recall_score, roc_auc_score
+
+from scoring.evaluation import THRESHOLDS, evaluate
+
+
+def scored(seed=0, rows=2000):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, rows)
+    probabilities = np.clip(0.3 * y + rng.uniform(0, 0.7, rows), 0, 1)
+    return y, probabilities
+
+
+@pytest.mark.parametrize('decimals', [None, 2, 1])
+def test_auc_matches_sklearn(decimals):
+    # Rounded probabilities have ties, which sklearn counts as half
+    y, probabilities = scored()
+    if decimals is not None:
+        probabilities = probabilities.round(decimals)
+    report = evaluate(y, probabilities, bootstrap=0)
+    assert report['auc']['value'] == pytest.approx(roc_auc_score(y, probabilities), abs=1e-12)
+
+
+def test_threshold_sweep_matches_sklearn():
+    y, probabilities = scored(1)
+    report = evaluate(y, probabilities, bootstrap=0)['thresholds']
+    for i in (10, 35, 50, 80):
+        predicted = probabilities >= THRESHOLDS[i]
+        assert report['precision'][i] == pytest.approx(
+            precision_score(y, predicted, zero_division=1), abs=1e-6)
+        assert report['recall'][i] == pytest.approx(recall_score(y, predicted), abs=1e-6)
+        assert report['tp'][i] + report['fn'][i] == y.sum()
+        assert report['tp'][i] + report['fp'][i] == predicted.sum()
+
+
+def test_bootstrap_interval_surrounds_the_auc():
+    y, probabilities = scored(2, rows=500)
+    report = evaluate(y, probabilities, bootstrap=100, jobs=1)
+    auc = report['auc']
+    assert auc['low'] < auc['value'] < auc['high']
+    again = evaluate(y, probabilities, bootstrap=100, jobs=1)['auc']
+    assert (again['low'], again['high']) == (auc['low'], auc['high'])
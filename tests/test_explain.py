@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from scoring import explain
+from scoring.compiled import compile_estimator
+
+
+def data(seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(400, 5))
+    y = (X[:, 0] + X[:, 1] * X[:, 2] + rng.normal(0, 0.5, 400) > 0).astype(int)
+    return X, y
+
+
+@pytest.fixture(autouse=True)
+def fresh_explainer(monkeypatch):
+    monkeypatch.setattr(explain, '_explainer', {})
+
+
+def test_path_contributions_add_up_to_the_prediction():
+    X, y = data()
+    forest = RandomForestClassifier(n_estimators=10, max_depth=6, random_state=0).fit(X, y)
+    base_value, contributions = explain.path_contributions(compile_estimator(forest), X[:20])
+    np.testing.assert_allclose(base_value + contributions.sum(axis=1),
+                               forest.predict_proba(X[:20])[:, 1], atol=1e-6)
+
+
+def test_sequential_contributions_add_up_to_the_prediction():
+    X, y = data()
+    model = make_pipeline(StandardScaler(), LogisticRegression()).fit(X, y)
+    baseline = X.mean(axis=0)
+    base_value, contributions = explain.sequential_contributions(model, X[:20], baseline)
+    assert base_value == pytest.approx(model.predict_proba(baseline[np.newaxis])[0, 1])
+    np.testing.assert_allclose(base_value + contributions.sum(axis=1),
+                               model.predict_proba(X[:20])[:, 1], atol=1e-12)
+
+
+def test_models_without_trees_are_explained_feature_by_feature():
+    X, y = data()
+    model = make_pipeline(StandardScaler(), LogisticRegression()).fit(X, y)
+    method, explainer = explain._get_explainer(model)
+    assert method == 'sequential' and explainer is model
+    forest = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+    method, _ = explain._get_explainer(forest)
+    assert method == explain.EXPLAINER
+
+
+def test_path_attributions_are_reported_as_saabas(monkeypatch):
+    X, y = data()
+    forest = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+    monkeypatch.setattr(explain.estimators, 'get_cxl_estimator', lambda: forest)
+    monkeypatch.setattr(explain, 'EXPLAINER', 'path')
+    assert explain.explanation_method() == 'saabas'
+
+
+def test_tree_shap_matches_the_shap_package():
+    shap = pytest.importorskip('shap')
+    X, y = data()
+    # Inputs the trees compare as float32, as shap doesn't
+    X = X.astype(np.float32).astype(float)
+    forest = RandomForestClassifier(n_estimators=10, max_depth=8, random_state=0).fit(X, y)
+    base_value, contributions = explain.tree_shap(compile_estimator(forest), X[:20])
+    explainer = shap.TreeExplainer(forest)
+    np.testing.assert_allclose(contributions, explainer.shap_values(X[:20])[..., 1],
+                               atol=1e-12)
+    assert base_value == pytest.approx(explainer.expected_value[1])
+
+
+@pytest.mark.parametrize('bits', [8, 16])
+def test_tree_shap_of_a_compact_model_adds_up_to_its_prediction(bits):
+    from scoring.compact import compact
+
+    X, y = data()
+    forest = RandomForestClassifier(n_estimators=10, max_depth=8, random_state=0).fit(X, y)
+    model = compact(compile_estimator(forest), max_depth=6, bits=bits)
+    base_value, contributions = explain.tree_shap(model, X[:20])
+    np.testing.assert_allclose(base_value + contributions.sum(axis=1),
+                               model.predict_proba(X[:20])[:, 1], atol=1e-12)
+
+
+def test_tree_shap_is_the_default(monkeypatch):
+    X, y = data()
+    forest = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+    monkeypatch.setattr(explain.estimators, 'get_cxl_estimator', lambda: forest)
+    assert explain.EXPLAINER == 'tree_shap'
+    assert explain.explanation_method() == 'tree_shap'
+    method, base_value, contributions = explain.explain(X[:3])
+    assert method == 'tree_shap'
+    np.testing.assert_allclose(base_value + contributions.sum(axis=1),
+                               forest.predict_proba(X[:3])[:, 1], atol=1e-12)
+
+
+def test_models_packed_without_cover_fall_back_to_path_attributions(tmp_path):
+    X, y = data()
+    compiled = compile_estimator(RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y))
+    compiled.cover = None
+    compiled.save(tmp_path)
+    assert explain._get_explainer(type(compiled).load(tmp_path))[0] == 'path'
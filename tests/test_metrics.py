@@ -0,0 +1,61 @@
+import re
+
+import pytest
+
+from scoring import metrics
+from suite import FORM, dash_payload, forms
+
+
+def counter(text, route, status):
+    match = re.search(rf'^hotel_requests_total{{route="{re.escape(route)}",status="{status}"}} '
+                      rf'(\d+)$', text, re.MULTILINE)
+    return int(match.group(1)) if match else 0
+
+
+def test_histogram_counts_fall_in_their_buckets():
+    hist = metrics.Histogram(buckets=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 2.0):
+        hist.observe(seconds)
+    counts, total = hist.snapshot()
+    assert counts == [2, 1, 1] and total == pytest.approx(2.65)
+
+
+def test_requests_are_counted_at_the_endpoint(server):
+    assert metrics.METRICS
+    client = server.test_client()
+    before = client.get('/metrics').get_data(as_text=True)
+    records = [dict(zip(FORM, form)) for form in forms(3)]
+    assert client.post('/api/score', json=records).status_code == 200
+    assert client.post('/api/score', json={'reservations': 'none'}).status_code == 400
+
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+    text = response.get_data(as_text=True)
+    assert counter(text, '/api/score', 200) == counter(before, '/api/score', 200) + 1
+    assert counter(text, '/api/score', 400) == counter(before, '/api/score', 400) + 1
+    # The first scrape was answered before the second one rendered
+    assert counter(text, '/metrics', 200) >= 1
+    assert 'hotel_cache_hits{cache="predictions"}' in text
+    assert re.search(r'^hotel_model_info{model="cancellation",version=".+"} 1$', text,
+                     re.MULTILINE)
+
+
+def test_callback_stages_are_timed(server):
+    def count(text, stage):
+        match = re.search(rf'^hotel_latency_seconds_count{{stage="{stage}"}} (\d+)$', text,
+                          re.MULTILINE)
+        return int(match.group(1)) if match else 0
+
+    client = server.test_client()
+    before = client.get('/metrics').get_data(as_text=True)
+    client.post('/_dash-update-component', json=dash_payload(forms(1)[0]))
+    text = client.get('/metrics').get_data(as_text=True)
+    for stage in ('price_model', 'cancellation_features'):
+        assert count(text, stage) > count(before, stage)
+
+
+def test_metrics_can_be_turned_off(server, monkeypatch):
+    monkeypatch.setattr(metrics, 'METRICS', False)
+    assert server.test_client().get('/metrics').status_code == 404
+    assert metrics.timed('anything')(len) is len
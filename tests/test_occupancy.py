@@ -0,0 +1,84 @@
+import datetime as dt
+import itertools
+
+import numpy as np
+import pytest
+
+from scoring.occupancy import NightDistribution, OccupancyForecast, poisson_binomial
+
+NIGHT = dt.date(2026, 3, 1)
+
+
+def brute_force(probabilities):
+    # Sums the probability of every combination of events happening
+    pmf = np.zeros(len(probabilities) + 1)
+    for outcome in itertools.product([0, 1], repeat=len(probabilities)):
+        pmf[sum(outcome)] += np.prod([p if happens else 1 - p
+                                      for p, happens in zip(probabilities, outcome)])
+    return pmf
+
+
+@pytest.mark.parametrize('probabilities', [[], [0.3], [0.5, 0.5], [0.0, 1.0, 0.25],
+                                           list(np.linspace(0.05, 0.95, 11))])
+def test_poisson_binomial_matches_brute_force(probabilities):
+    np.testing.assert_allclose(poisson_binomial(probabilities), brute_force(probabilities),
+                               atol=1e-12)
+
+
+def test_poisson_binomial_fft_matches_direct():
+    # Long enough for the products near the root to be multiplied by FFT
+    probabilities = np.random.default_rng(0).uniform(size=300)
+    direct = np.ones(1)
+    for p in probabilities:
+        direct = np.convolve(direct, [1 - p, p])
+    pmf = poisson_binomial(probabilities)
+    np.testing.assert_allclose(pmf, direct, atol=1e-12)
+    assert pmf.min() >= 0
+    assert np.dot(np.arange(len(pmf)), pmf) == pytest.approx(probabilities.sum())
+
+
+def test_night_add_and_remove_match_rebuilding():
+    rng = np.random.default_rng(1)
+    probabilities = dict(enumerate(rng.uniform(size=20)))
+    night = NightDistribution()
+    for booking, p in probabilities.items():
+        night.add(booking, p)
+    for booking in [3, 7, 11]:
+        night.remove(booking)
+        del probabilities[booking]
+    np.testing.assert_allclose(night.pmf[:len(probabilities) + 1],
+                               poisson_binomial(list(probabilities.values())), atol=1e-12)
+    assert night.booked == len(probabilities)
+
+
+def test_night_quantiles_and_tail():
+    night = NightDistribution({0: 1.0, 1: 1.0, 2: 0.5})
+    assert night.mean() == pytest.approx(2.5)
+    assert night.quantile(0.1) == 2
+    assert night.quantile(0.9) == 3
+    assert night.prob_above(2) == pytest.approx(0.5)
+    assert night.prob_above(3) == 0
+
+
+def test_without_leaves_the_forecast_unchanged():
+    forecast = OccupancyForecast.from_bookings(
+        [(i, 1, NIGHT, 2, 0.5 + i / 40) for i in range(10)])
+    before = forecast.nights[(1, NIGHT)].pmf.copy()
+    view = forecast.without([1, 2, 'not booked'])
+    assert forecast.nights[(1, NIGHT)].booked == 10
+    np.testing.assert_array_equal(forecast.nights[(1, NIGHT)].pmf, before)
+    assert 1 in forecast.bookings and 1 not in view.bookings
+    kept = [0.5 + i / 40 for i in range(10) if i not in (1, 2)]
+    np.testing.assert_allclose(view.nights[(1, NIGHT)].pmf[:len(kept) + 1],
+                               poisson_binomial(kept), atol=1e-12)
+
+
+def test_cancelling_every_booking_drops_the_night():
+    forecast = OccupancyForecast.from_bookings([('a', 1, NIGHT, 1, 0.9)])
+    assert forecast.without(['a']).nights == {}
+    assert forecast.summary(1, rooms=0)[0]['prob_overbooked'] == pytest.approx(0.9)
+
+
+def test_duplicate_bookings_are_rejected():
+    with pytest.raises(ValueError, match='more than once'):
+        OccupancyForecast.from_bookings([('a', 1, NIGHT, 1, 0.9), ('a', 2, NIGHT, 3, 0.2)])
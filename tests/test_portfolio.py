@@ -0,0 +1,75 @@
+import csv
+
+import numpy as np
+import pytest
+from joblib import load
+
+from scoring import datastore, encoding, estimators, portfolio
+
+
+@pytest.fixture
+def models(model_dir, monkeypatch):
+    monkeypatch.setattr(estimators, 'MODEL_DIR', model_dir)
+    monkeypatch.setattr(estimators, '_estimators', {})
+    return model_dir
+
+
+def brute_force(model_dir, bookings):
+    # Every booking scored at once
+    X = encoding.prepare(bookings, encoding.load_imputer_means(model_dir))
+    return load(f'{model_dir}/cancellation_model.joblib').predict_proba(X)[:, 1]
+
+
+def read_scores(path):
+    with open(path) as f:
+        rows = list(csv.DictReader(f))
+    return [row[next(iter(row))] for row in rows], np.array(
+        [float(row['cancellation_probability']) for row in rows])
+
+
+@pytest.mark.parametrize('workers, chunksize', [(1, 1000), (2, 37), (3, 100)])
+def test_scores_add_up_to_scoring_every_booking_at_once(models, make_bookings, tmp_path,
+                                                        workers, chunksize):
+    bookings = make_bookings(500)
+    bookings.to_csv(tmp_path / 'bookings.csv', index=False)
+    rows, _ = portfolio.score_file(str(tmp_path / 'bookings.csv'), str(tmp_path / 'scores.csv'),
+                                   workers, chunksize)
+    ids, probabilities = read_scores(tmp_path / 'scores.csv')
+    expected = brute_force(models, bookings)
+
+    assert rows == len(ids) == 500
+    # In order, whichever worker scored each chunk
+    assert ids == [str(i) for i in range(500)]
+    np.testing.assert_allclose(probabilities, expected, atol=1e-12)
+    # Expected cancellations and their variance over the whole book
+    assert probabilities.sum() == pytest.approx(expected.sum(), abs=1e-9)
+    assert (probabilities * (1 - probabilities)).sum() == pytest.approx(
+        (expected * (1 - expected)).sum(), abs=1e-9)
+
+
+def test_a_store_scores_as_its_csv(models, make_bookings, tmp_path):
+    bookings = make_bookings(300)
+    bookings.to_csv(tmp_path / 'bookings.csv', index=False)
+    datastore.ingest(str(tmp_path / 'bookings.csv'), str(tmp_path / 'store'))
+    rows, _ = portfolio.score_file(str(tmp_path / 'store'), str(tmp_path / 'scores.csv'), 2, 64)
+    ids, probabilities = read_scores(tmp_path / 'scores.csv')
+    assert rows == 300 and ids == [str(i) for i in range(300)]
+    np.testing.assert_allclose(probabilities, brute_force(models, bookings), atol=1e-12)
+
+
+def test_bookings_are_identified_by_their_id_column(models, make_bookings, tmp_path):
+    bookings = make_bookings(40)
+    bookings['booking_id'] = [f'B{i:03}' for i in range(40)]
+    bookings.to_csv(tmp_path / 'bookings.csv', index=False)
+    portfolio.score_file(str(tmp_path / 'bookings.csv'), str(tmp_path / 'scores.csv'), 2, 15,
+                         id_column='booking_id')
+    ids, _ = read_scores(tmp_path / 'scores.csv')
+    assert ids == list(bookings['booking_id'])
+
+
+def test_a_store_has_no_id_column(models, make_bookings, tmp_path):
+    make_bookings(10).to_csv(tmp_path / 'bookings.csv', index=False)
+    datastore.ingest(str(tmp_path / 'bookings.csv'), str(tmp_path / 'store'))
+    with pytest.raises(ValueError, match='no id column'):
+        portfolio.score_file(str(tmp_path / 'store'), str(tmp_path / 'scores.csv'),
+                             id_column='booking_id')
@@ -0,0 +1,41 @@
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+from scoring.compiled import CompiledTrees
+from scoring.price_bands import leaf_bands, predict
+
+
+def fitted_tree():
+    # Prices rising with the first feature, in two clearly separate leaves
+    X = np.array([[0.0, 0.0], [1.0, 0.0], [10.0, 0.0], [11.0, 0.0]])
+    y = np.array([50.0, 60.0, 150.0, 160.0])
+    return DecisionTreeRegressor(max_depth=1).fit(X, y)
+
+
+def test_bands_cover_the_training_stays():
+    tree = fitted_tree()
+    X = np.array([[0.0, 0.0], [1.0, 0.0], [10.0, 0.0], [11.0, 0.0]])
+    bands = leaf_bands(tree, X, [50.0, 60.0, 150.0, 160.0], quantiles=(0.0, 1.0))
+    prices, lows, highs = predict(tree, bands, [[0.5, 0.0], [10.5, 0.0]])
+    np.testing.assert_allclose(prices, [55.0, 155.0])
+    np.testing.assert_allclose(lows, [50.0, 150.0])
+    np.testing.assert_allclose(highs, [60.0, 160.0])
+
+
+def test_unreached_leaf_falls_back_to_its_price():
+    # Bands built from stays that all end in the cheaper leaf
+    tree = fitted_tree()
+    bands = leaf_bands(tree, [[0.0, 0.0], [1.0, 0.0]], [50.0, 60.0])
+    assert not np.isnan(bands).any()
+    prices, lows, highs = predict(tree, bands, [[10.5, 0.0]])
+    np.testing.assert_allclose([lows[0], highs[0]], [prices[0], prices[0]])
+
+
+def test_nan_bands_fall_back_to_the_price():
+    # Bands saved before unreached leaves were filled in
+    tree = fitted_tree()
+    bands = np.full((tree.tree_.node_count, 2), np.nan)
+    for estimator in (tree, CompiledTrees.from_estimator(tree)):
+        prices, lows, highs = predict(estimator, bands, [[0.5, 0.0], [10.5, 0.0]])
+        np.testing.assert_allclose(lows, prices)
+        np.testing.assert_allclose(highs, prices)
@@ -0,0 +1,22 @@
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+from scoring.price_table import BOUNDS, SHAPE, PriceTable
+
+
+def fitted_tree():
+    rng = np.random.default_rng(0)
+    X = rng.integers(BOUNDS[:, 0], BOUNDS[:, 1] + 1, size=(1000, len(BOUNDS))).astype(float)
+    return DecisionTreeRegressor(max_depth=6).fit(X, 50 + X @ [2.0, 30.0, 10.0, -1.0])
+
+
+def test_table_answers_as_the_model(tmp_path):
+    estimator = fitted_tree()
+    table = PriceTable.build(estimator)
+    assert table.table.shape == SHAPE
+    np.save(tmp_path / 'price_table.npy', table.table)
+    loaded = PriceTable.load(estimator, tmp_path / 'price_table.npy')
+    # In the table, outside the form's bounds, and not whole numbers
+    X = np.array([[1, 1, 1, 1], [53, 2, 4, 30], [27, 1, 2, 3], [54, 1, 2, 3], [10, 1, 2, 40],
+                  [10.5, 1, 2, 3], [0, 1, 2, 3]], dtype=float)
+    np.testing.assert_array_equal(loaded.predict(X), estimator.predict(X))
@@ -0,0 +1,181 @@
+import datetime as dt
+import json
+import os
+import shutil
+import subprocess
+import threading
+
+import numpy as np
+import pytest
+from sklearn.tree import DecisionTreeRegressor
+
+from scoring import estimators, price_tree
+from scoring.features import arrival_features, nightly_rate
+from scoring.price_table import BOUNDS
+from scoring.price_tree import check, evaluate, export_tree
+
+CLIENTSIDE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                          'assets', 'clientside.js')
+
+# Runs assets/clientside.js as a browser would and answers calls of its
+# functions, one per line of JSON [name, arguments] on stdin
+NODE_SCRIPT = """
+const fs = require('fs'), vm = require('vm');
+const context = {window: {}};
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(process.argv[1], 'utf8'), context);
+const input = JSON.parse(fs.readFileSync(0, 'utf8'));
+context.window.priceTree = input.tree;
+const call = ([name, args]) => name === 'estimatePrice'
+    ? context.window.dash_clientside.hotel.estimatePrice(...args)
+    : context[name](...args);
+process.stdout.write(JSON.stringify(input.calls.map(call)));
+"""
+
+# ISO weeks around the turn of the year, including years of 53 weeks
+EDGE_DATES = ['2020-12-27', '2020-12-31', '2021-01-01', '2021-01-03', '2021-01-04',
+              '2024-02-29', '2024-12-29', '2024-12-30', '2025-12-28', '2025-12-29',
+              '2026-12-31', '2027-01-01', '2027-01-03', '2027-01-04', '2032-12-31']
+
+# Halves of a cent and float64 values just either side of them
+ROUNDING = [0.125, 0.135, 0.145, 1.005, 2.675, 10.5, 54.995, 99.985, 100.0, 123.445,
+            0.1 + 0.2, 1 / 3, 2.5e-3, 1234.565]
+
+
+def fitted_tree(seed=0):
+    # A price tree over the whole grid of the reservation form, with
+    # thresholds at halves as sklearn puts them
+    rng = np.random.default_rng(seed)
+    X = rng.integers(BOUNDS[:, 0], BOUNDS[:, 1] + 1, size=(2000, len(BOUNDS))).astype(float)
+    y = 60 + 3 * X[:, 0] + 25 * X[:, 1] + 12 * X[:, 2] - X[:, 3] + rng.normal(0, 7, len(X))
+    return DecisionTreeRegressor(max_depth=8, random_state=seed).fit(X, y)
+
+
+def read_asset(path):
+    with open(path) as f:
+        return json.loads(f.read().split('window.priceTree = ', 1)[1].rstrip(';\n'))
+
+
+def run_node(tree, calls):
+    result = subprocess.run([shutil.which('node'), '-e', NODE_SCRIPT, CLIENTSIDE],
+                            input=json.dumps({'tree': tree, 'calls': calls}),
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+needs_node = pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_export_gives_the_estimators_prices(seed):
+    estimator = fitted_tree(seed)
+    exported = export_tree(estimator)
+    check(exported, estimator)
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(BOUNDS[:, 0], BOUNDS[:, 1], size=(500, len(BOUNDS)))
+    assert [evaluate(exported, x) for x in X] == estimator.predict(X).tolist()
+
+
+def test_check_rejects_a_different_tree():
+    estimator = fitted_tree()
+    exported = export_tree(estimator)
+    leaf = exported['left'].index(-1)
+    exported['value'][leaf] += 0.01
+    with pytest.raises(ValueError, match='different price'):
+        check(exported, estimator)
+
+
+def test_export_has_a_band_for_every_leaf():
+    estimator = fitted_tree()
+    bands = np.column_stack([estimator.tree_.value[:, 0, 0] - 5,
+                             estimator.tree_.value[:, 0, 0] + 5])
+    exported = export_tree(estimator, bands)
+    leaves = [node for node, left in enumerate(exported['left']) if left == -1]
+    assert all(exported['low'][node] is not None for node in leaves)
+
+
+@needs_node
+def test_iso_week_matches_python():
+    dates = EDGE_DATES + [str(dt.date(2020, 1, 1) + dt.timedelta(days=i))
+                          for i in range(0, 4000, 3)]
+    weeks = run_node(None, [['isoWeek', [date]] for date in dates])
+    assert weeks == [arrival_features(date, dt.date(2020, 1, 1))[0] for date in dates]
+
+
+@needs_node
+def test_rounding_and_formatting_match_python():
+    values = ROUNDING + list(np.random.default_rng(0).uniform(0, 2000, 2000).round(4))
+    calls = [['npRound2', [x]] for x in values] + [['pyStr', [x]] for x in values]
+    rounded, texts = np.split(np.array(run_node(None, calls), dtype=object), 2)
+    assert list(rounded) == [float(round(np.float64(x), 2)) for x in values]
+    assert list(texts) == [str(float(x)) for x in values]
+
+
+@needs_node
+def test_estimate_price_matches_the_server():
+    estimator = fitted_tree()
+    bands = np.column_stack([estimator.tree_.value[:, 0, 0] - 5.125,
+                             estimator.tree_.value[:, 0, 0] + 5.125])
+    exported = export_tree(estimator, bands)
+    cases = [(date, adults, nights, meal, hotel) for date in EDGE_DATES
+             for adults in (1, 4) for nights in (1, 7, 30) for meal in (0, 3) for hotel in (1, 2)]
+    texts = run_node(exported, [['estimatePrice', list(case)] for case in cases])
+    for (date, adults, nights, meal, hotel), text in zip(cases, texts):
+        week, _ = arrival_features(date, dt.date(2020, 1, 1))
+        x = [week, hotel, adults, nights]
+        node = estimator.apply(np.array([x], dtype=np.float32))[0]
+        adr = nightly_rate(estimator.predict(np.array([x], dtype=float))[0], meal)
+        expected = (f'Estimated nightly rate {adr} Euros\n\n'
+                    f'Total cost {round(adr * nights, 2)} Euros\n\n'
+                    f'Likely between {nightly_rate(bands[node, 0], meal)} and '
+                    f'{nightly_rate(bands[node, 1], meal)} Euros a night')
+        assert text == expected
+
+
+@needs_node
+def test_server_price_wins_for_the_same_inputs():
+    exported = export_tree(fitted_tree())
+    server = {'inputs': ['2026-07-01', 2, 3, 1, 1], 'text': 'from the server'}
+    texts = run_node(exported, [['estimatePrice', ['2026-07-01', 2, 3, 1, 1, server]],
+                                ['estimatePrice', ['2026-07-02', 2, 3, 1, 1, server]],
+                                ['estimatePrice', ['2026-07-02', 2, 3, 1, 1, None]]])
+    assert texts[0] == 'from the server'
+    assert texts[1] == texts[2] != 'from the server'
+
+
+def test_reloading_the_price_model_exports_it(tmp_path, monkeypatch):
+    joblib = pytest.importorskip('joblib')
+    estimator = fitted_tree()
+    joblib.dump(estimator, tmp_path / 'price_model.joblib')
+    asset = tmp_path / 'price_tree.js'
+    monkeypatch.setattr(estimators, 'MODEL_DIR', str(tmp_path))
+    monkeypatch.setattr(estimators, '_estimators', {})
+    monkeypatch.setitem(estimators._LOADERS, 'price', lambda: estimator)
+    monkeypatch.setitem(estimators._HOOKS, 'price', [price_tree.refresh_asset])
+    monkeypatch.setattr(price_tree, 'ASSET_PATH', str(asset))
+    estimators._reload('price', 'new')
+    assert estimators._estimators['price'] == ('new', estimator)
+    assert read_asset(asset) == export_tree(estimator)
+
+
+def test_workers_writing_the_same_export_leave_one_file(tmp_path):
+    exported = export_tree(fitted_tree())
+    asset = tmp_path / 'price_tree.js'
+    threads = [threading.Thread(target=price_tree.write_asset, args=(exported, str(asset)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert read_asset(asset) == exported
+    assert os.listdir(tmp_path) == ['price_tree.js']
+
+
+def test_an_unchanged_export_is_not_rewritten(tmp_path):
+    asset = str(tmp_path / 'price_tree.js')
+    assert price_tree.write_asset(export_tree(fitted_tree()), asset)
+    mtime = os.stat(asset).st_mtime_ns
+    assert not price_tree.write_asset(export_tree(fitted_tree()), asset)
+    assert os.stat(asset).st_mtime_ns == mtime
+    assert price_tree.write_asset(export_tree(fitted_tree(1)), asset)
+
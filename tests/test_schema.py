@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from scoring import batch, schema
+from scoring.schema import CANCELLATION, PRICE, Feature
+
+
+def test_valid_follows_dtype_and_encoding():
+    values = np.array([0, 1, 2, 1.5, -1, np.nan, np.inf])
+    assert Feature('x', 'int16').valid(values).tolist() == [True, True, True, False, True,
+                                                            False, False]
+    assert Feature('x', 'bool').valid(values).tolist() == [True, True, False, False, False,
+                                                           False, False]
+    assert Feature('x', 'float64').valid(values).tolist() == [True] * 5 + [False, False]
+    deposit = CANCELLATION.fields['deposit_type']
+    assert deposit.valid(values).tolist() == [True, True, True] + [False] * 4
+
+
+@pytest.mark.parametrize('value', [None, 'two', '', [2], 10 ** 400, '1e400', 'nan', 2.5])
+def test_parse_rejects_what_the_model_cant_take(value):
+    with pytest.raises(ValueError, match='num_adults must be a whole number'):
+        CANCELLATION.fields['num_adults'].parse(value)
+
+
+def test_parse_takes_numbers_and_numeric_strings():
+    assert CANCELLATION.fields['num_adults'].parse('3') == 3.0
+    assert CANCELLATION.fields['deposit_type'].parse(2) == 2.0
+
+
+def test_write_a_row_over_the_defaults():
+    columns = np.array([PRICE.columns['adults'], PRICE.columns['arrival_date_week_number']])
+    row = PRICE.write(columns, (3, 27))
+    assert row.tolist() == [27, schema.HOTEL['City Hotel'], 3, 1]
+    # The template is left as it was
+    assert PRICE.template.tolist() == [0, schema.HOTEL['City Hotel'], 2, 1]
+
+
+def test_write_a_block_broadcasts_the_values():
+    columns = np.array([PRICE.columns['arrival_date_week_number'], PRICE.columns['adults']])
+    block = PRICE.write(columns, (np.array([1, 2, 3]), 4))
+    assert block.shape == (3, len(PRICE))
+    assert block[:, 0].tolist() == [1, 2, 3]
+    assert (block[:, 2] == 4).all() and (block[:, 1] == schema.HOTEL['City Hotel']).all()
+
+
+def test_write_into_out():
+    out = PRICE.empty((2,))
+    columns = np.array([PRICE.columns['nights_stay']])
+    assert PRICE.write(columns, (np.array([5, 6]),), out) is out
+    assert out[:, 3].tolist() == [5, 6]
+    row = PRICE.empty()
+    assert PRICE.write(columns, (7,), row) is row and row[3] == 7
+
+
+def test_column_of_valid_values():
+    records = [{'num_adults': 1}, {'num_adults': '2'}, {'num_adults': 3.0}]
+    assert batch._column(records, 'num_adults').tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize('bad', [[2], 10 ** 400, 'many', 1.5])
+def test_column_names_the_first_invalid_reservation(bad):
+    records = [{'num_adults': 2}, {'num_adults': bad}, {'num_adults': 'x'}]
+    with pytest.raises(ValueError, match='Reservation 1 is invalid'):
+        batch._column(records, 'num_adults')
+
+
+def test_column_rejects_values_that_are_only_valid_one_by_one():
+    # Each is a number on its own, but together they make a matrix
+    records = [{'num_adults': np.array([2])}, {'num_adults': np.array([3])}]
+    with pytest.raises(ValueError, match='num_adults must be a whole number'):
+        batch._column(records, 'num_adults')
@@ -0,0 +1,73 @@
+import os
+import shutil
+
+import pytest
+
+from conftest import ROOT
+from scoring import assets
+
+
+@pytest.fixture
+def built(server, tmp_path, monkeypatch):
+    import static_assets
+
+    source = tmp_path / 'assets'
+    source.mkdir()
+    shutil.copy(os.path.join(ROOT, 'assets', 'ROC.jpg'), source / 'ROC.jpg')
+    monkeypatch.setattr(assets, 'ASSETS_DIR', str(source))
+    monkeypatch.setattr(static_assets, 'ASSETS_DIR', str(source))
+    monkeypatch.setattr(static_assets, 'STATIC_DIR', str(tmp_path / 'build'))
+
+    def build():
+        assets.build(str(tmp_path / 'build'))
+        manifest = static_assets.load_manifest(str(tmp_path / 'build'))
+        monkeypatch.setattr(static_assets, 'manifest', manifest)
+        return manifest
+
+    return static_assets, source / 'ROC.jpg', build
+
+
+def src(element):
+    # The <img> of a plain image or of a <picture>
+    if element.__class__.__name__ == 'Picture':
+        element = element.children[-1]
+    return element.src
+
+
+def test_image_urls_carry_the_content_hash(built):
+    static_assets, path, build = built
+    build()
+    tag = assets.digest(path.read_bytes())
+    url = src(static_assets.image('ROC.jpg'))
+    assert url == f'{static_assets.URL_PREFIX}images/ROC.{tag}.jpg'
+
+    response = static_assets.server.test_client().get(url)
+    assert response.status_code == 200
+    assert response.headers['Cache-Control'] == static_assets.IMMUTABLE
+    assert response.get_data() == path.read_bytes()
+
+
+def test_image_urls_change_when_the_file_does(built):
+    static_assets, path, build = built
+    build()
+    before = src(static_assets.image('ROC.jpg'))
+    shutil.copy(os.path.join(ROOT, 'assets', 'balance.jpg'), path)
+
+    # Served as it is until the next build
+    manifest = static_assets.load_manifest(static_assets.STATIC_DIR)
+    assert 'ROC.jpg' not in manifest['images']
+    static_assets.manifest = manifest
+    assert src(static_assets.image('ROC.jpg')) == 'assets/ROC.jpg'
+
+    build()
+    after = src(static_assets.image('ROC.jpg'))
+    assert after != before
+    assert assets.digest(path.read_bytes()) in after
+
+
+def test_unchanged_files_keep_their_urls(built):
+    static_assets, _, build = built
+    build()
+    before = src(static_assets.image('ROC.jpg'))
+    build()
+    assert src(static_assets.image('ROC.jpg')) == before
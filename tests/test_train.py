@@ -0,0 +1,63 @@
+import json
+import os
+
+import numpy as np
+from joblib import load
+
+from scoring import encoding, train
+from scoring.features import CXL_FEATURES, PRICE_FEATURES
+
+CANDIDATES = ['logistic_regression', 'random_forest_undersampled']
+
+
+def test_training_writes_the_models_and_their_metadata(make_bookings, tmp_path):
+    source = str(tmp_path / 'bookings.csv')
+    make_bookings(1500).to_csv(source, index=False)
+    out = str(tmp_path / 'models')
+    metadata = train.train(source, out, jobs=1, candidates=CANDIDATES,
+                           cache_dir=str(tmp_path / 'cache'))
+
+    assert sorted(name for name in os.listdir(out)) == sorted([
+        'cancellation_model.joblib', 'price_model.joblib', 'price_bands.npy',
+        'reference_sample.npy', 'drift_profile.json', 'evaluation.json', encoding.METADATA])
+    with open(os.path.join(out, encoding.METADATA)) as f:
+        assert json.load(f) == json.loads(json.dumps(metadata))
+
+    rows = metadata['rows']
+    assert rows['train'] + rows['validation'] + rows['test'] == 1500
+    assert metadata['features'] == CXL_FEATURES
+    assert metadata['price_features'] == PRICE_FEATURES
+    assert sorted(metadata['candidates']) == sorted(CANDIDATES)
+    best = max(CANDIDATES, key=lambda name: metadata['candidates'][name]['roc_auc'])
+    assert metadata['cancellation_model'] == best
+    auc = metadata['test_roc_auc']
+    assert 0.5 < auc['low'] <= auc['value'] <= auc['high'] <= 1
+    assert sorted(metadata['imputer_means']) == sorted(CXL_FEATURES)
+
+    X = encoding.prepare(make_bookings(20, random_state=1),
+                         encoding.load_imputer_means(out))
+    probabilities = load(os.path.join(out, 'cancellation_model.joblib')).predict_proba(X)[:, 1]
+    assert ((0 <= probabilities) & (probabilities <= 1)).all()
+    price_X = X[:, [CXL_FEATURES.index(feature) for feature in PRICE_FEATURES]]
+    assert np.isfinite(load(os.path.join(out, 'price_model.joblib')).predict(price_X)).all()
+
+
+def cached_outputs(cache_dir):
+    return sum('output.pkl' in files for _, _, files in os.walk(cache_dir))
+
+
+def test_prepared_data_is_cached_by_version(make_bookings, tmp_path):
+    source = str(tmp_path / 'bookings.csv')
+    cache_dir = str(tmp_path / 'cache')
+    make_bookings(300).to_csv(source, index=False)
+    for run in ('first', 'second'):
+        train.train(source, str(tmp_path / run), jobs=1, candidates=CANDIDATES[:1],
+                    cache_dir=cache_dir)
+    assert cached_outputs(cache_dir) == 1
+
+    # New bookings are prepared afresh
+    make_bookings(300, random_state=1).to_csv(source, index=False)
+    os.utime(source, ns=(0, os.stat(source).st_mtime_ns + 10 ** 9))
+    train.train(source, str(tmp_path / 'third'), jobs=1, candidates=CANDIDATES[:1],
+                cache_dir=cache_dir)
+    assert cached_outputs(cache_dir) == 2